@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Benchmark display-width truncation on long CJK/emoji file names.
+
+Compares the previous per-character rich.cells loop with the shared
+cell_width module (memoised widths plus binary search over a prefix
+width table). Run from the repository root:
+
+    uv run python benchmarks/bench_cell_width.py
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from rich.cells import cell_len  # noqa: E402
+
+from platyplaty.ui.cell_width import truncate_to_width  # noqa: E402
+from platyplaty.ui.truncation import truncate_simple  # noqa: E402
+
+NAMES = [
+    "夢の中で踊る光と影のシンフォニー 第" + str(i) + "番 🎵🌈✨" * 8 + ".milk"
+    for i in range(200)
+]
+WIDTHS = (20, 40, 80)
+REPEAT = 20
+
+
+def _per_char_truncate(text: str, width: int) -> str:
+    """The per-character loop formerly used by truncate_line."""
+    if cell_len(text) <= width:
+        return text
+    result = []
+    current = 0
+    for char in text:
+        char_width = cell_len(char)
+        if current + char_width > width:
+            break
+        result.append(char)
+        current += char_width
+    return "".join(result)
+
+
+def _run(truncate: object) -> None:
+    """Truncate every name at every width once."""
+    assert callable(truncate)
+    for name in NAMES:
+        for width in WIDTHS:
+            truncate(name, width)
+
+
+def main() -> None:
+    """Print per-call timings for each approach."""
+    calls = len(NAMES) * len(WIDTHS)
+    for label, func in (
+        ("per-character cell_len loop", _per_char_truncate),
+        ("cell_width.truncate_to_width", truncate_to_width),
+        ("truncation.truncate_simple", truncate_simple),
+    ):
+        seconds = min(timeit.repeat(lambda f=func: _run(f), number=1, repeat=REPEAT))
+        print(f"{label:32} {seconds / calls * 1e6:8.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Benchmark the preset finder's fuzzy index on a 200k-preset library.
+
+Builds a synthetic library of word-based preset names spread over pack
+and author directories, then times the index build, incremental updates
+and a set of queries typed one character at a time (median of five
+runs each), against a naive linear scan. Run from the repository root:
+
+    uv run python benchmarks/bench_fuzzy_index.py
+"""
+
+import random
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from platyplaty.fuzzy_index import FuzzyIndex  # noqa: E402
+
+PRESET_COUNT = 200_000
+REPEATS = 5
+QUERIES = ("geiss", "flexi tunnel", "rvmtx", "zqx", "pack 042", "milk")
+WORDS = (
+    "aurora beat bass blur bloom cosmic crystal dance dream drift echo "
+    "electric fire flexi flow fractal galaxy geiss glow grid hyper "
+    "inferno jelly kaleido laser liquid lunar martin matrix mirror "
+    "nebula neon orbit pulse prism quantum rain rave ripple rovastar "
+    "shifter smoke solar spiral star storm swirl trance tunnel vortex "
+    "warp wave yin zylot"
+).split()
+
+
+def _make_paths() -> list[str]:
+    """Create paths like /presets/<pack>/<author>/<author> - <words>.milk.
+
+    2000 directories of about 100 presets each, as in large collections.
+    """
+    rng = random.Random(1)
+    authors = [" ".join(rng.choices(WORDS, k=2)).title() for _ in range(500)]
+    directories = [
+        (f"/home/user/presets/Pack {n // 10:03d}/{author}", author)
+        for n, author in enumerate(rng.choices(authors, k=2000))
+    ]
+    paths: set[str] = set()
+    while len(paths) < PRESET_COUNT:
+        directory, author = rng.choice(directories)
+        title = " ".join(rng.choices(WORDS, k=rng.randint(1, 3)))
+        paths.add(f"{directory}/{author} - {title} {rng.randint(1, 99)}.milk")
+    return sorted(paths)
+
+
+def _ms(seconds: float) -> str:
+    """Format a duration in milliseconds."""
+    return f"{seconds * 1000:8.2f} ms"
+
+
+def _linear(paths: list[str], query: str) -> list[str]:
+    """Naive fuzzy scan: every path, one regex match each."""
+    pattern = re.compile(".*?".join(map(re.escape, query)), re.IGNORECASE)
+    return [p for p in paths if pattern.search(p)]
+
+
+def main() -> None:
+    """Print timings for each operation."""
+    paths = _make_paths()
+
+    start = time.perf_counter()
+    index = FuzzyIndex(paths)
+    print(f"index build ({len(paths)} presets)   {_ms(time.perf_counter() - start)}")
+
+    added = [f"/presets/new/added {n}.milk" for n in range(1000)]
+    start = time.perf_counter()
+    index.add(added)
+    index.remove(added[::2])
+    print(f"add 1000, remove 500            {_ms(time.perf_counter() - start)}")
+
+    worst = 0.0
+    for query in QUERIES:
+        for length in range(1, len(query) + 1):
+            typed = query[:length]
+            timings = []
+            for _ in range(REPEATS):
+                start = time.perf_counter()
+                hits = index.search(typed)
+                timings.append(time.perf_counter() - start)
+            elapsed = statistics.median(timings)
+            worst = max(worst, elapsed)
+            print(f"query {typed!r:16} {len(hits):3} hits  {_ms(elapsed)}")
+        start = time.perf_counter()
+        _linear(paths, query)
+        print(f"  linear scan for {query!r:16}  {_ms(time.perf_counter() - start)}")
+    print(f"slowest indexed query (median) {_ms(worst)}")
+
+
+if __name__ == "__main__":
+    main()
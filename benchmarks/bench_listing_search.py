@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Benchmark type-ahead jump and incremental filtering on a large listing.
+
+Builds a synthetic 100k-entry listing and times the index build, prefix
+jumps, and a filter query typed one character at a time, against a
+naive linear scan. Run from the repository root:
+
+    uv run python benchmarks/bench_listing_search.py
+"""
+
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from platyplaty.ui.directory import _sort_key  # noqa: E402
+from platyplaty.ui.directory_types import (  # noqa: E402
+    DirectoryEntry,
+    DirectoryListing,
+    EntryType,
+)
+from platyplaty.ui.listing_search import (  # noqa: E402
+    IncrementalFilter,
+    find_prefix_index,
+    get_listing_index,
+)
+
+ENTRY_COUNT = 100_000
+PREFIXES = ("a", "fl", "gal", "zzz")
+TYPED_QUERY = "geiss"
+
+
+def _make_listing() -> DirectoryListing:
+    """Create a sorted listing of random .milk names."""
+    rng = random.Random(1)
+    alphabet = string.ascii_letters + " _-"
+    names = {
+        "".join(rng.choices(alphabet, k=rng.randint(10, 40))) + ".milk"
+        for _ in range(ENTRY_COUNT)
+    }
+    entries = [DirectoryEntry(n, EntryType.FILE, Path("/p") / n) for n in names]
+    return DirectoryListing(
+        entries=sorted(entries, key=_sort_key),
+        was_empty=False,
+        had_filtered_entries=False,
+        permission_denied=False,
+    )
+
+
+def _ms(start: float) -> str:
+    """Format the time elapsed since start in milliseconds."""
+    return f"{(time.perf_counter() - start) * 1000:8.2f} ms"
+
+
+def main() -> None:
+    """Print timings for each operation."""
+    listing = _make_listing()
+    names = [entry.name.lower() for entry in listing.entries]
+
+    start = time.perf_counter()
+    get_listing_index(listing)
+    print(f"index build (once per listing)  {_ms(start)}")
+
+    for prefix in PREFIXES:
+        start = time.perf_counter()
+        find_prefix_index(listing, prefix)
+        indexed = _ms(start)
+        start = time.perf_counter()
+        next((i for i, n in enumerate(names) if n.startswith(prefix)), None)
+        print(f"jump {prefix!r:6} indexed {indexed}  linear {_ms(start)}")
+
+    search = IncrementalFilter(listing)
+    for length in range(1, len(TYPED_QUERY) + 1):
+        query = TYPED_QUERY[:length]
+        start = time.perf_counter()
+        matches = search.update(query)
+        incremental = _ms(start)
+        start = time.perf_counter()
+        [i for i, n in enumerate(names) if query in n]
+        print(
+            f"filter {query!r:8} {len(matches):6} matches "
+            f"incremental {incremental}  linear {_ms(start)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Benchmark parsing a 1M-line .platy playlist.
+
+Writes a synthetic playlist of one million absolute preset paths to a
+temporary file, then times parse_playlist_file (median of three runs)
+against the previous line-by-line parser, which built a Path for every
+line. The target is several hundred thousand lines per second. Run
+from the repository root:
+
+    uv run python benchmarks/bench_playlist_parse.py
+"""
+
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from platyplaty.playlist_file import parse_playlist_file  # noqa: E402
+from platyplaty.playlist_validation import (  # noqa: E402
+    expand_path,
+    is_absolute_path,
+    raise_if_errors,
+)
+from platyplaty.preset_table import PresetTable  # noqa: E402
+
+LINE_COUNT = 1_000_000
+DISTINCT = 50_000
+REPEATS = 3
+
+
+def _make_lines() -> list[str]:
+    """Create paths like /home/user/presets/Pack NNN/Author - Title N.milk.
+
+    Entries repeat a library of DISTINCT presets, as long shuffled
+    playlists do.
+    """
+    rng = random.Random(1)
+    library = [
+        f"/home/user/presets/Pack {rng.randrange(300):03d}/"
+        f"Author {rng.randrange(500)} - Title {n}.milk"
+        for n in range(DISTINCT)
+    ]
+    return [rng.choice(library) for _ in range(LINE_COUNT)]
+
+
+def _line_by_line(filepath: Path) -> PresetTable:
+    """The previous parser: read, split, then one Path per line."""
+    relative_errors: list[int] = []
+    extension_errors: list[int] = []
+    paths = PresetTable()
+    for line_num, line in enumerate(filepath.read_text().splitlines(), start=1):
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if not is_absolute_path(stripped):
+            relative_errors.append(line_num)
+            continue
+        if not stripped.lower().endswith(".milk"):
+            extension_errors.append(line_num)
+            continue
+        paths.append(expand_path(stripped))
+    raise_if_errors(relative_errors, extension_errors)
+    return paths
+
+
+def _time(parse: Callable[[Path], PresetTable], filepath: Path) -> float:
+    """Return the median seconds parse takes on filepath."""
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        parse(filepath)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    """Print timings and throughput for both parsers."""
+    lines = _make_lines()
+    with tempfile.TemporaryDirectory() as tmp:
+        filepath = Path(tmp) / "big.platy"
+        filepath.write_text("\n".join(lines) + "\n")
+        size_mb = filepath.stat().st_size / 1e6
+        print(f"{LINE_COUNT} lines, {size_mb:.1f} MB")
+        assert parse_playlist_file(filepath).strings() == lines
+        for name, parse in (
+            ("parse_playlist_file", parse_playlist_file),
+            ("line-by-line parser", _line_by_line),
+        ):
+            elapsed = _time(parse, filepath)
+            rate = LINE_COUNT / elapsed
+            print(f"{name}  {elapsed * 1000:9.1f} ms  {rate:12,.0f} lines/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,11 @@ from platyplaty.ui import (
     FileBrowser,
     FooterContainer,
     PlaylistView,
+    PresetFinder,
+)
+from platyplaty.ui.directory_memory_store import (
+    DirectoryMemoryStore,
+    default_directory_memory_path,
 )
 
 if TYPE_CHECKING:
@@ -63,7 +68,11 @@ class PlatyplatyApp(App[None]):
         self.ansi_color = True
 
         # Create AppContext which builds dispatch tables in __post_init__
-        self.ctx = AppContext(config=config, playlist=playlist)
+        self.ctx = AppContext(
+            config=config,
+            playlist=playlist,
+            directory_memory=DirectoryMemoryStore(default_directory_memory_path()),
+        )
         self._start_path = start_path
 
     def compose(self) -> ComposeResult:
@@ -77,6 +86,7 @@ class PlatyplatyApp(App[None]):
             self.ctx.file_browser_dispatch_table,
             starting_dir=self._start_path,
             focused=is_file_browser_focused,
+            directory_memory=self.ctx.directory_memory,
             id="file_browser",
         )
         yield Static("", id="section_divider")
@@ -85,6 +95,7 @@ class PlatyplatyApp(App[None]):
         )
         yield FooterContainer(self.ctx.error_log, id="footer")
         yield ErrorView(self.ctx.error_log, id="error_view")
+        yield PresetFinder(id="preset_finder")
 
 
     async def on_mount(self) -> None:
@@ -203,6 +214,36 @@ class PlatyplatyApp(App[None]):
 
         await navigate_to_last_preset(self.ctx, self)
 
+    async def action_toggle_mark(self) -> None:
+        """Mark or unmark the selected preset."""
+        from platyplaty.playlist_select_actions import toggle_mark
+
+        await toggle_mark(self.ctx, self)
+
+    async def action_toggle_range(self) -> None:
+        """Start or end a visual range in the playlist."""
+        from platyplaty.playlist_select_actions import toggle_range
+
+        await toggle_range(self.ctx, self)
+
+    async def action_clear_marks(self) -> None:
+        """Clear the playlist marks and visual range."""
+        from platyplaty.playlist_select_actions import clear_multiselect
+
+        await clear_multiselect(self.ctx, self)
+
+    async def action_send_to_top(self) -> None:
+        """Move the selected presets to the top of the playlist."""
+        from platyplaty.playlist_select_actions import send_to_top
+
+        await send_to_top(self.ctx, self)
+
+    async def action_send_to_bottom(self) -> None:
+        """Move the selected presets to the bottom of the playlist."""
+        from platyplaty.playlist_select_actions import send_to_bottom
+
+        await send_to_bottom(self.ctx, self)
+
     async def action_shuffle_playlist(self) -> None:
         """Shuffle the playlist in place."""
         from platyplaty.playlist_edit_actions import shuffle_playlist
@@ -222,6 +263,12 @@ class PlatyplatyApp(App[None]):
         await toggle_autoplay(self.ctx, self)
 
 
+    async def action_find_preset(self) -> None:
+        """Open the fuzzy finder over the whole preset library."""
+        from platyplaty.preset_finder_actions import open_preset_finder
+
+        await open_preset_finder(self.ctx, self)
+
     async def action_switch_focus(self) -> None:
         """Switch focus between file browser and playlist sections."""
         if self.ctx.current_focus == "file_browser":
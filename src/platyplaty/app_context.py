@@ -15,12 +15,14 @@ from platyplaty.build_dispatch_tables import (
     build_playlist_table,
 )
 from platyplaty.dispatch_tables import DispatchTable
+from platyplaty.ui.directory_memory_store import DirectoryMemoryStore
 from platyplaty.ui.editing_mode import create_editing_mode
 from platyplaty.undo import UndoManager
 
 if TYPE_CHECKING:
     from platyplaty.autoplay_manager import AutoplayManager
     from platyplaty.playlist import Playlist
+    from platyplaty.preset_index import PresetIndex
     from platyplaty.socket_client import SocketClient
     from platyplaty.types.app_config import AppConfig
     from platyplaty.ui.editing_mode import EditingMode
@@ -57,6 +59,10 @@ class AppContext:
             crash tracking. Path for files, str for "idle://", None before
             first load.
         editing_mode: Editing mode for command prompt keybindings.
+        directory_memory: Remembered selection and scroll offset per
+            directory, persisted between sessions.
+        preset_index: Index of the configured preset directories, or
+            None if no preset directories are configured.
     """
 
     config: AppConfig
@@ -78,6 +84,10 @@ class AppContext:
     autoplay_manager: AutoplayManager | None = None
     preset_sent_to_renderer: Path | str | None = None
     editing_mode: EditingMode = field(default_factory=create_editing_mode)
+    directory_memory: DirectoryMemoryStore = field(
+        default_factory=DirectoryMemoryStore
+    )
+    preset_index: PresetIndex | None = None
 
     def __post_init__(self) -> None:
         """Build dispatch tables from keybindings."""
@@ -1,8 +1,15 @@
 """Shutdown logic for PlatyplatyApp."""
 
+import asyncio
 import contextlib
 from typing import TYPE_CHECKING
 
+from platyplaty.bulk_add_actions import cancel_bulk_add
+from platyplaty.playlist_persistence import close_journal
+from platyplaty.playlist_validation import PlaylistFileError
+from platyplaty.playlist_validation_actions import cancel_playlist_validation
+from platyplaty.preset_index import set_active_index
+
 if TYPE_CHECKING:
     from platyplaty.app import PlatyplatyApp
     from platyplaty.app_context import AppContext
@@ -11,14 +18,26 @@ if TYPE_CHECKING:
 async def perform_graceful_shutdown(ctx: "AppContext", app: "PlatyplatyApp") -> None:
     """Shut down the application gracefully.
 
-    Sets the exiting flag, sends QUIT command to the renderer (if
-    reachable), closes the socket, and exits the application.
+    Sets the exiting flag, stops any bulk add or playlist validation,
+    folds the autosave journal into the playlist file, saves directory
+    memory, closes the preset index, sends QUIT command to the renderer
+    (if reachable), closes the socket, and exits the application.
 
     Args:
         ctx: The AppContext instance with runtime state.
         app: The PlatyplatyApp instance (for exit).
     """
     ctx.exiting = True
+    cancel_bulk_add()
+    cancel_playlist_validation()
+    closing = close_journal(ctx.playlist, compact=True)
+    if closing is not None:
+        with contextlib.suppress(OSError, PlaylistFileError):
+            await asyncio.wrap_future(closing)
+    ctx.directory_memory.flush()
+    if ctx.preset_index is not None:
+        set_active_index(None)
+        ctx.preset_index.close()
     if ctx.client:
         with contextlib.suppress(ConnectionError):
             await ctx.client.send_command("QUIT")
@@ -4,6 +4,14 @@ from typing import TYPE_CHECKING
 
 from platyplaty.event_loop import stderr_monitor_task
 from platyplaty.idle_preset import load_initial_preset
+from platyplaty.playlist_validation_actions import start_playlist_validation
+from platyplaty.preset_finder_table import start_finder_table_sync
+from platyplaty.preset_index import (
+    PresetIndex,
+    default_preset_index_path,
+    set_active_index,
+)
+from platyplaty.preset_index_scan import REFRESH_INTERVAL, start_index_refresh
 from platyplaty.renderer import start_renderer
 from platyplaty.signal_handlers import setup_signal_handlers
 from platyplaty.socket_client import SocketClient
@@ -26,6 +34,9 @@ async def perform_startup(ctx: "AppContext", app: "PlatyplatyApp") -> None:
     Raises:
         Exception: On any startup failure after cleanup is performed.
     """
+    # Validate the playlist in the background while the renderer starts
+    start_playlist_validation(ctx, app)
+
     # Stage A: Direct calls before workers start
     ctx.renderer_process = await start_renderer(ctx.config.socket_path)
     ctx.client = SocketClient()
@@ -45,6 +56,35 @@ async def perform_startup(ctx: "AppContext", app: "PlatyplatyApp") -> None:
 
     # Stage B: Start workers
     app.run_worker(stderr_monitor_task(ctx, app), name="stderr_monitor")
+    start_preset_index(ctx, app)
+
+
+def start_preset_index(ctx: "AppContext", app: "PlatyplatyApp") -> None:
+    """Open the preset index and keep it refreshed in the background.
+
+    The preset finder's table is synced after every refresh. Does nothing
+    when no preset directories are configured.
+
+    Args:
+        ctx: The AppContext instance with runtime state.
+        app: The PlatyplatyApp instance (for the refresh timer).
+    """
+    preset_dirs = list(ctx.config.preset_dirs)
+    if not preset_dirs:
+        return
+    index = PresetIndex(default_preset_index_path())
+    ctx.preset_index = index
+    set_active_index(index)
+    _refresh_preset_index(index, preset_dirs)
+    app.set_interval(
+        REFRESH_INTERVAL, lambda: _refresh_preset_index(index, preset_dirs)
+    )
+
+
+def _refresh_preset_index(index: PresetIndex, preset_dirs: list[str]) -> None:
+    """Start an index refresh, then sync the finder table when it ends."""
+    future = start_index_refresh(index, preset_dirs)
+    future.add_done_callback(lambda _: start_finder_table_sync(index))
 
 
 
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Crash-safe file replacement.
+
+write_atomically writes a new version of a file next to it, syncs it to
+disk and renames it over the old one, so a crash leaves either the old
+or the new content, never a truncated file. Saving through a symlink
+replaces the file it points to, and an existing file keeps its mode.
+"""
+
+import contextlib
+import errno
+import os
+import secrets
+from collections.abc import Iterable
+from pathlib import Path
+
+
+def write_atomically(filepath: Path, chunks: Iterable[str]) -> os.stat_result:
+    """Replace a file's content in one step.
+
+    Args:
+        filepath: The file to write; it need not exist.
+        chunks: The new content, written in order.
+
+    Returns:
+        The status of the new file.
+
+    Raises:
+        PermissionError: If the file or its directory can't be written.
+        OSError: If the write fails for other reasons; the old file is
+            left as it was.
+    """
+    target = Path(os.path.realpath(filepath))
+    try:
+        mode: int | None = os.stat(target).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = None
+    if mode is not None and not os.access(target, os.W_OK):
+        raise PermissionError(errno.EACCES, os.strerror(errno.EACCES), str(filepath))
+    temp = target.with_name(f".{target.name}.{secrets.token_hex(4)}.tmp")
+    fd = os.open(temp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "w") as f:
+            if mode is not None:
+                os.fchmod(f.fileno(), mode)
+            f.writelines(chunks)
+            f.flush()
+            os.fsync(f.fileno())
+            status = os.fstat(f.fileno())
+        os.replace(temp, target)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(temp)
+        raise
+    _sync_directory(target.parent)
+    return status
+
+
+def _sync_directory(directory: Path) -> None:
+    """Flush a directory entry change to disk, where supported."""
+    with contextlib.suppress(OSError):
+        fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
@@ -8,11 +8,24 @@ presets automatically.
 
 The registry is session-only: it clears when platyplaty restarts, allowing
 users to retry presets that may work after libprojectM updates.
+
+Lookups find the queried file's (st_dev, st_ino), taken from the shared
+file_stat cache, in a dict from identities to registered paths rather
+than resolving the queried path, since the file browser checks every
+visible row on every paint. Listing a directory fills that cache, so
+painting its rows does no filesystem I/O, and each lookup is O(1).
 """
 from pathlib import Path
 
+from platyplaty.file_identity import FileIdentity, resolve_cached, stat_identity
+from platyplaty.file_stat import invalidate_file_stat
+
 _bad_presets: set[Path] = set()
 
+# Registered path of each bad preset's file identity; an entry counts
+# only while its path is still in _bad_presets
+_bad_identities: dict[FileIdentity, Path] = {}
+
 
 def mark_preset_as_bad(path: Path) -> None:
     """Mark a preset as bad (crashed the renderer).
@@ -21,17 +34,27 @@ def mark_preset_as_bad(path: Path) -> None:
         path: The path to the preset file. Will be resolved to handle
             symlinks pointing to the same target file.
     """
-    _bad_presets.add(path.resolve())
+    resolved = resolve_cached(path)
+    _bad_presets.add(resolved)
+    invalidate_file_stat(path)
+    identity = stat_identity(path)
+    if identity is not None:
+        _bad_identities[identity] = resolved
 
 
 def is_preset_bad(path: Path) -> bool:
     """Check if a preset is marked as bad.
 
     Args:
-        path: The path to the preset file. Will be resolved to handle
-            symlinks pointing to the same target file.
+        path: The path to the preset file. Symlinks pointing to the same
+            target file as a bad preset are also considered bad.
 
     Returns:
         True if the preset has previously crashed the renderer, False otherwise.
     """
-    return path.resolve() in _bad_presets
+    if not _bad_presets:
+        return False
+    identity = stat_identity(path)
+    if identity is not None:
+        return _bad_identities.get(identity) in _bad_presets
+    return resolve_cached(path) in _bad_presets
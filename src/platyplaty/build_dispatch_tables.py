@@ -27,6 +27,10 @@ def build_file_browser_table(kb: Keybindings) -> DispatchTable:
         add_preset_or_load_playlist_keys=kb.file_browser.add_preset_or_load_playlist,
         play_previous_preset_keys=kb.file_browser.play_previous_preset,
         play_next_preset_keys=kb.file_browser.play_next_preset,
+        find_keys=kb.file_browser.find,
+        filter_keys=kb.file_browser.filter,
+        toggle_flatten_keys=kb.file_browser.toggle_flatten,
+        add_directory_keys=kb.file_browser.add_directory,
     )
 
 
@@ -40,6 +44,7 @@ def build_global_table(kb: Keybindings) -> DispatchTable:
         open_selected_keys=kb.globals.open_selected,
         view_errors_keys=kb.globals.view_errors,
         play_selection_keys=kb.globals.play_selection,
+        find_preset_keys=kb.globals.find_preset,
     )
 
 
@@ -60,6 +65,11 @@ def build_playlist_table(kb: Keybindings) -> DispatchTable:
         page_down_keys=kb.playlist.page_down,
         navigate_to_first_keys=kb.playlist.navigate_to_first_preset,
         navigate_to_last_keys=kb.playlist.navigate_to_last_preset,
+        toggle_mark_keys=kb.playlist.toggle_mark,
+        toggle_range_keys=kb.playlist.toggle_range,
+        clear_marks_keys=kb.playlist.clear_marks,
+        send_to_top_keys=kb.playlist.send_to_top,
+        send_to_bottom_keys=kb.playlist.send_to_bottom,
     )
 
 
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""Background collection of many presets for adding to the playlist.
+
+A BulkAdd resolves a target to .milk files on a worker thread. The
+target is a directory, which is walked with the flattened file
+browser's walk (see flat_scan.walk_milk_files) so presets are added in
+the order that view lists them, a single .milk file, or a glob pattern
+whose matches may be either. The files are then validated in batches
+on a thread pool. The caller appends the result to the playlist in one
+operation when the job is done.
+"""
+
+import glob
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+
+from platyplaty.file_identity import FileIdentity, stat_identity
+from platyplaty.preset_validator import is_valid_preset
+from platyplaty.ui.flat_scan import walk_milk_files
+
+# Threads validating files; validation is I/O bound
+MAX_WORKERS = min(8, 2 * (os.cpu_count() or 1))
+
+# Minimum seconds between two progress notifications
+PROGRESS_INTERVAL = 0.1
+
+# Files validated by one pool job
+_VALIDATE_BATCH = 64
+
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bulk-add")
+
+
+class BulkAddProgress(NamedTuple):
+    """How far a bulk add has got.
+
+    Attributes:
+        found: Preset files found so far.
+        validated: Files validated so far.
+        scanning: True while files are still being found.
+    """
+
+    found: int
+    validated: int
+    scanning: bool
+
+
+class BulkAddResult(NamedTuple):
+    """The presets collected by a bulk add.
+
+    Attributes:
+        paths: The preset files, in walk order.
+        valid: Whether each file is a valid preset, in the same order.
+        identities: Each file's (st_dev, st_ino), or None if it could
+            not be stat'ed, in the same order.
+    """
+
+    paths: list[Path]
+    valid: list[bool]
+    identities: list[FileIdentity | None]
+
+
+class BulkAdd:
+    """A running or finished bulk add of one target."""
+
+    def __init__(
+        self,
+        target: Path,
+        on_progress: Callable[[], None],
+        literal: bool = False,
+        max_workers: int = MAX_WORKERS,
+    ) -> None:
+        """Start collecting target's presets in the background.
+
+        Args:
+            target: An absolute directory, .milk file or glob pattern.
+            on_progress: Called on the worker thread as files are found
+                and validated, and once more when the job finishes.
+            literal: True if target is a path that exists, never a
+                pattern (see find_presets).
+            max_workers: Threads used to validate files.
+        """
+        self.target = target
+        self.literal = literal
+        self._on_progress = on_progress
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._progress = BulkAddProgress(0, 0, True)
+        self._last_notify = 0.0
+        self._cancelled = threading.Event()
+        self.future: Future[BulkAddResult] = _executor.submit(self._run)
+
+    @property
+    def progress(self) -> BulkAddProgress:
+        """Return how far the job has got."""
+        with self._lock:
+            return self._progress
+
+    @property
+    def cancelled(self) -> bool:
+        """Return True if cancel() has been called."""
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """Stop the job; its result will be empty."""
+        self._cancelled.set()
+
+    def wait(self, timeout: float | None = None) -> BulkAddResult:
+        """Block until the job has finished and return its result.
+
+        Args:
+            timeout: Maximum number of seconds to wait, or None for no limit.
+        """
+        return self.future.result(timeout)
+
+    def _run(self) -> BulkAddResult:
+        """Worker job: find the files, then validate them."""
+        try:
+            paths = []
+            found = find_presets(self.target, self.literal, self._cancelled)
+            for path in found:
+                if self._cancelled.is_set():
+                    return BulkAddResult([], [], [])
+                paths.append(path)
+                self._update(BulkAddProgress(len(paths), 0, True))
+            self._update(BulkAddProgress(len(paths), 0, False), force=True)
+            valid, identities = self._validate(paths)
+            if self._cancelled.is_set():
+                return BulkAddResult([], [], [])
+            return BulkAddResult(paths, valid, identities)
+        finally:
+            self._notify()
+
+    def _validate(
+        self, paths: list[Path]
+    ) -> tuple[list[bool], list[FileIdentity | None]]:
+        """Validate and identify paths in batches on a thread pool.
+
+        Progress is reported as batches finish.
+        """
+        valid: list[bool] = []
+        identities: list[FileIdentity | None] = []
+        pool = ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="bulk-validate"
+        )
+        try:
+            batches = [
+                pool.submit(_validate_batch, paths[start:start + _VALIDATE_BATCH])
+                for start in range(0, len(paths), _VALIDATE_BATCH)
+            ]
+            for batch in batches:
+                results = batch.result()
+                if self._cancelled.is_set():
+                    break
+                valid.extend(ok for ok, _ in results)
+                identities.extend(identity for _, identity in results)
+                self._update(BulkAddProgress(len(paths), len(valid), False))
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        return valid, identities
+
+    def _update(self, progress: BulkAddProgress, force: bool = False) -> None:
+        """Record progress, notifying at most every PROGRESS_INTERVAL."""
+        with self._lock:
+            self._progress = progress
+        now = time.monotonic()
+        if force or now - self._last_notify >= PROGRESS_INTERVAL:
+            self._last_notify = now
+            self._notify()
+
+    def _notify(self) -> None:
+        """Report progress unless the job was cancelled."""
+        if not self._cancelled.is_set():
+            self._on_progress()
+
+
+def _validate_batch(paths: list[Path]) -> list[tuple[bool, FileIdentity | None]]:
+    """Pool job: validate a batch of files, reading each one's identity."""
+    return [(is_valid_preset(path), stat_identity(path)) for path in paths]
+
+
+def find_presets(
+    target: Path,
+    literal: bool = False,
+    cancelled: threading.Event | None = None,
+) -> Iterator[Path]:
+    """Yield the .milk files a target names.
+
+    Args:
+        target: An absolute directory, .milk file or glob pattern. A
+            pattern's matching directories are walked and its matching
+            .milk files are included; "**" matches across directories.
+        literal: True to take target as a path even if it contains glob
+            characters, such as a directory named "[live]".
+        cancelled: If given, directory walks stop once it is set.
+
+    Yields:
+        Each preset file once, directories in walk order.
+    """
+    text = str(target)
+    if literal or glob.escape(text) == text:
+        matches = [text]
+    else:
+        matches = sorted(glob.glob(text, recursive=True), key=str.lower)
+    visited: set[tuple[int, int]] = set()
+    seen: set[str] = set()
+    for match in matches:
+        for path in _walk(Path(match), visited, cancelled):
+            if str(path) not in seen:
+                seen.add(str(path))
+                yield path
+
+
+def _walk(
+    root: Path,
+    visited: set[tuple[int, int]],
+    cancelled: threading.Event | None,
+) -> Iterator[Path]:
+    """Yield root if it is a .milk file, or the .milk files beneath it.
+
+    Args:
+        root: A file or directory.
+        visited: (st_dev, st_ino) of directories already walked; updated.
+        cancelled: If given, the walk stops once it is set.
+    """
+    if not _is_dir(root):
+        if root.name.lower().endswith(".milk"):
+            yield root
+        return
+    for entry in walk_milk_files(root, visited, cancelled):
+        yield entry.path
+
+
+def _is_dir(path: Path) -> bool:
+    """Return True if path is a directory, following symlinks."""
+    try:
+        return path.is_dir()
+    except OSError:
+        return False
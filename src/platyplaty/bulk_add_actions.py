@@ -0,0 +1,123 @@
+"""Adding a whole directory or glob of presets to the playlist.
+
+The presets are found and validated by a BulkAdd job in the background
+while the status line shows its progress. When the job finishes, the
+presets are appended in one operation behind a single undo snapshot,
+and the playlist view is refreshed once. Only one bulk add runs at a
+time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import TYPE_CHECKING
+
+from platyplaty.bulk_add import BulkAdd
+from platyplaty.playlist_action_helpers import (
+    autoplay_first_preset,
+    refresh_playlist_view,
+)
+from platyplaty.playlist_snapshot import push_undo_snapshot
+from platyplaty.ui.transient_error import show_transient_error
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+    from pathlib import Path
+
+    from platyplaty.app import PlatyplatyApp
+    from platyplaty.app_context import AppContext
+    from platyplaty.bulk_add import BulkAddResult
+
+_current: BulkAdd | None = None
+
+
+def start_bulk_add(
+    ctx: AppContext, app: PlatyplatyApp, target: Path, literal: bool = False
+) -> str | None:
+    """Start adding the presets a target names to the playlist.
+
+    Must be called on the event loop thread.
+
+    Args:
+        ctx: Application context.
+        app: The Textual application.
+        target: An absolute directory, .milk file or glob pattern.
+        literal: True if target is an existing path, never a pattern.
+
+    Returns:
+        An error message if a bulk add is already running, else None.
+    """
+    global _current
+    if _current is not None and not _current.future.done():
+        return "Error: already adding presets"
+    loop = asyncio.get_running_loop()
+
+    def on_progress() -> None:
+        # RuntimeError means the loop is closed; nothing to show
+        with contextlib.suppress(RuntimeError):
+            loop.call_soon_threadsafe(_show_progress, app, job)
+
+    def on_done(_future: Future[BulkAddResult]) -> None:
+        with contextlib.suppress(RuntimeError):
+            loop.call_soon_threadsafe(app.call_later, _finish, ctx, app, job)
+
+    job = BulkAdd(target, on_progress, literal)
+    _current = job
+    job.future.add_done_callback(on_done)
+    return None
+
+
+def cancel_bulk_add() -> None:
+    """Stop a running bulk add, if any; nothing is added."""
+    if _current is not None:
+        _current.cancel()
+
+
+def progress_text(job: BulkAdd) -> str:
+    """Return the status line text for a bulk add's progress.
+
+    Args:
+        job: The bulk add.
+    """
+    progress = job.progress
+    if progress.scanning:
+        return f"[adding: {progress.found} found]"
+    return f"[adding: {progress.validated}/{progress.found}]"
+
+
+def _show_progress(app: PlatyplatyApp, job: BulkAdd) -> None:
+    """Show a running job's progress in the status line."""
+    if job.future.done():
+        return
+    _set_status_progress(app, progress_text(job))
+
+
+def _set_status_progress(app: PlatyplatyApp, text: str | None) -> None:
+    """Show or clear progress text in the status line."""
+    from platyplaty.ui.status_line import StatusLine
+
+    with contextlib.suppress(Exception):
+        app.query_one("#status_line", StatusLine).show_progress(text)
+
+
+async def _finish(ctx: AppContext, app: PlatyplatyApp, job: BulkAdd) -> None:
+    """Append a finished job's presets to the playlist."""
+    _set_status_progress(app, None)
+    try:
+        result = job.future.result()
+    except Exception as exc:
+        show_transient_error(app, f"Cannot add: {exc}")
+        return
+    if job.cancelled:
+        return
+    if not result.paths:
+        show_transient_error(app, "Cannot add: no presets found")
+        return
+    playlist = ctx.playlist
+    was_empty = len(playlist.presets) == 0
+    push_undo_snapshot(ctx)
+    playlist.add_presets(result.paths, result.valid, result.identities)
+    if was_empty:
+        await autoplay_first_preset(ctx, app)
+    refresh_playlist_view(app)
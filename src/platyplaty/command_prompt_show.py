@@ -12,18 +12,29 @@ if TYPE_CHECKING:
 
 
 async def show_command_prompt(ctx: "AppContext", app: "PlatyplatyApp") -> None:
-    """Show the command prompt and set up the callback.
+    """Show the command prompt and set up the callback and completion.
 
     Args:
         ctx: Application context.
         app: The Textual application.
     """
     from platyplaty.command_prompt_handler import create_command_callback
+    from platyplaty.commands.dispatcher import get_file_browser_current_dir
     from platyplaty.focus_helpers import get_previous_focus_id
+    from platyplaty.ui.command_completion import CommandCompleter
     from platyplaty.ui.command_line import CommandLine
+    from platyplaty.ui.command_prompt import CommandPrompt
 
     command_line = app.query_one(CommandLine)
     callback = create_command_callback(ctx, app)
     previous_focus_id = get_previous_focus_id(ctx)
-    command_line.show_command_prompt(callback, previous_focus_id)
+    completer = CommandCompleter(
+        app.query_one(CommandPrompt), get_file_browser_current_dir(app)
+    )
+    command_line.show_command_prompt(
+        callback,
+        previous_focus_id,
+        on_change=completer.on_change,
+        key_handler=completer.handle_key,
+    )
 
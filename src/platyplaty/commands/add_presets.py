@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Add presets command handler.
+
+Implements the :add command for adding every preset in a directory, or
+matching a glob pattern, to the playlist.
+"""
+
+import glob
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from platyplaty.bulk_add_actions import start_bulk_add
+from platyplaty.commands.load_helpers import expand_command_path
+
+if TYPE_CHECKING:
+    from platyplaty.app import PlatyplatyApp
+    from platyplaty.app_context import AppContext
+
+
+async def execute(
+    args: str | None, ctx: "AppContext", app: "PlatyplatyApp", base_dir: Path
+) -> tuple[bool, str | None]:
+    """Execute the :add command.
+
+    Directories are searched recursively for .milk files. A path that
+    exists is taken literally, even if it contains glob characters;
+    anything else is expanded as a pattern. The presets are added in
+    the background; they appear in the playlist, behind a
+    single undo step, once all have been validated.
+
+    Args:
+        args: Command arguments (directory, .milk file or glob pattern).
+        ctx: Application context.
+        app: The Textual application.
+        base_dir: Base directory for resolving relative paths.
+
+    Returns:
+        Tuple of (success, error_message). error_message is None on success.
+    """
+    if args is None:
+        return (False, "Error: add requires a path argument")
+    target = expand_command_path(args, base_dir)
+    literal = os.path.lexists(target)
+    text = str(target)
+    if not literal and glob.escape(text) == text:
+        return (False, f"Error: no such file or directory: {args}")
+    error = start_bulk_add(ctx, app, target, literal)
+    if error is not None:
+        return (False, error)
+    return (True, None)
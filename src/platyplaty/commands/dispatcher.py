@@ -42,6 +42,9 @@ async def execute_command(
     if name == "save":
         from platyplaty.commands.save_playlist import execute as save_exec
         return await save_exec(args, ctx, app, base_dir)
+    if name == "add":
+        from platyplaty.commands.add_presets import execute as add_exec
+        return await add_exec(args, ctx, app, base_dir)
     if name == "clear":
         from platyplaty.commands.clear_playlist import execute as clear_exec
         return await clear_exec(ctx, app)
@@ -6,7 +6,8 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from platyplaty.commands.load_validation import validate_playlist_path
-from platyplaty.playlist_file import parse_playlist_file
+from platyplaty.playlist_persistence import replace_from_file
+from platyplaty.playlist_validation_actions import start_playlist_validation
 
 if TYPE_CHECKING:
     from platyplaty.app import PlatyplatyApp
@@ -68,14 +69,12 @@ async def perform_load(
         Tuple of (success, error_message).
     """
     try:
-        presets = parse_playlist_file(filepath)
+        replace_from_file(ctx.playlist, filepath)
     except Exception as e:
         return (False, f"Error: could not load playlist: {e}")
-    ctx.playlist.presets = presets
-    ctx.playlist.associated_filename = filepath
-    ctx.playlist.dirty_flag = False
-    ctx.playlist._selection_index = 0
+    ctx.playlist.set_selection(0)
     ctx.playlist.broken_indices = set()
+    start_playlist_validation(ctx, app)
     await start_playing_after_load(ctx, app)
     return (True, None)
 
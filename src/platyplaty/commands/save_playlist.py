@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from platyplaty.commands.load_helpers import expand_command_path
+from platyplaty.playlist_persistence import save_in_background
 
 if TYPE_CHECKING:
     from platyplaty.app import PlatyplatyApp
@@ -37,7 +38,7 @@ async def save_to_associated(ctx: "AppContext") -> tuple[bool, str | None]:
     """Save to the associated filename if it exists."""
     if ctx.playlist.associated_filename is None:
         return (False, "Error: No file name")
-    return perform_save(ctx, ctx.playlist.associated_filename)
+    return await perform_save(ctx, ctx.playlist.associated_filename)
 
 
 async def save_to_path(
@@ -57,7 +58,7 @@ async def check_and_save(
     if filepath.exists():
         await show_overwrite_prompt(filepath, ctx, app)
         return (True, None)
-    return perform_save(ctx, filepath)
+    return await perform_save(ctx, filepath)
 
 
 async def show_overwrite_prompt(
@@ -72,15 +73,17 @@ async def show_overwrite_prompt(
 
     async def on_response(confirmed: bool) -> None:
         if confirmed:
-            perform_save(ctx, filepath)
+            await perform_save(ctx, filepath)
 
     previous_focus_id = get_previous_focus_id(ctx)
     command_line.show_confirmation_prompt(msg, on_response, previous_focus_id)
 
-def perform_save(ctx: "AppContext", filepath: Path) -> tuple[bool, str | None]:
-    """Perform the actual save operation."""
+async def perform_save(
+    ctx: "AppContext", filepath: Path
+) -> tuple[bool, str | None]:
+    """Perform the actual save operation, writing in the background."""
     try:
-        ctx.playlist.save_to_file(filepath)
+        await save_in_background(ctx.playlist, filepath)
     except Exception as e:
         return (False, f"Error: could not save playlist: {e}")
     return (True, None)
@@ -15,6 +15,10 @@ def build_file_browser_dispatch_table(
     add_preset_or_load_playlist_keys: list[str],
     play_previous_preset_keys: list[str],
     play_next_preset_keys: list[str],
+    find_keys: list[str],
+    filter_keys: list[str],
+    toggle_flatten_keys: list[str],
+    add_directory_keys: list[str],
 ) -> DispatchTable:
     """Build dispatch table for file browser navigation key events."""
     return _build_table([
@@ -25,6 +29,10 @@ def build_file_browser_dispatch_table(
         (add_preset_or_load_playlist_keys, "add_preset_or_load_playlist"),
         (play_previous_preset_keys, "play_previous_preset"),
         (play_next_preset_keys, "play_next_preset"),
+        (find_keys, "find"),
+        (filter_keys, "filter"),
+        (toggle_flatten_keys, "toggle_flatten"),
+        (add_directory_keys, "add_directory"),
     ])
 
 
@@ -36,6 +44,7 @@ def build_global_dispatch_table(
     open_selected_keys: list[str],
     view_errors_keys: list[str],
     play_selection_keys: list[str],
+    find_preset_keys: list[str],
 ) -> DispatchTable:
     """Build dispatch table for global key events."""
     return _build_table([
@@ -46,6 +55,7 @@ def build_global_dispatch_table(
         (open_selected_keys, "open_selected"),
         (view_errors_keys, "view_errors"),
         (play_selection_keys, "play_selection"),
+        (find_preset_keys, "find_preset"),
     ])
 
 
@@ -64,6 +74,11 @@ def build_playlist_dispatch_table(
     page_down_keys: list[str],
     navigate_to_first_keys: list[str],
     navigate_to_last_keys: list[str],
+    toggle_mark_keys: list[str],
+    toggle_range_keys: list[str],
+    clear_marks_keys: list[str],
+    send_to_top_keys: list[str],
+    send_to_bottom_keys: list[str],
 ) -> DispatchTable:
     """Build dispatch table for playlist section key events."""
     return _build_table([
@@ -81,6 +96,11 @@ def build_playlist_dispatch_table(
         (page_down_keys, "page_down"),
         (navigate_to_first_keys, "navigate_to_first_preset"),
         (navigate_to_last_keys, "navigate_to_last_preset"),
+        (toggle_mark_keys, "toggle_mark"),
+        (toggle_range_keys, "toggle_range"),
+        (clear_marks_keys, "clear_marks"),
+        (send_to_top_keys, "send_to_top"),
+        (send_to_bottom_keys, "send_to_bottom"),
     ])
 
 
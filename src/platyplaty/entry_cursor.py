@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Playlist positions that follow an entry rather than an index.
+
+The selection and playing pointers of a playlist are EntryCursors: they
+remember the stable key of the entry they point at, plus the index it
+was last seen at. Reading the index checks that hint first, so after a
+delete, move or shuffle the pointer is found again without any action
+having to shift it, and an unchanged playlist costs one comparison.
+"""
+
+from platyplaty.preset_table import PresetTable
+
+
+class EntryCursor:
+    """A pointer to one playlist entry, tracked by key.
+
+    If the entry is removed the cursor keeps its last index, which is
+    what an index-based pointer would have done.
+    """
+
+    __slots__ = ("_key", "_index")
+
+    def __init__(self, index: int | None = None) -> None:
+        """Initialize a cursor not yet bound to an entry.
+
+        Args:
+            index: The initial index, or None for no entry.
+        """
+        self._key: int | None = None
+        self._index = index
+
+    def get(self, table: PresetTable) -> int | None:
+        """Return the current index of the entry.
+
+        Args:
+            table: The table the cursor points into.
+        """
+        if self._key is not None:
+            found = table.find_key(self._key, self._index)
+            if found is not None:
+                self._index = found
+        return self._index
+
+    def set(self, table: PresetTable, index: int | None) -> None:
+        """Point the cursor at the entry at index.
+
+        Args:
+            table: The table the cursor points into.
+            index: The entry's index. None, or an index outside the
+                table, is kept as a plain index.
+        """
+        self._index = index
+        self._key = None
+        if index is not None and 0 <= index < len(table):
+            self._key = table.key_at(index)
+
+    def rebind(self, old: PresetTable, new: PresetTable) -> None:
+        """Move the cursor to a replacement table, keeping its index.
+
+        Args:
+            old: The table the cursor pointed into.
+            new: The table replacing it.
+        """
+        self.set(new, self.get(old))
@@ -6,6 +6,15 @@ EXAMPLE_CONFIG = '''# Platyplaty configuration file
 # Optional: Path to .platy playlist file to load at startup
 # playlist = "/path/to/playlist.platy"
 
+# Save edits to the playlist file as they are made. Each edit is
+# appended to a hidden journal next to the file (.name.platy.journal),
+# which is folded back into the file in the background and on exit
+autosave = false
+
+# Optional: Preset directories to index in the background, so preset
+# checks and searches do not have to go back to the filesystem
+# preset-dirs = ["~/presets"]
+
 [renderer]
 # PulseAudio source for audio capture
 # Default: monitor of the default output sink
@@ -45,6 +54,9 @@ view-errors = ["e"]
 # Load preset into renderer (preview in file browser, play in playlist)
 play-selection = ["enter"]
 
+# Fuzzy-find a preset across all preset-dirs (needs preset-dirs)
+find-preset = ["ctrl+f"]
+
 # Keybindings for file browser section.
 [keybindings.file-browser]
 # Go to parent directory
@@ -59,6 +71,18 @@ play-previous-preset = ["K"]
 # Skip to next .milk file and play
 play-next-preset = ["J"]
 
+# Jump to the first entry starting with the typed text
+find = ["f"]
+
+# Show only entries whose name contains the typed text
+filter = ["slash"]
+
+# Toggle showing every .milk file beneath the current directory as one list
+toggle-flatten = ["F"]
+
+# Add every .milk file beneath the selected directory to the playlist
+add-directory = ["A"]
+
 # Keybindings and settings for playlist section.
 [keybindings.playlist]
 # Seconds to display each preset before advancing (must be >= 1)
@@ -70,13 +94,13 @@ play-previous = ["K"]
 # Select next preset and play
 play-next = ["J"]
 
-# Move selected item up in list
+# Move selected items up in list
 reorder-up = ["ctrl+k"]
 
-# Move selected item down in list
+# Move selected items down in list
 reorder-down = ["ctrl+j"]
 
-# Remove selected preset from playlist
+# Remove selected presets from playlist
 delete-from-playlist = ["D", "delete"]
 
 # Undo last playlist modification
@@ -106,6 +130,21 @@ navigate-to-first-preset = ["home"]
 # Go to last preset
 navigate-to-last-preset = ["end"]
 
+# Mark or unmark the selected preset for batch edits
+toggle-mark = ["m"]
+
+# Start or end a visual range of presets for batch edits
+toggle-range = ["v"]
+
+# Clear all marks and the visual range
+clear-marks = ["escape"]
+
+# Move selected presets to the top of the list
+send-to-top = ["T"]
+
+# Move selected presets to the bottom of the list
+send-to-bottom = ["B"]
+
 # Keybindings for error view section.
 [keybindings.error-view]
 # Clear all errors from log
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Cached file identity and realpath lookups.
+
+Resolving a path follows every symlink component and costs several
+system calls, which is too slow to repeat for every visible row on every
+paint or every cursor move. This module keeps two bounded, time-limited
+caches:
+
+- realpaths, for code that needs a canonical path string (directory
+  memory keys), and
+- file identities as (st_dev, st_ino), for code that only needs to know
+  whether two paths name the same file (bad presets, broken playlist
+  entries).
+
+Entries expire after IDENTITY_TTL_SECONDS so changes made outside
+platyplaty are eventually seen. Call clear_identity_caches() when the
+file browser re-reads the filesystem to drop stale entries immediately.
+"""
+
+import os
+from pathlib import Path
+
+import cachetools
+
+from platyplaty.file_stat import file_stat
+
+IDENTITY_TTL_SECONDS = 5.0
+
+FileIdentity = tuple[int, int]
+
+_realpath_cache: cachetools.TTLCache[tuple[Path], Path] = cachetools.TTLCache(
+    maxsize=4096, ttl=IDENTITY_TTL_SECONDS
+)
+_identity_cache: cachetools.TTLCache[tuple[Path], FileIdentity | None] = (
+    cachetools.TTLCache(maxsize=4096, ttl=IDENTITY_TTL_SECONDS)
+)
+
+
+@cachetools.cached(_realpath_cache)
+def resolve_cached(path: Path) -> Path:
+    """Return path with all symlinks resolved, using the realpath cache.
+
+    Args:
+        path: The path to resolve.
+
+    Returns:
+        The resolved absolute path.
+    """
+    return path.resolve()
+
+
+@cachetools.cached(_identity_cache)
+def file_identity(path: Path) -> FileIdentity | None:
+    """Return the (st_dev, st_ino) pair of the file path refers to.
+
+    Symlinks are followed, so a symlink and its target share an identity.
+
+    Args:
+        path: The path to identify.
+
+    Returns:
+        The device and inode numbers, or None if the file cannot be
+        stat'ed (missing, broken symlink, or permission denied).
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino)
+
+
+def stat_identity(path: Path) -> FileIdentity | None:
+    """Return the (st_dev, st_ino) of path from the shared stat cache.
+
+    Code that has just checked a path through file_stat gets its
+    identity this way without another system call.
+
+    Args:
+        path: The path to identify.
+
+    Returns:
+        The device and inode numbers, or None if the file cannot be
+        stat'ed.
+    """
+    st = file_stat(path).stat
+    return None if st is None else (st.st_dev, st.st_ino)
+
+
+def clear_identity_caches() -> None:
+    """Drop all cached realpaths and file identities."""
+    _realpath_cache.clear()
+    _identity_cache.clear()
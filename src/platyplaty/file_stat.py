@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Shared cache of lstat and stat results.
+
+The file browser, its size and count indicators and the preset
+validator all ask the same questions about the same paths: is it a
+symlink, does its target exist, is it a directory, how big is it. This
+module answers them from one bounded, time-limited cache holding both
+the lstat and the (symlink-following) stat result of each path, so a
+path costs at most two system calls per FILE_STAT_TTL_SECONDS however
+many callers look at it.
+
+Entries expire after FILE_STAT_TTL_SECONDS so changes made outside
+platyplaty are eventually seen. Call invalidate_file_stat() to drop
+one path, or every path, immediately.
+"""
+
+import os
+import stat
+import threading
+from pathlib import Path
+from typing import NamedTuple
+
+import cachetools
+
+FILE_STAT_TTL_SECONDS = 5.0
+
+# Paths kept in the cache; each holds up to two stat results
+FILE_STAT_CACHE_SIZE = 20000
+
+
+class FileStat(NamedTuple):
+    """The lstat and stat results of one path.
+
+    Attributes:
+        lstat: The path's own stat result, or None if it does not exist
+            or cannot be stat'ed.
+        stat: The stat result with symlinks followed, or None if the
+            path or its symlink target cannot be stat'ed.
+    """
+
+    lstat: os.stat_result | None
+    stat: os.stat_result | None
+
+    @property
+    def exists(self) -> bool:
+        """Return True if the path (or its symlink target) exists."""
+        return self.stat is not None
+
+    @property
+    def is_symlink(self) -> bool:
+        """Return True if the path itself is a symlink."""
+        return self.lstat is not None and stat.S_ISLNK(self.lstat.st_mode)
+
+    @property
+    def is_broken_symlink(self) -> bool:
+        """Return True if the path is a symlink whose target is missing."""
+        return self.is_symlink and self.stat is None
+
+    @property
+    def is_dir(self) -> bool:
+        """Return True if the path is, or links to, a directory."""
+        return self.stat is not None and stat.S_ISDIR(self.stat.st_mode)
+
+    @property
+    def size(self) -> int:
+        """Return the followed size in bytes, or 0 if unknown."""
+        return self.stat.st_size if self.stat is not None else 0
+
+    @property
+    def link_size(self) -> int:
+        """Return the path's own size in bytes, or 0 if unknown."""
+        return self.lstat.st_size if self.lstat is not None else 0
+
+
+_lock = threading.Lock()
+_stat_cache: cachetools.TTLCache[tuple[Path], FileStat] = cachetools.TTLCache(
+    maxsize=FILE_STAT_CACHE_SIZE, ttl=FILE_STAT_TTL_SECONDS
+)
+
+
+@cachetools.cached(_stat_cache, lock=_lock)
+def file_stat(path: Path) -> FileStat:
+    """Return the cached lstat and stat results of path.
+
+    The followed stat is only made when the path is a symlink; for
+    anything else it is the lstat result.
+
+    Args:
+        path: The path to stat.
+
+    Returns:
+        The path's FileStat.
+    """
+    try:
+        lst = os.lstat(path)
+    except OSError:
+        return FileStat(None, None)
+    if not stat.S_ISLNK(lst.st_mode):
+        return FileStat(lst, lst)
+    try:
+        return FileStat(lst, os.stat(path))
+    except OSError:
+        return FileStat(lst, None)
+
+
+def invalidate_file_stat(path: Path | None = None) -> None:
+    """Drop cached stat results.
+
+    Args:
+        path: The path to forget, or None to forget every path.
+    """
+    with _lock:
+        if path is None:
+            _stat_cache.clear()
+        else:
+            _stat_cache.pop((path,), None)
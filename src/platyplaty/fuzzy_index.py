@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""In-memory fuzzy name table for the preset finder.
+
+Matches a query against preset paths the way fzf does: every query
+character must appear in the path, in order, ignoring case. Results
+are ranked in tiers, best first:
+
+0. the file name starts with the query
+1. the file name contains the query
+2. the directory part of the path contains the query
+3. the query's characters appear in order somewhere in the path
+
+Within a tier, shorter file names rank first. Entries are numbered in
+that order when the table is built, so an entry's id is its tiebreak
+and each tier can be read in id order, stopping as soon as enough
+results are found. No tier loops over the whole table in Python:
+
+- tier 0 bisects the sorted file names (the prefix index);
+- tier 1 runs str.find over the file names joined by newlines, mapping
+  each hit back to its entry by bisection; it is skipped outright when
+  some pair of adjacent query characters occurs in no file name;
+- tier 2 matches the (far fewer) distinct directories, then merges
+  their entry id lists;
+- tier 3 only tests entries containing every query character, found
+  by ANDing per-character bitsets (Python ints, one bit per entry),
+  and tests them in batches through C-level compress/map pipelines.
+
+Paths added after the table was built take the next free ids, so they
+rank after older entries of the same tier until the table is rebuilt;
+removed paths are masked out. Once enough entries have churned,
+fragmented turns true and the owner should build a fresh table.
+"""
+
+import heapq
+import re
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from itertools import compress, repeat
+from operator import contains
+
+# Entries unpacked from a bitset at a time in the fuzzy tier
+BATCH_SIZE = 2048
+
+# Fraction of ids added or removed since the build that makes a table fragmented
+FRAGMENTATION_LIMIT = 0.25
+
+_FLAGS_TO_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+_DIGITS_TO_FLAGS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+class FuzzyIndex:
+    """Fuzzy-searchable table of preset paths.
+
+    Not thread-safe; threads sharing a table must serialize access.
+    """
+
+    def __init__(self, paths: Iterable[str] = ()) -> None:
+        """Build the table.
+
+        Args:
+            paths: Absolute preset paths; duplicates are ignored.
+        """
+        self._build(list(dict.fromkeys(paths)))
+
+    def __len__(self) -> int:
+        """Return the number of paths in the table."""
+        return len(self._ids)
+
+    def __contains__(self, path: object) -> bool:
+        """Return True if path is in the table."""
+        return path in self._ids
+
+    def paths(self) -> set[str]:
+        """Return every path in the table."""
+        return set(self._ids)
+
+    def add(self, paths: Iterable[str]) -> None:
+        """Add paths that are not in the table yet.
+
+        Args:
+            paths: Absolute preset paths.
+        """
+        base = len(self._paths)
+        new = [p for p in dict.fromkeys(paths) if p not in self._ids]
+        if not new:
+            return
+        folded = [p.lower() for p in new]
+        self._paths.extend(new)
+        self._folded.extend(folded)
+        for entry_id, (path, text) in enumerate(zip(new, folded, strict=True), base):
+            self._ids[path] = entry_id
+            directory, name = _split(text)
+            self._names.append(name)
+            self._name_pairs.update(_pairs(name))
+            position = bisect_right(self._sorted_names, name)
+            self._sorted_names.insert(position, name)
+            self._sorted_ids.insert(position, entry_id)
+            self._dir_entries.setdefault(directory, []).append(entry_id)
+        self._alive.extend(b"\x01" * len(new))
+        self._live |= ((1 << len(new)) - 1) << base
+        for char, bits in _char_bitsets(folded).items():
+            self._char_bits[char] = self._char_bits.get(char, 0) | bits << base
+        self._churn += len(new)
+
+    def remove(self, paths: Iterable[str]) -> None:
+        """Remove paths from the table; unknown paths are ignored.
+
+        Args:
+            paths: Absolute preset paths.
+        """
+        dead = 0
+        for path in paths:
+            entry_id = self._ids.pop(path, None)
+            if entry_id is not None:
+                self._alive[entry_id] = 0
+                dead |= 1 << entry_id
+                self._churn += 1
+        self._live &= ~dead
+
+    @property
+    def fragmented(self) -> bool:
+        """Return True once enough entries changed to warrant a rebuild."""
+        return self._churn > FRAGMENTATION_LIMIT * max(len(self._paths), 1)
+
+    def search(self, query: str, limit: int = 50) -> list[str]:
+        """Return the best matching paths, best first.
+
+        Args:
+            query: The text typed by the user; case is ignored.
+            limit: Maximum number of paths to return.
+
+        Returns:
+            Up to limit paths ranked by tier, then by file name length.
+        """
+        folded = query.lower()
+        if not folded or "\n" in folded or limit <= 0:
+            return []
+        found: dict[int, None] = {}
+        tiers = (
+            self._prefix_ids(folded, limit),
+            self._name_substring_ids(folded),
+            self._directory_ids(folded),
+            self._fuzzy_ids(folded, found),
+        )
+        for tier in tiers:
+            for entry_id in tier:
+                found.setdefault(entry_id)
+                if len(found) >= limit:
+                    return [self._paths[i] for i in found]
+        return [self._paths[i] for i in found]
+
+    def _build(self, paths: list[str]) -> None:
+        """Number entries by (file name length, path) and index them."""
+        keyed = sorted(
+            (len(_split(folded)[1]), folded, path)
+            for path in paths
+            for folded in (path.lower(),)
+        )
+        self._paths: list[str] = [path for _, _, path in keyed]
+        self._folded: list[str] = [folded for _, folded, _ in keyed]
+        self._ids: dict[str, int] = {p: i for i, p in enumerate(self._paths)}
+        self._names: list[str] = []
+        self._dir_entries: dict[str, list[int]] = {}
+        for entry_id, text in enumerate(self._folded):
+            directory, name = _split(text)
+            self._names.append(name)
+            self._dir_entries.setdefault(directory, []).append(entry_id)
+        self._alive = bytearray(b"\x01" * len(self._paths))
+        self._live = (1 << len(self._paths)) - 1
+        self._char_bits = _char_bitsets(self._folded)
+        order = sorted(range(len(self._names)), key=self._names.__getitem__)
+        self._sorted_names = [self._names[i] for i in order]
+        self._sorted_ids = order
+        self._name_blob = "\n".join(self._names)
+        self._name_pairs = _pairs(self._name_blob)
+        self._name_starts: list[int] = []
+        offset = 0
+        for name in self._names:
+            self._name_starts.append(offset)
+            offset += len(name) + 1
+        self._built = len(self._paths)
+        self._churn = 0
+
+    def _prefix_ids(self, folded: str, limit: int) -> Iterator[int]:
+        """Yield live ids whose file name starts with folded, best first."""
+        names = self._sorted_names
+        start = bisect_left(names, folded)
+        end = bisect_left(names, folded + "\U0010ffff", lo=start)
+        ids = self._sorted_ids[start:end]
+        live = compress(ids, map(self._alive.__getitem__, ids))
+        yield from heapq.nsmallest(limit, live)
+
+    def _name_substring_ids(self, folded: str) -> Iterator[int]:
+        """Yield live ids whose file name contains folded, in id order."""
+        if not _pairs(folded) <= self._name_pairs:
+            return
+        alive, blob, starts = self._alive, self._name_blob, self._name_starts
+        pos = blob.find(folded)
+        while pos != -1:
+            entry_id = bisect_right(starts, pos) - 1
+            if alive[entry_id]:
+                yield entry_id
+            if entry_id + 1 >= len(starts):
+                break
+            pos = blob.find(folded, starts[entry_id + 1])
+        for entry_id in range(self._built, len(self._paths)):
+            if alive[entry_id] and folded in self._names[entry_id]:
+                yield entry_id
+
+    def _directory_ids(self, folded: str) -> Iterator[int]:
+        """Yield live ids whose directory contains folded, in id order."""
+        directories = self._dir_entries
+        matched = compress(directories, map(contains, directories, repeat(folded)))
+        alive = self._alive
+        merged = heapq.merge(*(directories[d] for d in matched))
+        return (entry_id for entry_id in merged if alive[entry_id])
+
+    def _fuzzy_ids(self, folded: str, skip: dict[int, None]) -> Iterator[int]:
+        """Yield ids whose path holds folded's characters in order.
+
+        Entries already in skip are passed over. Ids come in order, in
+        batches, so the caller can stop once it has enough.
+        """
+        mask = self._live
+        for char in set(folded):
+            mask &= self._char_bits.get(char, 0)
+        search = _subsequence_pattern(folded).search
+        paths = self._folded
+        for low, flags in _windows(mask):
+            ids = compress(range(low, low + len(flags)), flags)
+            texts = compress(paths[low : low + len(flags)], flags)
+            for entry_id in compress(ids, map(search, texts)):
+                if entry_id not in skip:
+                    yield entry_id
+
+
+def _subsequence_pattern(folded: str) -> re.Pattern[str]:
+    """Compile a pattern matching folded's characters in order.
+
+    Each gap is a possessive run of anything but the next character, so
+    the match takes the earliest occurrence of each character and never
+    backtracks; "a.*?b.*?c" is exponential on queries like "eeeeee".
+    """
+    parts = [re.escape(folded[0])]
+    for char in folded[1:]:
+        parts.append(f"[^{re.escape(char)}]*+{re.escape(char)}")
+    return re.compile("".join(parts))
+
+
+def _split(path: str) -> tuple[str, str]:
+    """Split a slash-separated path into its directory and file name."""
+    cut = path.rfind("/") + 1
+    return path[:cut], path[cut:]
+
+
+def _pairs(text: str) -> set[str]:
+    """Return the set of adjacent character pairs in text."""
+    return set(map(str.__add__, text, text[1:]))
+
+
+def _char_bitsets(texts: list[str]) -> dict[str, int]:
+    """Map each character to an int whose bit i is set if texts[i] has it."""
+    chars = set().union(*map(set, texts)) if texts else set()
+    return {
+        char: _flags_to_int(bytes(map(contains, texts, repeat(char))))
+        for char in chars
+    }
+
+
+def _flags_to_int(flags: bytes) -> int:
+    """Convert one 0/1 byte per entry into an int with one bit per entry."""
+    return int(flags[::-1].translate(_FLAGS_TO_DIGITS), 2)
+
+
+def _windows(mask: int) -> Iterator[tuple[int, bytes]]:
+    """Unpack mask BATCH_SIZE bits at a time, lowest bits first.
+
+    Yields (first bit position, one 0/1 byte per bit) for each window
+    with a bit set, so a caller that stops early does not unpack the
+    whole table.
+    """
+    low = 0
+    window_mask = (1 << BATCH_SIZE) - 1
+    while mask:
+        window = mask & window_mask
+        if window:
+            digits = format(window, "b").encode("ascii")[::-1]
+            yield low, digits.translate(_DIGITS_TO_FLAGS)
+        mask >>= BATCH_SIZE
+        low += BATCH_SIZE
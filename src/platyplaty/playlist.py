@@ -1,108 +1,255 @@
 #!/usr/bin/env python3
 """Playlist class for managing presets with navigation and state."""
 
+from collections.abc import Iterable, Sequence
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from platyplaty import playlist_modify as modify
 from platyplaty import playlist_navigation as nav
 from platyplaty import playlist_persistence as persist
+from platyplaty.entry_cursor import EntryCursor
+from platyplaty.file_identity import FileIdentity
+from platyplaty.preset_table import BROKEN, MARKED, FlagSet, PresetTable
+
+if TYPE_CHECKING:
+    from platyplaty.playlist_journal import PlaylistJournal
 
 
 class Playlist:
-    """Manages a list of presets with navigation and state tracking."""
+    """Manages a list of presets with navigation and state tracking.
+
+    Presets are held in a PresetTable, which stores entries compactly
+    and carries their stable keys and broken flags; assigning any
+    iterable of paths to presets converts it. The selection and playing
+    pointers follow their entries by key, so edits never have to shift
+    them.
+
+    Batch edits act on the multi-selection: the visual range between
+    the range anchor and the selection if one is active, else the
+    marked presets, else just the selected preset. Marks are an
+    entry flag and the anchor is another pointer, so both follow their
+    entries too.
+
+    With autosave on, a playlist associated with a file has a journal
+    that writes every edit to disk as it is made (see playlist_journal),
+    so it never has unsaved changes while the journal works.
+    """
 
-    presets: list[Path]
+    _presets: PresetTable
     loop: bool
-    _playing_index: int | None
-    _selection_index: int
+    _playing: EntryCursor
+    _selection: EntryCursor
+    _anchor: EntryCursor
     associated_filename: Path | None
-    dirty_flag: bool
-    broken_indices: set[int]
+    autosave: bool
+    journal: "PlaylistJournal | None"
+    _dirty: bool
 
-    def __init__(self, presets: list[Path], loop: bool = True) -> None:
+    def __init__(self, presets: Iterable[Path], loop: bool = True) -> None:
         """Initialize playlist with presets and optional loop setting."""
+        self._presets = PresetTable()
+        self._playing = EntryCursor(0)
+        self._selection = EntryCursor(0)
+        self._anchor = EntryCursor()
+        self.journal = None
         self.presets = presets
         self.loop = loop
-        self._playing_index = 0
-        self._selection_index = 0
         self.associated_filename = None
+        self.autosave = False
         self.dirty_flag = False
-        self.broken_indices: set[int] = set()
+
+    @property
+    def presets(self) -> PresetTable:
+        """Return the preset table."""
+        return self._presets
+
+    @presets.setter
+    def presets(self, presets: Iterable[Path]) -> None:
+        """Replace the presets; a PresetTable is used as is.
+
+        Any visual range ends, and an autosave journal moves to the new
+        presets.
+        """
+        if not isinstance(presets, PresetTable):
+            presets = PresetTable(presets)
+        old = self._presets
+        self._presets = presets
+        if self.journal is not None:
+            self.journal.rebind(presets)
+        self._playing.rebind(old, presets)
+        self._selection.rebind(old, presets)
+        self._anchor = EntryCursor()
+
+    @property
+    def dirty_flag(self) -> bool:
+        """Return True if there are unsaved changes."""
+        return self._dirty and (self.journal is None or self.journal.failed)
+
+    @dirty_flag.setter
+    def dirty_flag(self, dirty: bool) -> None:
+        """Record whether the presets differ from the saved file."""
+        self._dirty = dirty
+
+    @property
+    def broken_indices(self) -> FlagSet:
+        """Return the indices of broken presets, as a live set."""
+        return FlagSet(self._presets, BROKEN)
+
+    @broken_indices.setter
+    def broken_indices(self, indices: Iterable[int]) -> None:
+        """Mark exactly the given indices as broken."""
+        self._presets.clear_flag(BROKEN)
+        for index in indices:
+            self._presets.set_flag(index, BROKEN)
+
+    @property
+    def marked(self) -> FlagSet:
+        """Return the indices of marked presets, as a live set."""
+        return FlagSet(self._presets, MARKED)
+
+    def toggle_mark(self, index: int) -> None:
+        """Mark the preset at index, or unmark it if marked."""
+        marked = not self._presets.has_flag(index, MARKED)
+        self._presets.set_flag(index, MARKED, marked)
+
+    def start_range(self) -> None:
+        """Start a visual range anchored at the selection."""
+        self._anchor.set(self._presets, self.get_selection())
+
+    def clear_range(self) -> None:
+        """End the visual range, if any."""
+        self._anchor.set(self._presets, None)
+
+    def get_range(self) -> range | None:
+        """Return the indices in the visual range, or None if inactive."""
+        anchor = self._anchor.get(self._presets)
+        if anchor is None or not 0 <= anchor < len(self._presets):
+            return None
+        selection = self.get_selection()
+        return range(min(anchor, selection), max(anchor, selection) + 1)
+
+    def in_multiselect(self, index: int) -> bool:
+        """Return True if the preset at index is marked or in the range."""
+        visual = self.get_range()
+        if visual is not None:
+            return index in visual
+        return self._presets.has_flag(index, MARKED)
+
+    def target_indices(self) -> list[int]:
+        """Return the indices batch edits act on, in ascending order."""
+        visual = self.get_range()
+        if visual is not None:
+            return list(visual)
+        if self._presets.count_flagged(MARKED):
+            return list(self._presets.flagged(MARKED))
+        if not self._presets:
+            return []
+        return [self.get_selection()]
 
     def current(self) -> Path:
         """Return the current preset path."""
-        return nav.get_current(self.presets, self._playing_index)
+        return nav.get_current(self.presets, self.get_playing())
 
     def at_end(self) -> bool:
         """Return True if at the last preset."""
-        return nav.is_at_end(self.presets, self._playing_index)
+        return nav.is_at_end(self.presets, self.get_playing())
 
     def next(self) -> Path | None:
         """Advance to the next preset."""
-        result = nav.advance_next(self.presets, self._playing_index, self.loop)
+        result = nav.advance_next(self.presets, self.get_playing(), self.loop)
         if result is None:
             return None
-        self._playing_index, preset = result
+        index, preset = result
+        self.set_playing(index)
         return preset
 
     def previous(self) -> Path | None:
         """Move to the previous preset."""
-        result = nav.go_previous(self.presets, self._playing_index, self.loop)
+        result = nav.go_previous(self.presets, self.get_playing(), self.loop)
         if result is None:
             return None
-        self._playing_index, preset = result
+        index, preset = result
+        self.set_playing(index)
         return preset
 
     def get_selection(self) -> int:
         """Return the current selection index."""
-        return self._selection_index
+        return self._selection.get(self._presets) or 0
 
     def set_selection(self, index: int) -> None:
         """Set the selection index."""
-        self._selection_index = index
+        self._selection.set(self._presets, index)
 
     def get_playing(self) -> int | None:
         """Return the current playing index, or None if idle."""
-        return self._playing_index
+        return self._playing.get(self._presets)
 
     def set_playing(self, index: int | None) -> None:
         """Set the playing index. None means idle preset."""
-        self._playing_index = index
+        self._playing.set(self._presets, index)
 
     def add_preset(self, path: Path) -> None:
         """Add a preset at the end of the playlist."""
-        modify.add_preset_to_playlist(self.presets, self.broken_indices, path)
+        modify.add_preset_to_playlist(self.presets, path)
+        self.dirty_flag = True
+
+    def add_presets(
+        self,
+        paths: Sequence[Path],
+        valid: Sequence[bool],
+        identities: Sequence[FileIdentity | None] = (),
+    ) -> None:
+        """Add already validated presets at the end in one operation."""
+        if not paths:
+            return
+        modify.add_presets_to_playlist(self.presets, paths, valid, identities)
         self.dirty_flag = True
 
     def remove_preset(self, index: int) -> None:
         """Remove the preset at the given index."""
-        self.broken_indices = modify.remove_preset_from_playlist(
-            self.presets, self.broken_indices, index
-        )
+        modify.remove_preset_from_playlist(self.presets, index)
+        self.dirty_flag = True
+
+    def remove_presets(self, indices: Iterable[int]) -> None:
+        """Remove the presets at several indices in one operation."""
+        modify.remove_presets_from_playlist(self.presets, indices)
         self.dirty_flag = True
 
+    def move_presets(self, indices: Iterable[int], step: int) -> bool:
+        """Move several presets one step (-1 up, 1 down) as a block.
+
+        Returns False if none could move.
+        """
+        result = modify.move_presets_in_playlist(self.presets, indices, step)
+        self.dirty_flag = self.dirty_flag or result
+        return result
+
+    def move_presets_to_edge(self, indices: Iterable[int], top: bool) -> bool:
+        """Move several presets to the top or bottom, keeping their order.
+
+        Returns False if the order did not change.
+        """
+        result = modify.move_presets_to_edge_of_playlist(self.presets, indices, top)
+        self.dirty_flag = self.dirty_flag or result
+        return result
+
     def move_preset_up(self, index: int) -> bool:
         """Move preset at index up by one. Return False if at top."""
-        result = modify.move_preset_up_in_playlist(
-            self.presets, self.broken_indices, index
-        )
+        result = modify.move_preset_up_in_playlist(self.presets, index)
         self.dirty_flag = self.dirty_flag or result
         return result
 
     def move_preset_down(self, index: int) -> bool:
         """Move preset at index down by one. Return False if at bottom."""
-        result = modify.move_preset_down_in_playlist(
-            self.presets, self.broken_indices, index
-        )
+        result = modify.move_preset_down_in_playlist(self.presets, index)
         self.dirty_flag = self.dirty_flag or result
         return result
 
 
     def shuffle(self) -> None:
         """Shuffle the playlist in place."""
-        self.broken_indices = modify.shuffle_playlist(
-            self.presets, self.broken_indices
-        )
+        modify.shuffle_playlist(self.presets)
         self.dirty_flag = True
 
     def clear(self) -> None:
@@ -49,7 +49,8 @@ def find_preset_index(playlist: Playlist, path: Path) -> int | None:
     """Find the index of a preset in the playlist.
 
     If preset appears multiple times, prefer current playing index.
-    Otherwise return first instance.
+    Otherwise return first instance. The table's position index answers
+    this without scanning the playlist.
 
     Args:
         playlist: The playlist to search.
@@ -58,7 +59,7 @@ def find_preset_index(playlist: Playlist, path: Path) -> int | None:
     Returns:
         Index of the preset, or None if not in playlist.
     """
-    indices = [i for i, p in enumerate(playlist.presets) if p == path]
+    indices = playlist.presets.positions(path)
     if not indices:
         return None
     playing = playlist.get_playing()
@@ -10,7 +10,13 @@ if TYPE_CHECKING:
 
 
 async def delete_from_playlist(ctx: AppContext, app: PlatyplatyApp) -> None:
-    """Delete selected preset from playlist."""
+    """Delete the selected presets from the playlist.
+
+    Deletes the visual range or the marked presets if there are any,
+    else the preset under the selection, as one edit. The selection
+    lands where the first deleted preset was; if the playing preset
+    was deleted, the preset there is played instead.
+    """
     from platyplaty.playlist_action_helpers import (
         load_preset_at_index,
         refresh_playlist_view,
@@ -27,11 +33,12 @@ async def delete_from_playlist(ctx: AppContext, app: PlatyplatyApp) -> None:
     playlist = ctx.playlist
     if not playlist.presets:
         return
-    current = playlist.get_selection()
-    playing = playlist.get_playing()
-    was_playing = playing == current
+    indices = playlist.target_indices()
+    current = indices[0]
+    was_playing = playlist.get_playing() in set(indices)
     push_undo_snapshot(ctx)
-    playlist.remove_preset(current)
+    playlist.clear_range()
+    playlist.remove_presets(indices)
     if not playlist.presets:
         playlist.set_selection(0)
         playlist.set_playing(None)
@@ -42,6 +49,4 @@ async def delete_from_playlist(ctx: AppContext, app: PlatyplatyApp) -> None:
     if was_playing:
         playlist.set_playing(new_selection)
         await load_preset_at_index(ctx, app, new_selection)
-    elif playing is not None and playing > current:
-        playlist.set_playing(playing - 1)
     refresh_playlist_view(app)
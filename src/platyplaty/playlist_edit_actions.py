@@ -23,21 +23,15 @@ async def shuffle_playlist(ctx: AppContext, app: PlatyplatyApp) -> None:
     playlist = ctx.playlist
     if len(playlist.presets) < 2:
         return
-    selected_path = playlist.presets[playlist.get_selection()]
-    playing_idx = playlist.get_playing()
-    playing_path = playlist.presets[playing_idx] if playing_idx is not None else None
     push_undo_snapshot(ctx)
     playlist.shuffle()
-    playlist.set_selection(playlist.presets.index(selected_path))
-    if playing_path is not None:
-        playlist.set_playing(playlist.presets.index(playing_path))
     refresh_playlist_view(app)
 
 
 async def save_playlist(ctx: AppContext, app: PlatyplatyApp) -> None:
     """Save playlist to associated filename."""
     from platyplaty.playlist_action_helpers import refresh_playlist_view
-    from platyplaty.playlist_persistence import save_to_file
+    from platyplaty.playlist_persistence import save_in_background
     from platyplaty.ui.transient_error import show_transient_error
 
     playlist = ctx.playlist
@@ -45,7 +39,7 @@ async def save_playlist(ctx: AppContext, app: PlatyplatyApp) -> None:
         show_transient_error(app, "Error: No file name")
         return
     try:
-        save_to_file(playlist)
+        await save_in_background(playlist)
     except OSError as e:
         show_transient_error(app, f"Error: could not save playlist: {e}")
         return
@@ -4,24 +4,34 @@
 Handles reading and writing .platy playlist files.
 """
 
+from collections.abc import Iterable, Sequence
+from itertools import islice
 from pathlib import Path
 
+from platyplaty.atomic_file import write_atomically
 from platyplaty.playlist_validation import (
     InvalidExtensionError,
     expand_path,
     is_absolute_path,
     raise_if_errors,
 )
+from platyplaty.preset_table import PresetTable
 
+# Lines parsed together; plain blocks are checked as a whole
+_BLOCK_LINES = 65536
 
-def parse_playlist_file(filepath: Path) -> list[Path]:
-    """Parse a .platy playlist file and return list of preset paths.
+
+def parse_playlist_file(filepath: Path) -> PresetTable:
+    """Parse a .platy playlist file and return its preset paths.
+
+    The file is read through a buffered reader a block at a time, so
+    its whole content is never held in memory at once.
 
     Args:
         filepath: Path to the .platy file.
 
     Returns:
-        List of absolute Path objects for each preset.
+        Table of absolute paths, one per preset.
 
     Raises:
         RelativePathError: If any path is relative.
@@ -29,47 +39,113 @@ def parse_playlist_file(filepath: Path) -> list[Path]:
         FileNotFoundError: If the file doesn't exist.
         PermissionError: If the file can't be read.
     """
-    content = filepath.read_text()
-    return parse_playlist_content(content)
+    with filepath.open() as lines:
+        return parse_playlist_lines(lines)
 
 
-def parse_playlist_content(content: str) -> list[Path]:
-    """Parse playlist content and return list of preset paths.
+def parse_playlist_content(content: str) -> PresetTable:
+    """Parse playlist content and return its preset paths.
 
     Args:
         content: The text content of a playlist file.
 
     Returns:
-        List of absolute Path objects for each preset.
+        Table of absolute paths, one per preset.
+
+    Raises:
+        RelativePathError: If any path is relative.
+        InvalidExtensionError: If any path doesn't end with .milk.
+    """
+    return parse_playlist_lines(content.splitlines())
+
+
+def parse_playlist_lines(lines: Iterable[str]) -> PresetTable:
+    """Parse playlist lines and return their preset paths.
+
+    Lines are taken in blocks. A block holding only plain absolute
+    .milk paths, which is what saved playlists contain, is checked with
+    a few whole-block string operations and stored without creating
+    Path objects. Any other block is parsed line by line, expanding "~",
+    normalizing paths and recording errors. Parsing stops at the first
+    relative path.
+
+    Args:
+        lines: The lines of a playlist file, with or without newlines.
+
+    Returns:
+        Table of absolute paths, one per preset.
 
     Raises:
         RelativePathError: If any path is relative.
         InvalidExtensionError: If any path doesn't end with .milk.
     """
-    lines = content.splitlines()
-    relative_errors: list[int] = []
+    paths = PresetTable()
     extension_errors: list[int] = []
-    paths: list[Path] = []
+    line_iter = iter(lines)
+    first_line = 1
+    while block := list(islice(line_iter, _BLOCK_LINES)):
+        entries = list(filter(None, map(str.strip, block)))
+        if _are_plain_presets(entries):
+            paths.extend_strings(entries)
+        else:
+            _parse_block(block, first_line, paths, extension_errors)
+        first_line += len(block)
+    raise_if_errors([], extension_errors)
+    return paths
+
+
+def _are_plain_presets(entries: list[str]) -> bool:
+    """Return True if entries can be stored as they are.
+
+    That is, each is an absolute .milk path without "~" and already in
+    the form str(Path) gives it: no empty or "." components. Each check
+    is one search of the joined entries.
+    """
+    text = "\n" + "\n".join(entries) + "\n"
+    count = len(entries)
+    return (
+        text.count("\n/") == count
+        and text.lower().count(".milk\n") == count
+        and "//" not in text
+        and "/./" not in text
+    )
+
+
+def _parse_block(
+    block: list[str],
+    first_line: int,
+    paths: PresetTable,
+    extension_errors: list[int],
+) -> None:
+    """Parse a block of lines one at a time.
+
+    Args:
+        block: The lines.
+        first_line: The line number of the block's first line.
+        paths: Table the block's presets are appended to.
+        extension_errors: Line numbers of non-.milk paths; appended to.
 
-    for line_num, line in enumerate(lines, start=1):
+    Raises:
+        RelativePathError: At the first relative path.
+    """
+    for line_num, line in enumerate(block, start=first_line):
         stripped = line.strip()
         if not stripped:
             continue
         if not is_absolute_path(stripped):
-            relative_errors.append(line_num)
-            continue
+            raise_if_errors([line_num], [])
         if not stripped.lower().endswith('.milk'):
             extension_errors.append(line_num)
             continue
         paths.append(expand_path(stripped))
 
-    raise_if_errors(relative_errors, extension_errors)
-    return paths
-
 
-def write_playlist_file(filepath: Path, presets: list[Path]) -> None:
+def write_playlist_file(filepath: Path, presets: Sequence[Path]) -> None:
     """Write a list of preset paths to a .platy playlist file.
 
+    The file is replaced atomically, so a crash during the write leaves
+    the previous version intact.
+
     Args:
         filepath: Path where the playlist will be saved.
         presets: List of preset paths to write.
@@ -81,7 +157,8 @@ def write_playlist_file(filepath: Path, presets: list[Path]) -> None:
     """
     if not filepath.suffix.lower() == '.platy':
         raise InvalidExtensionError("filename must end with .platy")
-    content = "\n".join(str(p) for p in presets)
-    if content:
-        content += "\n"
-    filepath.write_text(content)
+    strings = (
+        presets.strings() if isinstance(presets, PresetTable)
+        else map(str, presets)
+    )
+    write_atomically(filepath, (f"{text}\n" for text in strings))
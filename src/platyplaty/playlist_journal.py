@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""Append-only autosave journal for a playlist file.
+
+While autosave is on, a playlist's edits are not written by rewriting
+its .platy file. Instead each edit is appended as a short record to a
+journal kept next to it (".name.platy.journal"), so saving an edit
+costs I/O in proportion to the edit, not the playlist. Records are
+written and synced to disk in batches by a single background thread.
+
+The .platy file plus its journal is the playlist. Once the journal
+has recorded more entries than the playlist holds (a permutation's
+indices count for an eighth of an entry each), it is compacted in the
+background: the .platy file is atomically rewritten with the current
+entries and a new, empty journal is started. Saving to the file
+compacts it the same way. Only edits that can't be described as one
+of the records below, such as assigning to an extended slice, compact
+it at once. Replacing the whole table, as undo and redo do, is
+recorded as one splice of the span that differs.
+
+The journal's first line records the size, modification time and
+inode of the .platy file it applies to. A journal left behind by an
+interrupted compaction, or by an edit made to the file elsewhere, does
+not match and is ignored. A record cut short by a crash ends the
+replay; the edits before it are kept.
+
+Records, one per line, with fields separated by tabs:
+
+    S start stop count    entries start to stop replaced by the
+                          count paths on the following lines
+    X i j                 entries i and j swapped
+    D i ...               entries at the ascending indices removed
+    R                     entries reversed
+    P i ...               entry i moved to index 0, the next to 1, ...
+"""
+
+import contextlib
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import TextIO
+
+from platyplaty.atomic_file import write_atomically
+from platyplaty.playlist_file import parse_playlist_file, write_playlist_file
+from platyplaty.playlist_validation import PlaylistFileError
+from platyplaty.preset_table import PresetTable, common_affixes
+
+# First field of the journal's first line
+_MAGIC = "platyplaty-journal"
+_VERSION = "1"
+
+# Entries journaled before compacting, however small the playlist
+_MIN_COMPACT_ENTRIES = 1000
+
+# Permutation indices counted as one journaled entry
+_INDICES_PER_ENTRY = 8
+
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="playlist-journal")
+
+
+def journal_path(filepath: Path) -> Path:
+    """Return the journal file of a playlist file."""
+    return filepath.with_name(f".{filepath.name}.journal")
+
+
+def read_journaled_playlist(filepath: Path) -> tuple[PresetTable, bool]:
+    """Parse a playlist file and replay its journal, if it has one.
+
+    Args:
+        filepath: Path to the .platy file.
+
+    Returns:
+        The playlist's entries, and True if journaled edits were
+        applied to them.
+
+    Raises:
+        RelativePathError: If any path in the file is relative.
+        InvalidExtensionError: If any path doesn't end with .milk.
+        OSError: If the file can't be read.
+    """
+    header = _header(os.stat(filepath))
+    presets = parse_playlist_file(filepath)
+    try:
+        with journal_path(filepath).open() as journal:
+            if journal.readline() != header:
+                return presets, False
+            return presets, _replay(journal, presets) > 0
+    except (OSError, UnicodeDecodeError):
+        return presets, False
+
+
+def discard_journal(filepath: Path) -> None:
+    """Remove a playlist file's journal, if it has one."""
+    with contextlib.suppress(OSError):
+        os.unlink(journal_path(filepath))
+
+
+def write_in_background(filepath: Path, presets: PresetTable) -> Future[None]:
+    """Write a playlist file and remove its journal on the writer thread.
+
+    The write is queued after every journal write already queued, such
+    as those of a journal just closed.
+
+    Args:
+        filepath: The .platy file to write.
+        presets: The entries to write; must not be edited afterwards.
+
+    Returns:
+        A future that is done when the file has been written; its
+        exception is the write's error, if any.
+    """
+    return _executor.submit(_write_and_discard, filepath, presets)
+
+
+def _write_and_discard(filepath: Path, presets: PresetTable) -> None:
+    """Writer job: write a playlist file, then remove its journal."""
+    write_playlist_file(filepath, presets)
+    discard_journal(filepath)
+
+
+class PlaylistJournal:
+    """The autosave journal of one playlist file.
+
+    Listens to the edits of one PresetTable at a time (see
+    PresetTable.listener). Must be used from one thread; the files are
+    written by a background thread.
+    """
+
+    def __init__(
+        self, filepath: Path, presets: PresetTable, compact: bool = False
+    ) -> None:
+        """Start journaling a playlist's edits.
+
+        Args:
+            filepath: The .platy file the entries were read from or
+                saved to.
+            presets: The entries, as they are in the file plus any
+                existing journal.
+            compact: True to rewrite the file with the entries first,
+                as when existing journaled edits were replayed.
+        """
+        self.filepath = filepath
+        self._presets = presets
+        self._lock = threading.Lock()
+        self._pending: list[str] = []
+        self._generation = 0
+        self._flush_scheduled = False
+        self._entries = 0
+        self._base_size = len(presets)
+        self._file: TextIO | None = None
+        self._error: Exception | None = None
+        self._closed = False
+        presets.listener = self
+        if compact:
+            self.compact()
+        else:
+            _executor.submit(self._guard, self._new_journal)
+
+    @property
+    def failed(self) -> bool:
+        """Return True if writing the journal or the file has failed."""
+        return self._error is not None
+
+    def rebind(self, presets: PresetTable) -> None:
+        """Journal another table, whose entries replace the current ones.
+
+        The replacement is recorded as a splice of the span where the
+        two tables differ, so restoring an undo snapshot costs a record
+        in proportion to the edit being undone.
+
+        Args:
+            presets: The new entries, e.g. an undo snapshot's.
+        """
+        old = self._presets
+        old.listener = None
+        self._presets = presets
+        presets.listener = self
+        head, tail = common_affixes(old, presets)
+        if head + tail < max(len(old), len(presets)):
+            changed = presets[head : len(presets) - tail].strings()
+            self.spliced(head, len(old) - tail, changed)
+
+    def compact(self) -> Future[None]:
+        """Rewrite the file with the current entries in the background.
+
+        Returns:
+            A future that is done when the file has been written; its
+            exception is the write's error, if any.
+        """
+        return _executor.submit(self._compact, *self._cut(), False)
+
+    def close(self, compact: bool = False) -> Future[None]:
+        """Stop journaling; pending writes finish in the background.
+
+        Args:
+            compact: True to fold the journal into the file and remove
+                it, if any edits were recorded.
+
+        Returns:
+            A future that is done when the journal is closed; its
+            exception is the compaction's error, if any.
+        """
+        if self._closed:
+            return _executor.submit(_nothing)
+        self._closed = True
+        self._presets.listener = None
+        edited = self._entries > 0 or bool(self._pending)
+        snapshot, records = self._cut()
+        if compact and edited:
+            future = _executor.submit(self._compact, snapshot, records, True)
+        else:
+            future = _executor.submit(self._guard, self._append, records)
+        _executor.submit(self._close_file)
+        return future
+
+    def spliced(self, start: int, stop: int, strings: list[str]) -> None:
+        """Record that entries start to stop were replaced."""
+        paths = "".join(f"{text}\n" for text in strings)
+        self._record(f"S\t{start}\t{stop}\t{len(strings)}\n{paths}", len(strings))
+
+    def swapped(self, i: int, j: int) -> None:
+        """Record that two entries were exchanged."""
+        self._record(f"X\t{i}\t{j}\n")
+
+    def deleted(self, indices: list[int]) -> None:
+        """Record that entries were removed."""
+        self._record("\t".join(["D", *map(str, indices)]) + "\n")
+
+    def reversed(self) -> None:
+        """Record that the entries were reversed."""
+        self._record("R\n")
+
+    def permuted(self, order: list[int]) -> None:
+        """Record that the entries were rearranged."""
+        text = "\t".join(["P", *map(str, order)]) + "\n"
+        self._record(text, len(order) // _INDICES_PER_ENTRY)
+
+    def rewritten(self) -> None:
+        """Compact, since the edit can't be recorded."""
+        self.compact()
+
+    def _record(self, text: str, entries: int = 1) -> None:
+        """Queue a record, compacting instead once enough have been queued.
+
+        Args:
+            text: The record.
+            entries: How many entries the record counts for towards
+                compaction.
+        """
+        self._entries += max(entries, 1)
+        if self._entries > max(_MIN_COMPACT_ENTRIES, self._base_size):
+            self.compact()
+            return
+        with self._lock:
+            self._pending.append(text)
+            schedule = not self._flush_scheduled
+            self._flush_scheduled = True
+        if schedule:
+            _executor.submit(self._flush, self._generation)
+
+    def _cut(self) -> tuple[PresetTable, list[str]]:
+        """Start a new generation at the current entries.
+
+        Returns:
+            A snapshot of the entries, and the records queued before it,
+            which belong to the old journal.
+        """
+        snapshot = self._presets.copy()
+        self._entries = 0
+        self._base_size = len(snapshot)
+        with self._lock:
+            records, self._pending = self._pending, []
+            self._generation += 1
+            self._flush_scheduled = False
+        return snapshot, records
+
+    def _compact(
+        self, snapshot: PresetTable, records: list[str], remove: bool
+    ) -> None:
+        """Writer job: finish the old journal, rewrite the file, start anew.
+
+        The old journal is completed first, so it is still whole if
+        the file can't be written.
+
+        Args:
+            snapshot: The entries to write.
+            records: Records queued before the snapshot was taken.
+            remove: True to remove the journal instead of starting one.
+
+        Raises:
+            OSError: If the file can't be written.
+            InvalidExtensionError: If the file isn't a .platy file.
+        """
+        self._guard(self._append, records)
+        self._close_file()
+        try:
+            write_playlist_file(self.filepath, snapshot)
+        except (OSError, PlaylistFileError) as e:
+            self._error = e
+            raise
+        if remove:
+            discard_journal(self.filepath)
+        else:
+            self._guard(self._new_journal)
+
+    def _flush(self, generation: int) -> None:
+        """Writer job: append the queued records of a generation."""
+        with self._lock:
+            if generation != self._generation:
+                return
+            records, self._pending = self._pending, []
+            self._flush_scheduled = False
+        self._guard(self._append, records)
+
+    def _new_journal(self) -> None:
+        """Replace the journal with one holding just a header."""
+        self._close_file()
+        path = journal_path(self.filepath)
+        write_atomically(path, [_header(os.stat(self.filepath))])
+        self._file = path.open("a")
+
+    def _append(self, records: list[str]) -> None:
+        """Append records to the journal and sync them to disk."""
+        if records and self._file is not None:
+            self._file.writelines(records)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def _close_file(self) -> None:
+        """Close the open journal file, if any."""
+        if self._file is not None:
+            with contextlib.suppress(OSError):
+                self._file.close()
+            self._file = None
+
+    def _guard(self, write: Callable[..., None], *args: list[str]) -> None:
+        """Run a write, recording its error and closing the journal."""
+        try:
+            write(*args)
+        except OSError as e:
+            self._error = e
+            self._close_file()
+
+
+def _nothing() -> None:
+    """Writer job that does nothing, for a future ordered after the queue."""
+
+
+def _header(status: os.stat_result) -> str:
+    """Return the journal header line for a playlist file's status."""
+    fields = (status.st_size, status.st_mtime_ns, status.st_dev, status.st_ino)
+    return "\t".join([_MAGIC, _VERSION, *map(str, fields)]) + "\n"
+
+
+def _replay(journal: TextIO, presets: PresetTable) -> int:
+    """Apply a journal's records to presets, stopping at a damaged one.
+
+    Args:
+        journal: The journal, positioned after its header.
+        presets: The entries to edit.
+
+    Returns:
+        The number of records applied.
+    """
+    applied = 0
+    while line := journal.readline():
+        try:
+            if not line.endswith("\n"):
+                break
+            op, *args = line.rstrip("\n").split("\t")
+            if op == "S":
+                start, stop, count = map(int, args)
+                strings = [journal.readline() for _ in range(count)]
+                if not all(text.endswith("\n") for text in strings):
+                    break
+                if not 0 <= start <= stop <= len(presets):
+                    break
+                new = PresetTable.from_strings(text[:-1] for text in strings)
+                presets[start:stop] = new
+            elif op == "X":
+                i, j = map(int, args)
+                if not (0 <= i < len(presets) and 0 <= j < len(presets)):
+                    break
+                presets.swap(i, j)
+            elif op == "D":
+                indices = list(map(int, args))
+                if not all(0 <= index < len(presets) for index in indices):
+                    break
+                presets.delete_indices(indices)
+            elif op == "R" and not args:
+                presets.reverse()
+            elif op == "P":
+                order = list(map(int, args))
+                if sorted(order) != list(range(len(presets))):
+                    break
+                presets.permute(order)
+            else:
+                break
+        except (ValueError, IndexError):
+            break
+        applied += 1
+    return applied
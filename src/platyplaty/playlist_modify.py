@@ -1,92 +1,138 @@
 #!/usr/bin/env python3
-"""Functions for modifying playlists with dirty flag and broken index tracking."""
+"""Functions for modifying playlists with broken flag tracking.
 
+Broken flags are stored in the PresetTable alongside each entry, so
+they follow removes, reorders and shuffles without being adjusted.
+"""
+
+from collections.abc import Iterable, Sequence
 from pathlib import Path
 
 from platyplaty import playlist_broken as broken
 from platyplaty import playlist_operations as ops
+from platyplaty.file_identity import FileIdentity, stat_identity
+from platyplaty.preset_table import BROKEN, FlagSet, PresetTable
 
 
-def add_preset_to_playlist(
-    presets: list[Path], broken_indices: set[int], path: Path
-) -> None:
+def add_preset_to_playlist(presets: PresetTable, path: Path) -> None:
     """Add a preset at the end of the playlist and validate it.
 
     Args:
-        presets: List of preset paths (modified in place).
-        broken_indices: Set of broken indices (modified in place).
+        presets: Table of preset paths (modified in place).
         path: Path of the preset to add.
     """
     ops.add_preset(presets, path)
-    broken.validate_new_preset(broken_indices, path, len(presets) - 1)
+    broken.validate_new_preset(FlagSet(presets, BROKEN), path, len(presets) - 1)
+    presets.record_identities([(str(path), stat_identity(path))])
 
 
-def remove_preset_from_playlist(
-    presets: list[Path], broken_indices: set[int], index: int
-) -> set[int]:
-    """Remove a preset and adjust broken indices.
+def add_presets_to_playlist(
+    presets: PresetTable,
+    paths: Sequence[Path],
+    valid: Sequence[bool],
+    identities: Sequence[FileIdentity | None] = (),
+) -> None:
+    """Add already validated presets at the end of the playlist.
 
     Args:
-        presets: List of preset paths (modified in place).
-        broken_indices: Set of broken indices.
-        index: Index of the preset to remove.
+        presets: Table of preset paths (modified in place).
+        paths: Paths of the presets to add.
+        valid: Whether each path is a valid preset, in the same order.
+        identities: Each path's file identity found while validating
+            it, in the same order, if known.
+    """
+    start = len(presets)
+    presets.extend(paths)
+    for offset, ok in enumerate(valid):
+        if not ok:
+            presets.set_flag(start + offset, BROKEN)
+    presets.record_identities(zip(map(str, paths), identities, strict=False))
 
-    Returns:
-        Updated set of broken indices.
+
+def remove_preset_from_playlist(presets: PresetTable, index: int) -> None:
+    """Remove a preset along with its broken flag.
+
+    Args:
+        presets: Table of preset paths (modified in place).
+        index: Index of the preset to remove.
     """
     ops.remove_preset(presets, index)
-    return broken.adjust_broken_indices_after_remove(broken_indices, index)
 
 
-def move_preset_up_in_playlist(
-    presets: list[Path], broken_indices: set[int], index: int
-) -> bool:
-    """Move a preset up and update broken indices if needed.
+def remove_presets_from_playlist(presets: PresetTable, indices: Iterable[int]) -> None:
+    """Remove several presets, with their flags, in one pass.
+
+    Args:
+        presets: Table of preset paths (modified in place).
+        indices: Indices of the presets to remove.
+    """
+    ops.remove_presets(presets, indices)
+
+
+def move_preset_up_in_playlist(presets: PresetTable, index: int) -> bool:
+    """Move a preset, and its broken flag, up.
 
     Args:
-        presets: List of preset paths (modified in place).
-        broken_indices: Set of broken indices (modified in place).
+        presets: Table of preset paths (modified in place).
         index: Index of the preset to move.
 
     Returns:
         True if moved, False if already at top.
     """
-    result = ops.move_preset_up(presets, index)
-    if result:
-        broken.swap_broken_indices(broken_indices, index - 1, index)
-    return result
+    return ops.move_preset_up(presets, index)
 
 
-def move_preset_down_in_playlist(
-    presets: list[Path], broken_indices: set[int], index: int
-) -> bool:
-    """Move a preset down and update broken indices if needed.
+def move_preset_down_in_playlist(presets: PresetTable, index: int) -> bool:
+    """Move a preset, and its broken flag, down.
 
     Args:
-        presets: List of preset paths (modified in place).
-        broken_indices: Set of broken indices (modified in place).
+        presets: Table of preset paths (modified in place).
         index: Index of the preset to move.
 
     Returns:
         True if moved, False if already at bottom.
     """
-    result = ops.move_preset_down(presets, index)
-    if result:
-        broken.swap_broken_indices(broken_indices, index, index + 1)
-    return result
+    return ops.move_preset_down(presets, index)
 
 
-def shuffle_playlist(
-    presets: list[Path], broken_indices: set[int]
-) -> set[int]:
-    """Shuffle the playlist in place and clear broken indices.
+def move_presets_in_playlist(
+    presets: PresetTable, indices: Iterable[int], step: int
+) -> bool:
+    """Move several presets, and their flags, one step up or down.
 
     Args:
-        presets: List of preset paths (modified in place).
-        broken_indices: Set of broken indices (cleared after shuffle).
+        presets: Table of preset paths (modified in place).
+        indices: Indices of the presets to move.
+        step: -1 to move them up, 1 to move them down.
 
     Returns:
-        Empty set (broken indices are invalidated by shuffle).
+        True if any preset moved.
+    """
+    if step < 0:
+        return ops.move_presets_up(presets, indices)
+    return ops.move_presets_down(presets, indices)
+
+
+def move_presets_to_edge_of_playlist(
+    presets: PresetTable, indices: Iterable[int], top: bool
+) -> bool:
+    """Move several presets, and their flags, to the top or bottom.
+
+    Args:
+        presets: Table of preset paths (modified in place).
+        indices: Indices of the presets to move.
+        top: True to move them to the top, False for the bottom.
+
+    Returns:
+        True if the order changed.
+    """
+    return ops.move_presets_to_edge(presets, indices, top)
+
+
+def shuffle_playlist(presets: PresetTable) -> None:
+    """Shuffle the playlist in place; broken flags move with their presets.
+
+    Args:
+        presets: Table of preset paths (modified in place).
     """
     ops.shuffle_presets(presets)
-    return set()
@@ -4,14 +4,15 @@
 Pure functions for navigating through a list of presets.
 """
 
+from collections.abc import Sequence
 from pathlib import Path
 
 
-def get_current(presets: list[Path], playing_index: int | None) -> Path:
+def get_current(presets: Sequence[Path], playing_index: int | None) -> Path:
     """Return the preset at the current playing index.
 
     Args:
-        presets: List of preset paths.
+        presets: Sequence of preset paths.
         playing_index: Current playing index, or None if idle.
 
     Returns:
@@ -25,11 +26,11 @@ def get_current(presets: list[Path], playing_index: int | None) -> Path:
     return presets[playing_index]
 
 
-def is_at_end(presets: list[Path], playing_index: int | None) -> bool:
+def is_at_end(presets: Sequence[Path], playing_index: int | None) -> bool:
     """Check if at the last preset.
 
     Args:
-        presets: List of preset paths.
+        presets: Sequence of preset paths.
         playing_index: Current playing index, or None if idle.
 
     Returns:
@@ -41,12 +42,12 @@ def is_at_end(presets: list[Path], playing_index: int | None) -> bool:
 
 
 def advance_next(
-    presets: list[Path], playing_index: int | None, loop: bool
+    presets: Sequence[Path], playing_index: int | None, loop: bool
 ) -> tuple[int, Path] | None:
     """Advance to the next preset.
 
     Args:
-        presets: List of preset paths.
+        presets: Sequence of preset paths.
         playing_index: Current playing index, or None if idle.
         loop: Whether to wrap around at the end.
 
@@ -65,12 +66,12 @@ def advance_next(
 
 
 def go_previous(
-    presets: list[Path], playing_index: int | None, loop: bool
+    presets: Sequence[Path], playing_index: int | None, loop: bool
 ) -> tuple[int, Path] | None:
     """Move to the previous preset.
 
     Args:
-        presets: List of preset paths.
+        presets: Sequence of preset paths.
         playing_index: Current playing index, or None if idle.
         loop: Whether to wrap around at the start.
 
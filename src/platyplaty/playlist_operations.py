@@ -4,35 +4,37 @@
 Functions for adding, removing, and reordering presets.
 """
 
-import random
+from collections.abc import Iterable
 from pathlib import Path
 
+from platyplaty.preset_table import PresetTable
 
-def add_preset(presets: list[Path], path: Path) -> None:
+
+def add_preset(presets: PresetTable, path: Path) -> None:
     """Add a preset at the end of the playlist.
 
     Args:
-        presets: List of preset paths (modified in place).
+        presets: Table of preset paths (modified in place).
         path: Path of the preset to add.
     """
     presets.append(path)
 
 
-def remove_preset(presets: list[Path], index: int) -> None:
+def remove_preset(presets: PresetTable, index: int) -> None:
     """Remove the preset at the given index.
 
     Args:
-        presets: List of preset paths (modified in place).
+        presets: Table of preset paths (modified in place).
         index: Index of the preset to remove.
     """
     del presets[index]
 
 
-def move_preset_up(presets: list[Path], index: int) -> bool:
+def move_preset_up(presets: PresetTable, index: int) -> bool:
     """Move preset at index up by one position.
 
     Args:
-        presets: List of preset paths (modified in place).
+        presets: Table of preset paths (modified in place).
         index: Index of the preset to move up.
 
     Returns:
@@ -40,15 +42,15 @@ def move_preset_up(presets: list[Path], index: int) -> bool:
     """
     if index <= 0:
         return False
-    presets[index - 1], presets[index] = presets[index], presets[index - 1]
+    presets.swap(index - 1, index)
     return True
 
 
-def move_preset_down(presets: list[Path], index: int) -> bool:
+def move_preset_down(presets: PresetTable, index: int) -> bool:
     """Move preset at index down by one position.
 
     Args:
-        presets: List of preset paths (modified in place).
+        presets: Table of preset paths (modified in place).
         index: Index of the preset to move down.
 
     Returns:
@@ -56,13 +58,100 @@ def move_preset_down(presets: list[Path], index: int) -> bool:
     """
     if index >= len(presets) - 1:
         return False
-    presets[index], presets[index + 1] = presets[index + 1], presets[index]
+    presets.swap(index, index + 1)
+    return True
+
+
+def remove_presets(presets: PresetTable, indices: Iterable[int]) -> None:
+    """Remove the presets at several indices in one pass.
+
+    Args:
+        presets: Table of preset paths (modified in place).
+        indices: Indices of the presets to remove.
+    """
+    presets.delete_indices(indices)
+
+
+def move_presets_up(presets: PresetTable, indices: Iterable[int]) -> bool:
+    """Move each preset at indices up past one unselected neighbour.
+
+    A contiguous run moves up as a block; the preset above it ends up
+    below it. Presets already at the top, or stacked below selected
+    presets that are, stay put. Costs one swap per selected preset.
+
+    Args:
+        presets: Table of preset paths (modified in place).
+        indices: Indices of the presets to move.
+
+    Returns:
+        True if any preset moved.
+    """
+    moved = False
+    limit = 0  # Topmost position still free to move into
+    for index in sorted(indices):
+        if index > limit:
+            presets.swap(index - 1, index)
+            moved = True
+            limit = index
+        else:
+            limit = index + 1
+    return moved
+
+
+def move_presets_down(presets: PresetTable, indices: Iterable[int]) -> bool:
+    """Move each preset at indices down past one unselected neighbour.
+
+    The mirror image of move_presets_up.
+
+    Args:
+        presets: Table of preset paths (modified in place).
+        indices: Indices of the presets to move.
+
+    Returns:
+        True if any preset moved.
+    """
+    moved = False
+    limit = len(presets) - 1  # Bottommost position still free to move into
+    for index in sorted(indices, reverse=True):
+        if index < limit:
+            presets.swap(index, index + 1)
+            moved = True
+            limit = index
+        else:
+            limit = index - 1
+    return moved
+
+
+def move_presets_to_edge(
+    presets: PresetTable, indices: Iterable[int], top: bool
+) -> bool:
+    """Move the presets at indices, in order, to the top or bottom.
+
+    The other presets keep their order. The moved presets are deleted
+    in one pass and inserted as one run, so only they are touched.
+
+    Args:
+        presets: Table of preset paths (modified in place).
+        indices: Indices of the presets to move.
+        top: True to move them to the top, False for the bottom.
+
+    Returns:
+        True if the order changed.
+    """
+    chosen = sorted(set(indices))
+    edge = 0 if top else len(presets) - len(chosen)
+    if chosen == list(range(edge, edge + len(chosen))):
+        return False
+    moved = presets.take(chosen)
+    presets.delete_indices(chosen)
+    at = 0 if top else len(presets)
+    presets[at:at] = moved
     return True
 
-def shuffle_presets(presets: list[Path]) -> None:
+def shuffle_presets(presets: PresetTable) -> None:
     """Shuffle the playlist in place.
 
     Args:
-        presets: List of preset paths (modified in place).
+        presets: Table of preset paths (modified in place).
     """
-    random.shuffle(presets)
+    presets.shuffle()
@@ -1,62 +1,154 @@
 #!/usr/bin/env python3
 """Playlist persistence operations.
 
-Functions for loading, saving, and clearing playlist state.
+Functions for loading, saving, and clearing playlist state. Files are
+written on the autosave journal's writer thread, so a save queued
+behind journal writes happens after them.
 """
 
+import asyncio
+from concurrent.futures import Future
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from platyplaty.playlist_file import parse_playlist_file, write_playlist_file
+from platyplaty.playlist_journal import (
+    PlaylistJournal,
+    read_journaled_playlist,
+    write_in_background,
+)
+from platyplaty.preset_table import PresetTable
 
 if TYPE_CHECKING:
     from platyplaty.playlist import Playlist
 
 
 def clear_playlist(playlist: "Playlist") -> None:
-    """Remove all presets and clear associated filename."""
+    """Remove all presets and clear associated filename.
+
+    The autosave journal is closed first, so the file keeps its presets.
+    """
+    close_journal(playlist)
     playlist.presets.clear()
     playlist.associated_filename = None
-    playlist._selection_index = 0
-    playlist._playing_index = None
+    playlist.set_selection(0)
+    playlist.set_playing(None)
     playlist.dirty_flag = True
     playlist.broken_indices = set()
 
 
 def load_from_file(playlist: "Playlist", filepath: Path) -> None:
-    """Load presets from a .platy file, replacing current contents."""
-    playlist.presets = parse_playlist_file(filepath)
+    """Load presets from a .platy file, replacing current contents.
+
+    The presets are not validated here; see playlist_validation_actions.
+    """
+    replace_from_file(playlist, filepath)
+    playlist.set_selection(0)
+    playlist.set_playing(0 if playlist.presets else None)
+
+
+def replace_from_file(playlist: "Playlist", filepath: Path) -> None:
+    """Replace the presets with a .platy file's and associate the file.
+
+    Edits left in the file's journal by an autosave that was cut short
+    are applied. With autosave on they are folded into the file and the
+    file's journal is started; otherwise they are unsaved changes.
+
+    Raises:
+        PlaylistFileError: If the file is not a valid playlist.
+        OSError: If the file can't be read.
+    """
+    presets, recovered = read_journaled_playlist(filepath)
+    close_journal(playlist)
+    playlist.presets = presets
     playlist.associated_filename = filepath
-    playlist._selection_index = 0
-    playlist._playing_index = 0 if playlist.presets else None
-    playlist.dirty_flag = False
-    playlist.broken_indices = _validate_presets(playlist.presets)
+    playlist.dirty_flag = recovered
+    if playlist.autosave:
+        playlist.journal = PlaylistJournal(filepath, presets, compact=recovered)
 
 
 def save_to_file(playlist: "Playlist", filepath: Path | None = None) -> None:
-    """Save presets to a .platy file."""
+    """Save presets to a .platy file, waiting for the write.
+
+    Saving to the file being autosaved compacts its journal; saving to
+    another file moves autosaving there.
+
+    Raises:
+        ValueError: If no file is given or associated.
+        OSError: If the file can't be written.
+    """
+    filepath, written, future = _start_save(playlist, filepath)
+    future.result()
+    _finish_save(playlist, filepath, written)
+
+
+async def save_in_background(
+    playlist: "Playlist", filepath: Path | None = None
+) -> None:
+    """Save presets to a .platy file without blocking the event loop.
+
+    Like save_to_file, but the file is written while other events are
+    handled. Edits made meanwhile stay unsaved, or are autosaved.
+
+    Raises:
+        ValueError: If no file is given or associated.
+        OSError: If the file can't be written.
+    """
+    filepath, written, future = _start_save(playlist, filepath)
+    await asyncio.wrap_future(future)
+    _finish_save(playlist, filepath, written)
+
+
+def _start_save(
+    playlist: "Playlist", filepath: Path | None
+) -> tuple[Path, PresetTable, Future[None]]:
+    """Queue the write of a save.
+
+    Returns:
+        The file, the entries being written and the write's future.
+    """
     if filepath is None:
         filepath = playlist.associated_filename
     if filepath is None:
         raise ValueError("No file name")
-    write_playlist_file(filepath, playlist.presets)
+    written = playlist.presets.copy()
+    journal = playlist.journal
+    if journal is not None and journal.filepath == filepath and not journal.failed:
+        return filepath, written, journal.compact()
+    close_journal(playlist)
+    return filepath, written, write_in_background(filepath, written)
+
+
+def _finish_save(playlist: "Playlist", filepath: Path, written: PresetTable) -> None:
+    """Record a finished save, starting autosave if it is on.
+
+    Args:
+        playlist: The playlist saved.
+        filepath: The file written.
+        written: The entries written, which the playlist may have
+            been edited away from since.
+    """
+    unchanged = playlist.presets == written
     playlist.associated_filename = filepath
-    playlist.dirty_flag = False
+    if playlist.autosave and playlist.journal is None:
+        playlist.journal = PlaylistJournal(
+            filepath, playlist.presets, compact=not unchanged
+        )
+    playlist.dirty_flag = not unchanged
 
 
-def _validate_presets(presets: list[Path]) -> set[int]:
-    """Validate presets and return set of broken indices.
+def close_journal(playlist: "Playlist", compact: bool = False) -> Future[None] | None:
+    """Stop autosaving the playlist; pending writes finish in the background.
 
     Args:
-        presets: List of preset paths to validate.
+        playlist: The playlist.
+        compact: True to fold the journal into the file, as on exit.
 
     Returns:
-        Set of indices of broken presets.
+        A future that is done when the journal is closed, or None if
+        the playlist had no journal.
     """
-    from platyplaty.preset_validator import is_valid_preset
-
-    broken = set()
-    for i, path in enumerate(presets):
-        if not is_valid_preset(path):
-            broken.add(i)
-    return broken
+    journal = playlist.journal
+    if journal is None:
+        return None
+    playlist.journal = None
+    return journal.close(compact)
@@ -1,6 +1,9 @@
 """Playlist reorder action handlers.
 
-This module provides reorder actions (move up, move down).
+This module provides reorder actions (move up, move down). They move
+the visual range or the marked presets as a block, else the selected
+preset. The selection and playing pointers follow the moved entries by
+themselves.
 """
 
 from __future__ import annotations
@@ -13,7 +16,7 @@ if TYPE_CHECKING:
 
 
 async def reorder_up(ctx: AppContext, app: PlatyplatyApp) -> None:
-    """Move selected preset up in the playlist."""
+    """Move the selected presets up in the playlist."""
     from platyplaty.playlist_action_helpers import refresh_playlist_view
     from platyplaty.playlist_snapshot import push_undo_snapshot
     from platyplaty.ui.playlist_key import (
@@ -27,20 +30,13 @@ async def reorder_up(ctx: AppContext, app: PlatyplatyApp) -> None:
     playlist = ctx.playlist
     if not playlist.presets:
         return
-    current = playlist.get_selection()
-    playing = playlist.get_playing()
-    push_undo_snapshot(ctx)
-    if playlist.move_preset_up(current):
-        playlist.set_selection(current - 1)
-        if playing == current:
-            playlist.set_playing(current - 1)
-        elif playing == current - 1:
-            playlist.set_playing(current)
+    push_undo_snapshot(ctx, "reorder_up")
+    if playlist.move_presets(playlist.target_indices(), -1):
         refresh_playlist_view(app)
 
 
 async def reorder_down(ctx: AppContext, app: PlatyplatyApp) -> None:
-    """Move selected preset down in the playlist."""
+    """Move the selected presets down in the playlist."""
     from platyplaty.playlist_action_helpers import refresh_playlist_view
     from platyplaty.playlist_snapshot import push_undo_snapshot
     from platyplaty.ui.playlist_key import (
@@ -54,13 +50,6 @@ async def reorder_down(ctx: AppContext, app: PlatyplatyApp) -> None:
     playlist = ctx.playlist
     if not playlist.presets:
         return
-    current = playlist.get_selection()
-    playing = playlist.get_playing()
-    push_undo_snapshot(ctx)
-    if playlist.move_preset_down(current):
-        playlist.set_selection(current + 1)
-        if playing == current:
-            playlist.set_playing(current + 1)
-        elif playing == current + 1:
-            playlist.set_playing(current)
+    push_undo_snapshot(ctx, "reorder_down")
+    if playlist.move_presets(playlist.target_indices(), 1):
         refresh_playlist_view(app)
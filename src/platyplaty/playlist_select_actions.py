@@ -0,0 +1,93 @@
+"""Playlist multi-select action handlers.
+
+This module provides the actions that build a multi-selection (marks
+and the visual range) and the batch moves to the top or bottom. Delete
+and reorder act on the multi-selection too; see their modules.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from platyplaty.app import PlatyplatyApp
+    from platyplaty.app_context import AppContext
+
+
+async def toggle_mark(ctx: AppContext, app: PlatyplatyApp) -> None:
+    """Mark or unmark the selected preset and select the next one."""
+    from platyplaty.playlist_action_helpers import refresh_playlist_view
+
+    if not await _can_edit(ctx, app):
+        return
+    playlist = ctx.playlist
+    selection = playlist.get_selection()
+    playlist.toggle_mark(selection)
+    playlist.set_selection(min(selection + 1, len(playlist.presets) - 1))
+    refresh_playlist_view(app)
+
+
+async def toggle_range(ctx: AppContext, app: PlatyplatyApp) -> None:
+    """Start a visual range at the selection, or end the current one."""
+    from platyplaty.playlist_action_helpers import refresh_playlist_view
+
+    if not await _can_edit(ctx, app):
+        return
+    playlist = ctx.playlist
+    if playlist.get_range() is None:
+        playlist.start_range()
+    else:
+        playlist.clear_range()
+    refresh_playlist_view(app)
+
+
+async def clear_multiselect(ctx: AppContext, app: PlatyplatyApp) -> None:
+    """End the visual range and remove all marks."""
+    from platyplaty.playlist_action_helpers import refresh_playlist_view
+
+    if ctx.current_focus != "playlist":
+        return
+    playlist = ctx.playlist
+    if playlist.get_range() is None and not playlist.marked:
+        return
+    playlist.clear_range()
+    playlist.marked.clear()
+    refresh_playlist_view(app)
+
+
+async def send_to_top(ctx: AppContext, app: PlatyplatyApp) -> None:
+    """Move the selected presets to the top of the playlist."""
+    await _send_to_edge(ctx, app, top=True)
+
+
+async def send_to_bottom(ctx: AppContext, app: PlatyplatyApp) -> None:
+    """Move the selected presets to the bottom of the playlist."""
+    await _send_to_edge(ctx, app, top=False)
+
+
+async def _send_to_edge(ctx: AppContext, app: PlatyplatyApp, top: bool) -> None:
+    """Move the selected presets to one end as a single edit."""
+    from platyplaty.playlist_action_helpers import refresh_playlist_view
+    from platyplaty.playlist_snapshot import push_undo_snapshot
+
+    if not await _can_edit(ctx, app):
+        return
+    playlist = ctx.playlist
+    push_undo_snapshot(ctx)
+    if playlist.move_presets_to_edge(playlist.target_indices(), top):
+        refresh_playlist_view(app)
+
+
+async def _can_edit(ctx: AppContext, app: PlatyplatyApp) -> bool:
+    """Return True if the focused, non-empty playlist may be edited."""
+    from platyplaty.ui.playlist_key import (
+        is_autoplay_blocking,
+        show_autoplay_blocked_error,
+    )
+
+    if ctx.current_focus != "playlist" or not ctx.playlist.presets:
+        return False
+    if is_autoplay_blocking(ctx):
+        await show_autoplay_blocked_error(app)
+        return False
+    return True
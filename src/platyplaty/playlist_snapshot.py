@@ -3,6 +3,8 @@
 
 from typing import TYPE_CHECKING
 
+from platyplaty.playlist_persistence import close_journal
+from platyplaty.preset_table import PresetTable
 from platyplaty.undo import PlaylistSnapshot
 
 if TYPE_CHECKING:
@@ -14,7 +16,7 @@ def create_snapshot(playlist: "Playlist") -> PlaylistSnapshot:
     """Create an immutable snapshot of the playlist's current state.
 
     Captures all state needed to restore the playlist:
-    - presets list (as tuple for immutability)
+    - presets (a copy of the table, sharing its string pool)
     - selection index
     - playing index
     - associated filename
@@ -27,7 +29,7 @@ def create_snapshot(playlist: "Playlist") -> PlaylistSnapshot:
         An immutable PlaylistSnapshot.
     """
     return PlaylistSnapshot(
-        presets=tuple(playlist.presets),
+        presets=PresetTable(playlist.presets),
         selection_index=playlist.get_selection(),
         playing_index=playlist.get_playing(),
         associated_filename=playlist.associated_filename,
@@ -39,24 +41,29 @@ def restore_snapshot(playlist: "Playlist", snapshot: PlaylistSnapshot) -> None:
     """Restore a playlist to a previous state from a snapshot.
 
     Restores all state from the snapshot:
-    - presets list
+    - presets, with their broken flags
     - selection index
     - playing index
     - associated filename
     - dirty flag
 
+    An autosave journal for another file is closed first.
+
     Args:
         playlist: The playlist to restore.
         snapshot: The snapshot containing state to restore.
     """
-    playlist.presets = list(snapshot.presets)
+    journal = playlist.journal
+    if journal is not None and journal.filepath != snapshot.associated_filename:
+        close_journal(playlist)
+    playlist.presets = PresetTable(snapshot.presets)
     playlist.set_selection(snapshot.selection_index)
     playlist.set_playing(snapshot.playing_index)
     playlist.associated_filename = snapshot.associated_filename
     playlist.dirty_flag = snapshot.dirty_flag
 
 
-def push_undo_snapshot(ctx: "AppContext") -> None:
+def push_undo_snapshot(ctx: "AppContext", kind: str | None = None) -> None:
     """Create a snapshot and push it to the undo stack.
 
     Convenience function that combines create_snapshot and push_undo.
@@ -64,6 +71,8 @@ def push_undo_snapshot(ctx: "AppContext") -> None:
 
     Args:
         ctx: Application context with playlist and undo_manager.
+        kind: Name of the edit, for coalescing repeated edits into one
+            undo step (see UndoManager.push_undo).
     """
     snapshot = create_snapshot(ctx.playlist)
-    ctx.undo_manager.push_undo(snapshot)
+    ctx.undo_manager.push_undo(snapshot, kind)
@@ -0,0 +1,73 @@
+"""Validating a loaded playlist's presets in the background.
+
+Loading a playlist no longer opens every preset before it is shown.
+Instead a PlaylistValidation job is started once the playlist is in
+place, and broken presets are marked in the playlist view as results
+arrive. Only one validation runs at a time; starting another, as a new
+load does, cancels the previous one.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import TYPE_CHECKING
+
+from platyplaty.playlist_action_helpers import refresh_playlist_view
+from platyplaty.playlist_validation_job import PlaylistValidation
+
+if TYPE_CHECKING:
+    from platyplaty.app import PlatyplatyApp
+    from platyplaty.app_context import AppContext
+
+_current: PlaylistValidation | None = None
+
+
+def start_playlist_validation(ctx: AppContext, app: PlatyplatyApp) -> None:
+    """Validate the playlist's presets in the background.
+
+    Presets near the selection and the playing preset are validated
+    first. Must be called on the event loop thread.
+
+    Args:
+        ctx: Application context.
+        app: The Textual application.
+    """
+    global _current
+    cancel_playlist_validation()
+    playlist = ctx.playlist
+    if not playlist.presets:
+        return
+    loop = asyncio.get_running_loop()
+
+    def on_results() -> None:
+        # RuntimeError means the loop is closed; nothing to show
+        with contextlib.suppress(RuntimeError):
+            loop.call_soon_threadsafe(_apply_results, ctx, app)
+
+    near = (playlist.get_selection(), playlist.get_playing())
+    _current = PlaylistValidation(playlist.presets, near, on_results)
+
+
+def cancel_playlist_validation() -> None:
+    """Stop a running validation, if any."""
+    global _current
+    if _current is not None:
+        _current.cancel()
+        _current = None
+
+
+def _apply_results(ctx: AppContext, app: PlatyplatyApp) -> None:
+    """Record identities, mark broken presets found so far and refresh."""
+    if _current is None:
+        return
+    playlist = ctx.playlist
+    playlist.presets.record_identities(_current.take_identities())
+    broken = _current.take_broken()
+    if not broken:
+        return
+    broken_indices = playlist.broken_indices
+    for path in broken:
+        for index in playlist.presets.positions(path):
+            broken_indices.add(index)
+    refresh_playlist_view(app)
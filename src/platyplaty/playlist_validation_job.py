@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""Background validation of a loaded playlist's presets.
+
+A PlaylistValidation checks every distinct preset of a playlist
+snapshot with is_valid_preset on a shared thread pool, so a large
+playlist is usable while its files are still being opened. Paths are
+handed to the pool in chunks, nearest the given positions (the
+selection and the playing preset) first, so the entries the user is
+looking at are marked broken before distant ones.
+
+Broken paths are collected as chunks finish and taken by the caller,
+which marks every entry with that path in the live playlist. Matching
+by path rather than index keeps the results correct while the playlist
+is being edited. The file identity of every path, read from the stat
+the validation just made, is collected the same way for the table's
+identity index (see PresetTable.record_identities).
+"""
+
+import os
+import threading
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+from platyplaty.file_identity import FileIdentity, stat_identity
+from platyplaty.preset_table import PresetTable
+from platyplaty.preset_validator import is_valid_preset
+
+# Threads validating files; validation is I/O bound
+MAX_WORKERS = min(8, 2 * (os.cpu_count() or 1))
+
+# Distinct paths handed to a validation thread at a time
+_VALIDATE_CHUNK = 32
+
+# Identities collected before the caller is told to take them
+_IDENTITY_BATCH = 4096
+
+# A chunk's broken paths, and the identity of each of its paths
+_ChunkResult = tuple[list[str], list[tuple[str, FileIdentity | None]]]
+
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="playlist-validate")
+_pool = ThreadPoolExecutor(
+    max_workers=MAX_WORKERS, thread_name_prefix="playlist-validate-pool"
+)
+
+
+class PlaylistValidation:
+    """A running or finished validation of one playlist snapshot."""
+
+    def __init__(
+        self,
+        presets: PresetTable,
+        near: Iterable[int | None],
+        on_results: Callable[[], None],
+    ) -> None:
+        """Start validating presets in the background.
+
+        Args:
+            presets: The playlist's entries; a snapshot is taken.
+            near: Positions whose neighbourhood is validated first;
+                None values are ignored.
+            on_results: Called on a worker thread when broken presets
+                or a batch of identities have been found, and once more
+                when the job finishes.
+        """
+        self._presets = presets.copy()
+        self._near = [index for index in near if index is not None]
+        self._on_results = on_results
+        self._lock = threading.Lock()
+        self._broken: list[str] = []
+        self._identities: list[tuple[str, FileIdentity | None]] = []
+        self._pending = 0
+        self._scanning = True
+        self._cancelled = threading.Event()
+        self._done = threading.Event()
+        self.future: Future[None] = _executor.submit(self._run)
+
+    @property
+    def cancelled(self) -> bool:
+        """Return True if cancel() has been called."""
+        return self._cancelled.is_set()
+
+    @property
+    def done(self) -> bool:
+        """Return True once every preset has been validated."""
+        return self._done.is_set()
+
+    def cancel(self) -> None:
+        """Stop the job; no further results are reported."""
+        self._cancelled.set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until the job has finished.
+
+        Args:
+            timeout: Maximum number of seconds to wait, or None for no limit.
+
+        Returns:
+            True if the job finished within the timeout.
+        """
+        return self._done.wait(timeout)
+
+    def take_broken(self) -> list[Path]:
+        """Return the broken presets found since the last call."""
+        with self._lock:
+            broken, self._broken = self._broken, []
+        return [Path(text) for text in broken]
+
+    def take_identities(self) -> list[tuple[str, FileIdentity | None]]:
+        """Return the (path, identity) pairs found since the last call."""
+        with self._lock:
+            identities, self._identities = self._identities, []
+        return identities
+
+    def _run(self) -> None:
+        """Coordinator job: queue distinct paths in priority order."""
+        try:
+            presets = self._presets
+            seen: set[str] = set()
+            chunk: list[str] = []
+            for index in priority_order(len(presets), self._near):
+                if self._cancelled.is_set():
+                    return
+                text = presets.path_string(index)
+                if text in seen:
+                    continue
+                seen.add(text)
+                chunk.append(text)
+                if len(chunk) == _VALIDATE_CHUNK:
+                    self._submit(chunk)
+                    chunk = []
+            if chunk:
+                self._submit(chunk)
+        finally:
+            with self._lock:
+                self._scanning = False
+                finished = self._pending == 0
+            if finished:
+                self._finish()
+
+    def _submit(self, chunk: list[str]) -> None:
+        """Hand a chunk of paths to the validation pool."""
+        with self._lock:
+            self._pending += 1
+        _pool.submit(self._validate, chunk).add_done_callback(self._chunk_done)
+
+    def _validate(self, chunk: list[str]) -> _ChunkResult:
+        """Pool job: find the broken paths in chunk and every identity."""
+        broken: list[str] = []
+        identities: list[tuple[str, FileIdentity | None]] = []
+        for text in chunk:
+            if self._cancelled.is_set():
+                break
+            path = Path(text)
+            if not is_valid_preset(path):
+                broken.append(text)
+            identities.append((text, stat_identity(path)))
+        return broken, identities
+
+    def _chunk_done(self, future: Future[_ChunkResult]) -> None:
+        """Collect a finished chunk's broken paths and identities."""
+        failed = future.exception() is not None
+        broken, identities = ([], []) if failed else future.result()
+        with self._lock:
+            self._broken.extend(broken)
+            self._identities.extend(identities)
+            self._pending -= 1
+            finished = not self._scanning and self._pending == 0
+            collected = len(self._identities) >= _IDENTITY_BATCH
+        if finished:
+            self._finish()
+        elif broken or collected:
+            self._notify()
+
+    def _finish(self) -> None:
+        """Mark the job done and report any remaining results."""
+        self._done.set()
+        self._notify()
+
+    def _notify(self) -> None:
+        """Report results unless the job was cancelled."""
+        if not self._cancelled.is_set():
+            self._on_results()
+
+
+def priority_order(size: int, near: Sequence[int]) -> Iterator[int]:
+    """Yield every index below size, nearest to a position in near first.
+
+    Indices at the same distance come in the order of near, lower side
+    first. With no positions the indices come in ascending order.
+
+    Args:
+        size: Number of indices.
+        near: Positions to start from; those out of range are ignored.
+    """
+    centers = [index for index in near if 0 <= index < size]
+    if not centers:
+        yield from range(size)
+        return
+    seen = bytearray(size)
+    remaining = size
+    distance = 0
+    while remaining:
+        for center in centers:
+            for index in (center - distance, center + distance):
+                if 0 <= index < size and not seen[index]:
+                    seen[index] = 1
+                    remaining -= 1
+                    yield index
+        distance += 1
@@ -0,0 +1,90 @@
+"""Preset finder action handlers.
+
+Opens the preset finder overlay with the command prompt as its query
+line. Every edit re-runs the fuzzy search; Up/Down (or Ctrl+P/Ctrl+N)
+move the selection, Tab adds the selected preset to the playlist and
+Enter previews it and closes the finder. Escape closes it unchanged.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from platyplaty.focus_helpers import get_previous_focus_id
+from platyplaty.preset_finder_table import start_finder_table_sync
+from platyplaty.ui import CommandLine, CommandPrompt, FileBrowser, PresetFinder
+from platyplaty.ui.file_browser_actions import add_milk_preset
+from platyplaty.ui.file_browser_error import show_transient_error
+from platyplaty.ui.file_browser_preset_preview import preview_milk_preset
+
+if TYPE_CHECKING:
+    from platyplaty.app import PlatyplatyApp
+    from platyplaty.app_context import AppContext
+
+FINDER_PREFIX = "preset: "
+
+_SELECTION_MOVES = {"up": -1, "ctrl+p": -1, "down": 1, "ctrl+n": 1}
+
+
+async def open_preset_finder(ctx: AppContext, app: PlatyplatyApp) -> None:
+    """Show the preset finder and its query prompt.
+
+    Args:
+        ctx: Application context.
+        app: The Textual application.
+    """
+    browser = app.query_one(FileBrowser)
+    if ctx.preset_index is None:
+        show_transient_error(browser, "Preset finder needs preset-dirs in config")
+        return
+    finder = app.query_one(PresetFinder)
+    finder.open()
+    loop = asyncio.get_running_loop()
+
+    def on_synced(_future: object) -> None:
+        # May run on the loop's own thread if the sync finished first;
+        # RuntimeError means the loop is closed
+        with contextlib.suppress(RuntimeError):
+            loop.call_soon_threadsafe(_refresh_if_open, finder)
+
+    start_finder_table_sync(ctx.preset_index).add_done_callback(on_synced)
+
+    def key_handler(key: str) -> bool:
+        if key in _SELECTION_MOVES:
+            finder.move_selection(_SELECTION_MOVES[key])
+            return True
+        if key == "tab":
+            path = finder.selected_path
+            if path is not None:
+                app.call_later(_add_to_playlist, browser, path)
+            return True
+        return False
+
+    async def on_submit(_text: str) -> None:
+        path = finder.selected_path
+        app.query_one(CommandPrompt).hide()
+        if path is not None:
+            await preview_milk_preset(browser, Path(path))
+
+    app.query_one(CommandLine).show_command_prompt(
+        on_submit,
+        get_previous_focus_id(ctx),
+        prefix=FINDER_PREFIX,
+        on_change=finder.set_query,
+        key_handler=key_handler,
+        on_hide=finder.close,
+    )
+
+
+def _refresh_if_open(finder: PresetFinder) -> None:
+    """Re-run the finder's query once its table has been synced."""
+    if finder.is_open:
+        finder.refresh_results()
+
+
+async def _add_to_playlist(browser: FileBrowser, path: str) -> None:
+    """Add a found preset to the playlist, as 'a' does in the browser."""
+    await add_milk_preset(browser, Path(path))
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Fuzzy name table for the preset finder, kept in step with the index.
+
+The table is built from the preset index on a worker thread and then
+updated incrementally: each sync compares the index's generation with
+the one the table was last synced at, and only when it moved does it
+diff the indexed paths against the table. A fragmented table, or the
+first one, is built off the lock and swapped in, so searches from the
+UI thread never wait for a full build.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from platyplaty.fuzzy_index import FuzzyIndex
+from platyplaty.preset_index import PresetIndex
+
+_lock = threading.Lock()
+_pending: Future[None] | None = None
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="preset-finder")
+_table: FuzzyIndex | None = None
+_synced_generation = -1
+
+
+def sync_finder_table(index: PresetIndex) -> None:
+    """Bring the finder table up to date with the index.
+
+    Args:
+        index: The preset index to read from.
+    """
+    global _table, _synced_generation
+    generation = index.generation
+    if _table is not None and generation == _synced_generation:
+        return
+    paths = index.preset_paths()
+    with _lock:
+        table = _table
+    if table is None or table.fragmented:
+        table = FuzzyIndex(paths)
+    else:
+        wanted = set(paths)
+        with _lock:
+            current = table.paths()
+            table.add(p for p in paths if p not in current)
+            table.remove(current - wanted)
+    with _lock:
+        _table = table
+        _synced_generation = generation
+
+
+def start_finder_table_sync(index: PresetIndex) -> Future[None]:
+    """Sync the finder table in the background unless a sync is running.
+
+    Args:
+        index: The preset index to read from.
+
+    Returns:
+        The future of the running (possibly already started) sync.
+    """
+    global _pending
+    with _lock:
+        if _pending is None or _pending.done():
+            _pending = _executor.submit(sync_finder_table, index)
+        return _pending
+
+
+def search_finder_table(query: str, limit: int) -> list[str] | None:
+    """Search the finder table.
+
+    Args:
+        query: The text typed into the finder.
+        limit: Maximum number of paths to return.
+
+    Returns:
+        The best matching paths, or None if the table is not built yet.
+    """
+    with _lock:
+        if _table is None:
+            return None
+        return _table.search(query, limit)
+
+
+def reset_finder_table() -> None:
+    """Drop the table so the next sync rebuilds it from scratch."""
+    global _table, _synced_generation
+    with _lock:
+        _table = None
+        _synced_generation = -1
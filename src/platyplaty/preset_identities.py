@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""File identity to path map for the strings of a preset pool.
+
+When a preset crashes the renderer, every playlist entry naming the
+same file, through any symlink, is marked broken. An IdentityIndex
+answers which interned path strings name a file by keeping the
+(st_dev, st_ino) identity of each string.
+
+Identities are recorded as entries are validated: the background
+validation of a loaded playlist, a bulk add and a single add already
+stat every entry they check, and hand the results over on the event
+loop. A crash only stats the live entries that have no identity yet,
+such as those whose file could not be stat'ed before, so once a
+playlist has been validated crash handling stats nothing but the
+candidates.
+
+The candidates for an identity are checked again (through the cached
+file_identity) before they are returned, so a path that now names
+another file is dropped, but a path that has come to name the file
+since it was identified is not found.
+"""
+
+from collections.abc import Iterable
+from pathlib import Path
+
+from platyplaty.file_identity import FileIdentity, file_identity
+
+
+class IdentityIndex:
+    """The file identities of a pool's path strings, and their inverse."""
+
+    __slots__ = ("_strings", "_identity_of", "_by_identity")
+
+    def __init__(self, strings: list[str]) -> None:
+        """Create an empty index over a pool's strings.
+
+        Args:
+            strings: The pool's strings, by id. Only ever appended to.
+        """
+        self._strings = strings
+        self._identity_of: dict[int, FileIdentity] = {}
+        self._by_identity: dict[FileIdentity, set[int]] = {}
+
+    def record(self, ident: int, identity: FileIdentity | None) -> None:
+        """Record the identity of a string, or that it could not be stat'ed.
+
+        Args:
+            ident: The string's id.
+            identity: The file's (st_dev, st_ino), or None to forget the
+                string so the next lookup stats it again.
+        """
+        old = self._identity_of.pop(ident, None)
+        if old is not None:
+            self._by_identity[old].discard(ident)
+        if identity is not None:
+            self._identity_of[ident] = identity
+            self._by_identity.setdefault(identity, set()).add(ident)
+
+    def ids_of(self, identity: FileIdentity, live: Iterable[int]) -> list[int]:
+        """Return the live ids of the strings naming the file with identity.
+
+        Live strings without a recorded identity are stat'ed first.
+
+        Args:
+            identity: The file's (st_dev, st_ino).
+            live: The ids of the strings in use.
+        """
+        strings = self._strings
+        live = set(live)
+        for ident in live.difference(self._identity_of):
+            self.record(ident, file_identity(Path(strings[ident])))
+        found = []
+        for ident in sorted(live.intersection(self._by_identity.get(identity, ()))):
+            current = file_identity(Path(strings[ident]))
+            if current == identity:
+                found.append(ident)
+            else:
+                self.record(ident, current)
+        return found
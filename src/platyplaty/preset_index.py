@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""Persistent index of the preset library.
+
+Records every .milk and .platy file under the configured preset
+directories in an SQLite database, together with its inode, size,
+mtime, ctime, content hash and parse status, and every directory walked to
+find them with its mtime. The index is filled and refreshed by
+preset_index_scan; this module only stores and queries it.
+
+Every write bumps the index's generation, so derived in-memory tables
+(such as the preset finder's) can tell when they need to catch up.
+
+One index can be registered as the active index. The validator and the
+file browser's size indicators consult it instead of reading files,
+but only for rows that still match the path's (cached) stat result;
+for anything else they fall back to live checks.
+
+The database lives under $XDG_CACHE_HOME/platyplaty because it can
+always be rebuilt from the preset directories.
+"""
+
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import NamedTuple
+
+from platyplaty.file_stat import file_stat
+
+SCHEMA_VERSION = 3
+
+INDEX_FILENAME = "preset_index.sqlite3"
+
+# Parse status values
+STATUS_OK = "ok"
+STATUS_UNREADABLE = "unreadable"
+STATUS_INVALID = "invalid"
+
+_SCHEMA = """
+CREATE TABLE presets (
+    path TEXT PRIMARY KEY,
+    root TEXT NOT NULL,
+    dev INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    ctime_ns INTEGER NOT NULL,
+    hash TEXT,
+    status TEXT NOT NULL
+);
+CREATE INDEX presets_root ON presets (root);
+CREATE INDEX presets_hash ON presets (hash);
+CREATE TABLE directories (
+    path TEXT PRIMARY KEY,
+    root TEXT NOT NULL,
+    dev INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE INDEX directories_root ON directories (root);
+"""
+
+
+class IndexedPreset(NamedTuple):
+    """One row of the preset index.
+
+    Attributes:
+        path: Absolute path of the file.
+        root: The preset directory the file was found under.
+        dev: Device number (st_dev).
+        inode: Inode number (st_ino).
+        size: Size in bytes.
+        mtime_ns: Modification time in nanoseconds.
+        ctime_ns: Status change time in nanoseconds, which changes
+            with the file's mode and owner.
+        hash: Hex digest of the content, or None if unreadable.
+        status: STATUS_OK, STATUS_UNREADABLE or STATUS_INVALID.
+    """
+
+    path: str
+    root: str
+    dev: int
+    inode: int
+    size: int
+    mtime_ns: int
+    ctime_ns: int
+    hash: str | None
+    status: str
+
+    def matches(self, st: os.stat_result) -> bool:
+        """Return True if a stat result still describes the indexed file.
+
+        The ctime is compared too, so a chmod or chown that may have
+        made the file unreadable invalidates the row.
+        """
+        return (
+            self.dev, self.inode, self.size, self.mtime_ns, self.ctime_ns
+        ) == (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+
+
+class IndexedDirectory(NamedTuple):
+    """A directory walked by the last refresh.
+
+    Attributes:
+        path: Absolute path of the directory, as it was walked.
+        root: The preset directory it was found under.
+        dev: Device number (st_dev).
+        inode: Inode number (st_ino).
+        mtime_ns: Modification time in nanoseconds when it was listed,
+            or -1 to have the next refresh list it again.
+    """
+
+    path: str
+    root: str
+    dev: int
+    inode: int
+    mtime_ns: int
+
+
+def default_preset_index_path() -> Path:
+    """Return the cache file used to store the preset index.
+
+    Returns:
+        $XDG_CACHE_HOME/platyplaty/preset_index.sqlite3, falling back to
+        ~/.cache when XDG_CACHE_HOME is unset or empty.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    base = Path(cache_home) if cache_home else Path.home() / ".cache"
+    return base / "platyplaty" / INDEX_FILENAME
+
+
+class PresetIndex:
+    """SQLite-backed table of preset files.
+
+    Safe to use from several threads; every access is serialized by an
+    internal lock.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        """Open (creating if needed) the index database.
+
+        An index written with a different schema version is discarded.
+
+        Args:
+            path: Database file, or ":memory:" for a temporary index.
+        """
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock, self._conn:
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != SCHEMA_VERSION:
+                self._conn.execute("DROP TABLE IF EXISTS presets")
+                self._conn.execute("DROP TABLE IF EXISTS directories")
+                self._conn.executescript(_SCHEMA)
+                self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            self._conn.execute("PRAGMA journal_mode = WAL")
+
+    @property
+    def generation(self) -> int:
+        """Return a counter that changes whenever rows are written."""
+        return self._generation
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def lookup(self, path: Path | str) -> IndexedPreset | None:
+        """Return the row for a path, or None if it is not indexed.
+
+        Args:
+            path: Absolute path of the file.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM presets WHERE path = ?", (str(path),)
+            ).fetchone()
+        return IndexedPreset(*row) if row else None
+
+    def rows_under(self, root: str) -> dict[str, IndexedPreset]:
+        """Return every row recorded for a preset directory, keyed by path.
+
+        Args:
+            root: The preset directory.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM presets WHERE root = ?", (root,)
+            ).fetchall()
+        return {row[0]: IndexedPreset(*row) for row in rows}
+
+    def directories_under(self, root: str) -> dict[str, IndexedDirectory]:
+        """Return every directory recorded for a preset directory, by path.
+
+        Args:
+            root: The preset directory.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM directories WHERE root = ?", (root,)
+            ).fetchall()
+        return {row[0]: IndexedDirectory(*row) for row in rows}
+
+    def count_under(self, directory: Path | str) -> int:
+        """Count indexed files at any depth beneath a directory.
+
+        Args:
+            directory: Absolute directory path.
+        """
+        low, high = _subtree_bounds(str(directory))
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) FROM presets WHERE path >= ? AND path < ?",
+                (low, high),
+            ).fetchone()
+        return int(row[0])
+
+    def search(self, text: str, limit: int = 200) -> list[str]:
+        """Find indexed paths containing text, case-insensitively.
+
+        Args:
+            text: The text to look for (matched literally).
+            limit: Maximum number of paths to return.
+
+        Returns:
+            Matching paths in path order.
+        """
+        pattern = "%" + _escape_like(text) + "%"
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path FROM presets WHERE path LIKE ? ESCAPE '\\' "
+                "ORDER BY path LIMIT ?",
+                (pattern, limit),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def preset_paths(self) -> list[str]:
+        """Return the paths of every loadable .milk preset, in path order.
+
+        Unreadable files and playlists are left out.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path FROM presets WHERE status = ? "
+                "AND lower(path) LIKE '%.milk' ORDER BY path",
+                (STATUS_OK,),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def paths_with_hash(self, content_hash: str) -> list[str]:
+        """Return every indexed path whose content has the given hash.
+
+        Args:
+            content_hash: Hex digest as stored in the index.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path FROM presets WHERE hash = ? ORDER BY path",
+                (content_hash,),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def upsert(self, rows: Iterable[IndexedPreset]) -> None:
+        """Insert or replace rows in one transaction.
+
+        Args:
+            rows: The rows to write.
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.executemany(
+                "INSERT OR REPLACE INTO presets VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._bump_generation(cursor.rowcount)
+
+    def delete(self, paths: Iterable[str]) -> None:
+        """Remove rows in one transaction.
+
+        Args:
+            paths: Paths of the rows to remove.
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.executemany(
+                "DELETE FROM presets WHERE path = ?", ((p,) for p in paths)
+            )
+            self._bump_generation(cursor.rowcount)
+
+    def replace_directories(
+        self, root: str, directories: Iterable[IndexedDirectory]
+    ) -> None:
+        """Replace the directories recorded for a preset directory.
+
+        Directories are bookkeeping for the scanner, so writing them
+        does not advance the generation.
+
+        Args:
+            root: The preset directory.
+            directories: Every directory walked under it.
+        """
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM directories WHERE root = ?", (root,))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO directories VALUES (?, ?, ?, ?, ?)",
+                directories,
+            )
+
+    def delete_roots_except(self, roots: Iterable[str]) -> None:
+        """Remove rows from preset directories no longer configured.
+
+        Args:
+            roots: The preset directories to keep.
+        """
+        keep = list(roots)
+        placeholders = ", ".join("?" * len(keep))
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                f"DELETE FROM presets WHERE root NOT IN ({placeholders})", keep
+            )
+            self._conn.execute(
+                f"DELETE FROM directories WHERE root NOT IN ({placeholders})", keep
+            )
+            self._bump_generation(cursor.rowcount)
+
+    def _bump_generation(self, changed_rows: int) -> None:
+        """Advance the generation if a write changed any rows."""
+        if changed_rows > 0:
+            self._generation += 1
+
+
+def _subtree_bounds(directory: str) -> tuple[str, str]:
+    """Return the half-open path range covering everything under directory."""
+    prefix = directory.rstrip("/") + "/"
+    # "0" is the character after "/", so this bounds every child path
+    return prefix, prefix[:-1] + "0"
+
+
+def _escape_like(text: str) -> str:
+    """Escape LIKE wildcards so text is matched literally."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+_active_index: PresetIndex | None = None
+
+
+def set_active_index(index: PresetIndex | None) -> None:
+    """Register the index consulted by lookup_indexed.
+
+    Args:
+        index: The index to use, or None to always check live.
+    """
+    global _active_index
+    _active_index = index
+
+
+def get_active_index() -> PresetIndex | None:
+    """Return the registered index, or None if there is none."""
+    return _active_index
+
+
+def lookup_indexed(path: Path) -> IndexedPreset | None:
+    """Look a path up in the active index, if its row is still current.
+
+    The row is checked against the path's stat result from the shared
+    stat cache, so a file that was deleted, replaced or edited since it
+    was indexed is not answered from the index.
+
+    Args:
+        path: Absolute path of the file.
+
+    Returns:
+        The indexed row, or None if there is no active index, it does
+        not cover path, or the file no longer matches the row.
+    """
+    index = _active_index
+    if index is None:
+        return None
+    row = index.lookup(path)
+    if row is None:
+        return None
+    st = file_stat(path).stat
+    if st is None or not row.matches(st):
+        return None
+    return row
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""Background scanner that fills and refreshes the preset index.
+
+A refresh walks each preset directory, statting every directory in it.
+Only directories whose (device, inode, mtime) differ from the last
+refresh are listed with os.scandir; the files of the others are taken
+to be unchanged and their recorded subdirectories are walked instead.
+In listed directories, files whose (device, inode, size, mtime, ctime)
+match their index row are skipped. The rest are read, hashed and parsed on a
+thread pool, and the results are written to the index in batches. Rows
+for files that disappeared are removed.
+
+Editing a file in place does not change its directory's mtime, so such
+an edit is only picked up once the directory changes. Lookups compare
+rows with a fresh stat result (see preset_index.lookup_indexed), so a
+stale row is never used in place of the file.
+
+A directory modified less than _RACY_SECONDS before it was listed may
+change again within the same timestamp tick, so it is listed again on
+the next refresh.
+
+Directories are identified by (st_dev, st_ino) and each is visited at
+most once per refresh, so symlink loops terminate.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import NamedTuple
+
+from platyplaty.playlist_file import parse_playlist_content
+from platyplaty.playlist_validation import PlaylistFileError
+from platyplaty.preset_index import (
+    STATUS_INVALID,
+    STATUS_OK,
+    STATUS_UNREADABLE,
+    IndexedDirectory,
+    IndexedPreset,
+    PresetIndex,
+)
+
+# Threads reading and hashing changed files
+MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+# Rows written to the database per transaction
+WRITE_BATCH = 500
+
+# Seconds between background refreshes while platyplaty runs
+REFRESH_INTERVAL = 60.0
+
+# Directories modified this recently are listed again on the next refresh
+_RACY_SECONDS = 2.0
+
+_INDEXED_SUFFIXES = (".milk", ".platy")
+
+_lock = threading.Lock()
+_pending: Future["IndexRefresh"] | None = None
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="preset-index")
+
+
+class IndexRefresh(NamedTuple):
+    """Outcome of one refresh.
+
+    Attributes:
+        scanned: Files found in the preset directories.
+        updated: Files added or re-read because they changed.
+        removed: Rows dropped because their file disappeared.
+    """
+
+    scanned: int
+    updated: int
+    removed: int
+
+
+class _Walk(NamedTuple):
+    """What walking one preset directory found.
+
+    Attributes:
+        files: Files in listed directories, with their (followed) stat.
+        kept: Paths of unlisted directories, whose files are unchanged.
+        directories: Every directory visited, to record for next time.
+    """
+
+    files: list[tuple[Path, os.stat_result]]
+    kept: set[str]
+    directories: list[IndexedDirectory]
+
+
+def refresh_index(
+    index: PresetIndex,
+    preset_dirs: list[str],
+    max_workers: int = MAX_WORKERS,
+) -> IndexRefresh:
+    """Bring the index up to date with the preset directories.
+
+    Args:
+        index: The index to update.
+        preset_dirs: Absolute preset directory paths.
+        max_workers: Threads used to read and hash changed files.
+
+    Returns:
+        Counts of scanned, updated and removed files.
+    """
+    index.delete_roots_except(preset_dirs)
+    scanned = updated = removed = 0
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="preset-hash"
+    ) as pool:
+        for root in preset_dirs:
+            known = index.rows_under(root)
+            walk = _walk(root, index.directories_under(root))
+            seen = {key for key in known if os.path.dirname(key) in walk.kept}
+            futures: list[Future[IndexedPreset]] = []
+            for path, st in walk.files:
+                key = str(path)
+                seen.add(key)
+                row = known.get(key)
+                if row is not None and row.matches(st):
+                    continue
+                futures.append(pool.submit(_index_file, path, root, st))
+            batch: list[IndexedPreset] = []
+            for future in as_completed(futures):
+                batch.append(future.result())
+                if len(batch) >= WRITE_BATCH:
+                    index.upsert(batch)
+                    batch.clear()
+            index.upsert(batch)
+            gone = known.keys() - seen
+            index.delete(gone)
+            index.replace_directories(root, walk.directories)
+            scanned += len(seen)
+            updated += len(futures)
+            removed += len(gone)
+    return IndexRefresh(scanned, updated, removed)
+
+
+def start_index_refresh(
+    index: PresetIndex, preset_dirs: list[str]
+) -> Future[IndexRefresh]:
+    """Refresh the index in the background unless a refresh is running.
+
+    Args:
+        index: The index to update.
+        preset_dirs: Absolute preset directory paths.
+
+    Returns:
+        The future of the running (possibly already started) refresh.
+    """
+    global _pending
+    with _lock:
+        if _pending is None or _pending.done():
+            _pending = _executor.submit(refresh_index, index, list(preset_dirs))
+        return _pending
+
+
+def _walk(root: str, known: dict[str, IndexedDirectory]) -> _Walk:
+    """Find the .milk/.platy files under root in directories that changed.
+
+    Args:
+        root: The preset directory to walk.
+        known: The directories recorded by the last refresh, by path.
+
+    Returns:
+        The files of listed directories, the unlisted directories and
+        every directory visited.
+    """
+    subdirectories: defaultdict[str, list[str]] = defaultdict(list)
+    for path in known:
+        subdirectories[os.path.dirname(path)].append(path)
+    racy_before = time.time_ns() - int(_RACY_SECONDS * 1e9)
+    walk = _Walk([], set(), [])
+    visited: set[tuple[int, int]] = set()
+    stack = [str(Path(root))]
+    while stack:
+        directory = stack.pop()
+        try:
+            st = os.stat(directory)
+        except OSError:
+            continue
+        identity = (st.st_dev, st.st_ino)
+        if identity in visited:
+            continue
+        visited.add(identity)
+        current = IndexedDirectory(
+            directory, root, st.st_dev, st.st_ino,
+            st.st_mtime_ns if st.st_mtime_ns < racy_before else -1,
+        )
+        previous = known.get(directory)
+        if previous is not None and (
+            (previous.dev, previous.inode, previous.mtime_ns)
+            == (st.st_dev, st.st_ino, st.st_mtime_ns)
+        ):
+            walk.kept.add(directory)
+            walk.directories.append(previous)
+            stack.extend(subdirectories[directory])
+            continue
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        walk.directories.append(current)
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    stack.append(entry.path)
+                    continue
+                if not entry.name.lower().endswith(_INDEXED_SUFFIXES):
+                    continue
+                file_st = entry.stat()
+            except OSError:
+                continue
+            walk.files.append((Path(entry.path), file_st))
+    return walk
+
+
+def _index_file(path: Path, root: str, st: os.stat_result) -> IndexedPreset:
+    """Read, hash and parse one file (worker job).
+
+    Args:
+        path: The file to index.
+        root: The preset directory it was found under.
+        st: Its stat result from the walk.
+
+    Returns:
+        The index row for the file.
+    """
+    try:
+        data = path.read_bytes()
+    except OSError:
+        content_hash = None
+        status = STATUS_UNREADABLE
+    else:
+        content_hash = hashlib.blake2b(data, digest_size=16).hexdigest()
+        status = _parse_status(path, data)
+    return IndexedPreset(
+        str(path), root, st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns,
+        st.st_ctime_ns, content_hash, status,
+    )
+
+
+def _parse_status(path: Path, data: bytes) -> str:
+    """Return the parse status of a file's content.
+
+    Presets are parsed by the renderer, so any readable .milk file is
+    STATUS_OK. Playlists must decode and parse as a .platy file.
+    """
+    if path.suffix.lower() != ".platy":
+        return STATUS_OK
+    try:
+        parse_playlist_content(data.decode("utf-8"))
+    except (UnicodeDecodeError, PlaylistFileError):
+        return STATUS_INVALID
+    return STATUS_OK
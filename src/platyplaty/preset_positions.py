@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""Path to positions index for a PresetTable.
+
+A PositionIndex lists the positions of every entry grouped by pool id,
+as two parallel arrays sorted by (id, position). Looking up where a
+path occurs is a binary search for its group, so finding, counting and
+testing for a preset no longer scan the playlist.
+
+The index is built in one sorting pass and costs eight bytes per
+entry. Swaps, inserts, appends and deletes update it in place: the
+affected entries are located by binary search, the arrays are rebuilt
+from slices around them, and the positions after the edit are shifted
+in one pass. An edit touching more than 1/_REBUILD_FRACTION of the
+entries is cheaper to apply by rebuilding, so the table drops the index
+instead (see accepts).
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+
+# Edits touching more than 1/_REBUILD_FRACTION of the entries rebuild
+_REBUILD_FRACTION = 8
+
+# Edits at least this small are always applied in place
+_MIN_IN_PLACE = 64
+
+
+class PositionIndex:
+    """The positions of each pool id in one table."""
+
+    __slots__ = ("_ids", "_order")
+
+    _ids: "array[int]"
+    _order: "array[int]"
+
+    def __init__(self, ids: "array[int]") -> None:
+        """Index a table's id column.
+
+        Args:
+            ids: The pool id of each entry.
+        """
+        self._order = array("I", sorted(range(len(ids)), key=ids.__getitem__))
+        self._ids = array("I", map(ids.__getitem__, self._order))
+
+    def __len__(self) -> int:
+        """Return the number of entries indexed."""
+        return len(self._order)
+
+    def accepts(self, edited: int) -> bool:
+        """Return True if an edit of this many entries should be applied.
+
+        Larger edits are cheaper to handle by building a new index.
+
+        Args:
+            edited: The number of entries removed plus those added.
+        """
+        return edited <= max(_MIN_IN_PLACE, len(self._order) // _REBUILD_FRACTION)
+
+    def _span(self, ident: int) -> tuple[int, int]:
+        """Return the bounds of ident's group in the sorted arrays."""
+        return bisect_left(self._ids, ident), bisect_right(self._ids, ident)
+
+    def positions(self, ident: int) -> "array[int]":
+        """Return the positions of ident's entries, in ascending order."""
+        lo, hi = self._span(ident)
+        return self._order[lo:hi]
+
+    def first(self, ident: int, start: int = 0) -> int | None:
+        """Return the first position of ident at or after start, if any."""
+        lo, hi = self._span(ident)
+        found = bisect_left(self._order, start, lo, hi)
+        return self._order[found] if found < hi else None
+
+    def count(self, ident: int) -> int:
+        """Return the number of entries with ident."""
+        lo, hi = self._span(ident)
+        return hi - lo
+
+    def swap(self, i: int, ident_i: int, j: int, ident_j: int) -> None:
+        """Record that the entries at positions i and j were exchanged.
+
+        Args:
+            i: A non-negative position.
+            ident_i: The id that was at i.
+            j: Another non-negative position.
+            ident_j: The id that was at j.
+        """
+        if ident_i != ident_j:
+            self._move(ident_i, i, j)
+            self._move(ident_j, j, i)
+
+    def splice(
+        self, start: int, removed: Sequence[int], added: Sequence[int]
+    ) -> None:
+        """Record that a run of entries was replaced by another.
+
+        Args:
+            start: The non-negative position of the first entry replaced.
+            removed: The ids of the entries that were at start onwards.
+            added: The ids of the entries now at start onwards.
+        """
+        stop = start + len(removed)
+        shifted = stop < len(self._order)
+        self._remove(range(start, stop), removed)
+        delta = len(added) - len(removed)
+        if shifted and delta:
+            self._order = array(
+                "I", [pos + delta if pos >= stop else pos for pos in self._order]
+            )
+        self._add(start, added)
+
+    def delete(self, positions: Sequence[int], removed: Sequence[int]) -> None:
+        """Record that entries at several positions were removed.
+
+        Args:
+            positions: The positions of the entries, ascending.
+            removed: The id of each of those entries.
+        """
+        if not positions:
+            return
+        self._remove(positions, removed)
+        first = positions[0]
+        self._order = array("I", [
+            pos - bisect_left(positions, pos) if pos > first else pos
+            for pos in self._order
+        ])
+
+    def _remove(self, positions: Sequence[int], removed: Sequence[int]) -> None:
+        """Drop the entries at positions, whose ids are removed."""
+        if not positions:
+            return
+        drop = sorted(
+            bisect_left(self._order, pos, *self._span(ident))
+            for pos, ident in zip(positions, removed, strict=True)
+        )
+        ids, order = array("I"), array("I")
+        last = 0
+        for at in drop:
+            ids += self._ids[last:at]
+            order += self._order[last:at]
+            last = at + 1
+        ids += self._ids[last:]
+        order += self._order[last:]
+        self._ids, self._order = ids, order
+
+    def _add(self, start: int, added: Sequence[int]) -> None:
+        """Insert entries with ids added at positions from start on."""
+        if not added:
+            return
+        # Sorted by (id, position), so the insertion points ascend too
+        offsets = sorted(range(len(added)), key=added.__getitem__)
+        points = [
+            bisect_left(self._order, start + offset, *self._span(added[offset]))
+            for offset in offsets
+        ]
+        ids, order = array("I"), array("I")
+        last = 0
+        for at, offset in zip(points, offsets, strict=True):
+            ids += self._ids[last:at]
+            order += self._order[last:at]
+            ids.append(added[offset])
+            order.append(start + offset)
+            last = at
+        ids += self._ids[last:]
+        order += self._order[last:]
+        self._ids, self._order = ids, order
+
+    def _move(self, ident: int, old: int, new: int) -> None:
+        """Replace position old with new in ident's group, keeping it sorted."""
+        lo, hi = self._span(ident)
+        group = list(self._order[lo:hi])
+        group[bisect_left(group, old)] = new
+        group.sort()
+        self._order[lo:hi] = array("I", group)
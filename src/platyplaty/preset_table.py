@@ -0,0 +1,690 @@
+#!/usr/bin/env python3
+"""Compact storage for playlist entries.
+
+A PresetTable is a mutable sequence of preset paths that stores each
+entry as a 32-bit id into a pool of interned path strings, a 32-bit
+stable entry key and one byte of flags. Path objects are only built
+when an entry is read, so a playlist costs nine bytes per entry plus
+one string per distinct path, rather than a Path object (and its
+cached parts) per entry.
+
+Tables derived from one another (copies, slices, concatenations) share
+their pool, so comparing them is a comparison of arrays. Pools only
+grow; a pool is freed with the last table using it.
+
+Searching for a path (index, count, in, positions) goes through a
+PositionIndex built on first use. Swaps, inserts, appends, deletes and
+contiguous slice assignments update it in place; reordering the whole
+table, or an edit too large to be worth applying, drops it until the
+next lookup. Entries naming a given file, through any path, are found
+through an IdentityIndex kept by the pool, which is filled with the
+identities validation records (see record_identities).
+
+A table's listener, if set, is told about every change to its entries
+(not their flags) after it is made; the autosave journal records edits
+this way.
+"""
+
+import random
+from array import array
+from collections.abc import Iterable, Iterator, MutableSequence, MutableSet, Sequence
+from itertools import compress, count
+from operator import ne
+from pathlib import Path
+from typing import NamedTuple, Protocol, overload
+
+from platyplaty.file_identity import FileIdentity
+from platyplaty.preset_identities import IdentityIndex
+from platyplaty.preset_positions import PositionIndex
+
+# Flag bit set on entries whose preset is missing or unreadable
+BROKEN = 0x01
+
+# Flag bit set on entries the user has marked for a batch operation
+MARKED = 0x02
+
+
+class _PathPool:
+    """Interned path strings, addressed by id, and the entry key counter."""
+
+    __slots__ = ("strings", "ids", "next_key", "_identities")
+
+    def __init__(self) -> None:
+        """Initialize an empty pool."""
+        self.strings: list[str] = []
+        self.ids: dict[str, int] = {}
+        self.next_key = 0
+        self._identities: IdentityIndex | None = None
+
+    def identities(self) -> IdentityIndex:
+        """Return the pool's identity index, creating it if needed."""
+        if self._identities is None:
+            self._identities = IdentityIndex(self.strings)
+        return self._identities
+
+    def intern(self, text: str) -> int:
+        """Return the id of text, adding it if new."""
+        ident = self.ids.get(text)
+        if ident is None:
+            ident = self.ids[text] = len(self.strings)
+            self.strings.append(text)
+        return ident
+
+    def new_keys(self, n: int) -> range:
+        """Allocate n entry keys not used by any table over this pool."""
+        first = self.next_key
+        self.next_key += n
+        return range(first, first + n)
+
+
+class _Columns(NamedTuple):
+    """Parallel per-entry arrays: path ids, entry keys and flags."""
+
+    ids: "array[int]"
+    keys: "array[int]"
+    flags: bytearray
+
+
+class EditListener(Protocol):
+    """Receives the edits made to a PresetTable's entries."""
+
+    def spliced(self, start: int, stop: int, strings: list[str]) -> None:
+        """Entries start to stop were replaced by paths given as strings."""
+
+    def swapped(self, i: int, j: int) -> None:
+        """The entries at non-negative indices i and j were exchanged."""
+
+    def deleted(self, indices: list[int]) -> None:
+        """The entries at the given ascending indices were removed."""
+
+    def reversed(self) -> None:
+        """The entries were reversed."""
+
+    def permuted(self, order: list[int]) -> None:
+        """Entry order[i] was moved to index i, for every i."""
+
+    def rewritten(self) -> None:
+        """The entries were rearranged as a whole."""
+
+
+class PresetTable(MutableSequence[Path]):
+    """A list of preset paths stored as ids into a shared string pool.
+
+    Behaves like list[Path]. Each entry also has a stable key, unique
+    among tables sharing the pool, and a byte of flags (see BROKEN and
+    MARKED). Both travel with the entry when it is moved, swapped or
+    shuffled, and entries taken from a table over the same pool (a
+    snapshot being restored, a slice being spliced back) keep theirs.
+    Entries added any other way, including by item assignment, get a new key and no
+    flags.
+    """
+
+    __slots__ = ("_pool", "_ids", "_keys", "_flags", "_index", "listener")
+
+    _pool: _PathPool
+    _ids: "array[int]"
+    _keys: "array[int]"
+    _flags: bytearray
+    _index: PositionIndex | None
+    listener: EditListener | None
+
+    def __init__(self, presets: Iterable[Path] = ()) -> None:
+        """Initialize the table.
+
+        Args:
+            presets: Initial entries. Another PresetTable is copied
+                cheaply, sharing its pool and keeping its keys and
+                flags.
+        """
+        self._pool = (
+            presets._pool if isinstance(presets, PresetTable) else _PathPool()
+        )
+        self.listener = None
+        self._set_columns(self._columns_of(presets))
+
+    @classmethod
+    def from_strings(cls, strings: Iterable[str]) -> "PresetTable":
+        """Build a table from path strings without creating Path objects.
+
+        Args:
+            strings: Normalized absolute path strings, as str(Path)
+                would return them.
+        """
+        table = cls()
+        table.extend_strings(strings)
+        return table
+
+    def _set_columns(self, columns: _Columns) -> None:
+        """Replace the per-entry arrays."""
+        self._ids, self._keys, self._flags = columns
+        self._index = None
+
+    def _derived(self, columns: _Columns) -> "PresetTable":
+        """Return a table over this pool holding columns."""
+        table = PresetTable.__new__(PresetTable)
+        table._pool = self._pool
+        table.listener = None
+        table._set_columns(columns)
+        return table
+
+    def _columns_of(self, presets: Iterable[Path]) -> _Columns:
+        """Return new columns in this pool holding presets."""
+        if isinstance(presets, PresetTable):
+            flags = bytearray(presets._flags)
+            if presets._pool is self._pool:
+                keys = array("I", presets._keys)
+                return _Columns(array("I", presets._ids), keys, flags)
+            ids = array("I", map(self._pool.intern, presets.strings()))
+        else:
+            ids = array("I", map(self._pool.intern, map(str, presets)))
+            flags = bytearray(len(ids))
+        return _Columns(ids, array("I", self._pool.new_keys(len(ids))), flags)
+
+    def _columns(self) -> _Columns:
+        """Return this table's per-entry arrays."""
+        return _Columns(self._ids, self._keys, self._flags)
+
+    def _edit_columns(self) -> _Columns:
+        """Return the per-entry arrays for editing, dropping the index."""
+        self._index = None
+        return self._columns()
+
+    def _span(self, index: slice) -> tuple[int, int] | None:
+        """Return the entries a slice covers as (start, stop), if contiguous."""
+        start, stop, step = index.indices(len(self._ids))
+        return (start, max(start, stop)) if step == 1 else None
+
+    def _spliced(self, span: tuple[int, int] | None, ids: Iterable[int]) -> None:
+        """Tell the listener that the entries in span were replaced by ids."""
+        if self.listener is None:
+            return
+        if span is None:
+            self.listener.rewritten()
+            return
+        strings = self._pool.strings
+        self.listener.spliced(*span, [strings[ident] for ident in ids])
+
+    def _splice_index(
+        self,
+        span: tuple[int, int] | None,
+        removed: Sequence[int],
+        added: Sequence[int],
+    ) -> None:
+        """Update the position index, if built, for replaced entries.
+
+        Args:
+            span: The (start, stop) of the entries replaced, or None if
+                they were not contiguous.
+            removed: The ids of the entries replaced.
+            added: The ids of the entries now at start onwards.
+        """
+        index = self._index
+        if index is None:
+            return
+        if span is None or not index.accepts(len(removed) + len(added)):
+            self._index = None
+        else:
+            index.splice(span[0], removed, added)
+
+    def _position_index(self) -> PositionIndex:
+        """Return the position index, building it if needed."""
+        if self._index is None:
+            self._index = PositionIndex(self._ids)
+        return self._index
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return len(self._ids)
+
+    @overload
+    def __getitem__(self, index: int) -> Path: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "PresetTable": ...
+
+    def __getitem__(self, index: int | slice) -> "Path | PresetTable":
+        """Return the path at index, or a table for a slice."""
+        if isinstance(index, slice):
+            return self._derived(
+                _Columns(self._ids[index], self._keys[index], self._flags[index])
+            )
+        return Path(self._pool.strings[self._ids[index]])
+
+    @overload
+    def __setitem__(self, index: int, value: Path) -> None: ...
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[Path]) -> None: ...
+
+    def __setitem__(self, index: int | slice, value: "Path | Iterable[Path]") -> None:
+        """Store a path at index, or replace a slice."""
+        if isinstance(value, Path):
+            if isinstance(index, slice):
+                raise TypeError("can only assign an iterable of paths to a slice")
+            if not -len(self) <= index < len(self):
+                raise IndexError("table assignment index out of range")
+            value = (value,)
+            index = slice(index, index + 1 or None)
+        elif not isinstance(index, slice):
+            raise TypeError("can only assign a Path to an index")
+        span = self._span(index)
+        removed = self._ids[index]
+        new_columns = self._columns_of(value)
+        for column, new in zip(self._columns(), new_columns, strict=True):
+            column[index] = new
+        self._splice_index(span, removed, new_columns.ids)
+        self._spliced(span, new_columns.ids)
+
+    def __delitem__(self, index: int | slice) -> None:
+        """Remove the entry at index, or a slice of entries."""
+        if isinstance(index, slice):
+            span = self._span(index)
+            removed = self._ids[index]
+        else:
+            start = range(len(self._ids))[index]
+            span = (start, start + 1)
+            removed = self._ids[start:start + 1]
+        for column in self._columns():
+            del column[index]
+        self._splice_index(span, removed, ())
+        self._spliced(span, ())
+
+    def insert(self, index: int, value: Path) -> None:
+        """Insert a path before index."""
+        ident = self._pool.intern(str(value))
+        start = len(self._ids) + index if index < 0 else index
+        start = min(max(start, 0), len(self._ids))
+        self._ids.insert(start, ident)
+        self._keys.insert(start, self._pool.new_keys(1)[0])
+        self._flags.insert(start, 0)
+        self._splice_index((start, start), (), (ident,))
+        self._spliced((start, start), (ident,))
+
+    def append(self, value: Path) -> None:
+        """Add a path at the end."""
+        self.insert(len(self._ids), value)
+
+    def extend(self, values: Iterable[Path]) -> None:
+        """Add paths at the end."""
+        end = len(self._ids)
+        new_columns = self._columns_of(values)
+        for column, new in zip(self._columns(), new_columns, strict=True):
+            column.extend(new)
+        self._splice_index((end, end), (), new_columns.ids)
+        self._spliced((end, end), new_columns.ids)
+
+    def extend_strings(self, strings: Iterable[str]) -> None:
+        """Add paths at the end from path strings, without creating Paths.
+
+        Args:
+            strings: Normalized absolute path strings, as str(Path)
+                would return them.
+        """
+        end = len(self._ids)
+        new_ids = array("I", map(self._pool.intern, strings))
+        ids, keys, flags = self._columns()
+        ids.extend(new_ids)
+        keys.extend(self._pool.new_keys(len(new_ids)))
+        flags.extend(bytes(len(new_ids)))
+        self._splice_index((end, end), (), new_ids)
+        self._spliced((end, end), new_ids)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        del self[:]
+
+    def reverse(self) -> None:
+        """Reverse the entries in place."""
+        for column in self._edit_columns():
+            column.reverse()
+        if self.listener is not None:
+            self.listener.reversed()
+
+    def swap(self, i: int, j: int) -> None:
+        """Exchange two entries, keys and flags included."""
+        i, j = range(len(self._ids))[i], range(len(self._ids))[j]
+        if self._index is not None:
+            self._index.swap(i, self._ids[i], j, self._ids[j])
+        for column in self._columns():
+            column[i], column[j] = column[j], column[i]
+        if self.listener is not None:
+            self.listener.swapped(i, j)
+
+    def shuffle(self, rng: random.Random | None = None) -> None:
+        """Shuffle the entries in place, keys and flags included.
+
+        Args:
+            rng: Random number generator; the random module's shared
+                generator when None.
+        """
+        order = list(range(len(self._ids)))
+        (rng or random).shuffle(order)
+        self.permute(order)
+
+    def permute(self, order: Iterable[int]) -> None:
+        """Rearrange the entries in one pass, keys and flags included.
+
+        Args:
+            order: The old index of each entry, in its new order; a
+                permutation of range(len(self)).
+        """
+        order = list(order)
+        self._set_columns(self._taken(order))
+        if self.listener is not None:
+            self.listener.permuted(order)
+
+    def take(self, indices: Iterable[int]) -> "PresetTable":
+        """Return a table of the entries at indices, keys and flags included.
+
+        Args:
+            indices: Indices of the entries, in the order wanted.
+        """
+        return self._derived(self._taken(list(indices)))
+
+    def _taken(self, indices: list[int]) -> _Columns:
+        """Return new columns holding the entries at indices."""
+        return _Columns(
+            array("I", map(self._ids.__getitem__, indices)),
+            array("I", map(self._keys.__getitem__, indices)),
+            bytearray(map(self._flags.__getitem__, indices)),
+        )
+
+    def delete_indices(self, indices: Iterable[int]) -> None:
+        """Remove the entries at several indices in one pass.
+
+        Args:
+            indices: Non-negative indices of the entries to remove, in
+                any order.
+        """
+        deleted = sorted(set(indices))
+        keep = bytearray(b"\x01") * len(self._ids)
+        for index in deleted:
+            keep[index] = 0
+        position_index = self._index
+        removed = [self._ids[i] for i in deleted] if position_index is not None else []
+        self._set_columns(_Columns(
+            array("I", compress(self._ids, keep)),
+            array("I", compress(self._keys, keep)),
+            bytearray(compress(self._flags, keep)),
+        ))
+        if position_index is not None and position_index.accepts(len(deleted)):
+            position_index.delete(deleted, removed)
+            self._index = position_index
+        if self.listener is not None:
+            self.listener.deleted(deleted)
+
+    def copy(self) -> "PresetTable":
+        """Return a shallow copy sharing this table's pool."""
+        return PresetTable(self)
+
+    def key_at(self, index: int) -> int:
+        """Return the stable key of the entry at index."""
+        return self._keys[index]
+
+    def find_key(self, key: int, near: int | None = None) -> int | None:
+        """Return the index of the entry with key, or None if absent.
+
+        Args:
+            key: The entry key.
+            near: Where the entry was last seen. That slot and its
+                neighbours, where a single move or delete leaves it,
+                are checked before the whole table is searched.
+        """
+        keys = self._keys
+        if near is not None:
+            for index in (near, near - 1, near + 1):
+                if 0 <= index < len(keys) and keys[index] == key:
+                    return index
+        try:
+            return keys.index(key)
+        except ValueError:
+            return None
+
+    def _find_id(self, value: object) -> int | None:
+        """Return the pool id of a path, or None if it is not pooled."""
+        if not isinstance(value, Path):
+            return None
+        return self._pool.ids.get(str(value))
+
+    def __contains__(self, value: object) -> bool:
+        """Return True if the path is in the table."""
+        ident = self._find_id(value)
+        return ident is not None and self._position_index().count(ident) > 0
+
+    def index(self, value: Path, start: int = 0, stop: int | None = None) -> int:
+        """Return the first index of a path."""
+        ident = self._find_id(value)
+        if ident is not None:
+            start, end, _ = slice(start, stop).indices(len(self._ids))
+            found = self._position_index().first(ident, start)
+            if found is not None and found < end:
+                return found
+        raise ValueError(f"{value!r} is not in table")
+
+    def count(self, value: Path) -> int:
+        """Return the number of entries equal to a path."""
+        ident = self._find_id(value)
+        return 0 if ident is None else self._position_index().count(ident)
+
+    def positions(self, value: Path) -> Sequence[int]:
+        """Return the indices of entries equal to a path, ascending."""
+        ident = self._find_id(value)
+        if ident is None:
+            return ()
+        return self._position_index().positions(ident)
+
+    def identity_positions(self, identity: FileIdentity) -> list[int]:
+        """Return the indices of entries naming a file, ascending.
+
+        Entries are matched by the (st_dev, st_ino) of the file their
+        path names, so symlinks to the file are included. Only entries
+        without a recorded identity are stat'ed (see IdentityIndex).
+
+        Args:
+            identity: The file's (st_dev, st_ino).
+        """
+        index = self._position_index()
+        found: list[int] = []
+        for ident in self._pool.identities().ids_of(identity, self._ids):
+            found.extend(index.positions(ident))
+        return sorted(found)
+
+    def record_identities(
+        self, identities: Iterable[tuple[str, FileIdentity | None]]
+    ) -> None:
+        """Record the file identities of paths found while validating them.
+
+        Args:
+            identities: (path string, identity) pairs; identity is None
+                for a path that could not be stat'ed. Paths not in the
+                pool are ignored.
+        """
+        ids = self._pool.ids
+        index = self._pool.identities()
+        for text, identity in identities:
+            ident = ids.get(text)
+            if ident is not None:
+                index.record(ident, identity)
+
+    def distinct(self) -> Iterator[Path]:
+        """Yield each path in the table once, in order of first entry."""
+        strings = self._pool.strings
+        for ident in dict.fromkeys(self._ids):
+            yield Path(strings[ident])
+
+    def __iter__(self) -> Iterator[Path]:
+        """Yield each entry as a new Path."""
+        strings = self._pool.strings
+        for ident in self._ids:
+            yield Path(strings[ident])
+
+    def __reversed__(self) -> Iterator[Path]:
+        """Yield each entry as a new Path, last first."""
+        strings = self._pool.strings
+        for ident in reversed(self._ids):
+            yield Path(strings[ident])
+
+    def strings(self) -> list[str]:
+        """Return the entries as path strings, without creating Paths."""
+        strings = self._pool.strings
+        return [strings[ident] for ident in self._ids]
+
+    def path_string(self, index: int) -> str:
+        """Return the entry at index as a path string."""
+        return self._pool.strings[self._ids[index]]
+
+    def has_flag(self, index: int, flag: int) -> bool:
+        """Return True if the entry at index has flag set."""
+        return bool(self._flags[index] & flag)
+
+    def set_flag(self, index: int, flag: int, value: bool = True) -> None:
+        """Set or clear flag on the entry at index."""
+        if value:
+            self._flags[index] |= flag
+        else:
+            self._flags[index] &= ~flag & 0xFF
+
+    def clear_flag(self, flag: int) -> None:
+        """Clear flag on every entry."""
+        self._flags = self._flags.translate(_masks(~flag))
+
+    def flagged(self, flag: int) -> Iterator[int]:
+        """Yield the indices of entries with flag set."""
+        return compress(count(), self._flags.translate(_masks(flag)))
+
+    def count_flagged(self, flag: int) -> int:
+        """Return the number of entries with flag set."""
+        return len(self._flags) - self._flags.translate(_masks(flag)).count(0)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare with another table or any sequence of paths."""
+        if isinstance(other, PresetTable):
+            if other._pool is self._pool:
+                return self._ids == other._ids
+            return self.strings() == other.strings()
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(other) == len(self) and self.strings() == [
+                str(p) if isinstance(p, Path) else None for p in other
+            ]
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __add__(self, other: Iterable[Path]) -> "PresetTable":
+        """Return a new table with other's entries after this one's."""
+        table = self.copy()
+        table.extend(other)
+        return table
+
+    def __radd__(self, other: Iterable[Path]) -> "PresetTable":
+        """Return a new table with other's entries before this one's."""
+        table = self._derived(self._columns_of(other))
+        table.extend(self)
+        return table
+
+    def __sizeof__(self) -> int:
+        """Return the size of the per-entry arrays; the pool is shared."""
+        arrays = sum(column.__sizeof__() for column in self._columns())
+        return object.__sizeof__(self) + arrays
+
+    def __repr__(self) -> str:
+        """Return a list-like representation."""
+        return f"PresetTable({self.strings()!r})"
+
+
+class FlagSet(MutableSet[int]):
+    """The indices of a table's entries that have one flag set.
+
+    A live view: flags move with their entries, so the indices follow
+    inserts, deletes and reorders without being adjusted.
+    """
+
+    __slots__ = ("_table", "_flag")
+
+    def __init__(self, table: PresetTable, flag: int) -> None:
+        """Initialize the view.
+
+        Args:
+            table: The table whose flags are viewed.
+            flag: The flag bit, e.g. BROKEN.
+        """
+        self._table = table
+        self._flag = flag
+
+    def __contains__(self, index: object) -> bool:
+        """Return True if the entry at index has the flag."""
+        return (
+            isinstance(index, int)
+            and 0 <= index < len(self._table)
+            and self._table.has_flag(index, self._flag)
+        )
+
+    def __iter__(self) -> Iterator[int]:
+        """Yield flagged indices in order."""
+        return self._table.flagged(self._flag)
+
+    def __len__(self) -> int:
+        """Return the number of flagged entries."""
+        return self._table.count_flagged(self._flag)
+
+    def add(self, index: int) -> None:
+        """Set the flag on the entry at index."""
+        self._table.set_flag(index, self._flag)
+
+    def discard(self, index: int) -> None:
+        """Clear the flag on the entry at index, if it exists."""
+        if 0 <= index < len(self._table):
+            self._table.set_flag(index, self._flag, False)
+
+    def clear(self) -> None:
+        """Clear the flag on every entry."""
+        self._table.clear_flag(self._flag)
+
+    def __repr__(self) -> str:
+        """Return a set-like representation."""
+        return repr(set(self))
+
+
+def common_affixes(a: Sequence[Path], b: Sequence[Path]) -> tuple[int, int]:
+    """Return the lengths of the common head and tail of two sequences.
+
+    Tables sharing a pool are compared by entry key, so an entry
+    replaced by another copy of the same path counts as a change;
+    other sequences are compared by path string. Either way the scan
+    runs in C. The tail never overlaps the head.
+
+    Args:
+        a: The first sequence of paths.
+        b: The second sequence of paths.
+
+    Returns:
+        (head, tail): the number of equal leading and trailing entries.
+    """
+    keys_a: Sequence[object]
+    keys_b: Sequence[object]
+    if (
+        isinstance(a, PresetTable)
+        and isinstance(b, PresetTable)
+        and a._pool is b._pool
+    ):
+        keys_a, keys_b = a._keys, b._keys
+    else:
+        keys_a, keys_b = _strings(a), _strings(b)
+    limit = min(len(keys_a), len(keys_b))
+    head = next(compress(count(), map(ne, keys_a, keys_b)), limit)
+    tail = next(
+        compress(count(), map(ne, reversed(keys_a), reversed(keys_b))), limit
+    )
+    return head, min(tail, limit - head)
+
+
+def _masks(flag: int) -> bytes:
+    """Return a translation table that ANDs every byte with flag."""
+    return bytes(i & flag & 0xFF for i in range(256))
+
+
+def _strings(presets: Sequence[Path]) -> list[str]:
+    """Return presets as path strings."""
+    if isinstance(presets, PresetTable):
+        return presets.strings()
+    return [str(p) for p in presets]
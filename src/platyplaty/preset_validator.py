@@ -3,6 +3,9 @@
 
 from pathlib import Path
 
+from platyplaty.file_stat import file_stat
+from platyplaty.preset_index import STATUS_OK, lookup_indexed
+
 
 def is_broken_symlink(path: Path) -> bool:
     """Check if path is a broken symlink.
@@ -13,7 +16,7 @@ def is_broken_symlink(path: Path) -> bool:
     Returns:
         True if path is a symlink whose target does not exist.
     """
-    return path.is_symlink() and not path.exists()
+    return file_stat(path).is_broken_symlink
 
 
 def is_readable(path: Path) -> bool:
@@ -40,14 +43,20 @@ def is_valid_preset(path: Path) -> bool:
     - The file is readable
     - It is not a broken symlink
 
+    Files covered by the preset index, whose stat result still matches
+    their row, are judged by their indexed parse status instead of
+    opening them. Otherwise existence is taken from the shared stat
+    cache and only the readability check touches the file.
+
     Args:
         path: The path to the preset file.
 
     Returns:
         True if the preset is valid and playable.
     """
-    if is_broken_symlink(path):
-        return False
-    if not path.exists():
+    indexed = lookup_indexed(path)
+    if indexed is not None:
+        return indexed.status == STATUS_OK
+    if not file_stat(path).exists:
         return False
     return is_readable(path)
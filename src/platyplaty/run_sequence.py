@@ -11,6 +11,7 @@ from platyplaty.app import PlatyplatyApp
 from platyplaty.errors import InaccessibleDirectoryError, StartupError
 from platyplaty.path_resolution import resolve_path_argument
 from platyplaty.playlist import Playlist
+from platyplaty.preset_dirs import expand_preset_dirs, validate_preset_dirs
 from platyplaty.renderer_binary import (
     RendererNotFoundError,
     find_renderer_binary,
@@ -42,7 +43,11 @@ def run_startup_sequence(config: Config, path_argument: str | None) -> None:
     effective_playlist_path = resolved.playlist_path
     if effective_playlist_path is None and config.playlist:
         effective_playlist_path = Path(config.playlist)
-    playlist = _create_playlist(effective_playlist_path)
+    playlist = _create_playlist(effective_playlist_path, config.autosave)
+
+    # Expand and check the preset directories to index
+    preset_dirs = expand_preset_dirs(config.preset_dirs)
+    validate_preset_dirs(preset_dirs)
 
     # Compute socket path and check for stale socket
     try:
@@ -72,6 +77,7 @@ def run_startup_sequence(config: Config, path_argument: str | None) -> None:
         fullscreen=config.renderer.fullscreen,
         keybindings=config.keybindings,
         transition_type=config.renderer.transition_type,
+        preset_dirs=tuple(preset_dirs),
     )
 
     # Create and run Textual app
@@ -86,11 +92,13 @@ def run_startup_sequence(config: Config, path_argument: str | None) -> None:
         raise StartupError(str(e)) from None
 
 
-def _create_playlist(playlist_path: Path | None) -> Playlist:
+def _create_playlist(playlist_path: Path | None, autosave: bool = False) -> Playlist:
     """Create playlist from path or return empty playlist.
 
     Args:
         playlist_path: Path to .platy playlist file, or None.
+        autosave: Whether edits to a playlist file are saved as they
+            are made.
 
     Returns:
         Playlist loaded from file, or empty playlist if no path given.
@@ -99,6 +107,7 @@ def _create_playlist(playlist_path: Path | None) -> Playlist:
         StartupError: If playlist file cannot be loaded.
     """
     playlist = Playlist(presets=[], loop=True)
+    playlist.autosave = autosave
     if playlist_path is not None:
         try:
             playlist.load_from_file(playlist_path)
@@ -22,6 +22,7 @@ class AppConfig:
         fullscreen: Whether to start in fullscreen mode.
         keybindings: Keybindings for renderer, client, and file browser.
         transition_type: Transition type for preset loading ("soft" or "hard").
+        preset_dirs: Absolute preset directories to index.
     """
 
     socket_path: str
@@ -30,3 +31,4 @@ class AppConfig:
     fullscreen: bool
     keybindings: Keybindings
     transition_type: Literal["soft", "hard"]
+    preset_dirs: tuple[str, ...] = ()
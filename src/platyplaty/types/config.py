@@ -14,6 +14,10 @@ class Config(BaseModel):
 
     Attributes:
         playlist: Optional path to .platy playlist file to load at startup.
+        autosave: Save edits to the loaded or saved playlist file as they
+            are made, through an append-only journal.
+        preset_dirs: Directories whose presets are indexed in the
+            background; paths may contain ~ and environment variables.
         renderer: Renderer window settings (audio, fullscreen).
         keybindings: Keybindings for all sections.
     """
@@ -21,6 +25,8 @@ class Config(BaseModel):
     model_config = ConfigDict(extra="forbid", populate_by_name=True)
 
     playlist: str | None = Field(default=None)
+    autosave: bool = Field(default=False)
+    preset_dirs: list[str] = Field(default_factory=list, alias="preset-dirs")
     renderer: RendererConfig = Field(default_factory=RendererConfig)
     keybindings: Keybindings = Field(default_factory=Keybindings)
 
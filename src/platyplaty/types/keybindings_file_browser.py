@@ -21,6 +21,10 @@ class FileBrowserKeybindings(BaseModel):
     play_next_preset: list[str] = Field(
         default=["J"], alias="play-next-preset"
     )
+    find: list[str] = Field(default=["f"])
+    filter: list[str] = Field(default=["slash"])
+    toggle_flatten: list[str] = Field(default=["F"], alias="toggle-flatten")
+    add_directory: list[str] = Field(default=["A"], alias="add-directory")
 
     @model_validator(mode="after")
     def validate_keys(self) -> "FileBrowserKeybindings":
@@ -22,6 +22,7 @@ class GlobalKeybindings(BaseModel):
     )
     view_errors: list[str] = Field(default=["e"], alias="view-errors")
     play_selection: list[str] = Field(default=["enter"], alias="play-selection")
+    find_preset: list[str] = Field(default=["ctrl+f"], alias="find-preset")
 
     @model_validator(mode="after")
     def validate_keys(self) -> "GlobalKeybindings":
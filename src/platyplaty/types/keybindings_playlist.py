@@ -16,6 +16,8 @@ class PlaylistKeybindings(BaseModel):
         "delete_from_playlist", "undo", "redo", "save_playlist",
         "shuffle_playlist", "toggle_autoplay", "page_up", "page_down",
         "navigate_to_first_preset", "navigate_to_last_preset",
+        "toggle_mark", "toggle_range", "clear_marks", "send_to_top",
+        "send_to_bottom",
     )
     play_previous: list[str] = Field(default=["K"], alias="play-previous")
     play_next: list[str] = Field(default=["J"], alias="play-next")
@@ -37,6 +39,11 @@ class PlaylistKeybindings(BaseModel):
     navigate_to_last_preset: list[str] = Field(
         default=["end"], alias="navigate-to-last-preset"
     )
+    toggle_mark: list[str] = Field(default=["m"], alias="toggle-mark")
+    toggle_range: list[str] = Field(default=["v"], alias="toggle-range")
+    clear_marks: list[str] = Field(default=["escape"], alias="clear-marks")
+    send_to_top: list[str] = Field(default=["T"], alias="send-to-top")
+    send_to_bottom: list[str] = Field(default=["B"], alias="send-to-bottom")
     preset_duration: int = Field(
         default=30, ge=1, strict=True, alias="preset-duration"
     )
@@ -23,6 +23,7 @@ from platyplaty.ui.layout import (
 )
 from platyplaty.ui.persistent_message import PersistentMessage
 from platyplaty.ui.playlist_view import PlaylistView
+from platyplaty.ui.preset_finder import PresetFinder
 from platyplaty.ui.status_line import StatusLine
 from platyplaty.ui.transient_error import TransientErrorBar
 
@@ -45,4 +46,5 @@ __all__ = [
     "CommandLine",
     "FooterContainer",
     "PersistentMessage",
+    "PresetFinder",
 ]
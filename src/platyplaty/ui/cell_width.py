@@ -0,0 +1,133 @@
+"""Display width measurement shared by all truncation code.
+
+Pure-ASCII strings take a fast path (one cell per character). Other
+strings are measured with rich's cell tables; their widths and their
+prefix-width tables are memoised, and truncation binary-searches the
+prefix table instead of walking the string one character at a time.
+"""
+
+from bisect import bisect_left, bisect_right
+
+import cachetools
+from rich.cells import cell_len, get_character_cell_size
+
+_width_cache: cachetools.LRUCache[tuple[str], int] = cachetools.LRUCache(
+    maxsize=8192
+)
+_prefix_cache: cachetools.LRUCache[tuple[str], tuple[int, ...]] = (
+    cachetools.LRUCache(maxsize=1024)
+)
+
+
+def cell_width(text: str) -> int:
+    """Return the number of terminal cells needed to display text.
+
+    Args:
+        text: The string to measure.
+
+    Returns:
+        Display width in cells (wide CJK/emoji characters count as 2).
+    """
+    if text.isascii():
+        return len(text)
+    return _wide_cell_width(text)
+
+
+@cachetools.cached(_width_cache)
+def _wide_cell_width(text: str) -> int:
+    """Measure a non-ASCII string (memoised)."""
+    return cell_len(text)
+
+
+@cachetools.cached(_prefix_cache)
+def prefix_widths(text: str) -> tuple[int, ...]:
+    """Return cumulative display widths of every prefix of text.
+
+    Element i is the display width of text[:i], so the table has
+    len(text) + 1 entries and starts with 0.
+
+    Args:
+        text: The string to measure.
+
+    Returns:
+        Non-decreasing tuple of prefix widths.
+    """
+    widths = [0]
+    total = 0
+    for char in text:
+        total += get_character_cell_size(char)
+        widths.append(total)
+    return tuple(widths)
+
+
+def truncate_to_width(text: str, width: int) -> str:
+    """Return the longest prefix of text that fits in width cells.
+
+    Args:
+        text: The string to cut.
+        width: Maximum display width in cells.
+
+    Returns:
+        The prefix of text whose display width does not exceed width.
+    """
+    if width <= 0:
+        return ""
+    if text.isascii():
+        return text[:width]
+    if _wide_cell_width(text) <= width:
+        return text
+    end = bisect_right(prefix_widths(text), width) - 1
+    return text[:end]
+
+
+def truncate_left_to_width(text: str, width: int) -> str:
+    """Return the longest suffix of text that fits in width cells.
+
+    Args:
+        text: The string to cut.
+        width: Maximum display width in cells.
+
+    Returns:
+        The suffix of text whose display width does not exceed width.
+    """
+    if width <= 0:
+        return ""
+    if text.isascii():
+        return text[-width:]
+    widths = prefix_widths(text)
+    if widths[-1] <= width:
+        return text
+    return text[bisect_left(widths, widths[-1] - width) :]
+
+
+def first_char_to_width(text: str, width: int) -> str:
+    """Return the first character of text, or an ellipsis if it is too wide.
+
+    Used where a name is cut down to a single leading character, which
+    may itself be a wide CJK or emoji character.
+
+    Args:
+        text: The string whose first character to show; must not be empty.
+        width: Display width in cells available for the character.
+
+    Returns:
+        The first character if it fits in width cells, otherwise "…"
+        (one cell), or an empty string if width is not positive.
+    """
+    if width <= 0:
+        return ""
+    first = text[0]
+    return first if cell_width(first) <= width else "…"
+
+
+def pad_to_width(text: str, width: int) -> str:
+    """Left-justify text with spaces so it occupies width cells.
+
+    Args:
+        text: The string to pad (assumed to fit within width).
+        width: Target display width in cells.
+
+    Returns:
+        text followed by enough spaces to fill width cells.
+    """
+    return text + " " * max(0, width - cell_width(text))
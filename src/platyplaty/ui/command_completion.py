@@ -0,0 +1,145 @@
+"""Tab completion of path arguments in the command prompt.
+
+Completes the path argument of :cd, :load and :save like a shell does:
+a single match is filled in (with a trailing "/" for directories),
+several matches are filled in up to their longest common prefix, and
+further Tab presses cycle through them.
+
+Directory listings come from completion_listing and are read on a
+worker thread. The directory being typed into is prefetched on every
+edit, so a listing is usually ready by the time Tab is pressed; if it
+is not, the completion is applied once the listing arrives, provided
+the text has not changed in the meantime.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from platyplaty.ui.command_completion_match import (
+    common_prefix,
+    completion_target,
+    matching_names,
+)
+from platyplaty.ui.completion_listing import (
+    get_completion_listing,
+    prefetch_completion_listing,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Future
+
+    from platyplaty.ui.command_prompt import CommandPrompt
+
+COMPLETE_KEY = "tab"
+
+
+class CommandCompleter:
+    """Completes path arguments for one session of the command prompt.
+
+    Attributes:
+        prompt: The prompt whose text is completed.
+        base_dir: Base directory for resolving relative paths.
+    """
+
+    def __init__(self, prompt: CommandPrompt, base_dir: Path) -> None:
+        """Initialize the completer.
+
+        Must be called with an asyncio event loop running.
+
+        Args:
+            prompt: The prompt whose text is completed.
+            base_dir: Base directory for resolving relative paths.
+        """
+        self.prompt = prompt
+        self.base_dir = base_dir
+        self._loop = asyncio.get_running_loop()
+        self._prefetched: Path | None = None
+        self._cycle: list[str] = []
+        self._cycle_index = 0
+        self._completed_text: str | None = None
+
+    def on_change(self, text: str) -> None:
+        """Prefetch the listing of the directory being typed into.
+
+        Args:
+            text: The prompt text after an edit.
+        """
+        target = completion_target(text, self.base_dir)
+        if target is None or target.directory == self._prefetched:
+            return
+        self._prefetched = target.directory
+        prefetch_completion_listing(target.directory)
+
+    def handle_key(self, key: str) -> bool:
+        """Complete the argument if key is the completion key.
+
+        Args:
+            key: The key pressed in the prompt.
+
+        Returns:
+            True if the key was consumed.
+        """
+        if key != COMPLETE_KEY:
+            return False
+        text = self.prompt.input_text
+        if self.prompt.cursor_index != len(text):
+            return True
+        if self._cycle and text == self._completed_text:
+            self._cycle_index = (self._cycle_index + 1) % len(self._cycle)
+            self._set_text(self._cycle[self._cycle_index])
+            return True
+        self._cycle = []
+        target = completion_target(text, self.base_dir)
+        if target is None:
+            return True
+        pending = prefetch_completion_listing(target.directory)
+        if pending is None:
+            self._complete(text)
+        else:
+            pending.add_done_callback(self._listing_ready(text))
+        return True
+
+    def _listing_ready(self, text: str) -> Callable[[Future[None]], None]:
+        """Return a done callback completing text on the event loop."""
+
+        def callback(_future: Future[None]) -> None:
+            self._loop.call_soon_threadsafe(self._complete_if_unchanged, text)
+
+        return callback
+
+    def _complete_if_unchanged(self, text: str) -> None:
+        """Complete text if the prompt still shows it."""
+        if self.prompt.input_text == text and self.prompt.has_class("visible"):
+            self._complete(text)
+
+    def _complete(self, text: str) -> None:
+        """Fill in the completion of text from the cached listing."""
+        target = completion_target(text, self.base_dir)
+        if target is None:
+            return
+        listing = get_completion_listing(target.directory)
+        if listing is None:
+            return
+        names = matching_names(listing, target)
+        if not names:
+            return
+        if len(names) == 1:
+            self._set_text(target.head + names[0])
+            return
+        prefix = common_prefix(names)
+        if len(prefix) > len(target.stem):
+            self._set_text(target.head + prefix)
+            return
+        self._cycle = [target.head + name for name in names]
+        self._cycle_index = 0
+        self._set_text(self._cycle[0])
+
+    def _set_text(self, text: str) -> None:
+        """Replace the prompt text, with the cursor at its end."""
+        self._completed_text = text
+        self.prompt.input_text = text
+        self.prompt.update_cursor_with_scroll(len(text))
@@ -0,0 +1,107 @@
+"""Matching helpers for command prompt path completion.
+
+These are package-private functions used by command_completion. They
+split the prompt text into the part that stays and the file name being
+completed, and pick the matching entries from a directory listing.
+"""
+
+import os
+from pathlib import Path
+from typing import NamedTuple
+
+from platyplaty.commands.cd_path_expand import expand_cd_path
+from platyplaty.ui.directory_types import DirectoryListing, EntryType
+
+# Commands whose argument is completed, and whether it names a directory
+COMPLETED_COMMANDS = {"add": True, "cd": True, "load": False, "save": False}
+
+_DIRECTORY_TYPES = (EntryType.DIRECTORY, EntryType.SYMLINK_TO_DIRECTORY)
+
+
+class CompletionTarget(NamedTuple):
+    """The file name being completed in the prompt text.
+
+    Attributes:
+        head: Prompt text up to and including the last "/" of the
+            argument; it is kept as typed.
+        stem: The partial file name after head.
+        directory: The expanded directory that head names.
+        directories_only: True if only directories may complete stem.
+    """
+
+    head: str
+    stem: str
+    directory: Path
+    directories_only: bool
+
+
+def completion_target(text: str, base_dir: Path) -> CompletionTarget | None:
+    """Find the path argument being typed in the prompt text.
+
+    Args:
+        text: The prompt text, e.g. "load ~/playlists/fav".
+        base_dir: Base directory for resolving relative paths.
+
+    Returns:
+        The completion target, or None if text is not a completed
+        command followed by a space, or its directory cannot be
+        expanded (e.g. it names an undefined variable).
+    """
+    name, space, argument = text.partition(" ")
+    if not space or name not in COMPLETED_COMMANDS:
+        return None
+    cut = argument.rfind("/") + 1
+    dir_part, stem = argument[:cut], argument[cut:]
+    if dir_part:
+        directory, error = expand_cd_path(dir_part, base_dir)
+        if directory is None or error is not None:
+            return None
+    else:
+        directory = base_dir
+    head = text[: len(name) + 1 + cut]
+    return CompletionTarget(head, stem, directory, COMPLETED_COMMANDS[name])
+
+
+def matching_names(listing: DirectoryListing, target: CompletionTarget) -> list[str]:
+    """Return the completions of target's stem found in listing.
+
+    Directories get a trailing "/". Hidden entries are offered only
+    once the stem starts with ".". Besides directories, only .platy
+    files complete :load and :save arguments.
+
+    Args:
+        listing: The listing of target's directory.
+        target: The completion target.
+
+    Returns:
+        The completed names, in listing order.
+    """
+    stem = target.stem
+    names: list[str] = []
+    for entry in listing.entries:
+        if not entry.name.startswith(stem):
+            continue
+        if entry.name.startswith(".") and not stem.startswith("."):
+            continue
+        if entry.entry_type in _DIRECTORY_TYPES:
+            names.append(entry.name + "/")
+        elif not target.directories_only and _is_playlist(entry.name):
+            names.append(entry.name)
+    return names
+
+
+def common_prefix(names: list[str]) -> str:
+    """Return the longest prefix shared by every name.
+
+    Args:
+        names: At least one name.
+
+    Returns:
+        The shared prefix.
+    """
+    return os.path.commonprefix(names)
+
+
+def _is_playlist(name: str) -> bool:
+    """Return True if name has a .platy extension (any case)."""
+    return name.lower().endswith(".platy")
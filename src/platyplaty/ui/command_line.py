@@ -47,6 +47,10 @@ class CommandLine(Widget):
         callback: Callable[[str], Awaitable[None]],
         previous_focus_id: str | None = None,
         initial_text: str = "",
+        prefix: str = ":",
+        on_change: Callable[[str], None] | None = None,
+        key_handler: Callable[[str], bool] | None = None,
+        on_hide: Callable[[], None] | None = None,
     ) -> None:
         """Display the command prompt.
 
@@ -54,13 +58,21 @@ class CommandLine(Widget):
             callback: Function to call with entered text.
             previous_focus_id: Widget ID to return focus to on dismiss.
             initial_text: Initial text to populate the prompt with.
+            prefix: Text shown before the input.
+            on_change: Function to call with the text after every edit.
+            key_handler: Function offered each key before editing; it
+                returns True if it consumed the key.
+            on_hide: Function to call when the prompt is dismissed.
         """
         error_bar = self.query_one("#transient_error", TransientErrorBar)
         if error_bar.has_class("visible"):
             error_bar.cancel_and_hide()
         self.clear_persistent_message()
         prompt = self.query_one("#command_prompt", CommandPrompt)
-        prompt.show_prompt(callback, previous_focus_id, initial_text)
+        prompt.show_prompt(
+            callback, previous_focus_id, initial_text, prefix, on_change,
+            key_handler, on_hide,
+        )
 
     def show_confirmation_prompt(
         self,
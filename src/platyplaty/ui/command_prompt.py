@@ -30,7 +30,11 @@ class CommandPrompt(Widget, can_focus=True):
     cursor_index: reactive[int] = reactive(0, repaint=True)
     cursor_visible: reactive[bool] = reactive(True, repaint=True)
     callback: Callable[[str], Awaitable[None]] | None = None
+    on_change: Callable[[str], None] | None = None
+    key_handler: Callable[[str], bool] | None = None
+    on_hide: Callable[[], None] | None = None
     previous_focus_id: str | None = None
+    prefix: str = ":"
     _cursor: "CursorManager"
 
     DEFAULT_CSS = """
@@ -74,10 +78,30 @@ class CommandPrompt(Widget, can_focus=True):
         callback: Callable[[str], Awaitable[None]],
         previous_focus_id: str | None = None,
         initial_text: str = "",
+        prefix: str = ":",
+        on_change: Callable[[str], None] | None = None,
+        key_handler: Callable[[str], bool] | None = None,
+        on_hide: Callable[[], None] | None = None,
     ) -> None:
-        """Display the command prompt and take focus."""
+        """Display the command prompt and take focus.
+
+        Args:
+            callback: Function to call with the entered text on Enter.
+            previous_focus_id: Widget ID to return focus to on dismiss.
+            initial_text: Initial text to populate the prompt with.
+            prefix: Text shown before the input.
+            on_change: Function to call with the text after every edit.
+            key_handler: Function offered each key before editing; it
+                returns True if it consumed the key.
+            on_hide: Function to call when the prompt is dismissed.
+        """
         self.platyplaty_app.ctx.editing_mode.reset_transient_state()
+        self.prefix = prefix
+        self.on_change = None
         self.input_text = initial_text
+        self.on_change = on_change
+        self.key_handler = key_handler
+        self.on_hide = on_hide
         self._cursor.scroll = 0
         self.cursor_index = len(initial_text)
         self.callback = callback
@@ -89,13 +113,24 @@ class CommandPrompt(Widget, can_focus=True):
     def hide(self) -> None:
         """Hide the prompt and return focus."""
         self.stop_blink_timer()
+        on_hide, self.on_hide = self.on_hide, None
+        self.key_handler = None
+        self.on_change = None
         self.input_text = ""
+        self.prefix = ":"
         self._cursor.scroll = 0
         self.cursor_index = 0
         self.callback = None
         self.remove_class("visible")
         return_focus_to_widget(self.app, self.previous_focus_id)
         self.previous_focus_id = None
+        if on_hide is not None:
+            on_hide()
+
+    def watch_input_text(self, text: str) -> None:
+        """Report edits to the on_change hook, if one is set."""
+        if self.on_change is not None:
+            self.on_change(text)
 
     def start_blink_timer(self) -> None:
         """Start the cursor blink timer."""
@@ -115,11 +150,13 @@ class CommandPrompt(Widget, can_focus=True):
 
     def on_resize(self, event: object) -> None:
         """Recalculate scroll offset when widget is resized."""
-        self._cursor.handle_resize(self.cursor_index, self.size.width - 1)
+        self._cursor.handle_resize(
+            self.cursor_index, self.size.width - len(self.prefix)
+        )
 
     def update_cursor_with_scroll(self, new_cursor: int) -> None:
         """Update cursor position and scroll offset to keep cursor visible."""
-        self._cursor.update_position(new_cursor, self.size.width - 1)
+        self._cursor.update_position(new_cursor, self.size.width - len(self.prefix))
 
     def paste_text(self, text: str) -> bool:
         """Paste text at cursor, stripping whitespace."""
@@ -144,6 +181,8 @@ class CommandPrompt(Widget, can_focus=True):
     async def on_key(self, event: Key) -> None:
         """Handle key events for the command prompt."""
         event.stop()
+        if self.key_handler is not None and self.key_handler(event.key):
+            return
         editing_mode = self.platyplaty_app.ctx.editing_mode
         state_changed = await handle_command_key(
             event.key, self, event.character, editing_mode,
@@ -162,4 +201,5 @@ class CommandPrompt(Widget, can_focus=True):
             self._cursor.scroll,
             self.cursor_index,
             self.cursor_visible,
+            self.prefix,
         )
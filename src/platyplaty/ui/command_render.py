@@ -22,6 +22,7 @@ def render_command_line(
     text_scroll: int,
     cursor_index: int,
     cursor_visible: bool,
+    prefix: str = ":",
 ) -> Strip:
     """Render a single line of the command prompt.
 
@@ -31,17 +32,18 @@ def render_command_line(
         text_scroll: Horizontal scroll offset for the input text.
         cursor_index: Position of the cursor in the input text.
         cursor_visible: Whether the cursor should be rendered.
+        prefix: Text shown before the input (":" for commands).
 
     Returns:
         A Strip containing the rendered segments.
     """
-    visible_width = width - 1  # Account for ":" prefix
+    visible_width = width - len(prefix)
     if visible_width < 0:
         visible_width = 0
     end = text_scroll + visible_width
     visible_text = input_text[text_scroll:end]
     cursor_pos = cursor_index - text_scroll
-    segments: list[Segment] = [Segment(":", PROMPT_STYLE)]
+    segments: list[Segment] = [Segment(prefix, PROMPT_STYLE)]
     if not cursor_visible or cursor_pos < 0 or cursor_pos > len(visible_text):
         segments.append(Segment(visible_text.ljust(visible_width), PROMPT_STYLE))
     else:
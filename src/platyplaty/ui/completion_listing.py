@@ -0,0 +1,99 @@
+"""Background directory listings for command prompt path completion.
+
+Completing a path needs the listing of the directory being typed into.
+Listings are read on a worker thread and cached briefly, so pressing
+Tab never touches the filesystem on the UI thread, even on a slow
+mount. The file browser seeds the cache with the listings it has just
+read, so completing names in the directories on screen costs nothing.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+
+import cachetools
+
+from platyplaty.ui.directory import list_directory
+from platyplaty.ui.directory_types import DirectoryListing
+
+COMPLETION_TTL_SECONDS = 5.0
+
+_listing_cache: cachetools.TTLCache[Path, DirectoryListing] = cachetools.TTLCache(
+    maxsize=256, ttl=COMPLETION_TTL_SECONDS
+)
+
+_lock = threading.Lock()
+_pending: dict[Path, Future[None]] = {}
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="path-complete")
+
+
+def seed_completion_listing(directory: Path, listing: DirectoryListing) -> None:
+    """Cache a listing the caller has already read.
+
+    Args:
+        directory: The listed directory.
+        listing: Its plain (unfiltered, unflattened) listing.
+    """
+    with _lock:
+        _listing_cache[directory] = listing
+
+
+def get_completion_listing(directory: Path) -> DirectoryListing | None:
+    """Return the cached listing of a directory without blocking.
+
+    Args:
+        directory: The directory to list.
+
+    Returns:
+        The cached listing, or None if it has not been read yet.
+    """
+    with _lock:
+        return _listing_cache.get(directory)
+
+
+def prefetch_completion_listing(directory: Path) -> Future[None] | None:
+    """Read a directory's listing in the background unless it is cached.
+
+    Args:
+        directory: The directory to list.
+
+    Returns:
+        The future of the (possibly already running) read, or None if
+        the listing is cached.
+    """
+    with _lock:
+        if directory in _listing_cache:
+            return None
+        future = _pending.get(directory)
+        if future is None:
+            future = _executor.submit(_list_in_background, directory)
+            _pending[directory] = future
+        return future
+
+
+def wait_for_pending_listings(timeout: float | None = None) -> None:
+    """Block until all currently scheduled listings have been read.
+
+    Args:
+        timeout: Maximum number of seconds to wait, or None for no limit.
+    """
+    with _lock:
+        futures = list(_pending.values())
+    wait(futures, timeout)
+
+
+def clear_completion_listings() -> None:
+    """Drop every cached listing."""
+    with _lock:
+        _listing_cache.clear()
+
+
+def _list_in_background(directory: Path) -> None:
+    """Worker job: read and cache one listing."""
+    try:
+        listing = list_directory(directory)
+        with _lock:
+            _listing_cache[directory] = listing
+    finally:
+        with _lock:
+            _pending.pop(directory, None)
@@ -0,0 +1,127 @@
+"""Background directory counting for middle pane indicators.
+
+This module computes directory entry counts on a worker thread so that
+rendering never touches the filesystem. Each count is cached together
+with the directory's mtime; revalidation re-stats the directory on the
+worker and only recounts when the mtime has changed.
+"""
+
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+
+import cachetools
+
+from platyplaty.ui.indicators import count_directory_contents
+
+# Shown in place of a directory count that has not been computed yet
+COUNT_PLACEHOLDER = "?"
+
+directory_count_cache: cachetools.LRUCache[Path, tuple[int, int]] = (
+    cachetools.LRUCache(maxsize=10000)
+)
+
+_lock = threading.Lock()
+_pending: dict[Path, Future[None]] = {}
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="dir-count")
+_listener: Callable[[], None] | None = None
+
+
+def set_count_listener(listener: Callable[[], None] | None) -> None:
+    """Register the callback invoked when a count becomes available.
+
+    The listener is called on a worker thread, so it must hand off to
+    the UI thread itself (e.g. via App.call_from_thread).
+
+    Args:
+        listener: Callback to invoke, or None to remove the listener.
+    """
+    global _listener
+    _listener = listener
+
+
+def get_directory_count(path: Path) -> int | None:
+    """Return the cached count for a directory without blocking.
+
+    On a cache miss the count is scheduled on the worker and None is
+    returned so the caller can display COUNT_PLACEHOLDER.
+
+    Args:
+        path: Path to the directory (or symlink to a directory).
+
+    Returns:
+        The cached entry count, or None if not yet computed.
+    """
+    with _lock:
+        cached = directory_count_cache.get(path)
+    if cached is None:
+        _schedule(path)
+        return None
+    return cached[1]
+
+
+def revalidate_directory_count(path: Path) -> None:
+    """Schedule a background mtime check (and recount) for a directory.
+
+    The cached value stays visible until the worker has a newer one.
+
+    Args:
+        path: Path to the directory (or symlink to a directory).
+    """
+    _schedule(path)
+
+
+def wait_for_pending_counts(timeout: float | None = None) -> None:
+    """Block until all currently scheduled counts have finished.
+
+    Args:
+        timeout: Maximum number of seconds to wait, or None for no limit.
+    """
+    with _lock:
+        futures = list(_pending.values())
+    wait(futures, timeout)
+
+
+def _schedule(path: Path) -> None:
+    """Submit a count job for path unless one is already pending."""
+    with _lock:
+        if path in _pending:
+            return
+        _pending[path] = _executor.submit(_count_in_background, path)
+
+
+def _count_in_background(path: Path) -> None:
+    """Worker job: update the cached count and notify the listener."""
+    try:
+        changed = _update_count(path)
+    finally:
+        with _lock:
+            _pending.pop(path, None)
+    listener = _listener
+    if changed and listener is not None:
+        listener()
+
+
+def _update_count(path: Path) -> bool:
+    """Recount path if its mtime changed since the cached count.
+
+    Args:
+        path: Path to the directory to count.
+
+    Returns:
+        True if the cached count was added or changed.
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        mtime = -1
+    with _lock:
+        cached = directory_count_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return False
+    count = count_directory_contents(path)
+    with _lock:
+        directory_count_cache[path] = (mtime, count)
+    return cached is None or cached[1] != count
@@ -6,39 +6,41 @@ filtering entries, and sorting directory listings.
 
 from pathlib import Path
 
+from platyplaty.file_stat import FileStat, file_stat
 from platyplaty.ui.directory_types import EntryType
 
 
-def _get_symlink_type(path: Path) -> EntryType:
+def _get_symlink_type(st: FileStat) -> EntryType:
     """Determine the type of a symlink entry.
 
     Args:
-        path: Path to the symlink.
+        st: Stat results of the symlink.
 
     Returns:
         The EntryType for this symlink (to directory, to file, or broken).
     """
-    try:
-        target = path.resolve(strict=True)
-        if target.is_dir():
-            return EntryType.SYMLINK_TO_DIRECTORY
-        return EntryType.SYMLINK_TO_FILE
-    except OSError:
+    if not st.exists:
         return EntryType.BROKEN_SYMLINK
+    if st.is_dir:
+        return EntryType.SYMLINK_TO_DIRECTORY
+    return EntryType.SYMLINK_TO_FILE
 
 
 def get_entry_type(path: Path) -> EntryType:
     """Determine the type of a directory entry.
 
+    Stat results come from the shared file_stat cache.
+
     Args:
         path: Path to the entry.
 
     Returns:
         The EntryType for this entry.
     """
-    if path.is_symlink():
-        return _get_symlink_type(path)
-    if path.is_dir():
+    st = file_stat(path)
+    if st.is_symlink:
+        return _get_symlink_type(st)
+    if st.is_dir:
         return EntryType.DIRECTORY
     return EntryType.FILE
 
@@ -0,0 +1,198 @@
+"""Bounded, persistent store for per-directory navigation memory.
+
+Remembers the selected name and scroll offset of recently visited
+directories. The store keeps at most MAX_ENTRIES directories, evicting
+the least recently used, so memory stays flat over long sessions.
+
+When given a file path, the store persists itself as JSON (normally
+under $XDG_STATE_HOME/platyplaty). The file is read lazily on the first
+lookup, and changes are written on a background timer shortly after
+they happen and again by flush() at shutdown. Writes go through
+atomic_file.write_atomically, so a crash never leaves a truncated
+state file.
+"""
+
+import contextlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from platyplaty.atomic_file import write_atomically
+from platyplaty.ui.nav_types import DirectoryMemory
+
+# Directories remembered in memory and on disk
+MAX_ENTRIES = 2000
+
+# Seconds to wait after a change before writing the state file
+FLUSH_DELAY = 2.0
+
+STATE_FILENAME = "directory_memory.json"
+
+
+def default_directory_memory_path() -> Path:
+    """Return the XDG state file used to persist directory memory.
+
+    Returns:
+        $XDG_STATE_HOME/platyplaty/directory_memory.json, falling back to
+        ~/.local/state when XDG_STATE_HOME is unset or empty.
+    """
+    state_home = os.environ.get("XDG_STATE_HOME")
+    base = Path(state_home) if state_home else Path.home() / ".local" / "state"
+    return base / "platyplaty" / STATE_FILENAME
+
+
+class DirectoryMemoryStore:
+    """LRU mapping from resolved directory paths to DirectoryMemory.
+
+    Supports the mapping operations used by the nav_memory modules
+    (get, item access and assignment, membership). Without a path the
+    store is purely in-memory.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Initialize the store.
+
+        Args:
+            path: JSON file to persist to, or None for no persistence.
+        """
+        self._path = path
+        self._entries: OrderedDict[str, DirectoryMemory] = OrderedDict()
+        self._loaded = path is None
+        self._lock = threading.Lock()
+        # Serializes writes so a later snapshot is never overwritten
+        self._write_lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        self._dirty = False
+
+    def get(self, key: str) -> DirectoryMemory | None:
+        """Return the memory for a directory and mark it recently used.
+
+        Args:
+            key: The resolved directory path.
+
+        Returns:
+            The remembered state, or None if the directory is unknown.
+        """
+        self._ensure_loaded()
+        with self._lock:
+            memory = self._entries.get(key)
+            if memory is not None:
+                self._entries.move_to_end(key)
+        return memory
+
+    def __getitem__(self, key: str) -> DirectoryMemory:
+        """Return the memory for a directory, raising KeyError if unknown."""
+        memory = self.get(key)
+        if memory is None:
+            raise KeyError(key)
+        return memory
+
+    def __setitem__(self, key: str, memory: DirectoryMemory) -> None:
+        """Remember state for a directory and schedule a write."""
+        self._ensure_loaded()
+        with self._lock:
+            if self._entries.get(key) == memory:
+                self._entries.move_to_end(key)
+                return
+            self._entries[key] = memory
+            self._entries.move_to_end(key)
+            while len(self._entries) > MAX_ENTRIES:
+                self._entries.popitem(last=False)
+            self._dirty = True
+        self._schedule_flush()
+
+    def __contains__(self, key: object) -> bool:
+        """Return True if the directory is remembered."""
+        self._ensure_loaded()
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        """Return the number of remembered directories."""
+        self._ensure_loaded()
+        with self._lock:
+            return len(self._entries)
+
+    def flush(self) -> None:
+        """Write pending changes to the state file now.
+
+        Write failures are ignored; directory memory is a convenience
+        and must never prevent platyplaty from running or exiting.
+        """
+        with self._write_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                if self._path is None or not self._dirty:
+                    return
+                data = {
+                    key: [memory.selected_name, memory.scroll_offset]
+                    for key, memory in self._entries.items()
+                }
+                self._dirty = False
+            with contextlib.suppress(OSError):
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                write_atomically(self._path, [json.dumps(data)])
+
+    def _schedule_flush(self) -> None:
+        """Start the delayed background write unless one is pending."""
+        if self._path is None:
+            return
+        with self._lock:
+            if self._timer is not None:
+                return
+            self._timer = threading.Timer(FLUSH_DELAY, self._flush_from_timer)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _flush_from_timer(self) -> None:
+        """Timer callback: clear the pending timer and write."""
+        with self._lock:
+            self._timer = None
+        self.flush()
+
+    def _ensure_loaded(self) -> None:
+        """Read the state file on first use."""
+        if self._loaded:
+            return
+        assert self._path is not None
+        loaded = _read_state_file(self._path)
+        with self._lock:
+            if self._loaded:
+                return
+            # Entries set before loading are newer than those on disk
+            loaded.update(self._entries)
+            self._entries = loaded
+            self._loaded = True
+
+
+def _read_state_file(path: Path) -> OrderedDict[str, DirectoryMemory]:
+    """Parse a state file, ignoring missing, corrupt or malformed data.
+
+    Args:
+        path: The JSON state file.
+
+    Returns:
+        Entries ordered from least to most recently used.
+    """
+    entries: OrderedDict[str, DirectoryMemory] = OrderedDict()
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return entries
+    if not isinstance(data, dict):
+        return entries
+    for key, value in data.items():
+        if (
+            isinstance(value, list)
+            and len(value) == 2
+            and isinstance(value[0], str | None)
+            and isinstance(value[1], int)
+        ):
+            entries[key] = DirectoryMemory(value[0], value[1])
+    while len(entries) > MAX_ENTRIES:
+        entries.popitem(last=False)
+    return entries
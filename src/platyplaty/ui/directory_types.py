@@ -4,10 +4,14 @@ This module provides the data types used to represent directory entries
 and listing results in the file browser.
 """
 
-from dataclasses import dataclass
+import itertools
+from dataclasses import dataclass, field
 from enum import Enum, auto
 from pathlib import Path
 
+# Source of unique DirectoryListing generations (used as render cache keys)
+_listing_generations = itertools.count()
+
 
 class EntryType(Enum):
     """Type of directory entry."""
@@ -43,9 +47,41 @@ class DirectoryListing:
         was_empty: True if directory had no entries at all.
         had_filtered_entries: True if some entries were filtered out.
         permission_denied: True if directory could not be read.
+        filter_query: The name filter that produced this listing, or ""
+            for a plain directory listing.
+        scan_in_progress: True if this is a flattened listing whose
+            background scan has not finished yet.
+        generation: Unique number identifying this listing instance.
+        _name_index: Maps entry names to their index in entries.
     """
 
     entries: list[DirectoryEntry]
     was_empty: bool
     had_filtered_entries: bool
     permission_denied: bool
+    filter_query: str = ""
+    scan_in_progress: bool = False
+    generation: int = field(init=False, repr=False, compare=False)
+    _name_index: dict[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Assign a generation and build the name-to-index map.
+
+        The entries list must not be mutated after construction.
+        """
+        name_index: dict[str, int] = {}
+        for i, entry in enumerate(self.entries):
+            name_index.setdefault(entry.name, i)
+        object.__setattr__(self, "_name_index", name_index)
+        object.__setattr__(self, "generation", next(_listing_generations))
+
+    def index_of(self, name: str) -> int | None:
+        """Return the index of the first entry with the given name.
+
+        Args:
+            name: The entry name to look up.
+
+        Returns:
+            The entry index, or None if no entry has that name.
+        """
+        return self._name_index.get(name)
@@ -0,0 +1,150 @@
+"""Incremental display-name disambiguation for playlist entries.
+
+Presets sharing a basename are told apart by their parent directories.
+Each basename owns a trie of reversed parent components: the root
+holds every entry with that basename, its children split them by
+parent directory name, their children by grandparent name, and so on.
+Every node counts the entries (duplicates included) passing through
+it, so an entry's display name ends at the first node on its path
+whose count is 1.
+
+Adding or removing an entry touches only its own basename group, and
+only that group's cached names are dropped. Entries are keyed by path
+string, so the trie holds no Path objects of its own.
+"""
+
+from collections.abc import Iterable
+from pathlib import Path
+
+
+class _Node:
+    """One trie node: an entry count and children by component name."""
+
+    __slots__ = ("count", "children")
+
+    def __init__(self) -> None:
+        """Initialize an empty node."""
+        self.count = 0
+        self.children: dict[str, _Node] = {}
+
+
+class _Group:
+    """All entries sharing one basename.
+
+    Attributes:
+        root: Trie of reversed parent components.
+        paths: Number of entries per distinct path string.
+        names: Cached display names, by path string.
+    """
+
+    __slots__ = ("root", "paths", "names")
+
+    def __init__(self) -> None:
+        """Initialize an empty group."""
+        self.root = _Node()
+        self.paths: dict[str, int] = {}
+        self.names: dict[str, str] = {}
+
+
+class DisplayNameTrie:
+    """Display names of a multiset of preset paths, kept up to date.
+
+    A path whose basename is unique, or shared only by copies of the
+    same path, is shown by its basename. Otherwise it is shown with
+    just enough parent directories to tell it apart from the others;
+    a path that occurs more than once alongside other paths with the
+    same basename is shown in full.
+    """
+
+    def __init__(self, paths: Iterable[Path] | None = None) -> None:
+        """Initialize the trie.
+
+        Args:
+            paths: Entries to add, duplicates included.
+        """
+        self._groups: dict[str, _Group] = {}
+        for path in paths or ():
+            self.add(path)
+
+    def add(self, path: Path) -> None:
+        """Add one entry.
+
+        Args:
+            path: The preset path.
+        """
+        key = str(path)
+        group = self._groups.get(path.name)
+        if group is None:
+            group = self._groups[path.name] = _Group()
+        group.paths[key] = group.paths.get(key, 0) + 1
+        group.names.clear()
+        node = group.root
+        node.count += 1
+        for part in reversed(path.parts[:-1]):
+            child = node.children.get(part)
+            if child is None:
+                child = node.children[part] = _Node()
+            child.count += 1
+            node = child
+
+    def remove(self, path: Path) -> None:
+        """Remove one entry; paths not in the trie are ignored.
+
+        Args:
+            path: The preset path.
+        """
+        key = str(path)
+        group = self._groups.get(path.name)
+        if group is None or key not in group.paths:
+            return
+        if group.paths[key] == 1:
+            del group.paths[key]
+        else:
+            group.paths[key] -= 1
+        if not group.paths:
+            del self._groups[path.name]
+            return
+        group.names.clear()
+        node = group.root
+        node.count -= 1
+        for part in reversed(path.parts[:-1]):
+            child = node.children[part]
+            child.count -= 1
+            if child.count == 0:
+                del node.children[part]
+                break
+            node = child
+
+    def display_name(self, path: Path) -> str:
+        """Return the display name of an entry.
+
+        Args:
+            path: The preset path; paths not in the trie are shown by
+                their basename.
+
+        Returns:
+            The basename, the shortest unique parent/.../basename
+            suffix, or the full path.
+        """
+        key = str(path)
+        group = self._groups.get(path.name)
+        if group is None or key not in group.paths or len(group.paths) == 1:
+            return path.name
+        name = group.names.get(key)
+        if name is None:
+            name = group.names[key] = _unique_suffix(group.root, path)
+        return name
+
+
+def _unique_suffix(root: _Node, path: Path) -> str:
+    """Walk path's parents up from root to the first node held by it alone."""
+    parts = path.parts
+    node = root
+    for depth in range(1, len(parts)):
+        part = parts[-depth - 1]
+        if part == path.anchor:
+            break
+        node = node.children[part]
+        if node.count == 1:
+            return "/".join(parts[-depth - 1 :])
+    return str(path)
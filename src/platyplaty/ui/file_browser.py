@@ -5,6 +5,7 @@ file_browser_refresh, file_browser_sync, file_browser_nav,
 file_browser_nav_updown, file_browser_error, file_browser_key.
 """
 
+import contextlib
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -17,9 +18,12 @@ if TYPE_CHECKING:
     from platyplaty.app import PlatyplatyApp
 
 from platyplaty.dispatch_tables import DispatchTable
+from platyplaty.ui.directory_count_worker import set_count_listener
+from platyplaty.ui.directory_memory_store import DirectoryMemoryStore
 from platyplaty.ui.directory_types import DirectoryEntry, DirectoryListing
 from platyplaty.ui.file_browser_init import init_browser as _init_browser
 from platyplaty.ui.file_browser_key import on_key as _on_key
+from platyplaty.ui.file_browser_line_cache import clear_entry_line_cache
 from platyplaty.ui.file_browser_refresh import (
     refresh_right_pane as _refresh_right_pane,
 )
@@ -40,6 +44,7 @@ from platyplaty.ui.file_browser_sync import (
     refresh_panes as _refresh_panes,
 )
 from platyplaty.ui.file_browser_types import RightPaneContent
+from platyplaty.ui.flat_scan import cancel_flat_scan
 from platyplaty.ui.layout_state import LayoutState
 from platyplaty.ui.nav_state import NavigationState
 
@@ -76,13 +81,14 @@ class FileBrowser(Widget):
         dispatch_table: DispatchTable,
         starting_dir: Path | None = None,
         focused: bool = False,
+        directory_memory: DirectoryMemoryStore | None = None,
         name: str | None = None,
         id: str | None = None,
         classes: str | None = None,
     ) -> None:
         """Initialize the FileBrowser widget."""
         super().__init__(name=name, id=id, classes=classes)
-        _init_browser(self, dispatch_table, starting_dir, focused)
+        _init_browser(self, dispatch_table, starting_dir, focused, directory_memory)
 
     def get_content_width(self, container: Size, viewport: Size) -> int:
         """Return the content width."""
@@ -108,6 +114,26 @@ class FileBrowser(Widget):
         """Handle mount event to adjust scroll when size becomes valid."""
         _adjust_left_scroll(self, self.size.height - 1)
         _adjust_right_scroll(self, self.size.height - 1)
+        set_count_listener(self._on_directory_count_ready)
+
+    def on_unmount(self) -> None:
+        """Stop receiving directory counts and flattening scan results."""
+        set_count_listener(None)
+        cancel_flat_scan()
+
+    def _on_directory_count_ready(self) -> None:
+        """Repaint once a background directory count is available.
+
+        Called on a count worker thread.
+        """
+        # RuntimeError means the app is shutting down; nothing to repaint
+        with contextlib.suppress(RuntimeError):
+            self.app.call_from_thread(self._repaint_indicators)
+
+    def _repaint_indicators(self) -> None:
+        """Drop cached rows (their indicators are stale) and repaint."""
+        clear_entry_line_cache()
+        self.refresh()
 
     def get_selected_entry(self) -> DirectoryEntry | None:
         """Get the currently selected entry."""
@@ -131,23 +157,15 @@ class FileBrowser(Widget):
         """Get the index of the currently selected item.
 
         This is derived from _nav_state.selected_name to ensure
-        the browser and navigation state are always in sync.
+        the browser and navigation state are always in sync. The lookup
+        is cached by the navigation state per navigation generation.
 
         Returns:
             The index of the selected item, or None if no selection.
         """
         if not hasattr(self, '_nav_state'):
             return None
-        listing = self._nav_state.get_listing()
-        if listing is None or not listing.entries:
-            return None
-        name = self._nav_state.selected_name
-        if name is None:
-            return None
-        for i, entry in enumerate(listing.entries):
-            if entry.name == name:
-                return i
-        return None
+        return self._nav_state.get_selected_index()
 
     def set_selection_by_index(self, index: int) -> None:
         """Set the selection by index.
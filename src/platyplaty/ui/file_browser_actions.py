@@ -17,6 +17,8 @@ from platyplaty.ui.directory_types import EntryType
 from platyplaty.ui.file_browser_error import show_transient_error
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from platyplaty.ui.directory_types import DirectoryEntry
     from platyplaty.ui.file_browser import FileBrowser
 
@@ -38,7 +40,7 @@ async def action_add_preset_or_load_playlist(browser: FileBrowser) -> None:
     suffix = entry.path.suffix.lower()
     is_file_type = entry.entry_type in (EntryType.FILE, EntryType.SYMLINK_TO_FILE)
     if is_file_type and suffix == ".milk":
-        await _handle_add_milk_preset(browser, entry)
+        await add_milk_preset(browser, entry.path)
         return
     if is_file_type and suffix == ".platy":
         await _handle_load_platy_playlist(browser, entry)
@@ -46,17 +48,17 @@ async def action_add_preset_or_load_playlist(browser: FileBrowser) -> None:
     show_transient_error(browser, "Cannot add: not a playlist or preset")
 
 
-async def _handle_add_milk_preset(browser: FileBrowser, entry: DirectoryEntry) -> None:
+async def add_milk_preset(browser: FileBrowser, path: Path) -> None:
     """Add a .milk preset to the playlist.
 
     Checks readability and adds to playlist if readable.
-    Shows error if not readable.
+    Shows error if not readable. Used by the browser's add key and by
+    the preset finder.
 
     Args:
         browser: The file browser instance.
-        entry: The directory entry to add.
+        path: Path to the preset file.
     """
-    path = entry.path
     if not is_readable(path):
         show_transient_error(browser, "Cannot add: file not readable")
         return
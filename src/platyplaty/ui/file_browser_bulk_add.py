@@ -0,0 +1,36 @@
+"""Directory bulk add action for the file browser widget.
+
+This module provides the function for the "A" key, which adds every
+.milk file beneath the selected directory to the playlist. This is a
+package-private module used by the FileBrowser class.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from platyplaty.ui.directory_types import EntryType
+from platyplaty.ui.file_browser_error import show_transient_error
+
+if TYPE_CHECKING:
+    from platyplaty.ui.file_browser import FileBrowser
+
+
+async def action_add_directory(browser: FileBrowser) -> None:
+    """Handle 'A' key: add all presets beneath the selected directory.
+
+    Args:
+        browser: The file browser instance.
+    """
+    from platyplaty.bulk_add_actions import start_bulk_add
+
+    entry = browser.get_selected_entry()
+    if entry is None:
+        return
+    if entry.entry_type not in (EntryType.DIRECTORY, EntryType.SYMLINK_TO_DIRECTORY):
+        show_transient_error(browser, "Cannot add: not a directory")
+        return
+    app = browser.platyplaty_app
+    error = start_bulk_add(app.ctx, app, entry.path, literal=True)
+    if error is not None:
+        show_transient_error(browser, error)
@@ -10,6 +10,7 @@ from rich.segment import Segment
 from rich.style import Style
 
 from platyplaty.bad_presets import is_preset_bad
+from platyplaty.ui.cell_width import pad_to_width
 from platyplaty.ui.colors import (
     BACKGROUND_COLOR,
     BAD_PRESET_BG,
@@ -18,19 +19,31 @@ from platyplaty.ui.colors import (
     get_entry_color,
     get_inverted_colors,
 )
+from platyplaty.ui.directory_count_worker import (
+    COUNT_PLACEHOLDER,
+    get_directory_count,
+)
 from platyplaty.ui.directory_types import DirectoryEntry, EntryType
-from platyplaty.ui.indicators import count_directory_contents, format_indicator
+from platyplaty.ui.indicators import format_indicator
 from platyplaty.ui.truncation_entry import truncate_entry
 
 
 def _get_indicator_value(entry_type: EntryType, path: Path) -> int | str:
-    """Get indicator value in format expected by truncate_entry."""
-    if entry_type.name == "DIRECTORY":
-        return count_directory_contents(path)
+    """Get indicator value in format expected by truncate_entry.
+
+    Directory counts come from the background count cache; a placeholder
+    is shown until the worker has counted the directory.
+    """
+    if entry_type in (EntryType.DIRECTORY, EntryType.SYMLINK_TO_DIRECTORY):
+        count = get_directory_count(path)
+        value = COUNT_PLACEHOLDER if count is None else count
+        if entry_type == EntryType.DIRECTORY:
+            return value
+        return f"-> {value}"
     return format_indicator(entry_type, path)
 
 
-def _is_bad_preset(entry: DirectoryEntry) -> bool:
+def is_bad_preset_entry(entry: DirectoryEntry) -> bool:
     """Check if entry is a preset file that has crashed the renderer."""
     if entry.entry_type not in (EntryType.FILE, EntryType.SYMLINK_TO_FILE):
         return False
@@ -42,7 +55,7 @@ def render_normal_entry(
     focused: bool = True
 ) -> list[Segment]:
     """Render an entry with normal (non-selected) colors and 1-char indent."""
-    if focused and _is_bad_preset(entry):
+    if focused and is_bad_preset_entry(entry):
         fg_style = Style(color=BAD_PRESET_FG, bgcolor=BAD_PRESET_BG)
         bg_style = Style(bgcolor=BAD_PRESET_BG)
     else:
@@ -58,7 +71,7 @@ def render_normal_entry(
     display_text = truncate_entry(
         entry.name, entry.entry_type, indicator, content_width, show_indicators
     )
-    content_text = display_text.ljust(content_width)
+    content_text = pad_to_width(display_text, content_width)
     # Build segments: left space + content + right space
     segments = []
     if width > 0:
@@ -76,7 +89,7 @@ def render_selected_entry(
 ) -> list[Segment]:
     """Render an entry with inverted (selected) colors and padding."""
     if focused:
-        if _is_bad_preset(entry):
+        if is_bad_preset_entry(entry):
             fg, bg = BAD_PRESET_BG, BAD_PRESET_FG
         else:
             fg, bg = get_inverted_colors(entry.entry_type)
@@ -92,7 +105,7 @@ def render_selected_entry(
     display_text = truncate_entry(
         entry.name, entry.entry_type, indicator, content_width, show_indicators
     )
-    content_text = display_text.ljust(content_width)
+    content_text = pad_to_width(display_text, content_width)
     # Build segments: left pad + content + right pad (all highlighted)
     segments = []
     if width > 0:
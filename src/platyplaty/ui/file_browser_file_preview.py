@@ -6,10 +6,10 @@ including size checks, binary detection, and content reading.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from pathlib import Path
 
 from platyplaty.ui.file_browser_file_utils import read_file_preview_lines
-from platyplaty.ui.file_browser_playlist_preview import make_playlist_preview
+from platyplaty.ui.file_browser_playlist_preview import build_playlist_preview
 from platyplaty.ui.file_browser_types import (
     BinaryFileError,
     RightPaneBinaryFile,
@@ -17,29 +17,23 @@ from platyplaty.ui.file_browser_types import (
     RightPaneFilePreview,
 )
 
-if TYPE_CHECKING:
-    from platyplaty.ui.directory_types import DirectoryEntry
-    from platyplaty.ui.file_browser import FileBrowser
 
+def build_file_preview(file_path: Path, pane_height: int) -> RightPaneContent:
+    """Create file preview content for a file path.
 
-
-
-def make_file_preview(
-    browser: FileBrowser, entry: DirectoryEntry
-) -> RightPaneContent:
-    """Create file preview content for an entry.
+    Does not touch the browser, so it is safe to call from a worker
+    thread when prefetching previews.
 
     Args:
-        browser: The file browser instance.
-        entry: The directory entry to preview.
+        file_path: Path to the file (or symlink to a file).
+        pane_height: Number of lines the right pane can show.
 
     Returns:
         RightPaneFilePreview with file lines, or None if unreadable.
     """
     # Delegate .platy files to playlist preview (handles 0-byte files differently)
-    if entry.name.lower().endswith('.platy'):
-        return make_playlist_preview(browser, entry)
-    file_path = browser.current_dir / entry.name
+    if file_path.name.lower().endswith('.platy'):
+        return build_playlist_preview(file_path, pane_height)
     # Check file size: empty files trigger collapsed state
     try:
         file_size = file_path.stat().st_size
@@ -48,7 +42,6 @@ def make_file_preview(
     if file_size == 0:
         return None
     # Read file content, handling race conditions (file vanished after listing)
-    pane_height = max(1, browser.size.height - 1)
     try:
         lines = read_file_preview_lines(file_path, pane_height)
     except (PermissionError, FileNotFoundError):
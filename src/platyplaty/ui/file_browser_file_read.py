@@ -0,0 +1,104 @@
+"""Bounded byte-level reading for file previews.
+
+Preview reads only look at as much of a file as the pane can show.
+Large files are memory-mapped so that scanning for line boundaries does
+not copy the file, and a bounded sniff window detects binary content
+before any of it is decoded. These are package-private functions used
+by file_browser_file_utils.
+"""
+
+import codecs
+import mmap
+from pathlib import Path
+
+from platyplaty.ui.file_browser_types import BinaryFileError
+
+# Files at least this large are memory-mapped instead of read
+MMAP_THRESHOLD = 64 * 1024
+
+# Leading bytes inspected for NUL bytes before anything is decoded
+SNIFF_BYTES = 8 * 1024
+
+# Upper bound on bytes decoded per preview line, for files without newlines
+MAX_LINE_BYTES = 4 * 1024
+
+
+def read_preview_text(path: Path, max_lines: int | None) -> str:
+    """Read and decode the part of a file needed for a preview.
+
+    Args:
+        path: Path to the file to read.
+        max_lines: Maximum number of lines needed, or None for all.
+
+    Returns:
+        The decoded text covering at least max_lines lines (when the
+        file has that many), with universal newlines not yet applied.
+
+    Raises:
+        BinaryFileError: If the file looks binary or is not valid UTF-8.
+        OSError: If the file cannot be opened or read.
+    """
+    with path.open('rb') as f:
+        size = path.stat().st_size
+        if size == 0:
+            return ''
+        if size < MMAP_THRESHOLD:
+            return decode_preview_bytes(f.read(), max_lines, str(path))
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return decode_preview_bytes(mapped, max_lines, str(path))
+
+
+def decode_preview_bytes(
+    data: bytes | mmap.mmap, max_lines: int | None, name: str
+) -> str:
+    """Sniff and decode the leading lines of a file's contents.
+
+    Args:
+        data: The file contents (bytes or a memory map).
+        max_lines: Maximum number of lines needed, or None for all.
+        name: File name used in error messages.
+
+    Returns:
+        The decoded text of the leading lines.
+
+    Raises:
+        BinaryFileError: If the data looks binary or is not valid UTF-8.
+    """
+    length = len(data)
+    # NUL bytes never occur in text files, whatever their encoding
+    if data.find(b'\0', 0, SNIFF_BYTES) >= 0:
+        raise BinaryFileError(name)
+    end = find_lines_end(data, length, max_lines)
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    try:
+        return decoder.decode(data[:end], final=end == length)
+    except UnicodeDecodeError as e:
+        raise BinaryFileError(name) from e
+
+
+def find_lines_end(
+    data: bytes | mmap.mmap, length: int, max_lines: int | None
+) -> int:
+    """Return the byte offset just past the first max_lines lines.
+
+    Only newline bytes are scanned; the scan stops after max_lines of
+    them or after MAX_LINE_BYTES per requested line, whichever is first.
+
+    Args:
+        data: The file contents (bytes or a memory map).
+        length: Length of data in bytes.
+        max_lines: Number of lines needed, or None for all.
+
+    Returns:
+        Offset of the end of the region to decode.
+    """
+    if max_lines is None:
+        return length
+    limit = min(length, max_lines * MAX_LINE_BYTES)
+    pos = 0
+    for _ in range(max_lines):
+        newline = data.find(b'\n', pos, limit)
+        if newline < 0:
+            return limit
+        pos = newline + 1
+    return pos
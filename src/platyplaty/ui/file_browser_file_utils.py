@@ -5,9 +5,9 @@ content. These are package-private functions.
 """
 
 from pathlib import Path
-from typing import TextIO
 
-from platyplaty.ui.file_browser_types import BinaryFileError
+from platyplaty.ui.cell_width import pad_to_width, truncate_to_width
+from platyplaty.ui.file_browser_file_read import read_preview_text
 
 
 def truncate_line(line: str, width: int) -> str:
@@ -24,62 +24,37 @@ def truncate_line(line: str, width: int) -> str:
     Returns:
         The line truncated to fit within width.
     """
-    from rich.cells import cell_len
-
     # Expand tabs to 4 spaces
     expanded = line.expandtabs(4)
-
-    # If it fits, return as-is
-    if cell_len(expanded) <= width:
-        return expanded
-
-    # Truncate character by character until we fit
-    result = []
-    current_width = 0
-    for char in expanded:
-        char_width = cell_len(char)
-        if current_width + char_width > width:
-            break
-        result.append(char)
-        current_width += char_width
-    return ''.join(result)
-
-def _read_lines_from_file(f: TextIO, max_lines: int | None) -> tuple[str, ...]:
-    """Read lines from an open file handle.
-
-    Args:
-        f: Open file handle to read from.
-        max_lines: Maximum number of lines to read, or None for all.
-
-    Returns:
-        Tuple of lines stripped of trailing newlines.
-    """
-    if max_lines is None:
-        return tuple(line.rstrip('\n\r') for line in f.readlines())
-    return tuple(
-        line.rstrip('\n\r')
-        for _, line in zip(range(max_lines), f, strict=False)
-    )
+    return truncate_to_width(expanded, width)
 
 def read_file_preview_lines(
     path: Path, max_lines: int | None = None,
 ) -> tuple[str, ...] | None:
     """Read lines from a file for preview.
 
+    Only the bytes needed for max_lines lines are decoded; large files
+    are memory-mapped rather than read (see file_browser_file_read).
+
     Args:
         path: Path to the file to read.
         max_lines: Maximum number of lines to read, or None for all.
 
     Returns:
         Tuple of lines (stripped of trailing newlines), or None if file cannot be read.
+
+    Raises:
+        BinaryFileError: If the file looks binary or is not valid UTF-8.
     """
     try:
-        with path.open('r', encoding='utf-8') as f:
-            return _read_lines_from_file(f, max_lines)
-    except UnicodeDecodeError as e:
-        raise BinaryFileError(str(path)) from e
+        text = read_preview_text(path, max_lines)
     except OSError:
         return None
+    # Universal newlines, as text-mode reads would apply
+    lines = text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+    if not lines[-1]:
+        lines.pop()
+    return tuple(lines if max_lines is None else lines[:max_lines])
 
 
 def render_file_preview_line(
@@ -99,4 +74,4 @@ def render_file_preview_line(
         return " " * width
     line = lines[y]
     truncated = truncate_line(line, width)
-    return truncated.ljust(width)
+    return pad_to_width(truncated, width)
@@ -0,0 +1,48 @@
+"""Flattened view toggle for the file browser widget.
+
+Flattening replaces the middle pane with every .milk file beneath the
+current directory, streamed in from a background scan. This is a
+package-private module used by the FileBrowser class.
+"""
+
+from __future__ import annotations
+
+import contextlib
+from typing import TYPE_CHECKING
+
+from platyplaty.ui.file_browser_sync import show_nav_listing
+
+if TYPE_CHECKING:
+    from platyplaty.ui.file_browser import FileBrowser
+
+
+async def action_toggle_flatten(browser: FileBrowser) -> None:
+    """Switch between the directory listing and the flattened view.
+
+    Args:
+        browser: The file browser instance.
+    """
+    nav_state = browser._nav_state
+    if nav_state.is_flattened:
+        nav_state.stop_flatten()
+    elif not nav_state.start_flatten(lambda: _on_scan_progress(browser)):
+        return
+    show_nav_listing(browser)
+
+
+def _on_scan_progress(browser: FileBrowser) -> None:
+    """Hand new scan results to the UI thread.
+
+    Called on the scan worker thread.
+    """
+    # RuntimeError means the app is shutting down; nothing to repaint
+    with contextlib.suppress(RuntimeError):
+        browser.app.call_from_thread(_show_scan_progress, browser)
+
+
+def _show_scan_progress(browser: FileBrowser) -> None:
+    """Display the files scanned so far, if still flattened."""
+    if not browser._nav_state.is_flattened:
+        return
+    browser._nav_state.update_flat_listing()
+    show_nav_listing(browser)
@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING
 
 from platyplaty.dispatch_tables import DispatchTable
 from platyplaty.errors import InaccessibleDirectoryError
+from platyplaty.ui.directory_memory_store import DirectoryMemoryStore
 from platyplaty.ui.file_browser_refresh import refresh_listings
 from platyplaty.ui.layout_state import LayoutState
 from platyplaty.ui.nav_state import NavigationState
@@ -25,6 +26,7 @@ def init_browser(
     dispatch_table: DispatchTable,
     starting_dir: Path | None,
     focused: bool,
+    directory_memory: DirectoryMemoryStore | None = None,
 ) -> None:
     """Initialize the FileBrowser widget's state.
 
@@ -36,6 +38,8 @@ def init_browser(
         browser: The FileBrowser instance to initialize.
         dispatch_table: Dispatch table for navigation key bindings.
         starting_dir: Initial directory to display. Defaults to CWD.
+        directory_memory: Store for remembered selections and scroll
+            offsets. Defaults to a new in-memory store.
     """
     browser._dispatch_table = dispatch_table
     if starting_dir is None:
@@ -73,7 +77,7 @@ def init_browser(
     browser._focused = focused
 
     # Navigation state manager
-    browser._nav_state = NavigationState(browser.current_dir)
+    browser._nav_state = NavigationState(browser.current_dir, directory_memory)
 
     # Refresh listings on init
     refresh_listings(browser)
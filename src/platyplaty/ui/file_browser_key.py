@@ -13,12 +13,15 @@ from typing import TYPE_CHECKING, Any
 from textual.events import Key
 
 from platyplaty.ui.file_browser_actions import action_add_preset_or_load_playlist
+from platyplaty.ui.file_browser_bulk_add import action_add_directory
+from platyplaty.ui.file_browser_flatten import action_toggle_flatten
 from platyplaty.ui.file_browser_nav import action_nav_left, action_nav_right
 from platyplaty.ui.file_browser_nav_updown import action_nav_down, action_nav_up
 from platyplaty.ui.file_browser_play_actions import (
     action_play_next_preset,
     action_play_previous_preset,
 )
+from platyplaty.ui.file_browser_search import action_filter, action_find
 
 if TYPE_CHECKING:
     from platyplaty.ui.file_browser import FileBrowser
@@ -63,5 +66,9 @@ def _get_action_func(action_name: str) -> ActionFunc | None:
         "add_preset_or_load_playlist": action_add_preset_or_load_playlist,
         "play_previous_preset": action_play_previous_preset,
         "play_next_preset": action_play_next_preset,
+        "find": action_find,
+        "filter": action_filter,
+        "toggle_flatten": action_toggle_flatten,
+        "add_directory": action_add_directory,
     }
     return actions.get(action_name)
@@ -0,0 +1,33 @@
+"""Rendered line caches for the file browser widget.
+
+Pane rows and the path display line are memoised so that a repaint
+after a cursor move only renders the two rows whose selection changed.
+Pane rows are keyed by (listing generation, entry index, pane width,
+selected, focused, show indicators, bad preset); the path line is keyed
+by (path, width, mark selected). These are package-private.
+"""
+
+from pathlib import Path
+
+import cachetools
+from rich.segment import Segment
+
+EntryLineKey = tuple[int, int, int, bool, bool, bool, bool]
+PathLineKey = tuple[Path, int, bool]
+
+entry_line_cache: cachetools.LRUCache[EntryLineKey, list[Segment]] = (
+    cachetools.LRUCache(maxsize=4096)
+)
+path_line_cache: cachetools.LRUCache[PathLineKey, list[Segment]] = (
+    cachetools.LRUCache(maxsize=64)
+)
+
+
+def clear_entry_line_cache() -> None:
+    """Drop all cached pane rows (e.g. after indicator values change)."""
+    entry_line_cache.clear()
+
+
+def clear_path_line_cache() -> None:
+    """Drop all cached path lines (e.g. after the directory is re-read)."""
+    path_line_cache.clear()
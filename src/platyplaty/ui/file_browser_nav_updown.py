@@ -9,6 +9,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from platyplaty.ui.file_browser_prefetch import prefetch_neighbour_previews
 from platyplaty.ui.file_browser_refresh import refresh_right_pane
 from platyplaty.ui.file_browser_scroll import adjust_left_pane_scroll
 from platyplaty.ui.file_browser_sync import sync_from_nav_state
@@ -30,6 +31,7 @@ async def action_nav_up(browser: FileBrowser) -> None:
     sync_from_nav_state(browser)
     adjust_left_pane_scroll(browser, browser.size.height - 1)
     refresh_right_pane(browser)
+    prefetch_neighbour_previews(browser, -1)
     browser.refresh()
 
 
@@ -46,4 +48,5 @@ async def action_nav_down(browser: FileBrowser) -> None:
     sync_from_nav_state(browser)
     adjust_left_pane_scroll(browser, browser.size.height - 1)
     refresh_right_pane(browser)
+    prefetch_neighbour_previews(browser, 1)
     browser.refresh()
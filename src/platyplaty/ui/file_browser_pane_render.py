@@ -14,9 +14,11 @@ from platyplaty.ui.colors import (
 )
 from platyplaty.ui.directory_types import DirectoryListing
 from platyplaty.ui.file_browser_entry_render import (
+    is_bad_preset_entry,
     render_normal_entry,
     render_selected_entry,
 )
+from platyplaty.ui.file_browser_line_cache import entry_line_cache
 
 
 def render_pane_line(
@@ -53,15 +55,40 @@ def render_pane_line(
 
     # Render entry
     if y + scroll_offset < len(listing.entries):
-        entry = listing.entries[y + scroll_offset]
-        entry_idx = y + scroll_offset
-        is_selected = selected_index is not None and entry_idx == selected_index
-        if is_selected:
-            return render_selected_entry(entry, width, show_indicators, focused)
-        return render_normal_entry(entry, width, show_indicators, focused)
+        return _render_entry_cached(
+            listing, y + scroll_offset, width, selected_index,
+            show_indicators, focused,
+        )
 
     return [Segment(" " * width, bg_style)]
 
+
+def _render_entry_cached(
+    listing: DirectoryListing,
+    entry_idx: int,
+    width: int,
+    selected_index: int | None,
+    show_indicators: bool,
+    focused: bool,
+) -> list[Segment]:
+    """Render an entry row, reusing the cached segments when possible."""
+    entry = listing.entries[entry_idx]
+    is_selected = selected_index is not None and entry_idx == selected_index
+    is_bad = focused and is_bad_preset_entry(entry)
+    key = (
+        listing.generation, entry_idx, width, is_selected, focused,
+        show_indicators, is_bad,
+    )
+    cached = entry_line_cache.get(key)
+    if cached is not None:
+        return cached
+    if is_selected:
+        segments = render_selected_entry(entry, width, show_indicators, focused)
+    else:
+        segments = render_normal_entry(entry, width, show_indicators, focused)
+    entry_line_cache[key] = segments
+    return segments
+
 def _render_empty_listing(
     listing: DirectoryListing, y: int, width: int, is_left_pane: bool
 ) -> list[Segment]:
@@ -75,6 +102,10 @@ def _render_empty_listing(
             msg = "inaccessible directory"
         elif listing.was_empty:
             msg = "empty"
+        elif listing.filter_query:
+            msg = "no matches"
+        elif listing.scan_in_progress:
+            msg = "scanning..."
         else:
             msg = "no .milk files"
         text = msg.ljust(width)[:width]
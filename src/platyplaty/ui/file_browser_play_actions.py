@@ -45,7 +45,7 @@ async def _play_adjacent_preset(browser: FileBrowser, direction: int) -> None:
         browser: The file browser instance.
         direction: -1 for previous, 1 for next.
     """
-    from platyplaty.ui.file_browser_preset_preview import _preview_milk_preset
+    from platyplaty.ui.file_browser_preset_preview import preview_milk_preset
 
     target_index = _find_adjacent_milk_index(browser, direction)
     if target_index is None:
@@ -56,7 +56,7 @@ async def _play_adjacent_preset(browser: FileBrowser, direction: int) -> None:
     browser.refresh()
     entry = browser.get_selected_entry()
     if entry is not None:
-        await _preview_milk_preset(browser, entry.path)
+        await preview_milk_preset(browser, entry.path)
 
 
 def _find_adjacent_milk_index(browser: FileBrowser, direction: int) -> int | None:
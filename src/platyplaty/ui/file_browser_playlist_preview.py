@@ -2,12 +2,13 @@
 
 This module provides functions for parsing .platy files for right pane
 preview, using tolerant parsing that silently skips invalid lines.
+Previews stream the file and stop once the visible window is filled.
 """
 
 from __future__ import annotations
 
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import BinaryIO
 
 from platyplaty.playlist_validation import expand_path, is_absolute_path
 from platyplaty.ui.file_browser_types import (
@@ -18,45 +19,77 @@ from platyplaty.ui.file_browser_types import (
 )
 from platyplaty.ui.playlist_display_name import compute_display_names
 
-if TYPE_CHECKING:
-    from platyplaty.ui.directory_types import DirectoryEntry
-    from platyplaty.ui.file_browser import FileBrowser
+# Entries parsed beyond the visible window when previewing a playlist
+PREVIEW_MARGIN = 32
 
 
-def _parse_playlist_tolerant(content: str) -> list[Path]:
-    """Parse playlist content, silently skipping invalid lines.
+def _parse_line_tolerant(line: str) -> Path | None:
+    """Parse one playlist line, returning None if it is not a valid entry.
 
     Args:
-        content: The raw content of a .platy file.
+        line: A single line of a .platy file.
 
     Returns:
-        List of expanded Path objects for valid lines only.
+        The expanded Path, or None for blank or invalid lines.
+    """
+    stripped = line.strip()
+    if not stripped:
+        return None
+    if not is_absolute_path(stripped):
+        return None
+    if not stripped.lower().endswith('.milk'):
+        return None
+    try:
+        return expand_path(stripped)
+    except RuntimeError:
+        return None
+
+
+def _read_playlist_window(
+    file: BinaryIO, max_entries: int | None
+) -> list[Path] | None:
+    """Parse valid entries from an open .platy file, stopping early.
+
+    Lines are decoded one at a time, so reading stops as soon as
+    max_entries valid entries have been found.
+
+    Args:
+        file: The .platy file opened in binary mode.
+        max_entries: Number of valid entries wanted, or None for all.
+
+    Returns:
+        The valid entries found, or None if a line is not valid UTF-8.
     """
     result: list[Path] = []
-    for line in content.splitlines():
-        stripped = line.strip()
-        if not stripped:
-            continue
-        if not is_absolute_path(stripped):
-            continue
-        if not stripped.lower().endswith('.milk'):
-            continue
+    for raw_line in file:
         try:
-            expanded = expand_path(stripped)
-        except RuntimeError:
-            continue
-        result.append(expanded)
+            text = raw_line.decode('utf-8')
+        except UnicodeDecodeError:
+            return None
+        for line in text.splitlines():
+            path = _parse_line_tolerant(line)
+            if path is None:
+                continue
+            result.append(path)
+            if max_entries is not None and len(result) >= max_entries:
+                return result
     return result
 
 
-def make_playlist_preview(
-    browser: FileBrowser, entry: DirectoryEntry
+def build_playlist_preview(
+    file_path: Path, pane_height: int | None = None
 ) -> RightPaneContent:
-    """Create playlist preview content for a .platy file.
+    """Create playlist preview content for a .platy file path.
+
+    Only the first pane_height + PREVIEW_MARGIN valid entries are read
+    and disambiguated, so previewing a huge playlist costs about one
+    screen of parsing. Does not touch the browser, so it is safe to call
+    from a worker thread when prefetching previews.
 
     Args:
-        browser: The file browser instance.
-        entry: The directory entry to preview.
+        file_path: Path to the .platy file.
+        pane_height: Number of lines the right pane can show, or None
+            to parse the whole file.
 
     Returns:
         RightPanePlaylistPreview with disambiguated names,
@@ -64,16 +97,14 @@ def make_playlist_preview(
         RightPaneBinaryFile if decode fails,
         or None if permission denied or file not found.
     """
-    file_path = browser.current_dir / entry.name
+    max_entries = None if pane_height is None else pane_height + PREVIEW_MARGIN
     try:
-        raw_bytes = file_path.read_bytes()
+        with file_path.open('rb') as file:
+            paths = _read_playlist_window(file, max_entries)
     except (PermissionError, FileNotFoundError):
         return None
-    try:
-        content = raw_bytes.decode('utf-8')
-    except UnicodeDecodeError:
+    if paths is None:
         return RightPaneBinaryFile()
-    paths = _parse_playlist_tolerant(content)
     if not paths:
         return RightPaneNoMilk()
     names = compute_display_names(paths)
@@ -0,0 +1,47 @@
+"""Neighbour preview prefetching for the file browser widget.
+
+After the selection moves, the previews of the entries the user is
+likely to land on next are built in the background. These are
+package-private functions used by the navigation actions.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from platyplaty.ui.file_browser_preview import preview_pane_height
+from platyplaty.ui.file_browser_preview_cache import PreviewRequest, prefetch_previews
+
+if TYPE_CHECKING:
+    from platyplaty.ui.file_browser import FileBrowser
+
+# Entries warmed ahead of the selection in the direction of travel
+PREFETCH_AHEAD = 4
+
+# Entries warmed behind the selection, for quick reversals
+PREFETCH_BEHIND = 1
+
+
+def prefetch_neighbour_previews(browser: FileBrowser, direction: int) -> None:
+    """Warm the previews of entries near the selection.
+
+    Args:
+        browser: The file browser instance.
+        direction: 1 after moving down, -1 after moving up.
+    """
+    listing = browser._middle_listing
+    index = browser.selected_index
+    if listing is None or index is None:
+        return
+    entries = listing.entries
+    offsets = [direction * step for step in range(1, PREFETCH_AHEAD + 1)]
+    offsets += [-direction * step for step in range(1, PREFETCH_BEHIND + 1)]
+    requests: list[PreviewRequest] = []
+    for offset in offsets:
+        neighbour = index + offset
+        if 0 <= neighbour < len(entries):
+            entry = entries[neighbour]
+            path = browser.current_dir / entry.name
+            pane_height = preview_pane_height(browser, entry.entry_type)
+            requests.append((path, entry.entry_type, pane_height))
+    prefetch_previews(requests)
@@ -36,12 +36,14 @@ async def action_preview_preset(browser: FileBrowser) -> None:
     is_file = entry.entry_type in (EntryType.FILE, EntryType.SYMLINK_TO_FILE)
     if not (is_milk and is_file):
         return
-    await _preview_milk_preset(browser, entry.path)
+    await preview_milk_preset(browser, entry.path)
 
 
-async def _preview_milk_preset(browser: FileBrowser, path: Path) -> None:
+async def preview_milk_preset(browser: FileBrowser, path: Path) -> None:
     """Load a preset into the renderer for preview.
 
+    Used by the browser's preview and play keys and by the preset finder.
+
     Args:
         browser: The file browser instance.
         path: Path to the preset file.
@@ -9,15 +9,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from platyplaty.ui.directory import list_directory
 from platyplaty.ui.directory_types import EntryType
-from platyplaty.ui.file_browser_file_preview import make_file_preview
-from platyplaty.ui.file_browser_types import (
-    RightPaneContent,
-    RightPaneDirectory,
-    RightPaneEmpty,
-    RightPaneNoMilk,
-)
+from platyplaty.ui.file_browser_preview_cache import get_preview
+from platyplaty.ui.file_browser_types import RightPaneContent, RightPaneDirectory
 
 if TYPE_CHECKING:
     from platyplaty.ui.directory_types import DirectoryEntry
@@ -44,8 +38,8 @@ def calc_right_selection(browser: FileBrowser, dir_path: str) -> int:
     listing = content.listing
     if not listing or not listing.entries:
         return 0
-    gen = (i for i, e in enumerate(listing.entries) if e.name == remembered_name)
-    return next(gen, 0)
+    index = listing.index_of(remembered_name)
+    return 0 if index is None else index
 
 
 
@@ -54,6 +48,9 @@ def get_right_pane_content(
 ) -> RightPaneContent:
     """Determine what content to show in the right pane.
 
+    Previews are served from the preview cache when the entry has not
+    changed since it was last built or prefetched.
+
     Args:
         browser: The file browser instance.
         selected_entry: The currently selected entry, or None.
@@ -63,23 +60,24 @@ def get_right_pane_content(
     """
     if selected_entry is None:
         return None
+    path = browser.current_dir / selected_entry.name
     entry_type = selected_entry.entry_type
-    # Broken symlink: collapsed state
-    if entry_type == EntryType.BROKEN_SYMLINK:
-        return None
-    # Directory or symlink to directory
-    if entry_type in (EntryType.DIRECTORY, EntryType.SYMLINK_TO_DIRECTORY):
-        dir_path = browser.current_dir / selected_entry.name
-        listing = list_directory(dir_path)
-        if listing.permission_denied:
-            return None
-        if listing.was_empty:
-            return RightPaneEmpty()
-        if listing.had_filtered_entries and not listing.entries:
-            return RightPaneNoMilk()
-        return RightPaneDirectory(listing)
-    # File or symlink to file
+    return get_preview(path, entry_type, preview_pane_height(browser, entry_type))
+
+
+def preview_pane_height(browser: FileBrowser, entry_type: EntryType) -> int:
+    """Return the pane height a preview of this entry type depends on.
+
+    Only file previews are cut to the pane height; everything else uses
+    0 so that resizing does not invalidate cached directory previews.
+
+    Args:
+        browser: The file browser instance.
+        entry_type: Type of the entry being previewed.
+
+    Returns:
+        Number of preview lines, or 0 if the preview is height-independent.
+    """
     if entry_type in (EntryType.FILE, EntryType.SYMLINK_TO_FILE):
-        return make_file_preview(browser, selected_entry)
-    # Unknown entry type: collapsed state
-    return None
+        return max(1, browser.size.height - 1)
+    return 0
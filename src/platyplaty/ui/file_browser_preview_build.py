@@ -0,0 +1,57 @@
+"""Browser-independent construction of right pane content.
+
+This module builds right pane content from a path, entry type and pane
+height alone, so the same code serves the foreground refresh and the
+background preview prefetcher. These are package-private functions
+used by the file browser preview modules.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from platyplaty.ui.directory import list_directory
+from platyplaty.ui.directory_types import EntryType
+from platyplaty.ui.file_browser_file_preview import build_file_preview
+from platyplaty.ui.file_browser_types import (
+    RightPaneContent,
+    RightPaneDirectory,
+    RightPaneEmpty,
+    RightPaneNoMilk,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def build_right_pane_content(
+    path: Path, entry_type: EntryType, pane_height: int
+) -> RightPaneContent:
+    """Build the right pane content for an entry.
+
+    Args:
+        path: Path to the entry (current directory / entry name).
+        entry_type: Type of the entry.
+        pane_height: Number of lines the right pane can show.
+
+    Returns:
+        The appropriate RightPaneContent type, or None for collapsed state.
+    """
+    # Broken symlink: collapsed state
+    if entry_type == EntryType.BROKEN_SYMLINK:
+        return None
+    # Directory or symlink to directory
+    if entry_type in (EntryType.DIRECTORY, EntryType.SYMLINK_TO_DIRECTORY):
+        listing = list_directory(path)
+        if listing.permission_denied:
+            return None
+        if listing.was_empty:
+            return RightPaneEmpty()
+        if listing.had_filtered_entries and not listing.entries:
+            return RightPaneNoMilk()
+        return RightPaneDirectory(listing)
+    # File or symlink to file
+    if entry_type in (EntryType.FILE, EntryType.SYMLINK_TO_FILE):
+        return build_file_preview(path, pane_height)
+    # Unknown entry type: collapsed state
+    return None
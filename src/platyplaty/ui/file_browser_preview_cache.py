@@ -0,0 +1,175 @@
+"""Cached and prefetched right pane previews.
+
+Previews are cached by (path, size, mtime, pane height), so an entry
+whose file or directory has not changed is never re-read. Size and
+mtime come from the shared stat cache, so a cache hit, such as a
+resize, makes no system call. File previews
+are read for a whole bucket of pane heights and cut to the requested
+height on the way out, so resizing the terminal is served from the
+cache. The cache is bounded by an estimated memory budget rather than an
+entry count. Previews for entries the user is likely to move to next can
+be built ahead of time on a worker thread with prefetch_previews().
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+
+import cachetools
+
+from platyplaty.file_stat import file_stat
+from platyplaty.ui.directory_types import EntryType
+from platyplaty.ui.file_browser_preview_build import build_right_pane_content
+from platyplaty.ui.file_browser_types import (
+    RightPaneContent,
+    RightPaneDirectory,
+    RightPaneFilePreview,
+    RightPanePlaylistPreview,
+)
+
+# Estimated bytes of preview content kept in memory
+PREVIEW_CACHE_BUDGET = 8 * 1024 * 1024
+
+# File previews are read for at least this many lines (see _height_bucket)
+MIN_HEIGHT_BUCKET = 64
+
+# Rough per-object overheads used by the size estimate
+_LINE_OVERHEAD = 64
+_ENTRY_OVERHEAD = 256
+_CONTENT_OVERHEAD = 64
+
+PreviewKey = tuple[Path, int, int, int]
+PreviewRequest = tuple[Path, EntryType, int]
+
+
+def estimate_preview_size(content: RightPaneContent) -> int:
+    """Estimate the memory held by a piece of right pane content.
+
+    Args:
+        content: The cached content.
+
+    Returns:
+        Approximate size in bytes.
+    """
+    if isinstance(content, RightPaneFilePreview):
+        lines = content.lines
+    elif isinstance(content, RightPanePlaylistPreview):
+        lines = content.names
+    elif isinstance(content, RightPaneDirectory):
+        return _CONTENT_OVERHEAD + _ENTRY_OVERHEAD * len(content.listing.entries)
+    else:
+        return _CONTENT_OVERHEAD
+    return _CONTENT_OVERHEAD + sum(len(line) + _LINE_OVERHEAD for line in lines)
+
+
+preview_cache: cachetools.LRUCache[PreviewKey, RightPaneContent] = (
+    cachetools.LRUCache(maxsize=PREVIEW_CACHE_BUDGET, getsizeof=estimate_preview_size)
+)
+
+_lock = threading.Lock()
+_pending: dict[PreviewKey, Future[None]] = {}
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="preview")
+
+
+def get_preview(
+    path: Path, entry_type: EntryType, pane_height: int
+) -> RightPaneContent:
+    """Return the preview for an entry, building it on a cache miss.
+
+    Args:
+        path: Path to the entry.
+        entry_type: Type of the entry.
+        pane_height: Number of lines the right pane can show.
+
+    Returns:
+        The right pane content for the entry.
+    """
+    key = _preview_key(path, pane_height)
+    if key is None:
+        return build_right_pane_content(path, entry_type, pane_height)
+    with _lock:
+        content = preview_cache.get(key)
+    if content is None:
+        content = build_right_pane_content(path, entry_type, key[3])
+        _store(key, content)
+    return _cut_to_height(content, pane_height)
+
+
+def prefetch_previews(requests: list[PreviewRequest]) -> None:
+    """Build previews in the background, nearest request first.
+
+    Entries that are already cached or pending are skipped.
+
+    Args:
+        requests: (path, entry type, pane height) for each entry to warm.
+    """
+    for path, entry_type, pane_height in requests:
+        if entry_type == EntryType.BROKEN_SYMLINK:
+            continue
+        key = _preview_key(path, pane_height)
+        if key is None:
+            continue
+        with _lock:
+            if key in preview_cache or key in _pending:
+                continue
+            _pending[key] = _executor.submit(_prefetch_one, key, entry_type)
+
+
+def wait_for_pending_previews(timeout: float | None = None) -> None:
+    """Block until all currently scheduled prefetches have finished.
+
+    Args:
+        timeout: Maximum number of seconds to wait, or None for no limit.
+    """
+    with _lock:
+        futures = list(_pending.values())
+    wait(futures, timeout)
+
+
+def clear_preview_cache() -> None:
+    """Drop all cached previews."""
+    with _lock:
+        preview_cache.clear()
+
+
+def _preview_key(path: Path, pane_height: int) -> PreviewKey | None:
+    """Return the cache key for path, or None if it cannot be stat'ed."""
+    st = file_stat(path).stat
+    if st is None:
+        return None
+    return (path, st.st_size, st.st_mtime_ns, _height_bucket(pane_height))
+
+
+def _height_bucket(pane_height: int) -> int:
+    """Round a pane height up to the height previews are read for.
+
+    Heights of 0 (height-independent previews) are kept as they are.
+    """
+    if pane_height <= 0:
+        return 0
+    return max(MIN_HEIGHT_BUCKET, 1 << (pane_height - 1).bit_length())
+
+
+def _cut_to_height(content: RightPaneContent, pane_height: int) -> RightPaneContent:
+    """Return file preview content limited to pane_height lines."""
+    if isinstance(content, RightPaneFilePreview) and len(content.lines) > pane_height:
+        return RightPaneFilePreview(content.lines[:pane_height])
+    return content
+
+
+def _store(key: PreviewKey, content: RightPaneContent) -> None:
+    """Cache content unless it is a collapsed state or over budget."""
+    if content is None or estimate_preview_size(content) > PREVIEW_CACHE_BUDGET:
+        return
+    with _lock:
+        preview_cache[key] = content
+
+
+def _prefetch_one(key: PreviewKey, entry_type: EntryType) -> None:
+    """Worker job: build and cache one preview."""
+    path, _, _, pane_height = key
+    try:
+        _store(key, build_right_pane_content(path, entry_type, pane_height))
+    finally:
+        with _lock:
+            _pending.pop(key, None)
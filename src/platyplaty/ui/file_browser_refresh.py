@@ -9,8 +9,12 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from platyplaty.file_identity import clear_identity_caches, resolve_cached
+from platyplaty.file_stat import invalidate_file_stat
+from platyplaty.ui.completion_listing import seed_completion_listing
 from platyplaty.ui.directory import list_directory
 from platyplaty.ui.directory_types import DirectoryListing
+from platyplaty.ui.file_browser_line_cache import clear_path_line_cache
 from platyplaty.ui.file_browser_preview import (
     calc_right_selection,
     get_right_pane_content,
@@ -28,8 +32,14 @@ def refresh_listings(browser: FileBrowser) -> None:
     Args:
         browser: The file browser instance.
     """
+    # Path line component types and symlink targets may have changed on disk
+    clear_path_line_cache()
+    clear_identity_caches()
+    invalidate_file_stat()
+
     # Middle pane: current directory
     browser._middle_listing = list_directory(browser.current_dir)
+    seed_completion_listing(browser.current_dir, browser._middle_listing)
 
     # Left pane: parent directory (empty at filesystem root)
     parent = browser.current_dir.parent
@@ -43,6 +53,7 @@ def refresh_listings(browser: FileBrowser) -> None:
         )
     else:
         browser._left_listing = list_directory(parent)
+        seed_completion_listing(parent, browser._left_listing)
 
     # Right pane: preview of selected item
     refresh_right_pane(browser)
@@ -77,7 +88,7 @@ def refresh_right_pane(browser: FileBrowser) -> None:
 
     # Directory content: calculate selection and scroll position
     if isinstance(browser._right_content, RightPaneDirectory):
-        path_str = str((browser.current_dir / selected.name).resolve())
+        path_str = str(resolve_cached(browser.current_dir / selected.name))
         browser._right_selected_index = calc_right_selection(browser, path_str)
         nav_state = browser._nav_state
         browser._right_scroll_offset = nav_state.get_scroll_offset_for_directory(
@@ -14,6 +14,7 @@ from rich.style import Style
 from textual.strip import Strip
 
 from platyplaty.ui.colors import BACKGROUND_COLOR
+from platyplaty.ui.file_browser_line_cache import path_line_cache
 from platyplaty.ui.file_browser_pane_render import render_pane_line
 from platyplaty.ui.file_browser_path_render import (
     get_display_path,
@@ -27,16 +28,28 @@ from platyplaty.ui.layout import calculate_pane_widths
 if TYPE_CHECKING:
     from platyplaty.ui.file_browser import FileBrowser
 
+_GAP_SEGMENT = Segment(" ", Style(bgcolor=BACKGROUND_COLOR))
+
 
 def _calc_left_selected_index(browser: FileBrowser) -> int | None:
     """Calculate selected index for left pane (current dir in parent listing)."""
     if browser._left_listing is None or not browser._left_listing.entries:
         return None
-    current_name = browser.current_dir.name
-    for i, entry in enumerate(browser._left_listing.entries):
-        if entry.name == current_name:
-            return i
-    return None
+    return browser._left_listing.index_of(browser.current_dir.name)
+
+def _render_path_line(browser: FileBrowser, width: int) -> list[Segment]:
+    """Render the path display line, cached by (path, width, selected)."""
+    path = get_display_path(browser)
+    mark_selected = should_mark_selected(browser)
+    key = (path, width, mark_selected)
+    cached = path_line_cache.get(key)
+    if cached is not None:
+        return cached
+    path_text = render_path(path, width, mark_selected)
+    segments = text_to_segments(path_text, browser.app.console)
+    path_line_cache[key] = segments
+    return segments
+
 
 def render_line(browser: FileBrowser, y: int) -> Strip:
     """Render a single line of the file browser.
@@ -51,11 +64,7 @@ def render_line(browser: FileBrowser, y: int) -> Strip:
     width = browser.size.width
     # y=0 is the path display line
     if y == 0:
-        path = get_display_path(browser)
-        mark_selected = should_mark_selected(browser)
-        path_text = render_path(path, width, mark_selected)
-        path_segments = text_to_segments(path_text, browser.app.console)
-        return Strip(path_segments)
+        return Strip(_render_path_line(browser, width))
 
     layout_state = browser._layout_state
     pane_widths = calculate_pane_widths(width, layout_state)
@@ -72,7 +81,7 @@ def render_line(browser: FileBrowser, y: int) -> Strip:
             show_indicators=False, focused=browser._focused
         )
         segments.extend(left_segments)
-        segments.append(Segment(" ", Style(bgcolor=BACKGROUND_COLOR)))  # Gap
+        segments.append(_GAP_SEGMENT)
 
     # Render middle pane
     middle_segments = render_pane_line(
@@ -82,7 +91,7 @@ def render_line(browser: FileBrowser, y: int) -> Strip:
         focused=browser._focused
     )
     segments.extend(middle_segments)
-    segments.append(Segment(" ", Style(bgcolor=BACKGROUND_COLOR)))  # Gap
+    segments.append(_GAP_SEGMENT)
 
     # Render right pane
     right_segments = render_right_pane_line(
@@ -7,6 +7,7 @@ in the right pane. These are package-private functions.
 from rich.segment import Segment
 from rich.style import Style
 
+from platyplaty.ui.cell_width import pad_to_width, truncate_to_width
 from platyplaty.ui.colors import (
     BACKGROUND_COLOR,
     DIMMED_COLOR,
@@ -86,8 +87,8 @@ def render_right_pane_line(
             return [Segment(" " * width, bg_style)]
         content_width = max(0, width - 2)
         name = truncate_simple(content.names[y], content_width)
-        text = " " + name.ljust(content_width) + " "
-        text = text[:width]
+        text = " " + pad_to_width(name, content_width) + " "
+        text = truncate_to_width(text, width)
         color = FILE_COLOR if focused else DIMMED_COLOR
         style = Style(color=color, bgcolor=BACKGROUND_COLOR)
         return [Segment(text, style)]
@@ -13,22 +13,22 @@ from platyplaty.ui.file_browser_types import RightPaneDirectory
 from platyplaty.ui.nav_scroll import calc_safe_zone_scroll
 
 if TYPE_CHECKING:
-    from platyplaty.ui.directory_types import DirectoryEntry
+    from platyplaty.ui.directory_types import DirectoryListing
     from platyplaty.ui.file_browser import FileBrowser
 
 
-def find_entry_index_in_listing(entries: list[DirectoryEntry], name: str) -> int:
-    """Find the index of an entry by name in a list of entries.
+def find_entry_index_in_listing(listing: DirectoryListing, name: str) -> int:
+    """Find the index of an entry by name in a directory listing.
 
     Args:
-        entries: The list of directory entries to search.
+        listing: The directory listing to search.
         name: The name to find.
 
     Returns:
         Index of the entry, or 0 if not found.
     """
-    gen = (i for i, e in enumerate(entries) if e.name == name)
-    return next(gen, 0)
+    index = listing.index_of(name)
+    return 0 if index is None else index
 
 
 def adjust_left_pane_scroll(browser: FileBrowser, pane_height: int) -> None:
@@ -47,7 +47,7 @@ def adjust_left_pane_scroll(browser: FileBrowser, pane_height: int) -> None:
     if browser._left_listing is None or not browser._left_listing.entries:
         return
     current_name = browser.current_dir.name
-    index = find_entry_index_in_listing(browser._left_listing.entries, current_name)
+    index = find_entry_index_in_listing(browser._left_listing, current_name)
     item_count = len(browser._left_listing.entries)
     browser._left_scroll_offset = calc_safe_zone_scroll(
         index, browser._left_scroll_offset, pane_height, item_count
@@ -0,0 +1,72 @@
+"""Type-ahead find and filter actions for the file browser widget.
+
+Both actions open the command prompt with their own prefix and update
+the middle pane live as the text changes. Enter or Escape closes the
+prompt and keeps the result; a filter is cleared by re-opening it and
+deleting the text, or by leaving the directory. These are
+package-private functions used by the FileBrowser class.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from platyplaty.ui.command_line import CommandLine
+from platyplaty.ui.command_prompt import CommandPrompt
+from platyplaty.ui.file_browser_sync import show_nav_listing
+
+if TYPE_CHECKING:
+    from platyplaty.ui.file_browser import FileBrowser
+
+FIND_PREFIX = "find: "
+FILTER_PREFIX = "/"
+
+
+async def action_find(browser: FileBrowser) -> None:
+    """Prompt for a name prefix and jump to the first match as it is typed.
+
+    Args:
+        browser: The file browser instance.
+    """
+
+    def on_change(text: str) -> None:
+        if browser._nav_state.jump_to_prefix(text):
+            show_nav_listing(browser)
+
+    _open_prompt(browser, FIND_PREFIX, "", on_change)
+
+
+async def action_filter(browser: FileBrowser) -> None:
+    """Prompt for text and show only the entries whose name contains it.
+
+    The prompt starts with the active filter, if any.
+
+    Args:
+        browser: The file browser instance.
+    """
+
+    def on_change(text: str) -> None:
+        browser._nav_state.apply_filter(text)
+        show_nav_listing(browser)
+
+    initial_text = browser._nav_state.filter_query
+    _open_prompt(browser, FILTER_PREFIX, initial_text, on_change)
+
+
+def _open_prompt(
+    browser: FileBrowser,
+    prefix: str,
+    initial_text: str,
+    on_change: Callable[[str], None],
+) -> None:
+    """Show the command prompt with a live-update hook."""
+    app = browser.app
+
+    async def on_submit(_text: str) -> None:
+        app.query_one(CommandPrompt).hide()
+
+    app.query_one(CommandLine).show_command_prompt(
+        on_submit, browser.id, initial_text, prefix, on_change
+    )
+
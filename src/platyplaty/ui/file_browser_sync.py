@@ -10,7 +10,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from platyplaty.ui.directory_types import DirectoryEntry
-from platyplaty.ui.file_browser_refresh import refresh_listings
+from platyplaty.ui.file_browser_refresh import refresh_listings, refresh_right_pane
 from platyplaty.ui.file_browser_scroll import (
     adjust_left_pane_scroll,
     adjust_right_pane_scroll,
@@ -40,6 +40,21 @@ def sync_from_nav_state(browser: FileBrowser) -> None:
     browser._left_scroll_offset = browser._nav_state.get_parent_scroll_offset()
 
 
+def show_nav_listing(browser: FileBrowser) -> None:
+    """Display the navigation state's listing without re-reading it.
+
+    Used when the listing was filtered or flattened in place, so the
+    current directory and the left pane are unchanged.
+
+    Args:
+        browser: The file browser instance.
+    """
+    browser._middle_listing = browser._nav_state.get_listing()
+    sync_from_nav_state(browser)
+    refresh_right_pane(browser)
+    browser.refresh()
+
+
 def refresh_panes(browser: FileBrowser) -> None:
     """Refresh all three panes after navigation state changes.
 
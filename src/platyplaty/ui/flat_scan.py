@@ -0,0 +1,268 @@
+"""Background recursive scan for the flattened file browser view.
+
+A FlatScan walks a directory tree on a worker thread and collects every
+.milk file beneath it as a DirectoryEntry named by its path relative to
+the scanned root (for example "artist/pack/preset.milk"). Entries are
+published in batches so the browser can show results while the walk is
+still running.
+
+Children of each directory are visited in order of their folded name,
+with "/" appended to directory names. This makes the walk emit entries
+already sorted by their folded relative path, so every published batch
+extends a sorted listing and prefix searches stay valid mid-scan.
+
+Directories are identified by (st_dev, st_ino) and each is visited at
+most once per scan, so symlink loops terminate. The contents of every
+scanned directory are cached with its mtime; re-scanning a subtree only
+re-reads directories that changed.
+
+walk_milk_files is the walk itself; bulk adds use it too, so presets
+are added in the order this view lists them.
+"""
+
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import cachetools
+
+from platyplaty.ui.directory_types import DirectoryEntry, EntryType
+
+# Minimum seconds between two progress notifications
+PUBLISH_INTERVAL = 0.1
+
+
+@dataclass(frozen=True)
+class _DirectoryScan:
+    """Cached contents of one directory.
+
+    Attributes:
+        mtime_ns: The directory's mtime when it was read.
+        children: (name, entry_type) pairs in walk order; entry_type is
+            None for subdirectories.
+    """
+
+    mtime_ns: int
+    children: tuple[tuple[str, EntryType | None], ...]
+
+
+_scan_cache: cachetools.LRUCache[Path, _DirectoryScan] = cachetools.LRUCache(
+    maxsize=20000
+)
+_cache_lock = threading.Lock()
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="flat-scan")
+_current_scan: "FlatScan | None" = None
+
+
+class FlatScan:
+    """A running or finished recursive scan of one directory tree."""
+
+    def __init__(self, root: Path, on_progress: Callable[[], None]) -> None:
+        """Start scanning root in the background.
+
+        Args:
+            root: The directory whose .milk files are collected.
+            on_progress: Called on the worker thread whenever new
+                entries are published and when the scan finishes.
+        """
+        self.root = root
+        self._on_progress = on_progress
+        self._lock = threading.Lock()
+        self._entries: list[DirectoryEntry] = []
+        self._done = False
+        self._cancelled = threading.Event()
+        self._future: Future[None] = _executor.submit(self._run)
+
+    @property
+    def done(self) -> bool:
+        """True once the walk has finished or was cancelled."""
+        with self._lock:
+            return self._done
+
+    def snapshot(self) -> list[DirectoryEntry]:
+        """Return a copy of the entries published so far."""
+        with self._lock:
+            return list(self._entries)
+
+    def cancel(self) -> None:
+        """Stop the walk; no further progress is reported."""
+        self._cancelled.set()
+
+    def wait(self, timeout: float | None = None) -> None:
+        """Block until the walk has finished.
+
+        Args:
+            timeout: Maximum number of seconds to wait, or None for no limit.
+        """
+        self._future.exception(timeout)
+
+    def _run(self) -> None:
+        """Worker job: walk the tree, then mark the scan finished."""
+        try:
+            self._walk()
+        finally:
+            with self._lock:
+                self._done = True
+            self._notify()
+
+    def _walk(self) -> None:
+        """Depth-first walk publishing .milk files in sorted order."""
+        batch: list[DirectoryEntry] = []
+        last_publish = time.monotonic()
+        for entry in walk_milk_files(self.root, set(), self._cancelled):
+            batch.append(entry)
+            if time.monotonic() - last_publish >= PUBLISH_INTERVAL:
+                self._publish(batch)
+                last_publish = time.monotonic()
+        if not self._cancelled.is_set():
+            self._publish(batch)
+
+    def _publish(self, batch: list[DirectoryEntry]) -> None:
+        """Append a batch to the visible entries and notify."""
+        if not batch:
+            return
+        with self._lock:
+            self._entries.extend(batch)
+        batch.clear()
+        self._notify()
+
+    def _notify(self) -> None:
+        """Report progress unless the scan was cancelled."""
+        if not self._cancelled.is_set():
+            self._on_progress()
+
+
+def start_flat_scan(root: Path, on_progress: Callable[[], None]) -> FlatScan:
+    """Start a scan of root, cancelling any scan already running.
+
+    Args:
+        root: The directory whose .milk files are collected.
+        on_progress: Called on the worker thread as entries arrive.
+
+    Returns:
+        The new scan.
+    """
+    global _current_scan
+    cancel_flat_scan()
+    _current_scan = FlatScan(root, on_progress)
+    return _current_scan
+
+
+def cancel_flat_scan() -> None:
+    """Cancel the running scan, if any."""
+    global _current_scan
+    if _current_scan is not None:
+        _current_scan.cancel()
+        _current_scan = None
+
+
+def walk_milk_files(
+    root: Path,
+    visited: set[tuple[int, int]],
+    cancelled: threading.Event | None = None,
+) -> Iterator[DirectoryEntry]:
+    """Yield the .milk files beneath a directory in folded-path order.
+
+    Directory contents come from the mtime-checked scan cache.
+
+    Args:
+        root: The directory to walk.
+        visited: (st_dev, st_ino) of directories already walked; updated.
+        cancelled: If given, the walk stops once it is set.
+
+    Yields:
+        An entry per .milk file, named by its path relative to root.
+    """
+    # (relative name, path, entry type or None for a directory)
+    stack: list[tuple[str, Path, EntryType | None]] = [("", root, None)]
+    while stack:
+        if cancelled is not None and cancelled.is_set():
+            return
+        relative, path, entry_type = stack.pop()
+        if entry_type is not None:
+            yield DirectoryEntry(relative, entry_type, path)
+            continue
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        identity = (st.st_dev, st.st_ino)
+        if identity in visited:
+            continue
+        visited.add(identity)
+        scan = _scan_directory(path, st.st_mtime_ns)
+        for name, child_type in reversed(scan.children):
+            if child_type is None:
+                stack.append((f"{relative}{name}/", path / name, None))
+            else:
+                stack.append((f"{relative}{name}", path / name, child_type))
+
+
+def clear_flat_scan_cache() -> None:
+    """Drop all cached directory contents."""
+    with _cache_lock:
+        _scan_cache.clear()
+
+
+def _scan_directory(path: Path, mtime_ns: int) -> _DirectoryScan:
+    """Return the contents of a directory, reading it only if it changed.
+
+    Args:
+        path: The directory to read.
+        mtime_ns: Its current mtime.
+
+    Returns:
+        The subdirectories and .milk files of the directory.
+    """
+    with _cache_lock:
+        cached = _scan_cache.get(path)
+    if cached is not None and cached.mtime_ns == mtime_ns:
+        return cached
+    keyed: list[tuple[str, str, EntryType | None]] = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                child = _classify(entry)
+                if child is None:
+                    continue
+                if child in _DIRECTORY_TYPES:
+                    keyed.append((entry.name.lower() + "/", entry.name, None))
+                else:
+                    keyed.append((entry.name.lower(), entry.name, child))
+    except OSError:
+        return _DirectoryScan(mtime_ns, ())
+    keyed.sort(key=lambda item: item[0])
+    scan = _DirectoryScan(mtime_ns, tuple((name, kind) for _, name, kind in keyed))
+    with _cache_lock:
+        _scan_cache[path] = scan
+    return scan
+
+
+_DIRECTORY_TYPES = (EntryType.DIRECTORY, EntryType.SYMLINK_TO_DIRECTORY)
+
+
+def _classify(entry: os.DirEntry[str]) -> EntryType | None:
+    """Classify a directory entry for the walk.
+
+    Args:
+        entry: The entry to classify.
+
+    Returns:
+        The entry type of a directory or .milk file (either possibly
+        behind a symlink), or None to skip the entry.
+    """
+    try:
+        is_symlink = entry.is_symlink()
+        if entry.is_dir():
+            if is_symlink:
+                return EntryType.SYMLINK_TO_DIRECTORY
+            return EntryType.DIRECTORY
+        if not entry.name.lower().endswith(".milk") or not entry.is_file():
+            return None
+    except OSError:
+        return None
+    return EntryType.SYMLINK_TO_FILE if is_symlink else EntryType.FILE
@@ -4,45 +4,46 @@ This module provides functions to invalidate and refresh cached
 indicator values when navigation changes selection.
 """
 
+from collections.abc import Callable
 from pathlib import Path
 
+from platyplaty.file_stat import invalidate_file_stat
+from platyplaty.ui.directory_count_worker import revalidate_directory_count
 from platyplaty.ui.directory_types import EntryType
-from platyplaty.ui.indicators import (
-    count_directory_contents,
-    directory_count_cache,
-)
-from platyplaty.ui.size_format import (
-    file_size_cache,
-    get_file_size,
-    get_symlink_size,
-    symlink_size_cache,
-)
+from platyplaty.ui.file_browser_line_cache import clear_entry_line_cache
+from platyplaty.ui.size_format import get_file_size, get_symlink_size
 
 
 def refresh_indicator_cache(entry_type: EntryType, path: Path) -> None:
     """Invalidate cache for an entry and recalculate its indicator.
 
     Called when selection changes to refresh indicator values for
-    entries that remain visible. The cache key is deleted first,
-    then the appropriate function is called to recalculate.
+    entries that remain visible. File sizes are re-stat'ed after
+    dropping the path from the shared stat cache; if a size changed,
+    cached pane rows are dropped.
+    Directory counts are not evicted; instead the worker re-stats the
+    directory in the background and recounts only if its mtime changed,
+    so the old count stays visible meanwhile.
 
     Args:
         entry_type: Type of the entry.
         path: Path to the entry.
     """
-    key = (path,)
     if entry_type == EntryType.DIRECTORY:
-        directory_count_cache.pop(key, None)
-        count_directory_contents(path)
+        revalidate_directory_count(path)
     elif entry_type == EntryType.FILE:
-        file_size_cache.pop(key, None)
-        get_file_size(path)
+        _refresh_size(get_file_size, path)
     elif entry_type == EntryType.SYMLINK_TO_DIRECTORY:
-        directory_count_cache.pop(key, None)
-        count_directory_contents(path)
+        revalidate_directory_count(path)
     elif entry_type == EntryType.SYMLINK_TO_FILE:
-        file_size_cache.pop(key, None)
-        get_file_size(path)
+        _refresh_size(get_file_size, path)
     elif entry_type == EntryType.BROKEN_SYMLINK:
-        symlink_size_cache.pop(key, None)
-        get_symlink_size(path)
+        _refresh_size(get_symlink_size, path)
+
+
+def _refresh_size(get_size: Callable[[Path], int], path: Path) -> None:
+    """Recalculate a cached size, dropping rendered rows if it changed."""
+    old_size = get_size(path)
+    invalidate_file_stat(path)
+    if get_size(path) != old_size:
+        clear_entry_line_cache()
@@ -7,18 +7,11 @@ Indicators include directory counts, file sizes, and symlink markers.
 
 from pathlib import Path
 
-import cachetools
-
 from platyplaty.ui.directory_entry import get_entry_type, should_include
 from platyplaty.ui.directory_types import EntryType
 from platyplaty.ui.size_format import format_file_size, get_file_size, get_symlink_size
 
-directory_count_cache: cachetools.LRUCache[tuple[Path], int] = (
-    cachetools.LRUCache(maxsize=10000)
-)
-
 
-@cachetools.cached(directory_count_cache)
 def count_directory_contents(path: Path) -> int:
     """Count filtered directory contents.
 
@@ -29,7 +22,13 @@ def count_directory_contents(path: Path) -> int:
     - Broken symlinks if name ends in .milk or has no extension
 
     For symlinks to directories, this counts the target directory's
-    contents (Path.iterdir follows symlinks).
+    contents (Path.iterdir follows symlinks). Entry types come from the
+    shared file_stat cache, so entering the directory afterwards does
+    not stat its entries again.
+
+    This always reads the directory. The file browser does not call it
+    while painting; see directory_count_worker for the cached,
+    background-computed counts used there.
 
     Args:
         path: Path to the directory to count.
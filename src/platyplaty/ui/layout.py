@@ -8,6 +8,8 @@ panes. The right pane absorbs remaining space.
 
 from dataclasses import dataclass
 
+import cachetools
+
 from platyplaty.ui.layout_state import LayoutState
 
 __all__ = [
@@ -84,11 +86,18 @@ def calculate_standard_widths(terminal_width: int) -> PaneWidths:
     return PaneWidths(left=left_width, middle=middle_width, right=right_width)
 
 
+pane_widths_cache: cachetools.LRUCache[tuple[int, LayoutState], PaneWidths] = (
+    cachetools.LRUCache(maxsize=64)
+)
+
+
+@cachetools.cached(pane_widths_cache)
 def calculate_pane_widths(terminal_width: int, layout_state: LayoutState) -> PaneWidths:
     """Calculate pane widths based on terminal width and layout state.
 
     This is the unified entry point for layout calculation. It dispatches
     to either standard (1:3:4) or stretched calculation based on state.
+    Results are cached because render_line asks for them on every row.
 
     Args:
         terminal_width: Total terminal width in characters.
@@ -0,0 +1,201 @@
+"""Type-ahead and filter lookups over directory listings.
+
+Listings are sorted by directory._sort_key, so the case-folded sort
+keys of a listing form a sorted sequence that can be bisected to find
+the first entry with a given name prefix. The keys (and a single
+newline-joined string of the folded names, used to find substring
+matches without a Python-level loop) are built once per listing and
+cached by listing generation.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from dataclasses import dataclass
+from itertools import compress, repeat
+from operator import contains
+
+import cachetools
+
+from platyplaty.ui.directory import _sort_key
+from platyplaty.ui.directory_types import DirectoryListing
+
+
+@dataclass(frozen=True)
+class ListingIndex:
+    """Search index for one directory listing.
+
+    Attributes:
+        keys: The _sort_key of every entry, in listing order.
+        names: The folded names, in listing order.
+        blob: The folded names joined with newlines.
+        starts: Offset of each folded name within blob.
+    """
+
+    keys: tuple[tuple[int, str], ...]
+    names: tuple[str, ...]
+    blob: str
+    starts: tuple[int, ...]
+
+
+# Finding one occurrence in the joined names costs about this many
+# per-entry containment tests (see find_substring_indices)
+_FIND_COST_RATIO = 5
+
+# Scanning this many characters of the joined names costs about one
+# per-entry containment test
+_SCAN_CHARS_PER_TEST = 128
+
+# Characters of the joined names sampled to pick a search strategy
+_SAMPLE_CHARS = 64 * 1024
+
+_index_cache: cachetools.LRUCache[int, ListingIndex] = cachetools.LRUCache(
+    maxsize=16
+)
+
+
+def get_listing_index(listing: DirectoryListing) -> ListingIndex:
+    """Return the (cached) search index for a listing.
+
+    Args:
+        listing: A listing sorted by _sort_key.
+
+    Returns:
+        The listing's search index.
+    """
+    index = _index_cache.get(listing.generation)
+    if index is None:
+        keys = tuple(_sort_key(entry) for entry in listing.entries)
+        names = tuple(name for _, name in keys)
+        starts: list[int] = []
+        offset = 0
+        for name in names:
+            starts.append(offset)
+            offset += len(name) + 1
+        index = ListingIndex(keys, names, "\n".join(names), tuple(starts))
+        _index_cache[listing.generation] = index
+    return index
+
+
+def find_prefix_index(listing: DirectoryListing, prefix: str) -> int | None:
+    """Find the first entry whose name starts with prefix.
+
+    Matching is case-insensitive. Entries are searched in display
+    order, so a matching directory wins over a matching file.
+
+    Args:
+        listing: A listing sorted by _sort_key.
+        prefix: The typed prefix.
+
+    Returns:
+        Index of the first matching entry, or None if none match.
+    """
+    keys = get_listing_index(listing).keys
+    folded = prefix.lower()
+    for priority in (0, 1):
+        i = bisect_left(keys, (priority, folded))
+        if i < len(keys) and keys[i][0] == priority and keys[i][1].startswith(folded):
+            return i
+    return None
+
+
+def find_substring_indices(
+    listing: DirectoryListing,
+    query: str,
+    candidates: tuple[int, ...] | None = None,
+) -> tuple[int, ...]:
+    """Find entries whose name contains query, case-insensitively.
+
+    Selective queries are located with str.find over the joined names;
+    broad ones are tested entry by entry with a C-level compress/map
+    pipeline. The cheaper strategy is picked from the size of the
+    candidate pool and an estimate of how often query occurs, taken
+    from a sample of the joined names.
+
+    Args:
+        listing: The listing to search.
+        query: The text to look for.
+        candidates: Only consider these indices (ascending), or None
+            for every entry.
+
+    Returns:
+        Indices of the matching entries, in listing order.
+    """
+    index = get_listing_index(listing)
+    folded = query.lower()
+    pool = len(index.names) if candidates is None else len(candidates)
+    if not folded:
+        return tuple(range(pool)) if candidates is None else candidates
+    find_cost = (
+        _estimate_occurrences(index.blob, folded) * _FIND_COST_RATIO
+        + len(index.blob) // _SCAN_CHARS_PER_TEST
+    )
+    if find_cost < pool:
+        # Names containing query also contain any query it extends, so
+        # these are already a subset of candidates when narrowing
+        return _find_in_blob(index, folded)
+    if candidates is None:
+        names: Iterable[str] = index.names
+        positions: Iterable[int] = range(pool)
+    else:
+        names = map(index.names.__getitem__, candidates)
+        positions = candidates
+    return tuple(compress(positions, map(contains, names, repeat(folded))))
+
+
+def _estimate_occurrences(blob: str, folded: str) -> int:
+    """Estimate how many times folded occurs in blob from a prefix sample."""
+    if len(blob) <= _SAMPLE_CHARS:
+        return blob.count(folded)
+    sample_count = blob.count(folded, 0, _SAMPLE_CHARS)
+    return sample_count * len(blob) // _SAMPLE_CHARS
+
+
+def _find_in_blob(index: ListingIndex, folded: str) -> tuple[int, ...]:
+    """Locate every entry containing folded by searching the joined names."""
+    blob, starts = index.blob, index.starts
+    count = len(starts)
+    result: list[int] = []
+    pos = blob.find(folded)
+    while pos != -1:
+        i = bisect_right(starts, pos) - 1
+        result.append(i)
+        if i + 1 >= count:
+            break
+        pos = blob.find(folded, starts[i + 1])
+    return tuple(result)
+
+
+class IncrementalFilter:
+    """Substring filter that narrows its previous result as the query grows.
+
+    When a new query contains the previous one, every match of the new
+    query is among the previous matches, so only those are rechecked.
+    """
+
+    def __init__(self, listing: DirectoryListing) -> None:
+        """Initialize the filter with nothing filtered out.
+
+        Args:
+            listing: The unfiltered listing.
+        """
+        self.listing = listing
+        self.query = ""
+        self.indices: tuple[int, ...] = tuple(range(len(listing.entries)))
+
+    def update(self, query: str) -> tuple[int, ...]:
+        """Filter the listing by a new query.
+
+        Args:
+            query: The text entry names must contain.
+
+        Returns:
+            Indices of the matching entries, in listing order.
+        """
+        folded = query.lower()
+        if self.query and self.query in folded:
+            candidates: tuple[int, ...] | None = self.indices
+        else:
+            candidates = None
+        self.indices = find_substring_indices(self.listing, folded, candidates)
+        self.query = folded
+        return self.indices
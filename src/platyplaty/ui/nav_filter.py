@@ -0,0 +1,116 @@
+"""Type-ahead jump and listing filter for navigation state.
+
+This module provides functions for jumping to an entry by name prefix
+and for narrowing the current listing to entries whose names contain a
+query. These are package-private functions used by the nav_state
+module family.
+
+While a filter is active, state._listing is a filtered copy of the
+directory listing and the full listing is kept in
+state._unfiltered_listing. Re-reading the directory drops the filter.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from platyplaty.ui.directory_types import DirectoryListing
+from platyplaty.ui.listing_search import IncrementalFilter, find_prefix_index
+
+if TYPE_CHECKING:
+    from platyplaty.ui.nav_state import NavigationState
+
+
+def jump_to_prefix(state: NavigationState, prefix: str) -> bool:
+    """Select the first entry whose name starts with prefix.
+
+    Args:
+        state: The navigation state to update.
+        prefix: The typed name prefix (case-insensitive).
+
+    Returns:
+        True if a matching entry was found and selected, False otherwise.
+    """
+    if not state._listing or not prefix:
+        return False
+    index = find_prefix_index(state._listing, prefix)
+    if index is None:
+        return False
+    name = state._listing.entries[index].name
+    if name != state.selected_name:
+        state.selected_name = name
+    return True
+
+
+def apply_filter(state: NavigationState, query: str) -> None:
+    """Show only the entries whose name contains query.
+
+    The selection is kept if it still matches, otherwise the first match
+    is selected. An empty query shows the whole listing again.
+
+    Args:
+        state: The navigation state to update.
+        query: The text entry names must contain (case-insensitive).
+    """
+    if not query:
+        clear_filter(state)
+        return
+    if state._filter is None:
+        if not state._listing or state._listing.permission_denied:
+            return
+        state._unfiltered_listing = state._listing
+        state._filter = IncrementalFilter(state._listing)
+    source = state._filter.listing
+    indices = state._filter.update(query)
+    entries = [source.entries[i] for i in indices]
+    state._listing = DirectoryListing(
+        entries=entries,
+        was_empty=False,
+        had_filtered_entries=True,
+        permission_denied=False,
+        filter_query=query,
+    )
+    reselect_visible(state)
+
+
+def clear_filter(state: NavigationState) -> None:
+    """Restore the unfiltered listing, keeping the selection.
+
+    Args:
+        state: The navigation state to update.
+    """
+    if state._filter is None:
+        return
+    state._listing = state._unfiltered_listing
+    state._unfiltered_listing = None
+    state._filter = None
+    reselect_visible(state)
+
+
+def drop_filter(state: NavigationState) -> None:
+    """Forget the active filter without touching the listing.
+
+    Used when the listing is about to be replaced by a fresh read.
+
+    Args:
+        state: The navigation state to update.
+    """
+    state._unfiltered_listing = None
+    state._filter = None
+
+
+def reselect_visible(state: NavigationState) -> None:
+    """Keep the selection if visible, else select the first entry.
+
+    Call after replacing state._listing.
+
+    Args:
+        state: The navigation state to update.
+    """
+    listing = state._listing
+    name = state.selected_name
+    if listing and listing.entries and (name is None or listing.index_of(name) is None):
+        state.selected_name = listing.entries[0].name
+    else:
+        # The listing changed, so cached indices are stale either way
+        state.generation += 1
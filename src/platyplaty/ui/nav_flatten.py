@@ -0,0 +1,114 @@
+"""Flattened recursive view for navigation state.
+
+This module provides functions for replacing the current listing with
+every .milk file beneath the current directory, as collected by a
+background FlatScan. These are package-private functions used by the
+nav_state module family.
+
+While flattened, state._listing holds the files published so far, named
+by their path relative to current_dir, and the directory listing is kept
+in state._unflattened_listing. A name filter applies on top of the
+flattened files. Re-reading the directory leaves the flattened view.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from platyplaty.ui.directory_types import DirectoryListing
+from platyplaty.ui.flat_scan import start_flat_scan
+from platyplaty.ui.nav_filter import (
+    apply_filter,
+    clear_filter,
+    drop_filter,
+    reselect_visible,
+)
+
+if TYPE_CHECKING:
+    from platyplaty.ui.nav_state import NavigationState
+
+
+def start_flatten(state: NavigationState, on_progress: Callable[[], None]) -> bool:
+    """Switch to the flattened view and start scanning.
+
+    Args:
+        state: The navigation state to update.
+        on_progress: Called on a worker thread whenever more files are
+            available; it must arrange for update_flat_listing to run on
+            the UI thread.
+
+    Returns:
+        True if the view was flattened, False if already flattened or
+        the directory is inaccessible.
+    """
+    if state._flat_scan is not None:
+        return False
+    if not state._listing or state._listing.permission_denied:
+        return False
+    clear_filter(state)
+    state._unflattened_listing = state._listing
+    state._flat_scan = start_flat_scan(state.current_dir, on_progress)
+    update_flat_listing(state)
+    return True
+
+
+def stop_flatten(state: NavigationState) -> None:
+    """Return to the directory listing.
+
+    The entry containing the selected file is selected, so leaving the
+    flattened view lands on the subdirectory the file lives in.
+
+    Args:
+        state: The navigation state to update.
+    """
+    if state._flat_scan is None:
+        return
+    selected = state.selected_name
+    drop_flatten(state)
+    drop_filter(state)
+    state._listing = state._unflattened_listing
+    state._unflattened_listing = None
+    if selected is not None:
+        state.selected_name = selected.split("/", 1)[0]
+    reselect_visible(state)
+
+
+def update_flat_listing(state: NavigationState) -> None:
+    """Show the files the scan has published so far.
+
+    An active name filter is re-applied to the new files, and the
+    selection is kept if it is still visible.
+
+    Args:
+        state: The navigation state to update.
+    """
+    scan = state._flat_scan
+    if scan is None:
+        return
+    query = state.filter_query
+    drop_filter(state)
+    state._listing = DirectoryListing(
+        entries=scan.snapshot(),
+        was_empty=False,
+        had_filtered_entries=True,
+        permission_denied=False,
+        scan_in_progress=not scan.done,
+    )
+    if query:
+        apply_filter(state, query)
+    else:
+        reselect_visible(state)
+
+
+def drop_flatten(state: NavigationState) -> None:
+    """Cancel the scan without touching the listing.
+
+    Used when the listing is about to be replaced by a fresh read.
+
+    Args:
+        state: The navigation state to update.
+    """
+    if state._flat_scan is not None:
+        state._flat_scan.cancel()
+        state._flat_scan = None
@@ -11,6 +11,8 @@ from typing import TYPE_CHECKING
 
 from platyplaty.ui.directory import list_directory
 from platyplaty.ui.directory_types import DirectoryEntry, DirectoryListing
+from platyplaty.ui.nav_filter import drop_filter
+from platyplaty.ui.nav_flatten import drop_flatten
 from platyplaty.ui.nav_types import find_index_by_name
 
 if TYPE_CHECKING:
@@ -20,21 +22,40 @@ if TYPE_CHECKING:
 def refresh_listing(state: NavigationState) -> None:
     """Refresh the directory listing for the current directory.
 
+    Any active name filter or flattened view is dropped.
+
     Args:
         state: The navigation state to update.
     """
+    drop_filter(state)
+    drop_flatten(state)
+    state._unflattened_listing = None
     state._listing = list_directory(state.current_dir)
+    state.generation += 1
 
 
 def get_selected_index(state: NavigationState) -> int | None:
     """Get the index of the currently selected item.
 
+    The result is cached until the next navigation generation, so
+    repeated calls while painting are a single attribute comparison.
+
     Args:
         state: The navigation state to query.
 
     Returns:
         The index of the selected item, or None if no selection.
     """
+    if state._cached_index_generation == state.generation:
+        return state._cached_index
+    index = _resolve_selected_index(state)
+    state._cached_index = index
+    state._cached_index_generation = state.generation
+    return index
+
+
+def _resolve_selected_index(state: NavigationState) -> int | None:
+    """Look up the selected name in the current listing."""
     if not state._listing or not state._listing.entries:
         return None
     if state.selected_name is None:
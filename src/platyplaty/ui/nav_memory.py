@@ -9,6 +9,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from platyplaty.file_identity import resolve_cached
 from platyplaty.ui.nav_types import DirectoryMemory, find_name_in_listing
 
 if TYPE_CHECKING:
@@ -33,7 +34,7 @@ def save_current_memory(state: NavigationState) -> None:
     Args:
         state: The navigation state to save.
     """
-    key = str(state.current_dir.resolve())
+    key = str(resolve_cached(state.current_dir))
     state._directory_memory[key] = DirectoryMemory(
         selected_name=state.selected_name,
         scroll_offset=state.scroll_offset,
@@ -70,7 +71,7 @@ def restore_memory(state: NavigationState) -> None:
     Args:
         state: The navigation state to update.
     """
-    key = str(state.current_dir.resolve())
+    key = str(resolve_cached(state.current_dir))
     memory = state._directory_memory.get(key)
     if memory and try_restore_remembered_name(state, memory):
         return
@@ -84,7 +85,7 @@ def restore_scroll_from_memory(state: NavigationState) -> None:
     Args:
         state: The navigation state to update.
     """
-    key = str(state.current_dir.resolve())
+    key = str(resolve_cached(state.current_dir))
     memory = state._directory_memory.get(key)
     if memory:
         state.scroll_offset = memory.scroll_offset
@@ -10,6 +10,8 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from platyplaty.file_identity import resolve_cached
+
 if TYPE_CHECKING:
     from platyplaty.ui.nav_state import NavigationState
 
@@ -65,4 +67,4 @@ def get_parent_scroll_offset(state: NavigationState, current_dir: Path) -> int:
     parent = current_dir.parent
     if parent == current_dir:
         return 0
-    return get_scroll_offset_for_directory(state, str(parent.resolve()))
+    return get_scroll_offset_for_directory(state, str(resolve_cached(parent)))
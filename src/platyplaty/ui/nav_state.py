@@ -3,14 +3,28 @@
 Provides NavigationState class for tracking current directory, selection,
 scroll positions, and per-directory memory. Implementation split across
 nav_* modules.
+
+Every change of listing or selection bumps NavigationState.generation,
+which keys the cached selection index.
 """
 
+from collections.abc import Callable
 from pathlib import Path
 
+from platyplaty.ui.directory_memory_store import DirectoryMemoryStore
 from platyplaty.ui.directory_types import DirectoryEntry, DirectoryListing
+from platyplaty.ui.flat_scan import FlatScan
+from platyplaty.ui.listing_search import IncrementalFilter
+from platyplaty.ui.nav_filter import apply_filter as _apply_filter
+from platyplaty.ui.nav_filter import clear_filter as _clear_filter
+from platyplaty.ui.nav_filter import jump_to_prefix as _jump_to_prefix
+from platyplaty.ui.nav_flatten import start_flatten as _start_flatten
+from platyplaty.ui.nav_flatten import stop_flatten as _stop_flatten
+from platyplaty.ui.nav_flatten import update_flat_listing as _update_flat_listing
 from platyplaty.ui.nav_left import move_left as _move_left
 from platyplaty.ui.nav_listing import get_listing as _get_listing
 from platyplaty.ui.nav_listing import get_selected_entry as _get_selected_entry
+from platyplaty.ui.nav_listing import get_selected_index as _get_selected_index
 from platyplaty.ui.nav_listing import refresh_listing as _refresh_listing
 from platyplaty.ui.nav_memory import set_initial_selection as _set_initial_selection
 from platyplaty.ui.nav_memory_query import (
@@ -27,7 +41,6 @@ from platyplaty.ui.nav_moves import move_up as _move_up
 from platyplaty.ui.nav_refresh import refresh_after_editor as _refresh_after_editor
 from platyplaty.ui.nav_right import move_right as _move_right
 from platyplaty.ui.nav_scroll import adjust_scroll as _adjust_scroll
-from platyplaty.ui.nav_types import DirectoryMemory
 
 
 class NavigationState:
@@ -38,24 +51,58 @@ class NavigationState:
     """
 
     current_dir: Path
-    selected_name: str | None
     scroll_offset: int
-    _directory_memory: dict[str, DirectoryMemory]
+    generation: int
+    _selected_name: str | None
+    _directory_memory: DirectoryMemoryStore
     _listing: DirectoryListing | None
-
-    def __init__(self, starting_dir: Path) -> None:
+    _unfiltered_listing: DirectoryListing | None
+    _filter: IncrementalFilter | None
+    _flat_scan: FlatScan | None
+    _unflattened_listing: DirectoryListing | None
+    _cached_index: int | None
+    _cached_index_generation: int
+
+    def __init__(
+        self,
+        starting_dir: Path,
+        directory_memory: DirectoryMemoryStore | None = None,
+    ) -> None:
         """Initialize navigation state.
 
         Args:
             starting_dir: The initial directory (as logical path).
+            directory_memory: Store for per-directory memory. Defaults to
+                a new in-memory store.
         """
         self.current_dir = starting_dir
-        self._directory_memory = {}
+        self.generation = 0
+        self._selected_name = None
+        if directory_memory is None:
+            directory_memory = DirectoryMemoryStore()
+        self._directory_memory = directory_memory
         self._listing = None
+        self._unfiltered_listing = None
+        self._filter = None
+        self._flat_scan = None
+        self._unflattened_listing = None
+        self._cached_index = None
+        self._cached_index_generation = -1
         self.scroll_offset = 0
         _refresh_listing(self)
         _set_initial_selection(self)
 
+    @property
+    def selected_name(self) -> str | None:
+        """The name of the selected entry, or None if no selection."""
+        return self._selected_name
+
+    @selected_name.setter
+    def selected_name(self, name: str | None) -> None:
+        """Change the selection and start a new navigation generation."""
+        self._selected_name = name
+        self.generation += 1
+
     def move_up(self) -> bool:
         """Move selection up by one item."""
         return _move_up(self)
@@ -72,10 +119,48 @@ class NavigationState:
         """Navigate into selected directory or return file path for editor."""
         return _move_right(self)
 
+    @property
+    def filter_query(self) -> str:
+        """The active name filter, or "" if the listing is unfiltered."""
+        return self._filter.query if self._filter is not None else ""
+
+    def jump_to_prefix(self, prefix: str) -> bool:
+        """Select the first entry whose name starts with prefix."""
+        return _jump_to_prefix(self, prefix)
+
+    def apply_filter(self, query: str) -> None:
+        """Show only entries whose name contains query ("" shows all)."""
+        _apply_filter(self, query)
+
+    def clear_filter(self) -> None:
+        """Show the whole directory listing again."""
+        _clear_filter(self)
+
+    @property
+    def is_flattened(self) -> bool:
+        """True while showing every .milk file beneath current_dir."""
+        return self._flat_scan is not None
+
+    def start_flatten(self, on_progress: Callable[[], None]) -> bool:
+        """Show every .milk file beneath current_dir as it is scanned."""
+        return _start_flatten(self, on_progress)
+
+    def stop_flatten(self) -> None:
+        """Return from the flattened view to the directory listing."""
+        _stop_flatten(self)
+
+    def update_flat_listing(self) -> None:
+        """Show the files the flattening scan has found so far."""
+        _update_flat_listing(self)
+
     def get_listing(self) -> DirectoryListing | None:
         """Get the current directory listing."""
         return _get_listing(self)
 
+    def get_selected_index(self) -> int | None:
+        """Get the index of the selected entry (cached per generation)."""
+        return _get_selected_index(self)
+
     def get_selected_entry(self) -> DirectoryEntry | None:
         """Get the currently selected entry."""
         return _get_selected_entry(self)
@@ -33,7 +33,7 @@ def find_name_in_listing(listing: DirectoryListing, name: str) -> bool:
     Returns:
         True if the name exists in the listing.
     """
-    return any(entry.name == name for entry in listing.entries)
+    return listing.index_of(name) is not None
 
 
 def find_index_by_name(listing: DirectoryListing, name: str) -> int | None:
@@ -46,7 +46,4 @@ def find_index_by_name(listing: DirectoryListing, name: str) -> int | None:
     Returns:
         The index of the entry, or None if not found.
     """
-    for i, entry in enumerate(listing.entries):
-        if entry.name == name:
-            return i
-    return None
+    return listing.index_of(name)
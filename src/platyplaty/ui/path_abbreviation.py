@@ -7,6 +7,7 @@ the path is too long to fit in the available width.
 
 from rich.text import Text
 
+from platyplaty.ui.cell_width import cell_width
 from platyplaty.ui.path_coloring import render_path_components
 from platyplaty.ui.path_types import PathComponent
 
@@ -14,15 +15,15 @@ from platyplaty.ui.path_types import PathComponent
 def get_rendered_length(text: Text) -> int:
     """Calculate the rendered length of a Rich Text object.
 
-    Returns the visible character count excluding ANSI escape codes.
+    Returns the visible display width excluding ANSI escape codes.
 
     Args:
         text: Rich Text object to measure.
 
     Returns:
-        Number of visible characters.
+        Number of terminal cells the plain text occupies.
     """
-    return len(text.plain)
+    return cell_width(text.plain)
 
 
 def abbreviate_component(component: PathComponent) -> PathComponent:
@@ -5,6 +5,11 @@ This module provides functions to truncate the final path component
 when the abbreviated path still exceeds the terminal width.
 """
 
+from platyplaty.ui.cell_width import (
+    cell_width,
+    first_char_to_width,
+    truncate_to_width,
+)
 from platyplaty.ui.path_abbreviation import get_rendered_length
 from platyplaty.ui.path_coloring import render_path_components
 from platyplaty.ui.path_types import PathComponent
@@ -13,7 +18,7 @@ from platyplaty.ui.path_types import PathComponent
 def truncate_final_component(
     component: PathComponent, max_length: int
 ) -> PathComponent:
-    """Truncate a path component to fit within max_length characters.
+    """Truncate a path component to fit within max_length display cells.
 
     Uses simple right truncation with tilde (~) indicator.
     Ensures at least 1 character of the name plus tilde is shown.
@@ -25,12 +30,14 @@ def truncate_final_component(
     Returns:
         New PathComponent with truncated name, or original if it fits.
     """
-    if len(component.name) <= max_length:
+    if cell_width(component.name) <= max_length:
         return component
     if max_length < 2:
-        truncated_name = component.name[0] + "~" if component.name else "~"
+        truncated_name = (
+            first_char_to_width(component.name, 1) + "~" if component.name else "~"
+        )
     else:
-        truncated_name = component.name[: max_length - 1] + "~"
+        truncated_name = truncate_to_width(component.name, max_length - 1) + "~"
     return PathComponent(
         truncated_name, component.component_type, component.is_selected
     )
@@ -8,6 +8,7 @@ from rich.segment import Segment
 from rich.style import Style
 from textual.strip import Strip
 
+from platyplaty.ui.cell_width import pad_to_width, truncate_to_width
 from platyplaty.ui.truncation import truncate_simple
 
 if TYPE_CHECKING:
@@ -35,27 +36,26 @@ def render_entry(widget: PlaylistView, index: int) -> Strip:
     is_playing = index == playlist.get_playing()
     is_focused = widget._focused
     is_broken = index in playlist.broken_indices
+    is_marked = playlist.in_multiselect(index)
 
-    display_name = _get_display_name(widget, index)
+    display_name = widget.display_name(index)
     prefix = PLAYING_PREFIX if is_playing else NORMAL_PREFIX
     content_width = width - LEFT_MARGIN - RIGHT_MARGIN - len(prefix)
     truncated_name = truncate_simple(display_name, max(0, content_width))
 
-    style = _get_style(is_selected, is_focused, is_broken)
+    style = _get_style(is_selected, is_focused, is_broken, is_marked)
     text = _build_line(prefix, truncated_name, width)
 
     return Strip([Segment(text, style)])
 
 
-def _get_display_name(widget: PlaylistView, index: int) -> str:
-    """Get the display name for a preset at the given index."""
-    if index < len(widget._display_names):
-        return widget._display_names[index]
-    return widget._playlist.presets[index].name
-
-
-def _get_style(is_selected: bool, is_focused: bool, is_broken: bool) -> Style:
-    """Get the style for an entry based on selection, focus and broken state."""
+def _get_style(
+    is_selected: bool, is_focused: bool, is_broken: bool, is_marked: bool = False
+) -> Style:
+    """Get the style for an entry based on selection, focus, broken and mark state."""
+    if is_marked:
+        color = "red" if is_broken else "black"
+        return Style(color=color, bgcolor="bright_yellow" if is_selected else "yellow")
     if is_broken:
         if is_selected:
             return Style(color="black", bgcolor="red")
@@ -72,4 +72,4 @@ def _get_style(is_selected: bool, is_focused: bool, is_broken: bool) -> Style:
 def _build_line(prefix: str, name: str, width: int) -> str:
     """Build the full line with margins, prefix, and name."""
     content = " " * LEFT_MARGIN + prefix + name
-    return content.ljust(width)[:width]
+    return pad_to_width(truncate_to_width(content, width), width)
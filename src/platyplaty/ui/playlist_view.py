@@ -9,6 +9,8 @@ from textual.strip import Strip
 from textual.widget import Widget
 
 from platyplaty.playlist import Playlist
+from platyplaty.preset_table import PresetTable
+from platyplaty.ui.display_name_trie import DisplayNameTrie
 from platyplaty.ui.playlist_render import render_line as _render_line
 
 
@@ -22,7 +24,8 @@ class PlaylistView(Widget):
     _playlist: Playlist
     _scroll_offset: int
     _focused: bool
-    _display_names: list[str]
+    _display_name_trie: DisplayNameTrie
+    _display_paths: PresetTable
 
     def __init__(
         self,
@@ -37,16 +40,20 @@ class PlaylistView(Widget):
         self._playlist = playlist
         self._scroll_offset = 0
         self._focused = focused
-        self._display_names = []
-        self._update_display_names()
+        self._display_paths = PresetTable(playlist.presets)
+        self._display_name_trie = DisplayNameTrie(self._display_paths)
+
+    def display_name(self, index: int) -> str:
+        """Return the display name of the preset at index."""
+        return self._display_name_trie.display_name(self._playlist.presets[index])
 
     def _update_display_names(self) -> None:
-        """Update cached display names for all presets."""
-        from platyplaty.ui.playlist_display_name import (
-            compute_display_names,
-        )
+        """Bring the display-name trie up to date with the playlist."""
+        from platyplaty.ui.playlist_display_name import sync_display_names
 
-        self._display_names = compute_display_names(self._playlist.presets)
+        presets = PresetTable(self._playlist.presets)
+        sync_display_names(self._display_name_trie, self._display_paths, presets)
+        self._display_paths = presets
 
     def get_content_width(self, container: Size, viewport: Size) -> int:
         """Return the content width."""
@@ -0,0 +1,113 @@
+"""Preset finder overlay widget.
+
+Lists the preset library's best fuzzy matches for the text typed into
+the command prompt and tracks the selected match. Opening the finder
+and acting on the selection is done by preset_finder_actions.
+"""
+
+from textual.geometry import Size
+from textual.strip import Strip
+from textual.widget import Widget
+
+from platyplaty.preset_finder_table import search_finder_table
+
+# Most matches fetched per query
+RESULT_LIMIT = 100
+
+
+class PresetFinder(Widget):
+    """Overlay listing fuzzy matches from the whole preset library.
+
+    Attributes:
+        search_text: The text the matches were computed for.
+        results: Matching preset paths, best first.
+        selected: Index of the selected match.
+        indexing: True while the finder table is not built yet.
+    """
+
+    search_text: str
+    results: list[str]
+    selected: int
+    indexing: bool
+
+    def __init__(
+        self,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+    ) -> None:
+        """Initialize the PresetFinder widget."""
+        super().__init__(name=name, id=id, classes=classes)
+        self.search_text = ""
+        self.results = []
+        self.selected = 0
+        self.indexing = False
+
+    @property
+    def is_open(self) -> bool:
+        """Return True if the finder is shown."""
+        return self.has_class("visible")
+
+    @property
+    def selected_path(self) -> str | None:
+        """Return the selected preset path, or None if nothing matches."""
+        if not self.results:
+            return None
+        return self.results[self.selected]
+
+    def get_content_width(self, container: Size, viewport: Size) -> int:
+        """Return the content width."""
+        return container.width
+
+    def get_content_height(self, container: Size, viewport: Size, width: int) -> int:
+        """Return the content height."""
+        return container.height
+
+    def open(self) -> None:
+        """Show the finder with an empty query."""
+        self.set_query("")
+        self.add_class("visible")
+
+    def close(self) -> None:
+        """Hide the finder and drop its results."""
+        self.remove_class("visible")
+        self.search_text = ""
+        self.results = []
+        self.selected = 0
+
+    def set_query(self, query: str) -> None:
+        """Search for query and select the best match.
+
+        Args:
+            query: The text typed into the prompt.
+        """
+        self.search_text = query
+        self.selected = 0
+        results = search_finder_table(query, RESULT_LIMIT) if query else []
+        self.indexing = results is None
+        self.results = results or []
+        self.refresh()
+
+    def refresh_results(self) -> None:
+        """Re-run the current query, keeping the selection if it remains."""
+        previous = self.selected_path
+        self.set_query(self.search_text)
+        if previous in self.results:
+            self.selected = self.results.index(previous)
+
+    def move_selection(self, delta: int) -> None:
+        """Move the selection by delta matches, clamped to the list.
+
+        Args:
+            delta: Number of matches to move (negative moves up).
+        """
+        if not self.results:
+            return
+        self.selected = max(0, min(self.selected + delta, len(self.results) - 1))
+        self.refresh()
+
+    def render_line(self, y: int) -> Strip:
+        """Render a single line of the finder."""
+        from platyplaty.ui.preset_finder_render import render_line
+
+        return render_line(self, y, self.size.width)
@@ -0,0 +1,77 @@
+"""Preset finder rendering module.
+
+Renders the status header and one match per line below it. Each match
+shows its directory dimmed and its file name in full; directories too
+long for the line are cut from the left.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from rich.segment import Segment
+from rich.style import Style
+from textual.strip import Strip
+
+from platyplaty.ui.cell_width import cell_width, truncate_left_to_width
+from platyplaty.ui.colors import BACKGROUND_COLOR, DIMMED_COLOR, FILE_COLOR
+
+if TYPE_CHECKING:
+    from platyplaty.ui.preset_finder import PresetFinder
+
+_HEADER_STYLE = Style(color="black", bgcolor="white")
+_NAME_STYLE = Style(color=FILE_COLOR, bgcolor=BACKGROUND_COLOR)
+_DIR_STYLE = Style(color=DIMMED_COLOR, bgcolor=BACKGROUND_COLOR)
+_SELECTED_NAME_STYLE = Style(color="black", bgcolor=FILE_COLOR)
+_SELECTED_DIR_STYLE = Style(color="grey30", bgcolor=FILE_COLOR)
+
+_HINTS = "Enter: preview | Tab: add to playlist | Escape: close"
+
+
+def render_line(finder: PresetFinder, y: int, width: int) -> Strip:
+    """Render a single line of the finder.
+
+    Args:
+        finder: The PresetFinder widget.
+        y: The line number (0-indexed).
+        width: The widget width.
+
+    Returns:
+        A Strip for the line.
+    """
+    if y == 0:
+        return _render_header(finder, width)
+    rows = max(1, finder.size.height - 1)
+    top = max(0, finder.selected - rows + 1)
+    index = top + y - 1
+    if index >= len(finder.results):
+        return Strip([Segment(" " * width, _NAME_STYLE)])
+    return _render_match(finder.results[index], index == finder.selected, width)
+
+
+def _render_header(finder: PresetFinder, width: int) -> Strip:
+    """Render the status line with key hints."""
+    if finder.indexing:
+        status = "Indexing preset library..."
+    elif not finder.search_text:
+        status = "Type to search the preset library"
+    elif not finder.results:
+        status = "No matches"
+    else:
+        status = f"{len(finder.results)} matches"
+    text = f"{status} | {_HINTS}"[:width].ljust(width)
+    return Strip([Segment(text, _HEADER_STYLE)])
+
+
+def _render_match(path: str, selected: bool, width: int) -> Strip:
+    """Render one match as its dimmed directory and its file name."""
+    cut = path.rfind("/") + 1
+    directory, name = path[:cut], path[cut:]
+    room = width - cell_width(name)
+    if cell_width(directory) > room:
+        kept = truncate_left_to_width(directory, room - 1)
+        directory = "…" + kept if room > 1 else ""
+    dir_style = _SELECTED_DIR_STYLE if selected else _DIR_STYLE
+    name_style = _SELECTED_NAME_STYLE if selected else _NAME_STYLE
+    strip = Strip([Segment(directory, dir_style), Segment(name, name_style)])
+    return strip.adjust_cell_length(width, name_style)
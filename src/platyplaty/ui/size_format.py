@@ -4,17 +4,9 @@ This module provides functions to format file sizes for display
 using base-2 units (B, K, M, G, T).
 """
 
-import os
 from pathlib import Path
 
-import cachetools
-
-file_size_cache: cachetools.LRUCache[tuple[Path], int] = (
-    cachetools.LRUCache(maxsize=10000)
-)
-symlink_size_cache: cachetools.LRUCache[tuple[Path], int] = (
-    cachetools.LRUCache(maxsize=10000)
-)
+from platyplaty.file_stat import file_stat
 
 
 def format_file_size(size_bytes: int) -> str:
@@ -51,9 +43,8 @@ def _format_value_with_unit(value: float, unit: str) -> str:
     return f"{formatted} {unit}"
 
 
-@cachetools.cached(file_size_cache)
 def get_file_size(path: Path) -> int:
-    """Get file size in bytes using os.stat.
+    """Get file size in bytes from the shared stat cache.
 
     Args:
         path: Path to the file.
@@ -61,15 +52,11 @@ def get_file_size(path: Path) -> int:
     Returns:
         File size in bytes, or 0 on error (file deleted, permission denied).
     """
-    try:
-        return os.stat(path).st_size
-    except (OSError, PermissionError):
-        return 0
+    return file_stat(path).size
 
 
-@cachetools.cached(symlink_size_cache)
 def get_symlink_size(path: Path) -> int:
-    """Get symlink file size in bytes using os.lstat (does not follow symlinks).
+    """Get symlink file size in bytes from its lstat (does not follow symlinks).
 
     Args:
         path: Path to the symlink.
@@ -77,7 +64,4 @@ def get_symlink_size(path: Path) -> int:
     Returns:
         Symlink file size in bytes, or 0 on error.
     """
-    try:
-        return os.lstat(path).st_size
-    except (OSError, PermissionError):
-        return 0
+    return file_stat(path).link_size
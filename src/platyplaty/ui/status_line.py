@@ -4,6 +4,7 @@ The status line displays:
 - Autoplay state: "[autoplay: on]" or "[autoplay: off]"
 - Playlist filename (basename) or "no playlist file loaded"
 - Unsaved changes indicator: "* " prefix on filename when dirty
+- Progress of a background job such as a bulk add, while it runs
 
 Styled with black foreground on blue background.
 """
@@ -25,6 +26,7 @@ class StatusLine(Widget):
         _autoplay_enabled: Whether autoplay is on.
         _playlist_filename: The associated filename or None.
         _dirty: Whether the playlist has unsaved changes.
+        _progress: Progress text of a background job, or None.
     """
 
     DEFAULT_CSS = """
@@ -36,6 +38,7 @@ class StatusLine(Widget):
     _autoplay_enabled: bool
     _playlist_filename: Path | None
     _dirty: bool
+    _progress: str | None
     _error_log: list[str]
 
     def __init__(
@@ -51,6 +54,7 @@ class StatusLine(Widget):
         self._autoplay_enabled = False
         self._playlist_filename = None
         self._dirty = False
+        self._progress = None
 
     def update_state(
         self,
@@ -77,6 +81,15 @@ class StatusLine(Widget):
         from platyplaty.ui.status_line_render import render_status_line
         return render_status_line(self, self.size.width)
 
+    def show_progress(self, text: str | None) -> None:
+        """Show or, with None, clear background job progress.
+
+        Args:
+            text: The progress text, e.g. "[adding: 3/10]".
+        """
+        self._progress = text
+        self.refresh()
+
     def update_error_indicator(self) -> None:
         """Refresh the status line to update error indicator."""
         self.refresh()
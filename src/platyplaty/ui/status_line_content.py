@@ -17,22 +17,28 @@ def build_status_content(
     playlist_filename: Path | None,
     dirty: bool,
     width: int,
+    progress: str | None = None,
 ) -> str:
     """Build the status line content string with truncation.
 
     Format: "[autoplay: on/off] [* ]filename" or "[autoplay: on/off] no playlist..."
     The autoplay state is never truncated; only the filename is truncated.
+    Progress text, when given, follows the autoplay state and is not
+    truncated either.
 
     Args:
         autoplay_enabled: Whether autoplay is on.
         playlist_filename: Associated filename or None.
         dirty: Whether the playlist has unsaved changes.
         width: Available width in characters.
+        progress: Progress of a background job, e.g. "[adding: 3/10]".
 
     Returns:
         The formatted status line content.
     """
     autoplay_text = AUTOPLAY_ON if autoplay_enabled else AUTOPLAY_OFF
+    if progress:
+        autoplay_text = f"{autoplay_text} {progress}"
     file_part = _build_file_part(playlist_filename, dirty, width, autoplay_text)
     return f"{autoplay_text} {file_part}"
 
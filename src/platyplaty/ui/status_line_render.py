@@ -36,6 +36,7 @@ def render_status_line(widget: "StatusLine", width: int) -> Strip:
         widget._playlist_filename,
         widget._dirty,
         content_width,
+        widget._progress,
     )
     padded = content.ljust(content_width)
     segments = [Segment(padded, STATUS_LINE_STYLE)]
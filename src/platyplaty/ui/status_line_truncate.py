@@ -3,6 +3,7 @@
 Handles truncating playlist filenames using file browser rules.
 """
 
+from platyplaty.ui.cell_width import cell_width
 from platyplaty.ui.truncation_filename import (
     truncate_filename_no_extension,
     truncate_filename_with_extension,
@@ -40,7 +41,7 @@ def truncate_basename(basename: str, width: int) -> str:
     Returns:
         Truncated filename.
     """
-    if len(basename) <= width:
+    if cell_width(basename) <= width:
         return basename
     dot_index = basename.rfind(".")
     if dot_index > 0:
@@ -2,32 +2,40 @@
 
 This module provides functions to truncate file and directory names
 when they are too long to fit within pane widths. The truncation
-uses tilde (~) as the indicator throughout.
+uses tilde (~) as the indicator throughout. Widths are display cells,
+measured with cell_width.
 """
 
+from platyplaty.ui.cell_width import (
+    cell_width,
+    first_char_to_width,
+    truncate_to_width,
+)
+
 
 def truncate_simple(text: str, width: int) -> str:
     """Truncate text to fit within width using a tilde indicator.
 
     Args:
         text: The text to truncate.
-        width: Maximum width in characters.
+        width: Maximum display width in cells.
 
     Returns:
         The text if it fits, otherwise truncated with tilde.
         Edge cases:
         - width=0: returns empty string
-        - width=1: returns first char (or tilde if text is empty)
+        - width=1: returns first char (or tilde if text is empty), or
+          an ellipsis if the first char is double width
         - If text fits: returns as-is
-        - If text too long: returns first (width-1) chars + tilde
+        - If text too long: returns the prefix fitting (width-1) cells + tilde
     """
     if width <= 0:
         return ""
     if width == 1:
-        return text[0] if text else "~"
-    if len(text) <= width:
+        return first_char_to_width(text, 1) if text else "~"
+    if cell_width(text) <= width:
         return text
-    return text[: width - 1] + "~"
+    return truncate_to_width(text, width - 1) + "~"
 
 
 def split_filename(name: str) -> tuple[str, str]:
@@ -5,10 +5,11 @@ displayed with right-justified count indicators in the middle pane.
 The count indicator is always preserved except at extreme widths.
 """
 
+from platyplaty.ui.cell_width import cell_width
 from platyplaty.ui.truncation import truncate_simple
 
 
-def truncate_directory(name: str, count: int, width: int) -> str:
+def truncate_directory(name: str, count: int | str, width: int) -> str:
     """Truncate a directory name with preserved count indicator for middle pane.
 
     The count indicator is right-justified and always preserved unless width
@@ -17,7 +18,7 @@ def truncate_directory(name: str, count: int, width: int) -> str:
 
     Args:
         name: The directory name.
-        count: The directory entry count (integer).
+        count: The directory entry count, or a placeholder string.
         width: Total available width in characters.
 
     Returns:
@@ -51,12 +52,12 @@ def truncate_directory(name: str, count: int, width: int) -> str:
     name_available = width - 1 - count_len  # -1 for minimum space
 
     # Truncate name if needed
-    if len(name) <= name_available:
+    if cell_width(name) <= name_available:
         truncated_name = name
     else:
         truncated_name = truncate_simple(name, name_available)
 
     # Calculate padding to right-justify the count
-    padding = width - len(truncated_name) - count_len
+    padding = width - cell_width(truncated_name) - count_len
 
     return truncated_name + (" " * padding) + count_str
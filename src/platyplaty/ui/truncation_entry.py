@@ -48,9 +48,10 @@ def truncate_entry(
     Args:
         name: The entry name (filename or directory name).
         entry_type: The type of entry (DIRECTORY, FILE, SYMLINK_*, etc.).
-        indicator: The indicator value. For directories, an int count.
-            For files, a size string. For symlinks, the full indicator
-            string (e.g., "-> 42" or "-> 1.5 K").
+        indicator: The indicator value. For directories, an int count
+            (or a placeholder string while it is computed). For files,
+            a size string. For symlinks, the full indicator string
+            (e.g., "-> 42" or "-> 1.5 K").
         width: Total available width in characters.
         show_indicator: True for middle pane (show indicators),
             False for left/right panes (name only).
@@ -59,7 +60,7 @@ def truncate_entry(
         Truncated entry string, with or without indicator.
     """
     if entry_type == EntryType.DIRECTORY:
-        if show_indicator and isinstance(indicator, int):
+        if show_indicator and indicator is not None:
             return truncate_directory(name, indicator, width)
         return truncate_simple(name, width)
 
@@ -5,6 +5,7 @@ displayed with right-justified size indicators in the middle pane.
 The size indicator is always preserved except at extreme widths.
 """
 
+from platyplaty.ui.cell_width import cell_width
 from platyplaty.ui.truncation import split_filename
 from platyplaty.ui.truncation_filename import (
     truncate_filename_no_extension,
@@ -43,7 +44,7 @@ def truncate_file_with_indicator(name: str, size_str: str, width: int) -> str:
 
     # Minimum name size: 3 chars for files with extension (v~~), 2 for without (v~)
     min_name_len = 3 if has_ext else 2
-    size_len = len(size_str)
+    size_len = cell_width(size_str)
 
     # Minimum total width needed: min_name + 1 space + size
     min_width = min_name_len + 1 + size_len
@@ -60,7 +61,7 @@ def truncate_file_with_indicator(name: str, size_str: str, width: int) -> str:
     name_available = width - 1 - size_len  # -1 for minimum space
 
     # Truncate name if needed
-    if len(name) <= name_available:
+    if cell_width(name) <= name_available:
         truncated_name = name
     elif has_ext:
         truncated_name = truncate_filename_with_extension(base, ext, name_available)
@@ -68,6 +69,6 @@ def truncate_file_with_indicator(name: str, size_str: str, width: int) -> str:
         truncated_name = truncate_filename_no_extension(name, name_available)
 
     # Calculate padding to right-justify the size
-    padding = width - len(truncated_name) - size_len
+    padding = width - cell_width(truncated_name) - size_len
 
     return truncated_name + (" " * padding) + size_str
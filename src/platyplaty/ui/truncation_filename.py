@@ -5,6 +5,11 @@ too long to fit within pane widths. Handles both files with extensions
 (multi-stage truncation) and files without extensions (simple truncation).
 """
 
+from platyplaty.ui.cell_width import (
+    cell_width,
+    first_char_to_width,
+    truncate_to_width,
+)
 from platyplaty.ui.truncation import truncate_simple
 
 
@@ -26,35 +31,40 @@ def truncate_filename_with_extension(name: str, ext: str, width: int) -> str:
     Returns:
         The truncated filename. Edge cases for width < 3 are handled
         gracefully (width=2 returns first char + tilde, width=1 returns
-        first char, width=0 returns empty string).
+        first char, width=0 returns empty string). A double-width first
+        char that doesn't fit is shown as an ellipsis.
     """
     full = name + ext
     # Edge cases for very small widths
     if width <= 0:
         return ""
+    lead = name or ext or "~"
     if width == 1:
-        return name[0] if name else (ext[0] if ext else "~")
+        return first_char_to_width(lead, 1)
     if width == 2:
-        return (name[0] if name else (ext[0] if ext else "~")) + "~"
+        return first_char_to_width(lead, 1) + "~"
     # Stage 1: If it fits, return as-is
-    if len(full) <= width:
+    if cell_width(full) <= width:
         return full
+    ext_len = cell_width(ext)
     # Stage 2-3: Truncate base name, keep extension
     # Need space for: truncated_base + "~" + ext
     # Minimum base is 1 char, so minimum is: 1 + 1 + len(ext) = 2 + len(ext)
-    if width >= 2 + len(ext):
-        base_width = width - 1 - len(ext)  # -1 for tilde
-        return name[:base_width] + "~" + ext
+    if width >= 2 + ext_len:
+        base_width = width - 1 - ext_len  # -1 for tilde
+        return truncate_to_width(name, base_width) + "~" + ext
     # Stage 4: Truncate extension with tilde
     # Format: first_char + "~" + "." + truncated_ext + "~"
     # Minimum is 4 chars: v~.e~  (but we can go to v~~ at width=3)
     if width >= 4:
         # v~ + . + ext chars + ~
-        ext_width = width - 3  # -2 for "v~", -1 for trailing "~"
-        return (name[0] if name else "~") + "~" + ext[:ext_width] + "~"
+        first = name[0] if name else "~"
+        # -1 for the tilde after first, -1 for trailing "~"
+        ext_width = width - cell_width(first) - 2
+        return first + "~" + truncate_to_width(ext, ext_width) + "~"
     # Stage 5: Absolute minimum (width == 3)
     # Return v~~ (first char + tilde for base + tilde for ext, dot omitted)
-    return (name[0] if name else (ext[1] if len(ext) > 1 else "~")) + "~~"
+    return first_char_to_width(name or ext[1:] or "~", 1) + "~~"
 
 
 def truncate_filename_no_extension(name: str, width: int) -> str:
@@ -10,6 +10,7 @@ Indicator formats:
 - "-> 15 B" for broken symlinks (size of symlink file itself)
 """
 
+from platyplaty.ui.cell_width import cell_width
 from platyplaty.ui.truncation import truncate_simple
 
 
@@ -37,7 +38,7 @@ def truncate_symlink(name: str, indicator: str, width: int) -> str:
           and clamp name to width
         - If width < 2, return first char or empty string
     """
-    indicator_len = len(indicator)
+    indicator_len = cell_width(indicator)
 
     # Minimum name size: 2 chars (first letter + tilde)
     min_name_len = 2
@@ -55,12 +56,12 @@ def truncate_symlink(name: str, indicator: str, width: int) -> str:
     name_available = width - 1 - indicator_len  # -1 for minimum space
 
     # Truncate name if needed
-    if len(name) <= name_available:
+    if cell_width(name) <= name_available:
         truncated_name = name
     else:
         truncated_name = truncate_simple(name, name_available)
 
     # Calculate padding to right-justify the indicator
-    padding = width - len(truncated_name) - indicator_len
+    padding = width - cell_width(truncated_name) - indicator_len
 
     return truncated_name + (" " * padding) + indicator
@@ -1,21 +1,90 @@
 #!/usr/bin/env python3
-"""Undo/redo system for playlist modifications."""
+"""Undo/redo system for playlist modifications.
 
+Callers hand the manager a full snapshot of the playlist before each
+edit, but only the most recent one is kept whole. When the next
+snapshot (or an undo) arrives, the pending snapshot is reduced to a
+PlaylistEdit: the span of presets between the common head and tail of
+the two states, plus the scalar state on either side. A reorder or a
+single add/delete therefore stores a handful of paths however long the
+playlist is.
+
+Edits of the same kind made in quick succession, such as holding the
+reorder key, are coalesced into one undo step.
+"""
+
+import sys
+import time
+from collections import deque
+from collections.abc import Sequence
 from dataclasses import dataclass
 from pathlib import Path
+from typing import NamedTuple
+
+from platyplaty.preset_table import PresetTable, common_affixes
+
+# Seconds between same-kind edits for them to share one undo step
+COALESCE_SECONDS = 1.0
+
+# Edit kinds that are coalesced when repeated
+COALESCED_KINDS = frozenset({"reorder_up", "reorder_down"})
 
 
 @dataclass
 class PlaylistSnapshot:
     """Immutable snapshot of playlist state for undo/redo."""
 
-    presets: tuple[Path, ...]
+    presets: Sequence[Path]
     selection_index: int
     playing_index: int | None
     associated_filename: Path | None
     dirty_flag: bool
 
 
+class _PlaylistState(NamedTuple):
+    """The scalar part of a snapshot."""
+
+    selection_index: int
+    playing_index: int | None
+    associated_filename: Path | None
+    dirty_flag: bool
+
+
+class PlaylistEdit(NamedTuple):
+    """The difference between two playlist snapshots.
+
+    Attributes:
+        start: Index of the first preset that differs.
+        before: The differing presets in the older state.
+        after: The presets that replaced them in the newer state.
+        before_state: Selection, playing index, filename and dirty flag
+            of the older state.
+        after_state: The same for the newer state.
+    """
+
+    start: int
+    before: Sequence[Path]
+    after: Sequence[Path]
+    before_state: _PlaylistState
+    after_state: _PlaylistState
+
+
+class UndoMemory(NamedTuple):
+    """Memory held by the undo history.
+
+    Attributes:
+        steps: Undo plus redo steps stored.
+        paths: Preset entries held by those steps and the pending
+            snapshot.
+        bytes: Approximate size of the containers holding them; the
+            path strings themselves are shared with the playlist.
+    """
+
+    steps: int
+    paths: int
+    bytes: int
+
+
 class UndoManager:
     """Manages undo/redo stacks for playlist state."""
 
@@ -23,36 +92,119 @@ class UndoManager:
 
     def __init__(self) -> None:
         """Initialize empty undo and redo stacks."""
-        self._undo_stack: list[PlaylistSnapshot] = []
-        self._redo_stack: list[PlaylistSnapshot] = []
-
-    def push_undo(self, snapshot: PlaylistSnapshot) -> None:
-        """Save state before a modification."""
-        self._undo_stack.append(snapshot)
-        if len(self._undo_stack) > self.MAX_UNDO_LEVELS:
-            self._undo_stack.pop(0)
+        self._undo_stack: deque[PlaylistEdit] = deque()
+        self._redo_stack: list[PlaylistEdit] = []
+        self._pending: PlaylistSnapshot | None = None
+        self._pending_kind: str | None = None
+        self._pending_time = 0.0
+
+    def push_undo(self, snapshot: PlaylistSnapshot, kind: str | None = None) -> None:
+        """Save state before a modification.
+
+        Args:
+            snapshot: The playlist state before the modification.
+            kind: Name of the edit, e.g. "reorder_up"; repeated edits of
+                a kind in COALESCED_KINDS within COALESCE_SECONDS share
+                one undo step.
+        """
         self._redo_stack.clear()
+        now = time.monotonic()
+        if (
+            self._pending is not None
+            and kind in COALESCED_KINDS
+            and kind == self._pending_kind
+            and now - self._pending_time <= COALESCE_SECONDS
+        ):
+            self._pending_time = now
+            return
+        if self._pending is not None:
+            self._undo_stack.append(_diff(self._pending, snapshot))
+            while len(self._undo_stack) >= self.MAX_UNDO_LEVELS:
+                self._undo_stack.popleft()
+        self._pending = snapshot
+        self._pending_kind = kind
+        self._pending_time = now
 
     def undo(self, current: PlaylistSnapshot) -> PlaylistSnapshot | None:
         """Restore previous state and push current to redo stack."""
-        if not self._undo_stack:
+        if self._pending is not None:
+            edit = _diff(self._pending, current)
+            self._pending = None
+        elif self._undo_stack:
+            edit = self._undo_stack.pop()
+        else:
             return None
-        previous = self._undo_stack.pop()
-        self._redo_stack.append(current)
-        return previous
+        self._redo_stack.append(edit)
+        return _apply(current, edit.start, edit.after, edit.before, edit.before_state)
 
     def redo(self, current: PlaylistSnapshot) -> PlaylistSnapshot | None:
         """Restore next state and push current to undo stack."""
         if not self._redo_stack:
             return None
-        next_state = self._redo_stack.pop()
-        self._undo_stack.append(current)
-        return next_state
+        edit = self._redo_stack.pop()
+        self._undo_stack.append(edit)
+        return _apply(current, edit.start, edit.before, edit.after, edit.after_state)
 
     def can_undo(self) -> bool:
         """Return True if there are states to undo."""
-        return len(self._undo_stack) > 0
+        return self._pending is not None or len(self._undo_stack) > 0
 
     def can_redo(self) -> bool:
         """Return True if there are states to redo."""
         return len(self._redo_stack) > 0
+
+    def memory_usage(self) -> UndoMemory:
+        """Report how much the undo history holds."""
+        edits = [*self._undo_stack, *self._redo_stack]
+        paths = sum(len(e.before) + len(e.after) for e in edits)
+        size = sys.getsizeof(self._undo_stack) + sys.getsizeof(self._redo_stack)
+        size += sum(
+            sys.getsizeof(e) + sys.getsizeof(e.before) + sys.getsizeof(e.after)
+            for e in edits
+        )
+        if self._pending is not None:
+            paths += len(self._pending.presets)
+            size += sys.getsizeof(self._pending.presets)
+        return UndoMemory(len(edits), paths, size)
+
+
+def _state(snapshot: PlaylistSnapshot) -> _PlaylistState:
+    """Return the scalar part of a snapshot."""
+    return _PlaylistState(
+        snapshot.selection_index,
+        snapshot.playing_index,
+        snapshot.associated_filename,
+        snapshot.dirty_flag,
+    )
+
+
+def _diff(old: PlaylistSnapshot, new: PlaylistSnapshot) -> PlaylistEdit:
+    """Reduce two snapshots to the span of presets that differs.
+
+    Snapshots of one playlist share a string pool, so the presets are
+    compared by id without building Path objects.
+    """
+    a, b = old.presets, new.presets
+    head, tail = common_affixes(a, b)
+    return PlaylistEdit(
+        head, a[head : len(a) - tail], b[head : len(b) - tail],
+        _state(old), _state(new),
+    )
+
+
+def _apply(
+    current: PlaylistSnapshot,
+    start: int,
+    replaced: Sequence[Path],
+    replacement: Sequence[Path],
+    state: _PlaylistState,
+) -> PlaylistSnapshot:
+    """Return current with a span of presets replaced and state set."""
+    presets = current.presets
+    end = start + len(replaced)
+    spliced: Sequence[Path]
+    if isinstance(presets, PresetTable):
+        spliced = presets[:start] + replacement + presets[end:]
+    else:
+        spliced = (*presets[:start], *replacement, *presets[end:])
+    return PlaylistSnapshot(spliced, *state)
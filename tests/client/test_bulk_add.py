@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""Tests for adding whole directories and globs of presets."""
+
+import os
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import pytest
+
+from platyplaty.bulk_add import BulkAdd, find_presets
+from platyplaty.commands.add_presets import execute
+from platyplaty.playlist import Playlist
+
+if TYPE_CHECKING:
+    from platyplaty.app_context import AppContext
+
+
+def _touch(path: Path) -> Path:
+    """Create an empty file, with its parent directories."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("")
+    return path
+
+
+class TestFindPresets:
+    """Tests for find_presets."""
+
+    def test_walk_order(self, tmp_path: Path) -> None:
+        """Files come in folded name order, depth first, .milk only."""
+        _touch(tmp_path / "b.milk")
+        _touch(tmp_path / "A" / "z.MILK")
+        _touch(tmp_path / "a.milk")
+        _touch(tmp_path / "notes.txt")
+        found = [p.relative_to(tmp_path) for p in find_presets(tmp_path)]
+        assert found == [Path("a.milk"), Path("A/z.MILK"), Path("b.milk")]
+
+    def test_unchanged_directories_are_not_reread(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A second walk reuses the flat view's directory scan cache."""
+        _touch(tmp_path / "A" / "z.milk")
+        _touch(tmp_path / "a.milk")
+        first = list(find_presets(tmp_path))
+        scans: list[str] = []
+        real_scandir = os.scandir
+
+        def counting_scandir(path: Path) -> object:
+            scans.append(str(path))
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+        assert list(find_presets(tmp_path)) == first
+        assert scans == []
+
+    def test_glob(self, tmp_path: Path) -> None:
+        """Glob matches are walked or included, each file once."""
+        _touch(tmp_path / "x" / "one.milk")
+        _touch(tmp_path / "x" / "two.milk")
+        _touch(tmp_path / "y" / "one.milk")
+        found = list(find_presets(tmp_path / "**" / "one.milk"))
+        assert found == [tmp_path / "x" / "one.milk", tmp_path / "y" / "one.milk"]
+        both = list(find_presets(tmp_path / "x*"))
+        assert both == [tmp_path / "x" / "one.milk", tmp_path / "x" / "two.milk"]
+
+    def test_symlink_loop_terminates(self, tmp_path: Path) -> None:
+        """A symlink back to an ancestor is not followed twice."""
+        _touch(tmp_path / "d" / "p.milk")
+        os.symlink(tmp_path, tmp_path / "d" / "loop")
+        assert list(find_presets(tmp_path)) == [tmp_path / "d" / "p.milk"]
+
+    def test_single_file(self, tmp_path: Path) -> None:
+        """A .milk file names itself."""
+        preset = _touch(tmp_path / "p.milk")
+        assert list(find_presets(preset)) == [preset]
+
+    def test_literal_directory_with_glob_characters(self, tmp_path: Path) -> None:
+        """A literal path is walked even if it looks like a pattern."""
+        preset = _touch(tmp_path / "[live] set" / "p.milk")
+        _touch(tmp_path / "l" / "other.milk")
+        assert list(find_presets(tmp_path / "[live] set", literal=True)) == [preset]
+
+
+class TestBulkAdd:
+    """Tests for the background BulkAdd job."""
+
+    def test_result_and_validity(self, tmp_path: Path) -> None:
+        """Matched broken symlinks are collected but marked invalid."""
+        _touch(tmp_path / "good.milk")
+        os.symlink(tmp_path / "missing", tmp_path / "gone.milk")
+        calls: list[None] = []
+        job = BulkAdd(tmp_path / "*.milk", lambda: calls.append(None))
+        result = job.wait(5)
+        assert result.paths == [tmp_path / "gone.milk", tmp_path / "good.milk"]
+        assert result.valid == [False, True]
+        st = (tmp_path / "good.milk").stat()
+        assert result.identities == [None, (st.st_dev, st.st_ino)]
+        assert job.progress.validated == 2
+        assert calls
+
+    def test_validates_in_batches_keeping_order(self, tmp_path: Path) -> None:
+        """Validity is reported in walk order across several batches."""
+        for n in range(150):
+            if n % 7:
+                _touch(tmp_path / f"{n:03d}.milk")
+            else:
+                os.symlink(tmp_path / "missing", tmp_path / f"{n:03d}.milk")
+        result = BulkAdd(tmp_path / "*.milk", lambda: None).wait(5)
+        assert result.valid == [bool(n % 7) for n in range(150)]
+
+    def test_cancelled_job_is_empty(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A job cancelled while validating adds nothing."""
+        _touch(tmp_path / "p.milk")
+        release = threading.Event()
+
+        def slow_validate(_path: Path) -> bool:
+            release.wait(5)
+            return True
+
+        monkeypatch.setattr("platyplaty.bulk_add.is_valid_preset", slow_validate)
+        job = BulkAdd(tmp_path, lambda: None)
+        job.cancel()
+        release.set()
+        assert job.wait(5).paths == []
+        assert job.cancelled
+
+
+class TestPlaylistAddPresets:
+    """Tests for Playlist.add_presets."""
+
+    def test_appends_with_broken_flags(self) -> None:
+        """Presets are appended once, invalid ones marked broken."""
+        playlist = Playlist([Path("/a.milk")])
+        playlist.add_presets([Path("/b.milk"), Path("/c.milk")], [False, True])
+        assert playlist.presets == [Path(f"/{n}.milk") for n in "abc"]
+        assert playlist.broken_indices == {1}
+        assert playlist.dirty_flag
+
+    def test_nothing_to_add(self) -> None:
+        """Adding no presets leaves the playlist clean."""
+        playlist = Playlist([])
+        playlist.add_presets([], [])
+        assert not playlist.dirty_flag
+
+
+class TestAddCommand:
+    """Tests for the :add command's argument checks."""
+
+    @pytest.mark.asyncio
+    async def test_requires_argument(self, tmp_path: Path) -> None:
+        """:add without a path is an error."""
+        ctx: AppContext = MagicMock()
+        success, error = await execute(None, ctx, MagicMock(), tmp_path)
+        assert not success
+        assert error == "Error: add requires a path argument"
+
+    @pytest.mark.asyncio
+    async def test_missing_target(self, tmp_path: Path) -> None:
+        """A path that does not exist is an error."""
+        ctx: AppContext = MagicMock()
+        success, error = await execute("nowhere", ctx, MagicMock(), tmp_path)
+        assert not success
+        assert error is not None and "nowhere" in error
+
+    @pytest.mark.asyncio
+    async def test_existing_path_is_literal(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """An existing path with glob characters is not expanded."""
+        (tmp_path / "[live]").mkdir()
+        calls: list[tuple[Path, bool]] = []
+
+        def fake_start(
+            _ctx: object, _app: object, target: Path, literal: bool = False
+        ) -> None:
+            calls.append((target, literal))
+
+        monkeypatch.setattr(
+            "platyplaty.commands.add_presets.start_bulk_add", fake_start
+        )
+        ctx: AppContext = MagicMock()
+        assert await execute("[live]", ctx, MagicMock(), tmp_path) == (True, None)
+        assert await execute("l*", ctx, MagicMock(), tmp_path) == (True, None)
+        assert calls == [(tmp_path / "[live]", True), (tmp_path / "l*", False)]
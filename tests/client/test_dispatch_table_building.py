@@ -61,6 +61,7 @@ class TestDispatchTableBuilding:
             open_selected_keys=["l", "right"],
             view_errors_keys=["e"],
             play_selection_keys=["enter"],
+            find_preset_keys=["ctrl+f"],
         )
         assert table["tab"] == "switch_focus"
         assert table["q"] == "quit"
@@ -71,6 +72,7 @@ class TestDispatchTableBuilding:
         assert table["l"] == "open_selected"
         assert table["e"] == "view_errors"
         assert table["enter"] == "play_selection"
+        assert table["ctrl+f"] == "find_preset"
 
     def test_build_playlist_dispatch_table_maps_all_keys(self) -> None:
         """Playlist dispatch table maps all action keys."""
@@ -89,6 +91,11 @@ class TestDispatchTableBuilding:
             page_down_keys=["pagedown"],
             navigate_to_first_keys=["home"],
             navigate_to_last_keys=["end"],
+            toggle_mark_keys=["m"],
+            toggle_range_keys=["v"],
+            clear_marks_keys=["escape"],
+            send_to_top_keys=["T"],
+            send_to_bottom_keys=["B"],
         )
         assert table["K"] == "play_previous"
         assert table["J"] == "play_next"
@@ -105,6 +112,11 @@ class TestDispatchTableBuilding:
         assert table["pagedown"] == "page_down"
         assert table["home"] == "navigate_to_first_preset"
         assert table["end"] == "navigate_to_last_preset"
+        assert table["m"] == "toggle_mark"
+        assert table["v"] == "toggle_range"
+        assert table["escape"] == "clear_marks"
+        assert table["T"] == "send_to_top"
+        assert table["B"] == "send_to_bottom"
 
     def test_build_error_view_dispatch_table_maps_keys(self) -> None:
         """Error view dispatch table maps clear_errors key."""
@@ -121,7 +133,15 @@ class TestDispatchTableBuilding:
             add_preset_or_load_playlist_keys=["a"],
             play_previous_preset_keys=["K"],
             play_next_preset_keys=["J"],
+            find_keys=["f"],
+            filter_keys=["slash"],
+            toggle_flatten_keys=["F"],
+            add_directory_keys=["A"],
         )
         assert table["a"] == "add_preset_or_load_playlist"
         assert table["K"] == "play_previous_preset"
         assert table["J"] == "play_next_preset"
+        assert table["f"] == "find"
+        assert table["slash"] == "filter"
+        assert table["F"] == "toggle_flatten"
+        assert table["A"] == "add_directory"
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Tests for selection and playing pointers that follow their entries."""
+
+from pathlib import Path
+
+from platyplaty.entry_cursor import EntryCursor
+from platyplaty.playlist import Playlist
+from platyplaty.preset_table import PresetTable
+
+
+def _playlist(size: int) -> Playlist:
+    """Return a playlist of size distinct presets."""
+    return Playlist([Path(f"/presets/{i}.milk") for i in range(size)])
+
+
+class TestEntryCursor:
+    """Tests for EntryCursor."""
+
+    def test_follows_entry_through_edits(self) -> None:
+        """Inserts, deletes and moves elsewhere do not lose the entry."""
+        table = PresetTable([Path(f"/{i}.milk") for i in range(10)])
+        cursor = EntryCursor()
+        cursor.set(table, 5)
+        table.insert(0, Path("/new.milk"))
+        assert cursor.get(table) == 6
+        del table[:3]
+        assert cursor.get(table) == 3
+        table.swap(3, 6)
+        assert cursor.get(table) == 6
+        assert table[6] == Path("/5.milk")
+
+    def test_removed_entry_keeps_index(self) -> None:
+        """A cursor whose entry is deleted stays at its last index."""
+        table = PresetTable([Path(f"/{i}.milk") for i in range(4)])
+        cursor = EntryCursor()
+        cursor.set(table, 2)
+        del table[2]
+        assert cursor.get(table) == 2
+
+    def test_out_of_range_is_a_plain_index(self) -> None:
+        """None and indices past the end are kept as they are."""
+        table = PresetTable()
+        cursor = EntryCursor(0)
+        assert cursor.get(table) == 0
+        cursor.set(table, None)
+        assert cursor.get(table) is None
+
+
+class TestPlaylistPointers:
+    """Playlist selection and playing follow entries by key."""
+
+    def test_move_carries_selection_and_playing(self) -> None:
+        """Moving the selected, playing preset moves both pointers."""
+        playlist = _playlist(5)
+        playlist.set_selection(2)
+        playlist.set_playing(2)
+        playlist.move_preset_up(2)
+        assert playlist.get_selection() == 1
+        assert playlist.get_playing() == 1
+
+    def test_neighbour_move_shifts_playing(self) -> None:
+        """Moving another preset past the playing one shifts it."""
+        playlist = _playlist(5)
+        playlist.set_playing(1)
+        playlist.move_preset_up(2)
+        assert playlist.get_playing() == 2
+
+    def test_delete_above_shifts_playing(self) -> None:
+        """Deleting an earlier preset keeps the same preset playing."""
+        playlist = _playlist(5)
+        playlist.set_playing(3)
+        playlist.remove_preset(0)
+        assert playlist.get_playing() == 2
+        assert playlist.current() == Path("/presets/3.milk")
+
+    def test_replacing_presets_keeps_indices(self) -> None:
+        """Assigning new presets keeps the pointers' indices."""
+        playlist = _playlist(5)
+        playlist.set_selection(3)
+        playlist.presets = [Path(f"/other/{i}.milk") for i in range(5)]
+        assert playlist.get_selection() == 3
+        playlist.move_preset_down(3)
+        assert playlist.get_selection() == 4
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Unit tests for cached file identity and realpath lookups."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from platyplaty.bad_presets import _bad_presets, is_preset_bad, mark_preset_as_bad
+from platyplaty.file_identity import (
+    clear_identity_caches,
+    file_identity,
+    resolve_cached,
+)
+from platyplaty.file_stat import invalidate_file_stat
+from platyplaty.playlist import Playlist
+from platyplaty.playlist_broken import mark_all_matching_as_broken
+from platyplaty.ui.directory import list_directory
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    """Start every test with empty caches and registry."""
+    clear_identity_caches()
+    _bad_presets.clear()
+    yield
+    clear_identity_caches()
+    _bad_presets.clear()
+
+
+class TestFileIdentity:
+    """Tests for file_identity."""
+
+    def test_symlink_shares_identity_with_target(self, tmp_path: Path) -> None:
+        """A symlink and its target have the same identity."""
+        target = tmp_path / "a.milk"
+        target.touch()
+        link = tmp_path / "link.milk"
+        link.symlink_to(target)
+        assert file_identity(link) == file_identity(target)
+
+    def test_missing_file_returns_none(self, tmp_path: Path) -> None:
+        """Files that cannot be stat'ed have no identity."""
+        assert file_identity(tmp_path / "missing.milk") is None
+
+
+class TestResolveCached:
+    """Tests for resolve_cached."""
+
+    def test_repeat_lookups_resolve_once(self, tmp_path: Path) -> None:
+        """Repeated lookups are served from the cache."""
+        with patch.object(Path, "resolve", return_value=tmp_path) as mock_resolve:
+            for _ in range(3):
+                resolve_cached(tmp_path / "x")
+        assert mock_resolve.call_count == 1
+
+    def test_clear_picks_up_new_target(self, tmp_path: Path) -> None:
+        """Clearing the caches sees a retargeted symlink."""
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        link = tmp_path / "link"
+        link.symlink_to(tmp_path / "a")
+        assert resolve_cached(link) == (tmp_path / "a").resolve()
+        link.unlink()
+        link.symlink_to(tmp_path / "b")
+        clear_identity_caches()
+        assert resolve_cached(link) == (tmp_path / "b").resolve()
+
+
+class TestBadPresetLookup:
+    """Tests for identity-based bad preset checks."""
+
+    def test_empty_registry_does_no_filesystem_work(self, tmp_path: Path) -> None:
+        """With no bad presets, lookups never touch the filesystem."""
+        with patch("platyplaty.bad_presets.stat_identity") as mock_stat:
+            assert is_preset_bad(tmp_path / "a.milk") is False
+        mock_stat.assert_not_called()
+
+    def test_listed_rows_are_checked_without_io(self, tmp_path: Path) -> None:
+        """Rows whose stat a listing cached are checked without a stat."""
+        preset = tmp_path / "a.milk"
+        preset.touch()
+        other = tmp_path / "b.milk"
+        other.touch()
+        mark_preset_as_bad(preset)
+        invalidate_file_stat()
+        list_directory(tmp_path)
+        with (
+            patch("os.stat", side_effect=AssertionError) as mock_stat,
+            patch("os.lstat", side_effect=AssertionError),
+        ):
+            assert is_preset_bad(preset) is True
+            assert is_preset_bad(other) is False
+        mock_stat.assert_not_called()
+
+    def test_identity_counts_only_while_registered(self, tmp_path: Path) -> None:
+        """Clearing the registry also clears identity matches."""
+        preset = tmp_path / "a.milk"
+        preset.touch()
+        mark_preset_as_bad(preset)
+        assert is_preset_bad(preset) is True
+        _bad_presets.clear()
+        mark_preset_as_bad(tmp_path / "other.milk")
+        assert is_preset_bad(preset) is False
+
+    def test_hard_link_is_bad(self, tmp_path: Path) -> None:
+        """A hard link to a bad preset is the same file."""
+        preset = tmp_path / "a.milk"
+        preset.touch()
+        hard_link = tmp_path / "b.milk"
+        hard_link.hardlink_to(preset)
+        mark_preset_as_bad(preset)
+        assert is_preset_bad(hard_link) is True
+
+
+class TestMarkAllMatchingAsBroken:
+    """Tests for identity-based broken playlist marking."""
+
+    def test_marks_symlinked_entries(self, tmp_path: Path) -> None:
+        """Entries naming the same file through a symlink are marked."""
+        preset = tmp_path / "a.milk"
+        preset.touch()
+        other = tmp_path / "b.milk"
+        other.touch()
+        link = tmp_path / "link.milk"
+        link.symlink_to(preset)
+        playlist = Playlist([preset, other, link])
+        mark_all_matching_as_broken(playlist, preset)
+        assert playlist.broken_indices == {0, 2}
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Unit tests for the shared lstat/stat cache."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from platyplaty.file_stat import file_stat, invalidate_file_stat
+from platyplaty.preset_validator import is_valid_preset
+from platyplaty.ui.directory_entry import get_entry_type
+from platyplaty.ui.directory_types import EntryType
+from platyplaty.ui.indicators import count_directory_contents
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    """Start and end every test with an empty stat cache."""
+    invalidate_file_stat()
+    yield
+    invalidate_file_stat()
+
+
+class TestFileStat:
+    """Tests for file_stat."""
+
+    def test_regular_file(self, tmp_path: Path) -> None:
+        """A regular file exists, is not a symlink and has its size."""
+        f = tmp_path / "a.milk"
+        f.write_text("hello")
+        st = file_stat(f)
+        assert st.exists and not st.is_symlink and not st.is_dir
+        assert st.size == 5
+        assert st.lstat is st.stat
+
+    def test_symlink_to_directory(self, tmp_path: Path) -> None:
+        """Symlinks keep both their own and their target's stat."""
+        link = tmp_path / "link"
+        link.symlink_to(tmp_path)
+        st = file_stat(link)
+        assert st.is_symlink and st.is_dir
+        assert st.link_size == len(str(tmp_path))
+
+    def test_broken_symlink(self, tmp_path: Path) -> None:
+        """A symlink to a missing target is broken and does not exist."""
+        link = tmp_path / "broken.milk"
+        link.symlink_to(tmp_path / "missing.milk")
+        st = file_stat(link)
+        assert st.is_broken_symlink and not st.exists
+        assert st.size == 0
+
+    def test_missing_path(self, tmp_path: Path) -> None:
+        """A missing path has no stat results."""
+        st = file_stat(tmp_path / "missing.milk")
+        assert st.lstat is None and st.stat is None
+        assert not st.is_symlink and not st.is_broken_symlink
+
+    def test_results_are_cached(self, tmp_path: Path) -> None:
+        """Repeated lookups do not stat again."""
+        f = tmp_path / "a.milk"
+        f.touch()
+        file_stat(f)
+        with patch("platyplaty.file_stat.os.lstat") as lstat:
+            file_stat(f)
+        lstat.assert_not_called()
+
+
+class TestInvalidateFileStat:
+    """Tests for invalidate_file_stat."""
+
+    def test_invalidate_one_path(self, tmp_path: Path) -> None:
+        """Invalidating a path re-stats only that path."""
+        a = tmp_path / "a.milk"
+        b = tmp_path / "b.milk"
+        a.write_text("a")
+        b.write_text("b")
+        file_stat(a)
+        file_stat(b)
+        a.write_text("aaa")
+        b.write_text("bbb")
+        invalidate_file_stat(a)
+        assert file_stat(a).size == 3
+        assert file_stat(b).size == 1
+
+    def test_invalidate_all(self, tmp_path: Path) -> None:
+        """Invalidating without a path drops every entry."""
+        f = tmp_path / "a.milk"
+        file_stat(f)
+        f.touch()
+        assert not file_stat(f).exists
+        invalidate_file_stat()
+        assert file_stat(f).exists
+
+
+class TestSharedConsumers:
+    """The validator, entry typing and counts share one cache."""
+
+    def test_count_primes_entry_types(self, tmp_path: Path) -> None:
+        """Counting a directory caches the types of its entries."""
+        (tmp_path / "a.milk").touch()
+        (tmp_path / "sub").mkdir()
+        assert count_directory_contents(tmp_path) == 2
+        with patch("platyplaty.file_stat.os.lstat") as lstat:
+            assert get_entry_type(tmp_path / "sub") == EntryType.DIRECTORY
+            assert is_valid_preset(tmp_path / "a.milk")
+        lstat.assert_not_called()
+
+    def test_validator_rejects_broken_symlink(self, tmp_path: Path) -> None:
+        """Broken symlinks are invalid without opening them."""
+        link = tmp_path / "broken.milk"
+        link.symlink_to(tmp_path / "missing.milk")
+        with patch("platyplaty.preset_validator.is_readable") as readable:
+            assert not is_valid_preset(link)
+        readable.assert_not_called()
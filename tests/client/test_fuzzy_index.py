@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Tests for the preset finder's fuzzy index and its sync with the index."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from platyplaty import fuzzy_index
+from platyplaty.fuzzy_index import FuzzyIndex
+from platyplaty.preset_finder_table import (
+    reset_finder_table,
+    search_finder_table,
+    sync_finder_table,
+)
+from platyplaty.preset_index import PresetIndex
+from platyplaty.preset_index_scan import refresh_index
+
+PATHS = [
+    "/p/Geiss/Geiss - Cosmic Dust.milk",
+    "/p/Martin/Martin - Geiss Tribute.milk",
+    "/p/Geiss/Geiss - Swirl.milk",
+    "/p/Flexi/Flexi - Tunnel Vision.milk",
+    "/p/Rovastar/Rovastar - Tunnel.milk",
+    "/p/Rovastar/Rovastar - Gentle Eclipse.milk",
+]
+
+
+class TestSearch:
+    """Tests for FuzzyIndex.search ranking."""
+
+    def test_name_prefix_ranks_first(self) -> None:
+        """Names starting with the query beat names merely containing it."""
+        hits = FuzzyIndex(PATHS).search("geiss")
+        assert hits[:2] == [
+            "/p/Geiss/Geiss - Swirl.milk",
+            "/p/Geiss/Geiss - Cosmic Dust.milk",
+        ]
+        assert hits[2] == "/p/Martin/Martin - Geiss Tribute.milk"
+
+    def test_directory_matches_follow_name_matches(self) -> None:
+        """A query found only in the directory ranks after name matches."""
+        index = FuzzyIndex([*PATHS, "/p/Tunnels/Other.milk"])
+        assert index.search("tunnel") == [
+            "/p/Rovastar/Rovastar - Tunnel.milk",
+            "/p/Flexi/Flexi - Tunnel Vision.milk",
+            "/p/Tunnels/Other.milk",
+        ]
+
+    def test_fuzzy_matches_characters_in_order(self) -> None:
+        """Characters need not be adjacent, but must appear in order."""
+        index = FuzzyIndex(PATHS)
+        assert index.search("fxtv") == ["/p/Flexi/Flexi - Tunnel Vision.milk"]
+        assert index.search("vtxf") == []
+
+    def test_search_ignores_case(self) -> None:
+        """Upper-case queries match lower-case names and vice versa."""
+        assert FuzzyIndex(PATHS).search("SWIRL") == ["/p/Geiss/Geiss - Swirl.milk"]
+
+    def test_limit_caps_results(self) -> None:
+        """No more than limit paths are returned."""
+        assert len(FuzzyIndex(PATHS).search("milk", limit=2)) == 2
+
+    def test_regex_characters_are_literal(self) -> None:
+        """Queries with regex metacharacters are matched literally."""
+        index = FuzzyIndex(["/p/a[1].milk", "/p/a1.milk", "/p/x.*y.milk"])
+        assert index.search("[1]") == ["/p/a[1].milk"]
+        assert index.search(".*") == ["/p/x.*y.milk"]
+
+    def test_repeated_characters_do_not_blow_up(self) -> None:
+        """Long runs of one character are matched without backtracking."""
+        index = FuzzyIndex(["/p/" + "e" * 40 + ".milk"])
+        assert index.search("e" * 30) == ["/p/" + "e" * 40 + ".milk"]
+        assert index.search("e" * 50) == []
+
+    def test_empty_query_matches_nothing(self) -> None:
+        """An empty query returns no results."""
+        assert FuzzyIndex(PATHS).search("") == []
+
+    def test_unpacks_masks_across_windows(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Fuzzy candidates beyond the first unpacked window are found."""
+        monkeypatch.setattr(fuzzy_index, "BATCH_SIZE", 8)
+        paths = [f"/p/{n:02d}.milk" for n in range(30)] + ["/p/zq/wx.milk"]
+        assert FuzzyIndex(paths).search("zw") == ["/p/zq/wx.milk"]
+
+
+class TestUpdates:
+    """Tests for incremental additions and removals."""
+
+    def test_added_paths_are_found(self) -> None:
+        """Paths added after the build are searchable in every tier."""
+        index = FuzzyIndex(PATHS)
+        index.add(["/p/New/Geiss - Late.milk", "/p/Tunnels/Late.milk"])
+        assert "/p/New/Geiss - Late.milk" in index.search("geiss")
+        assert "/p/Tunnels/Late.milk" in index.search("tunnels")
+        assert index.search("glate") == ["/p/New/Geiss - Late.milk"]
+        assert len(index) == len(PATHS) + 2
+
+    def test_removed_paths_are_not_found(self) -> None:
+        """Removed paths disappear from every tier."""
+        index = FuzzyIndex(PATHS)
+        index.remove(["/p/Geiss/Geiss - Swirl.milk"])
+        assert "/p/Geiss/Geiss - Swirl.milk" not in index.search("geiss")
+        assert index.search("swirl") == []
+        assert "/p/Geiss/Geiss - Swirl.milk" not in index
+
+    def test_churn_marks_table_fragmented(self) -> None:
+        """Enough additions and removals ask for a rebuild."""
+        index = FuzzyIndex(PATHS)
+        assert not index.fragmented
+        index.remove(PATHS[:2])
+        assert index.fragmented
+
+
+class TestFinderTable:
+    """Tests for syncing the finder table from the preset index."""
+
+    @pytest.fixture
+    def index(self) -> Iterator[PresetIndex]:
+        """An in-memory preset index and a fresh finder table."""
+        idx = PresetIndex(":memory:")
+        reset_finder_table()
+        yield idx
+        reset_finder_table()
+        idx.close()
+
+    def test_unbuilt_table_returns_none(self, index: PresetIndex) -> None:
+        """Searches before the first sync report that nothing is built."""
+        assert search_finder_table("a", 10) is None
+
+    def test_sync_loads_presets_only(
+        self, index: PresetIndex, tmp_path: Path
+    ) -> None:
+        """Indexed .milk files are searchable; playlists are left out."""
+        (tmp_path / "swirl.milk").write_text("x")
+        (tmp_path / "swirl.platy").write_text(f"{tmp_path / 'swirl.milk'}\n")
+        refresh_index(index, [str(tmp_path)])
+        sync_finder_table(index)
+        assert search_finder_table("swirl", 10) == [str(tmp_path / "swirl.milk")]
+
+    def test_sync_follows_index_changes(
+        self, index: PresetIndex, tmp_path: Path
+    ) -> None:
+        """Files added or deleted on disk reach the table after a refresh."""
+        (tmp_path / "old.milk").write_text("x")
+        refresh_index(index, [str(tmp_path)])
+        sync_finder_table(index)
+        (tmp_path / "old.milk").unlink()
+        (tmp_path / "new.milk").write_text("x")
+        refresh_index(index, [str(tmp_path)])
+        sync_finder_table(index)
+        results = search_finder_table("milk", 10)
+        assert results == [str(tmp_path / "new.milk")]
+
+    def test_unchanged_index_is_not_reread(
+        self, index: PresetIndex, tmp_path: Path
+    ) -> None:
+        """A refresh that changes nothing leaves the generation alone."""
+        (tmp_path / "a.milk").write_text("x")
+        refresh_index(index, [str(tmp_path)])
+        generation = index.generation
+        refresh_index(index, [str(tmp_path)])
+        assert index.generation == generation
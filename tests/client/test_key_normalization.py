@@ -66,6 +66,11 @@ def _make_playlist_table_with_shift_format():
         page_down_keys=["pagedown"],
         navigate_to_first_keys=["home"],
         navigate_to_last_keys=["end"],
+        toggle_mark_keys=["m"],
+        toggle_range_keys=["v"],
+        clear_marks_keys=["escape"],
+        send_to_top_keys=["shift+t"],
+        send_to_bottom_keys=["shift+b"],
     )
 
 
@@ -5,6 +5,13 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
+import pytest
+
+from platyplaty.file_identity import (
+    clear_identity_caches,
+    file_identity,
+    stat_identity,
+)
 from platyplaty.playlist import Playlist
 from platyplaty.playlist_broken import mark_all_matching_as_broken
 
@@ -66,3 +73,106 @@ class TestMarkAllMatchingAsBroken:
         playlist.broken_indices.add(0)
         mark_all_matching_as_broken(playlist, preset2)
         assert playlist.broken_indices == {0, 1}
+
+    def test_paths_are_identified_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Later crashes only stat paths added since the last one."""
+        presets = [tmp_path / f"{name}.milk" for name in "abcd"]
+        for p in presets:
+            p.touch()
+        stats: list[Path] = []
+
+        def counting_identity(path: Path) -> tuple[int, int] | None:
+            stats.append(path)
+            return file_identity(path)
+
+        monkeypatch.setattr(
+            "platyplaty.preset_identities.file_identity", counting_identity
+        )
+        playlist = Playlist(presets[:3])
+        mark_all_matching_as_broken(playlist, presets[0])
+        assert len(stats) == 3 + 1
+        stats.clear()
+        playlist.presets.append(presets[3])
+        mark_all_matching_as_broken(playlist, presets[3])
+        assert stats == [presets[3], presets[3]]
+        assert playlist.broken_indices == {0, 3}
+
+    def test_validated_entries_are_not_stat_again(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A crash only stats candidates once identities are recorded."""
+        original = tmp_path / "original.milk"
+        other = tmp_path / "other.milk"
+        original.touch()
+        other.touch()
+        link = tmp_path / "link.milk"
+        link.symlink_to(original)
+        playlist = Playlist([original, other, link])
+        playlist.presets.record_identities(
+            (str(path), stat_identity(path)) for path in (original, other, link)
+        )
+        stats: list[Path] = []
+
+        def counting_identity(path: Path) -> tuple[int, int] | None:
+            stats.append(path)
+            return file_identity(path)
+
+        monkeypatch.setattr(
+            "platyplaty.preset_identities.file_identity", counting_identity
+        )
+        mark_all_matching_as_broken(playlist, original)
+        assert sorted(stats) == sorted([original, link])
+        assert playlist.broken_indices == {0, 2}
+
+    def test_deleted_entries_are_not_stat(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Only the playlist's live entries are identified."""
+        presets = [tmp_path / f"{name}.milk" for name in "abc"]
+        for p in presets:
+            p.touch()
+        playlist = Playlist(presets)
+        del playlist.presets[1]
+        stats: list[Path] = []
+
+        def counting_identity(path: Path) -> tuple[int, int] | None:
+            stats.append(path)
+            return file_identity(path)
+
+        monkeypatch.setattr(
+            "platyplaty.preset_identities.file_identity", counting_identity
+        )
+        mark_all_matching_as_broken(playlist, presets[0])
+        assert presets[1] not in stats
+
+    def test_failed_stat_is_retried(self, tmp_path: Path) -> None:
+        """An entry whose file was missing is identified on a later crash."""
+        original = tmp_path / "original.milk"
+        original.touch()
+        link = tmp_path / "link.milk"
+        playlist = Playlist([original, link])
+        mark_all_matching_as_broken(playlist, original)
+        assert playlist.broken_indices == {0}
+        link.symlink_to(original)
+        clear_identity_caches()
+        mark_all_matching_as_broken(playlist, original)
+        assert playlist.broken_indices == {0, 1}
+
+    def test_retargeted_symlink_is_not_marked(self, tmp_path: Path) -> None:
+        """A path that no longer names the crashed file is skipped."""
+        original = tmp_path / "original.milk"
+        other = tmp_path / "other.milk"
+        original.touch()
+        other.touch()
+        link = tmp_path / "link.milk"
+        link.symlink_to(original)
+        playlist = Playlist([original, link])
+        mark_all_matching_as_broken(playlist, original)
+        playlist.broken_indices.clear()
+        link.unlink()
+        link.symlink_to(other)
+        clear_identity_caches()
+        mark_all_matching_as_broken(playlist, original)
+        assert playlist.broken_indices == {0}
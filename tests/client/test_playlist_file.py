@@ -65,3 +65,39 @@ class TestParsePlaylistContent:
         """Empty content should return empty list."""
         result = parse_playlist_content("")
         assert result == []
+
+
+class TestParsePlaylistBlocks:
+    """Plain blocks are stored as they are; others line by line."""
+
+    @pytest.fixture(autouse=True)
+    def _small_blocks(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Parse two lines per block so tests cross block boundaries."""
+        monkeypatch.setattr("platyplaty.playlist_file._BLOCK_LINES", 2)
+
+    def test_mixed_blocks(self) -> None:
+        """Paths needing expansion or normalization are fixed up."""
+        content = "/a/1.milk\n/a/2.milk\n/a//3.milk\n/a/./4.milk\n~/5.milk\n"
+        result = parse_playlist_content(content)
+        assert result.strings() == [
+            "/a/1.milk", "/a/2.milk", "/a/3.milk", "/a/4.milk",
+            str(Path.home() / "5.milk"),
+        ]
+
+    def test_error_line_numbers_span_blocks(self) -> None:
+        """Line numbers count from the start of the file, not the block."""
+        content = "/a.milk\n\n/b.txt\n/c.milk\n/d.milk\nrel.milk\n"
+        with pytest.raises(RelativePathError) as exc_info:
+            parse_playlist_content(content)
+        assert str(exc_info.value) == "line 6"
+        content = "/a.milk\n/b.txt\n/c.milk\n/d.milk\n/e.MP3\n"
+        with pytest.raises(InvalidExtensionError) as exc_info:
+            parse_playlist_content(content)
+        assert str(exc_info.value) == "lines 2, 5"
+
+    def test_file_matches_content(self, tmp_path: Path) -> None:
+        """Reading a file gives the same table as parsing its text."""
+        content = "/a.milk\r\n  /b.milk  \r\n\r\n/c.milk"
+        filepath = tmp_path / "list.platy"
+        filepath.write_bytes(content.encode())
+        assert parse_playlist_file(filepath) == parse_playlist_content(content)
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""Tests for atomic playlist saves and the autosave journal."""
+
+import asyncio
+import os
+import random
+from collections.abc import Iterable
+from pathlib import Path
+
+import pytest
+
+from platyplaty.atomic_file import write_atomically
+from platyplaty.playlist import Playlist
+from platyplaty.playlist_journal import journal_path, read_journaled_playlist
+from platyplaty.playlist_operations import move_presets_to_edge
+from platyplaty.playlist_persistence import close_journal, save_in_background
+from platyplaty.playlist_snapshot import create_snapshot, restore_snapshot
+
+
+def _names(presets: Iterable[Path]) -> str:
+    """Return the preset names of presets joined into one string."""
+    return "".join(path.stem for path in presets)
+
+
+@pytest.fixture
+def platy(tmp_path: Path) -> Path:
+    """Create a playlist file of presets a to f."""
+    filepath = tmp_path / "list.platy"
+    filepath.write_text("".join(f"/p/{name}.milk\n" for name in "abcdef"))
+    return filepath
+
+
+def _close(playlist: Playlist, compact: bool = False) -> None:
+    """Close a playlist's journal and wait for it."""
+    closing = close_journal(playlist, compact)
+    if closing is not None:
+        closing.result()
+
+
+def _autosaved(platy: Path) -> Playlist:
+    """Load a playlist file with autosave on."""
+    playlist = Playlist([])
+    playlist.autosave = True
+    playlist.load_from_file(platy)
+    return playlist
+
+
+class TestWriteAtomically:
+    """Tests for write_atomically."""
+
+    def test_keeps_mode_and_follows_symlink(self, tmp_path: Path) -> None:
+        """The file a symlink points to is replaced with its mode kept."""
+        target = tmp_path / "real.platy"
+        target.write_text("old\n")
+        target.chmod(0o640)
+        link = tmp_path / "link.platy"
+        link.symlink_to(target)
+        write_atomically(link, ["new\n"])
+        assert link.is_symlink()
+        assert target.read_text() == "new\n"
+        assert target.stat().st_mode & 0o777 == 0o640
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "link.platy", "real.platy",
+        ]
+
+    def test_failed_write_keeps_old_content(self, tmp_path: Path) -> None:
+        """An error while writing leaves the file and no temporary."""
+        target = tmp_path / "list.platy"
+        target.write_text("old\n")
+
+        def chunks() -> list[str]:
+            raise OSError("disk full")
+
+        with pytest.raises(OSError, match="disk full"):
+            write_atomically(target, (text for text in chunks()))
+        assert target.read_text() == "old\n"
+        assert [p.name for p in tmp_path.iterdir()] == ["list.platy"]
+
+
+class TestJournal:
+    """Edits are journaled and replayed on load."""
+
+    def test_edits_replay(self, platy: Path) -> None:
+        """Journaled edits are applied on load; the file is untouched."""
+        playlist = _autosaved(platy)
+        original = platy.read_text()
+        presets = playlist.presets
+        presets.append(Path("/p/g.milk"))
+        presets.swap(0, 1)
+        presets.delete_indices([2, 4])
+        presets.insert(1, Path("/p/h.milk"))
+        presets[0:2] = [Path("/p/i.milk")]
+        presets.reverse()
+        del presets[-1]
+        assert not playlist.dirty_flag
+        expected = _names(presets)
+        _close(playlist)
+        assert platy.read_text() == original
+        replayed, recovered = read_journaled_playlist(platy)
+        assert recovered
+        assert _names(replayed) == expected
+
+    def test_rearrangements_replay(self, platy: Path) -> None:
+        """Shuffles and moves to an edge are journaled, not rewritten."""
+        playlist = _autosaved(platy)
+        original = platy.read_text()
+        playlist.presets.shuffle(random.Random(3))
+        move_presets_to_edge(playlist.presets, [1, 4], top=False)
+        expected = _names(playlist.presets)
+        _close(playlist)
+        assert platy.read_text() == original
+        replayed, recovered = read_journaled_playlist(platy)
+        assert recovered
+        assert _names(replayed) == expected
+
+    def test_undo_records_splice(self, platy: Path) -> None:
+        """Restoring a snapshot journals only the span that differs."""
+        playlist = _autosaved(platy)
+        original = platy.read_text()
+        snapshot = create_snapshot(playlist)
+        del playlist.presets[2]
+        restore_snapshot(playlist, snapshot)
+        _close(playlist)
+        assert platy.read_text() == original
+        journal = journal_path(platy).read_text().splitlines()
+        assert journal[1:] == ["S\t2\t3\t0", "S\t2\t2\t1", "/p/c.milk"]
+        assert _names(read_journaled_playlist(platy)[0]) == "abcdef"
+
+    def test_extended_slice_compacts(self, platy: Path) -> None:
+        """An edit no record describes rewrites the file."""
+        playlist = _autosaved(platy)
+        del playlist.presets[::2]
+        _close(playlist)
+        assert _names(Path(line) for line in platy.read_text().split()) == "bdf"
+        replayed, recovered = read_journaled_playlist(platy)
+        assert not recovered
+        assert _names(replayed) == "bdf"
+
+    def test_close_with_compact_removes_journal(self, platy: Path) -> None:
+        """On exit the journal is folded into the file."""
+        playlist = _autosaved(platy)
+        playlist.presets.swap(0, 5)
+        _close(playlist, compact=True)
+        assert not journal_path(platy).exists()
+        assert _names(read_journaled_playlist(platy)[0]) == "fbcdea"
+
+    def test_torn_record_is_dropped(self, platy: Path) -> None:
+        """Replay stops at a record cut short by a crash."""
+        playlist = _autosaved(platy)
+        playlist.presets.swap(0, 1)
+        _close(playlist)
+        with journal_path(platy).open("a") as journal:
+            journal.write("S\t0\t0\t2\n/p/x.milk\n")
+        replayed, recovered = read_journaled_playlist(platy)
+        assert recovered
+        assert _names(replayed) == "bacdef"
+
+    def test_stale_journal_is_ignored(self, platy: Path) -> None:
+        """A journal for an older version of the file is not replayed."""
+        playlist = _autosaved(platy)
+        playlist.presets.swap(0, 1)
+        _close(playlist)
+        platy.write_text("/p/z.milk\n")
+        assert _names(read_journaled_playlist(platy)[0]) == "z"
+
+
+class TestPlaylistAutosave:
+    """How autosave shows in the playlist's state."""
+
+    def test_recovered_edits_without_autosave_are_unsaved(
+        self, platy: Path
+    ) -> None:
+        """Recovered edits are unsaved changes when autosave is off."""
+        playlist = _autosaved(platy)
+        playlist.presets.swap(0, 1)
+        _close(playlist)
+        plain = Playlist([])
+        plain.load_from_file(platy)
+        assert _names(plain.presets) == "bacdef"
+        assert plain.dirty_flag
+        plain.save_to_file()
+        assert not journal_path(platy).exists()
+        assert not plain.dirty_flag
+
+    def test_failed_journal_leaves_changes_unsaved(
+        self, platy: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Edits that could not be written count as unsaved changes."""
+
+        def fail(*_args: object) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "fsync", fail)
+        playlist = _autosaved(platy)
+        playlist.presets.swap(0, 1)
+        playlist.dirty_flag = True
+        assert playlist.journal is not None
+        with pytest.raises(OSError, match="disk full"):
+            playlist.journal.compact().result()
+        assert playlist.journal.failed
+        assert playlist.dirty_flag
+        _close(playlist)
+
+    def test_clear_keeps_file(self, platy: Path) -> None:
+        """Clearing the playlist stops autosaving before removing presets."""
+        playlist = _autosaved(platy)
+        playlist.clear()
+        assert playlist.journal is None
+        assert _names(read_journaled_playlist(platy)[0]) == "abcdef"
+
+    @pytest.mark.asyncio
+    async def test_background_save_keeps_later_edits_unsaved(
+        self, platy: Path
+    ) -> None:
+        """Edits made while a save is written stay unsaved."""
+        playlist = Playlist([])
+        playlist.load_from_file(platy)
+        saving = asyncio.ensure_future(save_in_background(playlist))
+        await asyncio.sleep(0)
+        playlist.presets.swap(0, 1)
+        playlist.dirty_flag = True
+        await saving
+        assert playlist.dirty_flag
+        assert _names(read_journaled_playlist(platy)[0]) == "abcdef"
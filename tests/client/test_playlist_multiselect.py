@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""Tests for playlist marks, visual ranges and batch edits."""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from platyplaty.playlist import Playlist
+from platyplaty.playlist_delete_action import delete_from_playlist
+from platyplaty.playlist_reorder_actions import reorder_down, reorder_up
+from platyplaty.playlist_select_actions import (
+    clear_multiselect,
+    send_to_bottom,
+    send_to_top,
+    toggle_mark,
+    toggle_range,
+)
+from platyplaty.playlist_undo_actions import undo
+from platyplaty.preset_table import PresetTable
+from platyplaty.undo import UndoManager
+
+
+def _paths(names: str) -> list[Path]:
+    """Return one preset path per character of names."""
+    return [Path(f"/p/{name}.milk") for name in names]
+
+
+def _names(presets: PresetTable) -> str:
+    """Return the preset names of presets joined into one string."""
+    return "".join(path.stem for path in presets)
+
+
+@pytest.fixture
+def app() -> MagicMock:
+    """Create a mock PlatyplatyApp."""
+    return MagicMock()
+
+
+@pytest.fixture
+def ctx() -> MagicMock:
+    """Create a mock AppContext with a real playlist and undo manager."""
+    ctx = MagicMock()
+    ctx.current_focus = "playlist"
+    ctx.playlist = Playlist(_paths("abcdef"))
+    ctx.undo_manager = UndoManager()
+    ctx.autoplay_manager.autoplay_enabled = False
+    return ctx
+
+
+class TestTargetIndices:
+    """Which presets batch edits act on."""
+
+    def test_range_then_marks_then_selection(self) -> None:
+        """A visual range wins over marks, which win over the selection."""
+        playlist = Playlist(_paths("abcdef"))
+        playlist.set_selection(4)
+        assert playlist.target_indices() == [4]
+        playlist.toggle_mark(1)
+        playlist.toggle_mark(3)
+        assert playlist.target_indices() == [1, 3]
+        playlist.start_range()
+        playlist.set_selection(2)
+        assert playlist.target_indices() == [2, 3, 4]
+        assert playlist.in_multiselect(2) and not playlist.in_multiselect(1)
+        playlist.clear_range()
+        assert playlist.target_indices() == [1, 3]
+
+    def test_marks_follow_entries(self) -> None:
+        """Marks stay on their presets when others move."""
+        playlist = Playlist(_paths("abcd"))
+        playlist.toggle_mark(3)
+        playlist.move_preset_up(3)
+        assert playlist.marked == {2}
+
+
+class TestBlockMoves:
+    """Tests for moving several presets at once."""
+
+    def test_move_up_and_down(self) -> None:
+        """Runs move as blocks and stop at the ends."""
+        playlist = Playlist(_paths("abcdef"))
+        assert playlist.move_presets([0, 2, 3], -1)
+        assert _names(playlist.presets) == "acdbef"
+        assert playlist.move_presets([4, 5], 1) is False
+        assert playlist.move_presets([1, 2, 5], 1)
+        assert _names(playlist.presets) == "abcdef"
+
+    def test_move_to_edges(self) -> None:
+        """Presets keep their order when sent to the top or bottom."""
+        playlist = Playlist(_paths("abcdef"))
+        assert playlist.move_presets_to_edge([4, 1], top=True)
+        assert _names(playlist.presets) == "beacdf"
+        assert playlist.move_presets_to_edge([0, 1], top=True) is False
+        assert playlist.move_presets_to_edge([0, 1], top=False)
+        assert _names(playlist.presets) == "acdfbe"
+
+
+class TestBatchActions:
+    """Batch edits are single, undoable operations."""
+
+    @pytest.mark.asyncio
+    async def test_delete_marked(self, ctx: MagicMock, app: MagicMock) -> None:
+        """Marked presets are deleted together and undone together."""
+        playlist = ctx.playlist
+        playlist.set_playing(3)
+        await toggle_mark(ctx, app)
+        playlist.set_selection(3)
+        await toggle_mark(ctx, app)
+        assert playlist.get_selection() == 4
+        await delete_from_playlist(ctx, app)
+        assert _names(playlist.presets) == "bcef"
+        assert playlist.get_selection() == 0
+        assert playlist.get_playing() == 0
+        await undo(ctx, app)
+        assert _names(playlist.presets) == "abcdef"
+        assert not ctx.undo_manager.can_undo()
+
+    @pytest.mark.asyncio
+    async def test_delete_range_keeps_playing(
+        self, ctx: MagicMock, app: MagicMock
+    ) -> None:
+        """Deleting a range ends it; the playing preset is kept."""
+        playlist = ctx.playlist
+        playlist.set_playing(5)
+        playlist.set_selection(1)
+        await toggle_range(ctx, app)
+        playlist.set_selection(3)
+        await delete_from_playlist(ctx, app)
+        assert _names(playlist.presets) == "aef"
+        assert playlist.get_range() is None
+        assert playlist.get_selection() == 1
+        assert playlist.current() == Path("/p/f.milk")
+
+    @pytest.mark.asyncio
+    async def test_reorder_and_send_range(
+        self, ctx: MagicMock, app: MagicMock
+    ) -> None:
+        """Reorder keys move the range, which follows its presets."""
+        playlist = ctx.playlist
+        playlist.set_selection(2)
+        await toggle_range(ctx, app)
+        playlist.set_selection(3)
+        await reorder_up(ctx, app)
+        assert _names(playlist.presets) == "acdbef"
+        assert playlist.target_indices() == [1, 2]
+        await reorder_down(ctx, app)
+        await send_to_bottom(ctx, app)
+        assert _names(playlist.presets) == "abefcd"
+        await send_to_top(ctx, app)
+        assert _names(playlist.presets) == "cdabef"
+        await clear_multiselect(ctx, app)
+        assert playlist.target_indices() == [playlist.get_selection()]
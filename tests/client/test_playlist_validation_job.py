@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Tests for validating a loaded playlist in the background."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from platyplaty.playlist import Playlist
+from platyplaty.playlist_validation_actions import (
+    cancel_playlist_validation,
+    start_playlist_validation,
+)
+from platyplaty.playlist_validation_job import PlaylistValidation, priority_order
+from platyplaty.preset_table import PresetTable
+
+
+def _presets(tmp_path: Path, names: str) -> list[Path]:
+    """Return one preset path per character of names; uppercase are missing."""
+    paths = []
+    for name in names:
+        path = tmp_path / f"{name}.milk"
+        if name.islower():
+            path.write_text("")
+        paths.append(path)
+    return paths
+
+
+class TestPriorityOrder:
+    """Tests for priority_order."""
+
+    def test_nearest_first(self) -> None:
+        """Indices spread out from each position in turn."""
+        assert list(priority_order(8, [2, 6])) == [2, 6, 1, 3, 5, 7, 0, 4]
+
+    def test_no_positions(self) -> None:
+        """Without positions, or with out of range ones, order is ascending."""
+        assert list(priority_order(4, [])) == [0, 1, 2, 3]
+        assert list(priority_order(3, [9])) == [0, 1, 2]
+        assert list(priority_order(0, [0])) == []
+
+
+class TestPlaylistValidation:
+    """Tests for the PlaylistValidation job."""
+
+    def test_finds_broken_paths_once(self, tmp_path: Path) -> None:
+        """Each missing path is reported once, however often it occurs."""
+        paths = _presets(tmp_path, "aBcB")
+        job = PlaylistValidation(PresetTable(paths), [0], lambda: None)
+        assert job.wait(5)
+        assert job.take_broken() == [tmp_path / "B.milk"]
+        assert job.take_broken() == []
+
+    def test_collects_identities(self, tmp_path: Path) -> None:
+        """Each distinct path's identity is handed over, None if missing."""
+        paths = _presets(tmp_path, "aBa")
+        job = PlaylistValidation(PresetTable(paths), [0], lambda: None)
+        assert job.wait(5)
+        st = paths[0].stat()
+        assert dict(job.take_identities()) == {
+            str(paths[0]): (st.st_dev, st.st_ino),
+            str(paths[1]): None,
+        }
+        assert job.take_identities() == []
+
+    def test_nearby_presets_first(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Presets near the given positions are validated first."""
+        monkeypatch.setattr("platyplaty.playlist_validation_job._VALIDATE_CHUNK", 1)
+        monkeypatch.setattr(
+            "platyplaty.playlist_validation_job._pool", ThreadPoolExecutor(1)
+        )
+        order: list[str] = []
+
+        def record(path: Path) -> bool:
+            order.append(path.stem)
+            return True
+
+        monkeypatch.setattr("platyplaty.playlist_validation_job.is_valid_preset", record)
+        paths = _presets(tmp_path, "abcdefg")
+        assert PlaylistValidation(PresetTable(paths), [5], lambda: None).wait(5)
+        assert order == ["f", "e", "g", "d", "c", "b", "a"]
+
+    def test_cancel_stops_results(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A cancelled job reports nothing more."""
+        release = threading.Event()
+
+        def slow_validate(_path: Path) -> bool:
+            release.wait(5)
+            return False
+
+        monkeypatch.setattr(
+            "platyplaty.playlist_validation_job.is_valid_preset", slow_validate
+        )
+        calls: list[None] = []
+        job = PlaylistValidation(
+            PresetTable(_presets(tmp_path, "a")), [0], lambda: calls.append(None)
+        )
+        job.cancel()
+        release.set()
+        assert job.wait(5)
+        assert job.cancelled
+        assert calls == []
+
+
+class TestStartPlaylistValidation:
+    """Results are marked in the live playlist as they arrive."""
+
+    @pytest.mark.asyncio
+    async def test_marks_entries_by_path(self, tmp_path: Path) -> None:
+        """Broken presets are marked even after the playlist is reordered."""
+        ctx = MagicMock()
+        ctx.playlist = Playlist(_presets(tmp_path, "aBcB"))
+        app = MagicMock()
+        start_playlist_validation(ctx, app)
+        ctx.playlist.move_preset_up(1)
+        for _ in range(100):
+            if ctx.playlist.broken_indices:
+                break
+            await asyncio.sleep(0.01)
+        cancel_playlist_validation()
+        assert ctx.playlist.broken_indices == {0, 3}
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""Tests for the preset library index and its background scanner."""
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from platyplaty import preset_index
+from platyplaty.file_stat import invalidate_file_stat
+from platyplaty.preset_index import (
+    STATUS_INVALID,
+    STATUS_OK,
+    PresetIndex,
+    default_preset_index_path,
+    lookup_indexed,
+    set_active_index,
+)
+from platyplaty.preset_index_scan import refresh_index, start_index_refresh
+from platyplaty.preset_validator import is_valid_preset
+
+
+@pytest.fixture
+def index() -> Iterator[PresetIndex]:
+    """An in-memory index, unregistered after the test."""
+    idx = PresetIndex(":memory:")
+    yield idx
+    set_active_index(None)
+    idx.close()
+
+
+@pytest.fixture
+def library(tmp_path: Path) -> Path:
+    """A small preset library with a playlist and a symlink loop."""
+    root = tmp_path / "library"
+    (root / "artist" / "pack").mkdir(parents=True)
+    (root / "a.milk").write_text("preset a")
+    (root / "artist" / "b.MILK").write_text("preset b")
+    (root / "artist" / "pack" / "c.milk").write_text("preset a")
+    (root / "artist" / "notes.txt").write_text("ignored")
+    (root / "good.platy").write_text(f"{root / 'a.milk'}\n")
+    (root / "bad.platy").write_text("relative.milk\n")
+    (root / "artist" / "loop").symlink_to(root)
+    return root
+
+
+def _age_directories(root: Path) -> None:
+    """Backdate every directory under root, as if listed long ago."""
+    old = 1_000_000_000
+    for directory, _dirs, _files in os.walk(root):
+        os.utime(directory, (old, old))
+
+
+class TestRefreshIndex:
+    """Tests for building and refreshing the index."""
+
+    def test_indexes_presets_and_playlists(
+        self, index: PresetIndex, library: Path
+    ) -> None:
+        """Every .milk and .platy file is recorded once."""
+        result = refresh_index(index, [str(library)])
+        rows = index.rows_under(str(library))
+        assert sorted(Path(p).relative_to(library).as_posix() for p in rows) == [
+            "a.milk", "artist/b.MILK", "artist/pack/c.milk",
+            "bad.platy", "good.platy",
+        ]
+        assert result.scanned == 5
+        assert result.updated == 5
+
+    def test_records_stat_hash_and_status(
+        self, index: PresetIndex, library: Path
+    ) -> None:
+        """Rows carry the file's stat data, hash and parse status."""
+        refresh_index(index, [str(library)])
+        row = index.lookup(library / "a.milk")
+        assert row is not None
+        st = os.stat(library / "a.milk")
+        assert (row.dev, row.inode, row.size, row.mtime_ns) == (
+            st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns,
+        )
+        assert row.status == STATUS_OK
+        assert row.hash is not None
+        bad = index.lookup(library / "bad.platy")
+        good = index.lookup(library / "good.platy")
+        assert bad is not None and bad.status == STATUS_INVALID
+        assert good is not None and good.status == STATUS_OK
+
+    def test_identical_content_shares_hash(
+        self, index: PresetIndex, library: Path
+    ) -> None:
+        """Duplicate presets can be found by content hash."""
+        refresh_index(index, [str(library)])
+        row = index.lookup(library / "a.milk")
+        assert row is not None and row.hash is not None
+        assert index.paths_with_hash(row.hash) == [
+            str(library / "a.milk"), str(library / "artist/pack/c.milk"),
+        ]
+
+    def test_unchanged_files_are_skipped(
+        self, index: PresetIndex, library: Path
+    ) -> None:
+        """A second refresh re-reads only modified files."""
+        refresh_index(index, [str(library)])
+        (library / "a.milk").write_text("changed content")
+        result = refresh_index(index, [str(library)])
+        assert result.updated == 1
+        row = index.lookup(library / "a.milk")
+        assert row is not None and row.size == len("changed content")
+
+    def test_unchanged_directories_are_not_listed(
+        self, index: PresetIndex, library: Path
+    ) -> None:
+        """Only directories whose mtime changed are listed again."""
+        _age_directories(library)
+        refresh_index(index, [str(library)])
+        (library / "a.milk").write_text("edited in place")
+        (library / "artist" / "pack" / "d.milk").write_text("new")
+        result = refresh_index(index, [str(library)])
+        assert result.updated == 1
+        assert result.scanned == 6
+        row = index.lookup(library / "a.milk")
+        assert row is not None and row.size == len("preset a")
+
+    def test_recently_modified_directories_are_listed_again(
+        self, index: PresetIndex, library: Path
+    ) -> None:
+        """A directory changed just before a refresh is listed next time."""
+        refresh_index(index, [str(library)])
+        (library / "a.milk").write_text("edited in place")
+        assert refresh_index(index, [str(library)]).updated == 1
+
+    def test_removed_files_are_dropped(
+        self, index: PresetIndex, library: Path
+    ) -> None:
+        """Rows for deleted files are removed."""
+        refresh_index(index, [str(library)])
+        (library / "artist" / "b.MILK").unlink()
+        result = refresh_index(index, [str(library)])
+        assert result.removed == 1
+        assert index.lookup(library / "artist" / "b.MILK") is None
+
+    def test_unconfigured_roots_are_dropped(
+        self, index: PresetIndex, library: Path, tmp_path: Path
+    ) -> None:
+        """Directories removed from the config leave the index."""
+        refresh_index(index, [str(library)])
+        refresh_index(index, [str(tmp_path / "elsewhere")])
+        assert index.lookup(library / "a.milk") is None
+
+    def test_background_refresh(self, index: PresetIndex, library: Path) -> None:
+        """start_index_refresh runs the refresh on a worker."""
+        result = start_index_refresh(index, [str(library)]).result(10)
+        assert result.scanned == 5
+
+
+class TestQueries:
+    """Tests for index queries."""
+
+    def test_search_is_case_insensitive(
+        self, index: PresetIndex, library: Path
+    ) -> None:
+        """Search matches any part of the path."""
+        refresh_index(index, [str(library)])
+        assert index.search("B.milk") == [str(library / "artist" / "b.MILK")]
+
+    def test_search_treats_wildcards_literally(
+        self, index: PresetIndex, tmp_path: Path
+    ) -> None:
+        """% and _ in the query are not LIKE wildcards."""
+        (tmp_path / "100%_fun.milk").write_text("x")
+        (tmp_path / "100x.milk").write_text("x")
+        refresh_index(index, [str(tmp_path)])
+        assert index.search("100%_") == [str(tmp_path / "100%_fun.milk")]
+
+    def test_count_under_is_recursive(
+        self, index: PresetIndex, library: Path
+    ) -> None:
+        """Counts include files at any depth, but not sibling prefixes."""
+        refresh_index(index, [str(library)])
+        assert index.count_under(library / "artist") == 2
+        assert index.count_under(library / "art") == 0
+        assert index.count_under(library) == 5
+
+    def test_schema_change_rebuilds(self, tmp_path: Path) -> None:
+        """An index with another schema version is discarded."""
+        db = tmp_path / "index.sqlite3"
+        idx = PresetIndex(db)
+        idx._conn.execute("PRAGMA user_version = 999")
+        idx.close()
+        idx = PresetIndex(db)
+        assert idx.lookup("/nothing") is None
+        idx.close()
+
+    def test_default_path_uses_xdg_cache_home(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """The database lives under $XDG_CACHE_HOME/platyplaty."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert default_preset_index_path() == (
+            tmp_path / "platyplaty" / preset_index.INDEX_FILENAME
+        )
+
+
+class TestActiveIndexConsumers:
+    """Tests for code that consults the active index."""
+
+    def test_validator_uses_indexed_status(
+        self, index: PresetIndex, library: Path
+    ) -> None:
+        """Indexed files are judged by their status without opening them."""
+        refresh_index(index, [str(library)])
+        set_active_index(index)
+        invalidate_file_stat()
+        assert is_valid_preset(library / "a.milk")
+        assert not is_valid_preset(library / "bad.platy")
+
+    def test_validator_checks_files_changed_since_indexing(
+        self, index: PresetIndex, library: Path
+    ) -> None:
+        """A deleted or replaced file is not judged by its stale row."""
+        refresh_index(index, [str(library)])
+        set_active_index(index)
+        (library / "a.milk").unlink()
+        (library / "bad.platy").unlink()
+        (library / "bad.platy").write_text(f"{library / 'a.milk'}\n")
+        invalidate_file_stat()
+        assert not is_valid_preset(library / "a.milk")
+        assert is_valid_preset(library / "bad.platy")
+        invalidate_file_stat()
+
+    def test_chmod_since_indexing_is_checked_live(
+        self, index: PresetIndex, library: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A mode change invalidates the row, so readability is rechecked."""
+        refresh_index(index, [str(library)])
+        set_active_index(index)
+        (library / "a.milk").chmod(0o000)
+        invalidate_file_stat()
+        assert lookup_indexed(library / "a.milk") is None
+        monkeypatch.setattr(
+            "platyplaty.preset_validator.is_readable", lambda _path: False
+        )
+        assert not is_valid_preset(library / "a.milk")
+        invalidate_file_stat()
+
+    def test_validator_falls_back_for_unindexed_paths(
+        self, index: PresetIndex, tmp_path: Path
+    ) -> None:
+        """Paths outside the index are checked on the filesystem."""
+        set_active_index(index)
+        assert not is_valid_preset(tmp_path / "missing.milk")
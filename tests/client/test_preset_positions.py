@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Tests for the path to positions index of PresetTable."""
+
+import random
+from pathlib import Path
+
+import pytest
+
+from platyplaty.playlist import Playlist
+from platyplaty.playlist_action_helpers import find_preset_index
+from platyplaty.preset_table import PresetTable
+
+A = Path("/presets/a.milk")
+B = Path("/presets/b.milk")
+C = Path("/presets/c.milk")
+
+
+def _expected(paths: list[Path], value: Path) -> list[int]:
+    """Return the positions of value in paths, found by scanning."""
+    return [i for i, path in enumerate(paths) if path == value]
+
+
+class TestPositions:
+    """The index agrees with a linear scan."""
+
+    def test_lookups(self) -> None:
+        """positions, index, count and in use the index."""
+        table = PresetTable([A, B, A, C, A])
+        assert list(table.positions(A)) == [0, 2, 4]
+        assert table.index(A, 1) == 2
+        assert table.index(A, -1) == 4
+        assert table.count(A) == 3
+        assert B in table
+        assert list(table.positions(Path("/nowhere.milk"))) == []
+        assert list(table.distinct()) == [A, B, C]
+
+    def test_random_edits(self) -> None:
+        """Swaps update the index; other edits rebuild it."""
+        rng = random.Random(7)
+        pool = [Path(f"/p/{i}.milk") for i in range(6)]
+        table = PresetTable(rng.choice(pool) for _ in range(40))
+        mirror = list(table)
+        for step in range(300):
+            i, j = rng.randrange(len(mirror)), rng.randrange(len(mirror))
+            if step % 10 == 0:
+                del table[i]
+                del mirror[i]
+                table.append(pool[j % len(pool)])
+                mirror.append(pool[j % len(pool)])
+            else:
+                table.swap(i, j)
+                mirror[i], mirror[j] = mirror[j], mirror[i]
+            value = pool[step % len(pool)]
+            assert list(table.positions(value)) == _expected(mirror, value)
+
+    def test_edits_update_index_in_place(self) -> None:
+        """Inserts, appends, extends and deletes keep the index correct."""
+        rng = random.Random(11)
+        pool = [Path(f"/p/{i}.milk") for i in range(20)]
+        mirror = [rng.choice(pool) for _ in range(2000)]
+        table = PresetTable(mirror)
+        table.count(pool[0])
+        index = table._index
+        assert index is not None
+        for step in range(200):
+            i = rng.randrange(len(mirror))
+            value = rng.choice(pool)
+            kind = step % 7
+            if kind == 0:
+                table.insert(i, value)
+                mirror.insert(i, value)
+            elif kind == 1:
+                table.append(value)
+                mirror.append(value)
+            elif kind == 2:
+                new = [rng.choice(pool) for _ in range(rng.randrange(1, 30))]
+                table.extend(new)
+                mirror.extend(new)
+            elif kind == 3:
+                del table[i]
+                del mirror[i]
+            elif kind == 4:
+                new = [rng.choice(pool) for _ in range(rng.randrange(4))]
+                table[i:i + 3] = new
+                mirror[i:i + 3] = new
+            elif kind == 5:
+                table[i] = value
+                mirror[i] = value
+            else:
+                doomed = rng.sample(range(len(mirror)), 5)
+                table.delete_indices(doomed)
+                mirror = [p for n, p in enumerate(mirror) if n not in doomed]
+            assert list(table.positions(value)) == _expected(mirror, value)
+        assert table._index is index
+        for value in pool:
+            assert list(table.positions(value)) == _expected(mirror, value)
+
+    def test_index_stop_bound(self) -> None:
+        """index() honours its stop argument."""
+        table = PresetTable([A, B, A])
+        with pytest.raises(ValueError):
+            table.index(A, 1, 2)
+
+
+class TestFindPresetIndex:
+    """find_preset_index prefers the playing entry."""
+
+    def test_prefers_playing_duplicate(self) -> None:
+        """The playing copy of a duplicate wins over the first."""
+        playlist = Playlist([A, B, A])
+        playlist.set_playing(2)
+        assert find_preset_index(playlist, A) == 2
+        playlist.set_playing(1)
+        assert find_preset_index(playlist, A) == 0
+        assert find_preset_index(playlist, C) is None
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Tests for the array-backed preset table."""
+
+import random
+from pathlib import Path
+
+import pytest
+
+from platyplaty.playlist import Playlist
+from platyplaty.preset_table import BROKEN, FlagSet, PresetTable, common_affixes
+
+A = Path("/presets/a.milk")
+B = Path("/presets/b.milk")
+C = Path("/presets/c.milk")
+
+
+class TestPresetTable:
+    """PresetTable behaves like a list of paths."""
+
+    def test_list_behaviour(self) -> None:
+        """Indexing, slicing, mutation and search match list[Path]."""
+        table = PresetTable([A, B, A])
+        assert len(table) == 3
+        assert table[1] == B
+        assert table[-1] == A
+        assert table == [A, B, A]
+        table.insert(1, C)
+        table.append(B)
+        del table[0]
+        assert table == [C, B, A, B]
+        assert table.index(B) == 1
+        assert table.index(B, 2) == 3
+        assert table.count(B) == 2
+        assert C in table and Path("/other.milk") not in table
+        assert list(reversed(table)) == [B, A, B, C]
+
+    def test_mismatched_assignment(self) -> None:
+        """A Path needs an index and an iterable needs a slice."""
+        table = PresetTable([A, B])
+        with pytest.raises(TypeError):
+            table[0:1] = A  # type: ignore[call-overload]
+        with pytest.raises(TypeError):
+            table[0] = [A]  # type: ignore[call-overload]
+        assert table == [A, B]
+
+    def test_paths_are_interned(self) -> None:
+        """Repeated paths share one pooled string."""
+        table = PresetTable([A, B, A, A])
+        assert table.path_string(0) is table.path_string(3)
+        assert table.strings() == [str(A), str(B), str(A), str(A)]
+
+    def test_slices_and_concatenation(self) -> None:
+        """Slices and sums are tables over the same pool."""
+        table = PresetTable([A, B, C])
+        joined = table[:1] + [C] + table[2:]
+        assert isinstance(joined, PresetTable)
+        assert joined == [A, C, C]
+        assert (A, B) + table[2:] == [A, B, C]
+
+    def test_from_strings(self) -> None:
+        """Tables can be built from path strings."""
+        assert PresetTable.from_strings([str(A), str(B)]) == [A, B]
+        table = PresetTable([C])
+        table.extend_strings([str(A)])
+        assert table == [C, A]
+        assert table.key_at(1) != table.key_at(0)
+
+
+class TestFlags:
+    """Entry flags are stored per entry and move with it."""
+
+    def test_flags_follow_entries(self) -> None:
+        """Deletes, swaps and shuffles carry the flags along."""
+        table = PresetTable([A, B, C])
+        table.set_flag(2, BROKEN)
+        table.swap(1, 2)
+        assert list(table.flagged(BROKEN)) == [1]
+        del table[0]
+        assert list(table.flagged(BROKEN)) == [0]
+        table.extend([A] * 50)
+        table.shuffle(random.Random(1))
+        assert [table[i] for i in table.flagged(BROKEN)] == [C]
+
+    def test_flag_set_view(self) -> None:
+        """FlagSet reads and writes the flags as a set of indices."""
+        table = PresetTable([A, B, C])
+        broken = FlagSet(table, BROKEN)
+        broken.add(0)
+        broken.add(2)
+        assert broken == {0, 2}
+        assert 5 not in broken
+        broken.discard(0)
+        assert broken == {2}
+        broken.clear()
+        assert len(broken) == 0
+
+
+class TestPlaylistIntegration:
+    """Playlist keeps its list-and-set API on top of the table."""
+
+    def test_assigned_lists_are_converted(self) -> None:
+        """Assigning a list of paths stores a table."""
+        playlist = Playlist([A])
+        playlist.presets = [B, C]
+        assert isinstance(playlist.presets, PresetTable)
+        assert playlist.presets == [B, C]
+
+    def test_broken_indices_follow_moves(self) -> None:
+        """Broken indices track reorders and removals."""
+        playlist = Playlist([A, B, C])
+        playlist.broken_indices = {0}
+        playlist.move_preset_down(0)
+        assert playlist.broken_indices == {1}
+        playlist.remove_preset(0)
+        assert playlist.broken_indices == {0}
+
+
+class TestCommonAffixes:
+    """Tests for common_affixes."""
+
+    def test_tables_and_tuples(self) -> None:
+        """Head and tail are found for tables and plain sequences alike."""
+        table = PresetTable([A, B, C, A])
+        edited = table.copy()
+        edited.swap(1, 2)
+        assert common_affixes(table, edited) == (1, 1)
+        assert common_affixes((A, B), table) == (2, 0)
+        assert common_affixes(table, table.copy()) == (4, 0)
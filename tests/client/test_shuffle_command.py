@@ -9,96 +9,71 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
+from platyplaty.playlist import Playlist
+
+PRESETS = [Path(f"/{name}.milk") for name in "abcdefgh"]
+
+
+@pytest.fixture
+def playlist() -> Playlist:
+    """Create a Playlist with presets."""
+    return Playlist(list(PRESETS))
+
+
+@pytest.fixture
+def mock_ctx(playlist: Playlist) -> MagicMock:
+    """Create a mock AppContext."""
+    ctx = MagicMock()
+    ctx.playlist = playlist
+    return ctx
+
 
 class TestShufflePreservesSelection:
     """Tests for shuffle preserving selection."""
 
-    @pytest.fixture
-    def mock_playlist(self):
-        """Create a mock Playlist with presets."""
-        playlist = MagicMock()
-        playlist.presets = [
-            Path("/a.milk"),
-            Path("/b.milk"),
-            Path("/c.milk"),
-        ]
-        playlist.get_selection.return_value = 1  # /b.milk selected
-        playlist.get_playing.return_value = None
-        return playlist
-
-    @pytest.fixture
-    def mock_ctx(self, mock_playlist):
-        """Create a mock AppContext."""
-        ctx = MagicMock()
-        ctx.playlist = mock_playlist
-        return ctx
-
     @pytest.mark.asyncio
     async def test_shuffle_preserves_selected_preset(
-        self, mock_ctx, mock_playlist
-    ):
+        self, mock_ctx: MagicMock, playlist: Playlist
+    ) -> None:
         """Shuffle keeps the same preset selected."""
         from platyplaty.commands.shuffle_playlist import execute
 
-        # After shuffle, presets list is reordered
-        def reorder_presets():
-            mock_playlist.presets = [
-                Path("/c.milk"),
-                Path("/a.milk"),
-                Path("/b.milk"),
-            ]
+        playlist.set_selection(1)
+        with patch("platyplaty.commands.shuffle_playlist.push_undo_snapshot"):
+            await execute(mock_ctx)
+
+        assert playlist.presets[playlist.get_selection()] == PRESETS[1]
 
-        mock_playlist.shuffle.side_effect = reorder_presets
+    @pytest.mark.asyncio
+    async def test_shuffle_tracks_duplicates_by_entry(
+        self, mock_ctx: MagicMock, playlist: Playlist
+    ) -> None:
+        """With repeated paths, the selected entry itself stays selected."""
+        from platyplaty.commands.shuffle_playlist import execute
 
+        playlist.presets = [PRESETS[0]] * 8
+        playlist.set_selection(5)
+        key = playlist.presets.key_at(5)
         with patch("platyplaty.commands.shuffle_playlist.push_undo_snapshot"):
             await execute(mock_ctx)
 
-        # /b.milk was at index 1, now at index 2
-        mock_playlist.set_selection.assert_called_with(2)
+        assert playlist.presets.key_at(playlist.get_selection()) == key
 
 
 class TestShufflePreservesPlaying:
     """Tests for shuffle preserving playing state."""
 
-    @pytest.fixture
-    def mock_playlist(self):
-        """Create a mock Playlist with presets."""
-        playlist = MagicMock()
-        playlist.presets = [
-            Path("/a.milk"),
-            Path("/b.milk"),
-            Path("/c.milk"),
-        ]
-        playlist.get_selection.return_value = 0
-        playlist.get_playing.return_value = 2  # /c.milk playing
-        return playlist
-
-    @pytest.fixture
-    def mock_ctx(self, mock_playlist):
-        """Create a mock AppContext."""
-        ctx = MagicMock()
-        ctx.playlist = mock_playlist
-        return ctx
-
     @pytest.mark.asyncio
     async def test_shuffle_preserves_playing_preset(
-        self, mock_ctx, mock_playlist
-    ):
+        self, mock_ctx: MagicMock, playlist: Playlist
+    ) -> None:
         """Shuffle keeps the same preset playing."""
         from platyplaty.commands.shuffle_playlist import execute
 
-        # After shuffle, presets list is reordered
-        def reorder_presets():
-            mock_playlist.presets = [
-                Path("/c.milk"),
-                Path("/a.milk"),
-                Path("/b.milk"),
-            ]
-
-        mock_playlist.shuffle.side_effect = reorder_presets
-
+        playlist.set_playing(2)
         with patch("platyplaty.commands.shuffle_playlist.push_undo_snapshot"):
             await execute(mock_ctx)
 
-        # /c.milk was at index 2, now at index 0
-        mock_playlist.set_playing.assert_called_with(0)
+        playing = playlist.get_playing()
+        assert playing is not None
+        assert playlist.presets[playing] == PRESETS[2]
@@ -47,7 +47,7 @@ class TestCreatePlaylist:
         playlist_file = tmp_path / "test.platy"
         playlist_file.write_text(f"{preset}\n")
         playlist = _create_playlist(playlist_file)
-        assert playlist._selection_index == 0
+        assert playlist.get_selection() == 0
 
     def test_valid_playlist_sets_playing_index_zero(
         self, tmp_path: Path
@@ -58,7 +58,7 @@ class TestCreatePlaylist:
         playlist_file = tmp_path / "test.platy"
         playlist_file.write_text(f"{preset}\n")
         playlist = _create_playlist(playlist_file)
-        assert playlist._playing_index == 0
+        assert playlist.get_playing() == 0
 
     def test_nonexistent_file_raises_startup_error(self) -> None:
         """Nonexistent playlist file raises StartupError."""
@@ -72,4 +72,4 @@ class TestCreatePlaylist:
         playlist_file.write_text("")
         playlist = _create_playlist(playlist_file)
         assert len(playlist.presets) == 0
-        assert playlist._playing_index is None
+        assert playlist.get_playing() is None
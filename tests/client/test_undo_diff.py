@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Tests for diff-based undo storage and coalescing."""
+
+from pathlib import Path
+
+import pytest
+
+from platyplaty import undo as undo_module
+from platyplaty.playlist import Playlist
+from platyplaty.playlist_snapshot import create_snapshot, restore_snapshot
+from platyplaty.undo import UndoManager
+
+
+def _playlist(size: int) -> Playlist:
+    """Return a playlist of size distinct presets."""
+    return Playlist([Path(f"/presets/{i}.milk") for i in range(size)])
+
+
+def _edit(
+    manager: UndoManager, playlist: Playlist, kind: str | None = None
+) -> None:
+    """Push the current state, then move the selected preset up."""
+    manager.push_undo(create_snapshot(playlist), kind)
+    index = playlist.get_selection()
+    playlist.move_preset_up(index)
+    playlist.set_selection(index - 1)
+
+
+def _undo(manager: UndoManager, playlist: Playlist) -> bool:
+    """Undo one step, returning False if there was none."""
+    previous = manager.undo(create_snapshot(playlist))
+    if previous is None:
+        return False
+    restore_snapshot(playlist, previous)
+    return True
+
+
+class TestDiffStorage:
+    """Undo steps store only the presets that changed."""
+
+    def test_reorders_store_few_paths(self) -> None:
+        """Many reorders of a long playlist hold two paths per step."""
+        playlist = _playlist(10000)
+        playlist.set_selection(9999)
+        manager = UndoManager()
+        for _ in range(100):
+            _edit(manager, playlist)
+        manager.push_undo(create_snapshot(playlist))
+        usage = manager.memory_usage()
+        assert usage.steps == 100
+        assert usage.paths == 100 * 4 + 10000
+
+    def test_undo_and_redo_round_trip(self) -> None:
+        """Undoing every step restores the original playlist, redo replays it."""
+        playlist = _playlist(50)
+        playlist.set_selection(49)
+        original = list(playlist.presets)
+        manager = UndoManager()
+        for _ in range(10):
+            _edit(manager, playlist)
+        edited = list(playlist.presets)
+        while _undo(manager, playlist):
+            pass
+        assert playlist.presets == original
+        assert playlist.get_selection() == 49
+        while manager.can_redo():
+            nxt = manager.redo(create_snapshot(playlist))
+            assert nxt is not None
+            restore_snapshot(playlist, nxt)
+        assert playlist.presets == edited
+
+    def test_length_changes(self) -> None:
+        """Adds and removes are undone at the right position."""
+        playlist = _playlist(5)
+        manager = UndoManager()
+        manager.push_undo(create_snapshot(playlist))
+        playlist.remove_preset(2)
+        manager.push_undo(create_snapshot(playlist))
+        playlist.add_preset(Path("/presets/new.milk"))
+        assert _undo(manager, playlist)
+        assert len(playlist.presets) == 4
+        assert _undo(manager, playlist)
+        assert playlist.presets == _playlist(5).presets
+
+
+class TestCoalescing:
+    """Repeated edits of the same kind share one undo step."""
+
+    def test_repeated_reorders_coalesce(self) -> None:
+        """A burst of reorder_up is undone in one step."""
+        playlist = _playlist(10)
+        playlist.set_selection(9)
+        manager = UndoManager()
+        for _ in range(5):
+            _edit(manager, playlist, "reorder_up")
+        assert _undo(manager, playlist)
+        assert playlist.presets == _playlist(10).presets
+        assert playlist.get_selection() == 9
+        assert not manager.can_undo()
+
+    def test_other_kinds_break_the_burst(self) -> None:
+        """A different kind of edit starts a new step."""
+        playlist = _playlist(10)
+        playlist.set_selection(9)
+        manager = UndoManager()
+        _edit(manager, playlist, "reorder_up")
+        _edit(manager, playlist, "reorder_down")
+        _edit(manager, playlist, "reorder_up")
+        steps = 0
+        while _undo(manager, playlist):
+            steps += 1
+        assert steps == 3
+
+    def test_pause_breaks_the_burst(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Edits further apart than COALESCE_SECONDS are separate steps."""
+        clock = iter([0.0, undo_module.COALESCE_SECONDS + 1])
+        monkeypatch.setattr(undo_module.time, "monotonic", lambda: next(clock))
+        playlist = _playlist(10)
+        playlist.set_selection(9)
+        manager = UndoManager()
+        _edit(manager, playlist, "reorder_up")
+        _edit(manager, playlist, "reorder_up")
+        assert _undo(manager, playlist)
+        assert manager.can_undo()
+
+    def test_unnamed_edits_never_coalesce(self) -> None:
+        """Edits without a kind are always separate steps."""
+        playlist = _playlist(10)
+        playlist.set_selection(9)
+        manager = UndoManager()
+        _edit(manager, playlist)
+        _edit(manager, playlist)
+        assert _undo(manager, playlist)
+        assert manager.can_undo()
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""Integration tests for build_file_preview delegation to playlist preview.
+
+Tests that build_file_preview correctly delegates .platy files to
+build_playlist_preview instead of treating them as generic text files.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from platyplaty.ui.file_browser_file_preview import build_file_preview
+from platyplaty.ui.file_browser_types import RightPanePlaylistPreview
+
+
+class TestBuildFilePreviewDelegation:
+    """Integration tests for build_file_preview delegating to build_playlist_preview."""
+
+    def test_platy_lowercase_delegates(self, tmp_path: Path) -> None:
+        """build_file_preview delegates .platy files to build_playlist_preview."""
+        platy_file = tmp_path / "test.platy"
+        platy_file.write_text("/home/user/a.milk\n")
+        result = build_file_preview(platy_file, 19)
+        assert isinstance(result, RightPanePlaylistPreview)
+        assert result.names == ("a.milk",)
+
+    def test_platy_uppercase_delegates(self, tmp_path: Path) -> None:
+        """build_file_preview delegates .PLATY files to build_playlist_preview."""
+        platy_file = tmp_path / "test.PLATY"
+        platy_file.write_text("/home/user/b.milk\n")
+        result = build_file_preview(platy_file, 19)
+        assert isinstance(result, RightPanePlaylistPreview)
+        assert result.names == ("b.milk",)
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""Error case tests for build_playlist_preview function.
+
+Tests error handling: permission denied, file not found, and binary content.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from platyplaty.ui.file_browser_playlist_preview import build_playlist_preview
+from platyplaty.ui.file_browser_types import RightPaneBinaryFile
+
+
+class TestPermissionDenied:
+    """Tests for build_playlist_preview with permission denied."""
+
+    def test_permission_denied_returns_none(self, tmp_path: Path) -> None:
+        """Permission denied returns None."""
+        platy_file = tmp_path / "secret.platy"
+        platy_file.write_text("/home/user/a.milk\n")
+        with patch("pathlib.Path.open") as mock_open:
+            mock_open.side_effect = PermissionError()
+            result = build_playlist_preview(platy_file, 10)
+            assert result is None
+
+
+class TestFileNotFound:
+    """Tests for build_playlist_preview when file vanishes."""
+
+    def test_file_not_found_returns_none(self, tmp_path: Path) -> None:
+        """File not found (race condition) returns None."""
+        result = build_playlist_preview(tmp_path / "vanished.platy", 10)
+        assert result is None
+
+
+class TestBinaryContent:
+    """Tests for build_playlist_preview with binary content."""
+
+    def test_binary_returns_binary_file(self, tmp_path: Path) -> None:
+        """Binary content returns RightPaneBinaryFile."""
+        platy_file = tmp_path / "binary.platy"
+        platy_file.write_bytes(b"\xff\xfe\x00\x01")
+        result = build_playlist_preview(platy_file, 10)
+        assert isinstance(result, RightPaneBinaryFile)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Unit tests for the shared cell width measurement module."""
+
+from rich.cells import cell_len
+
+from platyplaty.ui.cell_width import (
+    cell_width,
+    first_char_to_width,
+    pad_to_width,
+    prefix_widths,
+    truncate_left_to_width,
+    truncate_to_width,
+)
+from platyplaty.ui.path_truncation import truncate_final_component
+from platyplaty.ui.path_types import PathComponent, PathComponentType
+from platyplaty.ui.truncation import truncate_simple
+from platyplaty.ui.truncation_filename import truncate_filename_with_extension
+from platyplaty.ui.truncation_file_indicator import truncate_file_with_indicator
+
+
+class TestCellWidth:
+    """Tests for cell_width."""
+
+    def test_ascii_is_length(self) -> None:
+        """ASCII strings are one cell per character."""
+        assert cell_width("preset.milk") == 11
+
+    def test_cjk_is_double_width(self) -> None:
+        """CJK characters occupy two cells each."""
+        assert cell_width("日本語") == 6
+
+    def test_matches_rich(self) -> None:
+        """Non-ASCII widths agree with rich."""
+        text = "Geiss — 夢 🎵.milk"
+        assert cell_width(text) == cell_len(text)
+
+
+class TestPrefixWidths:
+    """Tests for prefix_widths."""
+
+    def test_starts_at_zero_and_accumulates(self) -> None:
+        """Element i is the width of text[:i]."""
+        assert prefix_widths("a日b") == (0, 1, 3, 4)
+
+
+class TestTruncateToWidth:
+    """Tests for truncate_to_width."""
+
+    def test_ascii_slices(self) -> None:
+        """ASCII text is sliced by character count."""
+        assert truncate_to_width("abcdef", 3) == "abc"
+
+    def test_never_splits_wide_character(self) -> None:
+        """A wide character that would overflow is dropped whole."""
+        assert truncate_to_width("日本語", 5) == "日本"
+
+    def test_fits_returns_text(self) -> None:
+        """Text that fits is returned unchanged."""
+        assert truncate_to_width("日本", 4) == "日本"
+
+    def test_zero_width(self) -> None:
+        """Zero width yields an empty string."""
+        assert truncate_to_width("日本", 0) == ""
+
+
+class TestTruncateLeftToWidth:
+    """Tests for truncate_left_to_width."""
+
+    def test_ascii_keeps_suffix(self) -> None:
+        """ASCII text keeps its last characters."""
+        assert truncate_left_to_width("abcdef", 3) == "def"
+
+    def test_never_splits_wide_character(self) -> None:
+        """A wide character that would overflow is dropped whole."""
+        assert truncate_left_to_width("日本語", 5) == "本語"
+        assert truncate_left_to_width("日本", 4) == "日本"
+        assert truncate_left_to_width("日本", 0) == ""
+
+
+class TestFirstCharToWidth:
+    """Tests for first_char_to_width."""
+
+    def test_narrow_first_char(self) -> None:
+        """A single-cell first character is returned as-is."""
+        assert first_char_to_width("abc", 1) == "a"
+
+    def test_wide_first_char(self) -> None:
+        """A wide first character fits two cells but not one."""
+        assert first_char_to_width("日本", 2) == "日"
+        assert first_char_to_width("日本", 1) == "…"
+        assert first_char_to_width("日本", 0) == ""
+
+
+class TestPadToWidth:
+    """Tests for pad_to_width."""
+
+    def test_pads_by_cells(self) -> None:
+        """Padding counts display cells, not characters."""
+        assert pad_to_width("日本", 6) == "日本  "
+
+
+class TestTruncationUsesCellWidth:
+    """Truncation functions measure display cells."""
+
+    def test_truncate_simple_cjk(self) -> None:
+        """Wide names are cut to fit their cell budget."""
+        result = truncate_simple("日本語の名前", 7)
+        assert result == "日本語~"
+        assert cell_width(result) <= 7
+
+    def test_file_indicator_alignment_cjk(self) -> None:
+        """Right-justified size ends exactly at the pane width."""
+        result = truncate_file_with_indicator("夢の中.milk", "1 K", 20)
+        assert cell_width(result) == 20
+        assert result.endswith("1 K")
+
+    def test_narrow_widths_wide_first_char(self) -> None:
+        """Fallbacks at widths 1 to 4 never overflow on a wide first char."""
+        for width in range(1, 5):
+            assert cell_width(truncate_simple("夢の中", width)) <= width
+            result = truncate_filename_with_extension("夢の中", ".milk", width)
+            assert cell_width(result) <= width
+        assert truncate_filename_with_extension("夢の中", ".milk", 2) == "…~"
+        assert truncate_filename_with_extension("夢の中", ".milk", 5) == "夢~.~"
+
+    def test_path_component_wide_first_char(self) -> None:
+        """A final path component cut below two cells keeps its tilde."""
+        component = PathComponent("夢の中", PathComponentType.DIRECTORY, False)
+        assert truncate_final_component(component, 1).name == "…~"
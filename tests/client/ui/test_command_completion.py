@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""Tests for Tab completion of command prompt path arguments."""
+
+import asyncio
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from platyplaty.ui.command_completion import CommandCompleter
+from platyplaty.ui.command_completion_match import (
+    completion_target,
+    matching_names,
+)
+from platyplaty.ui.completion_listing import (
+    clear_completion_listings,
+    get_completion_listing,
+    prefetch_completion_listing,
+    seed_completion_listing,
+    wait_for_pending_listings,
+)
+from platyplaty.ui.directory import list_directory
+
+
+@pytest.fixture(autouse=True)
+def _fresh_listings() -> Iterator[None]:
+    """Start and end every test with no cached listings."""
+    clear_completion_listings()
+    yield
+    clear_completion_listings()
+
+
+@pytest.fixture
+def library(tmp_path: Path) -> Path:
+    """A directory with subdirectories, playlists, presets and a dotfile."""
+    (tmp_path / "ambient").mkdir()
+    (tmp_path / "amber").mkdir()
+    (tmp_path / "techno").mkdir()
+    (tmp_path / ".hidden").mkdir()
+    (tmp_path / "techno.platy").write_text("")
+    (tmp_path / "tech.milk").write_text("")
+    return tmp_path
+
+
+def _prompt(text: str) -> MagicMock:
+    """Return a fake prompt showing text with the cursor at its end."""
+    prompt = MagicMock()
+    prompt.input_text = text
+    prompt.cursor_index = len(text)
+    prompt.has_class.return_value = True
+
+    def move_cursor(index: int) -> None:
+        prompt.cursor_index = index
+
+    prompt.update_cursor_with_scroll.side_effect = move_cursor
+    return prompt
+
+
+def _tab(completer: CommandCompleter) -> str:
+    """Press Tab and return the resulting prompt text."""
+    assert completer.handle_key("tab")
+    return completer.prompt.input_text
+
+
+class TestCompletionTarget:
+    """Tests for completion_target."""
+
+    def test_relative_argument(self, tmp_path: Path) -> None:
+        """A bare name completes in the base directory."""
+        target = completion_target("cd amb", tmp_path)
+        assert target is not None
+        assert (target.head, target.stem) == ("cd ", "amb")
+        assert target.directory == tmp_path
+        assert target.directories_only
+
+    def test_nested_and_home_arguments(self, tmp_path: Path) -> None:
+        """The directory part is expanded, but kept as typed."""
+        target = completion_target("load ~/lists/fa", tmp_path)
+        assert target is not None
+        assert target.head == "load ~/lists/"
+        assert target.directory == Path.home() / "lists"
+        assert not target.directories_only
+
+    def test_other_commands_are_not_completed(self, tmp_path: Path) -> None:
+        """Only :cd, :load and :save arguments complete."""
+        assert completion_target("shuffle x", tmp_path) is None
+        assert completion_target("load", tmp_path) is None
+
+    def test_undefined_variable(self, tmp_path: Path) -> None:
+        """An unexpandable directory part offers no completion."""
+        assert completion_target("cd $PLATYPLATY_UNSET_VAR/x", tmp_path) is None
+
+
+class TestMatchingNames:
+    """Tests for matching_names."""
+
+    def test_cd_offers_directories_only(self, library: Path) -> None:
+        """:cd completes directories, with a trailing slash."""
+        target = completion_target("cd tech", library)
+        assert target is not None
+        names = matching_names(list_directory(library), target)
+        assert names == ["techno/"]
+
+    def test_load_offers_playlists_and_directories(self, library: Path) -> None:
+        """:load completes directories and .platy files, not presets."""
+        target = completion_target("load tech", library)
+        assert target is not None
+        names = matching_names(list_directory(library), target)
+        assert names == ["techno/", "techno.platy"]
+
+    def test_hidden_entries_need_a_dot(self, library: Path) -> None:
+        """Dot entries are only offered for a stem starting with '.'."""
+        listing = list_directory(library)
+        everything = completion_target("cd ", library)
+        dotted = completion_target("cd .", library)
+        assert everything is not None and dotted is not None
+        assert ".hidden/" not in matching_names(listing, everything)
+        assert matching_names(listing, dotted) == [".hidden/"]
+
+
+class TestCompletionListing:
+    """Tests for the background listing cache."""
+
+    def test_prefetch_reads_in_background(self, library: Path) -> None:
+        """A prefetched listing becomes available without blocking."""
+        future = prefetch_completion_listing(library)
+        assert future is not None
+        future.result(10)
+        listing = get_completion_listing(library)
+        assert listing is not None
+        assert prefetch_completion_listing(library) is None
+
+    def test_seeded_listing_is_served(self, library: Path) -> None:
+        """Listings seeded by the file browser need no read."""
+        listing = list_directory(library)
+        seed_completion_listing(library, listing)
+        assert get_completion_listing(library) is listing
+
+
+class TestCommandCompleter:
+    """Tests for CommandCompleter."""
+
+    async def test_unique_match(self, library: Path) -> None:
+        """A single match is filled in."""
+        seed_completion_listing(library, list_directory(library))
+        completer = CommandCompleter(_prompt("cd tec"), library)
+        assert _tab(completer) == "cd techno/"
+
+    async def test_common_prefix_then_cycle(self, library: Path) -> None:
+        """Several matches fill in their common prefix, then cycle."""
+        seed_completion_listing(library, list_directory(library))
+        completer = CommandCompleter(_prompt("cd a"), library)
+        assert _tab(completer) == "cd amb"
+        assert _tab(completer) == "cd amber/"
+        assert _tab(completer) == "cd ambient/"
+        assert _tab(completer) == "cd amber/"
+
+    async def test_waits_for_uncached_listing(self, library: Path) -> None:
+        """Tab on an unread directory completes once it has been read."""
+        completer = CommandCompleter(_prompt("save techno."), library)
+        assert _tab(completer) == "save techno."
+        wait_for_pending_listings(10)
+        await asyncio.sleep(0)
+        assert completer.prompt.input_text == "save techno.platy"
+
+    async def test_edits_prefetch_directory(self, library: Path) -> None:
+        """Typing a directory part starts reading that directory."""
+        completer = CommandCompleter(_prompt(""), library)
+        completer.on_change("cd ambient/")
+        wait_for_pending_listings(10)
+        assert get_completion_listing(library / "ambient") is not None
+
+    async def test_other_keys_pass_through(self, library: Path) -> None:
+        """Only Tab is consumed."""
+        completer = CommandCompleter(_prompt("cd a"), library)
+        assert not completer.handle_key("a")
@@ -28,6 +28,7 @@ class TestUpdateCursorWithScroll:
         """Create a mock prompt with given width and state."""
         prompt = MagicMock(spec=CommandPrompt)
         prompt.size = MockSize(width)
+        prompt.prefix = ":"
         prompt._cursor = CursorManager(prompt)
         prompt._cursor.scroll = scroll
         prompt.cursor_index = 0
@@ -86,6 +87,7 @@ class TestOnResize:
         """Create a mock prompt for resize testing."""
         prompt = MagicMock(spec=CommandPrompt)
         prompt.size = MockSize(width)
+        prompt.prefix = ":"
         prompt._cursor = CursorManager(prompt)
         prompt._cursor.scroll = scroll
         prompt.cursor_index = cursor
@@ -55,3 +55,21 @@ class TestStatusLineVisibleDuringPrompt:
         """StatusLine DEFAULT_CSS does not include display: none."""
         from platyplaty.ui.status_line import StatusLine
         assert "display: none" not in StatusLine.DEFAULT_CSS
+
+
+class TestPromptPrefix:
+    """Tests for prompts shown with a prefix other than ':'."""
+
+    def test_render_uses_prefix(self) -> None:
+        """The prefix is drawn before the input text."""
+        from platyplaty.ui.command_render import render_command_line
+        strip = render_command_line(20, "abc", 0, 3, False, prefix="find: ")
+        assert strip.text.startswith("find: abc")
+        assert strip.cell_length == 20
+
+    def test_default_prefix_is_colon(self) -> None:
+        """Command prompts keep the ':' prefix."""
+        from platyplaty.ui.command_render import render_command_line
+        strip = render_command_line(10, "load", 0, 4, False)
+        assert strip.text.startswith(":load")
+        assert strip.cell_length == 10
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Tests for background directory counting used by the middle pane."""
+
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from platyplaty.ui import directory_count_worker
+from platyplaty.ui.directory_count_worker import (
+    get_directory_count,
+    revalidate_directory_count,
+    set_count_listener,
+    wait_for_pending_counts,
+)
+from platyplaty.ui.directory_types import DirectoryEntry, EntryType
+from platyplaty.ui.file_browser_entry_render import render_normal_entry
+
+
+@pytest.fixture(autouse=True)
+def _no_listener():
+    """Ensure no listener leaks between tests."""
+    yield
+    set_count_listener(None)
+
+
+class TestGetDirectoryCount:
+    """Tests for non-blocking count lookups."""
+
+    def test_cache_miss_returns_none_then_count(self, tmp_path: Path) -> None:
+        """First lookup schedules a count; later lookups return it."""
+        (tmp_path / "a.milk").touch()
+        (tmp_path / "sub").mkdir()
+        assert get_directory_count(tmp_path) is None
+        wait_for_pending_counts()
+        assert get_directory_count(tmp_path) == 2
+
+    def test_listener_called_when_count_ready(self, tmp_path: Path) -> None:
+        """The listener fires after the worker stores a new count."""
+        ready = threading.Event()
+        set_count_listener(ready.set)
+        get_directory_count(tmp_path)
+        assert ready.wait(timeout=5)
+
+
+class TestRevalidation:
+    """Tests for mtime-based revalidation."""
+
+    def test_unchanged_mtime_skips_recount(self, tmp_path: Path) -> None:
+        """Revalidating an unchanged directory does not list it again."""
+        get_directory_count(tmp_path)
+        wait_for_pending_counts()
+        with patch.object(
+            directory_count_worker, "count_directory_contents"
+        ) as mock_count:
+            revalidate_directory_count(tmp_path)
+            wait_for_pending_counts()
+            mock_count.assert_not_called()
+
+    def test_changed_mtime_recounts(self, tmp_path: Path) -> None:
+        """Revalidating after a change picks up the new count."""
+        get_directory_count(tmp_path)
+        wait_for_pending_counts()
+        (tmp_path / "new.milk").touch()
+        revalidate_directory_count(tmp_path)
+        wait_for_pending_counts()
+        assert get_directory_count(tmp_path) == 1
+
+
+class TestPlaceholderRendering:
+    """Tests for rendering before a count is available."""
+
+    def test_placeholder_shown_on_cache_miss(self, tmp_path: Path) -> None:
+        """Uncounted directories render the placeholder, not a count."""
+        entry = DirectoryEntry("mydir", EntryType.DIRECTORY, tmp_path / "x")
+        with patch(
+            "platyplaty.ui.file_browser_entry_render.get_directory_count",
+            return_value=None,
+        ):
+            segments = render_normal_entry(entry, 20)
+        text = "".join(s.text for s in segments)
+        assert text.rstrip().endswith("?")
+
+    def test_symlink_placeholder_has_arrow(self, tmp_path: Path) -> None:
+        """Uncounted directory symlinks render '-> ?'."""
+        entry = DirectoryEntry(
+            "link", EntryType.SYMLINK_TO_DIRECTORY, tmp_path / "x"
+        )
+        with patch(
+            "platyplaty.ui.file_browser_entry_render.get_directory_count",
+            return_value=None,
+        ):
+            segments = render_normal_entry(entry, 20)
+        text = "".join(s.text for s in segments)
+        assert text.rstrip().endswith("-> ?")
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Tests for the bounded, persistent directory memory store."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+from platyplaty.ui.directory_memory_store import (
+    DirectoryMemoryStore,
+    default_directory_memory_path,
+)
+from platyplaty.ui.nav_state import NavigationState
+from platyplaty.ui.nav_types import DirectoryMemory
+
+_MODULE = "platyplaty.ui.directory_memory_store"
+
+
+class TestBounded:
+    """Tests for LRU eviction."""
+
+    def test_least_recently_used_is_evicted(self) -> None:
+        """Beyond the limit, the oldest unused directory is dropped."""
+        with patch(f"{_MODULE}.MAX_ENTRIES", 2):
+            store = DirectoryMemoryStore()
+            store["/a"] = DirectoryMemory("x", 0)
+            store["/b"] = DirectoryMemory("y", 0)
+            store.get("/a")
+            store["/c"] = DirectoryMemory("z", 0)
+        assert "/a" in store
+        assert "/b" not in store
+        assert len(store) == 2
+
+
+class TestPersistence:
+    """Tests for the state file."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Flushed memory is restored by a new store."""
+        path = tmp_path / "state" / "memory.json"
+        store = DirectoryMemoryStore(path)
+        store["/music"] = DirectoryMemory("b.milk", 7)
+        store.flush()
+        restored = DirectoryMemoryStore(path)
+        assert restored.get("/music") == DirectoryMemory("b.milk", 7)
+
+    def test_file_is_read_lazily(self, tmp_path: Path) -> None:
+        """Constructing a store does not read the state file."""
+        with patch(f"{_MODULE}._read_state_file") as mock_read:
+            DirectoryMemoryStore(tmp_path / "memory.json")
+        mock_read.assert_not_called()
+
+    def test_corrupt_file_is_ignored(self, tmp_path: Path) -> None:
+        """A corrupt state file starts an empty store."""
+        path = tmp_path / "memory.json"
+        path.write_text("{not json")
+        assert len(DirectoryMemoryStore(path)) == 0
+
+    def test_flush_replaces_file_atomically(self, tmp_path: Path) -> None:
+        """Flushing leaves only the complete state file behind."""
+        path = tmp_path / "memory.json"
+        store = DirectoryMemoryStore(path)
+        store["/a"] = DirectoryMemory(None, 0)
+        store.flush()
+        assert json.loads(path.read_text()) == {"/a": [None, 0]}
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_flush_keeps_file_mode(self, tmp_path: Path) -> None:
+        """Replacing the state file keeps its permissions."""
+        path = tmp_path / "memory.json"
+        path.write_text("{}")
+        path.chmod(0o640)
+        store = DirectoryMemoryStore(path)
+        store["/a"] = DirectoryMemory(None, 0)
+        store.flush()
+        assert path.stat().st_mode & 0o777 == 0o640
+
+    def test_unchanged_memory_does_not_write(self, tmp_path: Path) -> None:
+        """Re-saving identical memory does not schedule a write."""
+        path = tmp_path / "memory.json"
+        store = DirectoryMemoryStore(path)
+        store["/a"] = DirectoryMemory("x", 0)
+        store.flush()
+        path.unlink()
+        store["/a"] = DirectoryMemory("x", 0)
+        store.flush()
+        assert not path.exists()
+
+    def test_default_path_uses_xdg_state_home(self, monkeypatch, tmp_path) -> None:
+        """The default state file lives under XDG_STATE_HOME."""
+        monkeypatch.setenv("XDG_STATE_HOME", str(tmp_path))
+        expected = tmp_path / "platyplaty" / "directory_memory.json"
+        assert default_directory_memory_path() == expected
+
+
+class TestNavigationRestore:
+    """Tests for restoring selection across sessions."""
+
+    def test_selection_survives_restart(self, tmp_path: Path) -> None:
+        """A new session restores the remembered selection."""
+        library = tmp_path / "library"
+        (library / "deep").mkdir(parents=True)
+        (library / "deep" / "a.milk").touch()
+        (library / "deep" / "b.milk").touch()
+        path = tmp_path / "memory.json"
+        state = NavigationState(library, DirectoryMemoryStore(path))
+        state.move_right()
+        state.move_down()
+        state.move_left()
+        state._directory_memory.flush()
+        state = NavigationState(library, DirectoryMemoryStore(path))
+        state.move_right()
+        assert state.selected_name == "b.milk"
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Tests for incremental playlist display-name disambiguation."""
+
+from pathlib import Path
+
+from platyplaty.ui.display_name_trie import DisplayNameTrie
+from platyplaty.ui.playlist_display_name import (
+    compute_display_names,
+    sync_display_names,
+)
+
+A = Path("/presets/a/cool.milk")
+B = Path("/presets/b/cool.milk")
+DEEP = Path("/presets/x/b/cool.milk")
+OTHER = Path("/presets/a/other.milk")
+
+
+class TestDisplayNameTrie:
+    """Tests for DisplayNameTrie."""
+
+    def test_add_disambiguates_group(self) -> None:
+        """Adding a same-named preset lengthens both names."""
+        trie = DisplayNameTrie([A, OTHER])
+        assert trie.display_name(A) == "cool.milk"
+        trie.add(B)
+        assert trie.display_name(A) == "a/cool.milk"
+        assert trie.display_name(B) == "b/cool.milk"
+        assert trie.display_name(OTHER) == "other.milk"
+
+    def test_remove_restores_basename(self) -> None:
+        """Removing the last rival goes back to the basename."""
+        trie = DisplayNameTrie([A, B])
+        trie.remove(B)
+        assert trie.display_name(A) == "cool.milk"
+
+    def test_shared_parent_goes_up_a_level(self) -> None:
+        """Paths sharing a parent name show the first differing directory."""
+        trie = DisplayNameTrie([A, B, DEEP])
+        assert trie.display_name(A) == "a/cool.milk"
+        assert trie.display_name(B) == "presets/b/cool.milk"
+        assert trie.display_name(DEEP) == "x/b/cool.milk"
+        trie.remove(DEEP)
+        assert trie.display_name(B) == "b/cool.milk"
+
+    def test_duplicate_among_rivals_shows_full_path(self) -> None:
+        """A repeated path with other same-named paths is shown in full."""
+        trie = DisplayNameTrie([A, A, B])
+        assert trie.display_name(A) == str(A)
+        assert trie.display_name(B) == "b/cool.milk"
+        trie.remove(A)
+        assert trie.display_name(A) == "a/cool.milk"
+
+    def test_unknown_paths(self) -> None:
+        """Removing or naming a path not in the trie is harmless."""
+        trie = DisplayNameTrie([A, B])
+        trie.remove(DEEP)
+        assert trie.display_name(DEEP) == "cool.milk"
+        assert trie.display_name(A) == "a/cool.milk"
+
+
+class TestSyncDisplayNames:
+    """Tests for sync_display_names."""
+
+    def _check(self, old: list[Path], new: list[Path]) -> None:
+        """Syncing old to new names entries as a fresh computation would."""
+        trie = DisplayNameTrie(old)
+        sync_display_names(trie, old, new)
+        assert [trie.display_name(p) for p in new] == compute_display_names(new)
+
+    def test_insert(self) -> None:
+        """An inserted entry is added."""
+        self._check([A, OTHER], [A, B, OTHER])
+
+    def test_delete(self) -> None:
+        """A deleted entry is removed."""
+        self._check([A, B, DEEP, OTHER], [A, DEEP, OTHER])
+
+    def test_move(self) -> None:
+        """Swapping neighbours leaves the names intact."""
+        self._check([A, B, OTHER], [A, OTHER, B])
+
+    def test_replace_everything(self) -> None:
+        """Unrelated lists are fully resynced."""
+        self._check([A, A, B], [DEEP, OTHER])
+        self._check([], [A, B])
+        self._check([A, B], [])
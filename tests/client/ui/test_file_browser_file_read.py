@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Tests for bounded, memory-mapped file preview reads."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from platyplaty.ui.file_browser_file_read import (
+    MMAP_THRESHOLD,
+    decode_preview_bytes,
+    find_lines_end,
+)
+from platyplaty.ui.file_browser_file_utils import read_file_preview_lines
+from platyplaty.ui.file_browser_types import BinaryFileError
+
+
+class TestFindLinesEnd:
+    """Tests for find_lines_end."""
+
+    def test_stops_after_requested_lines(self) -> None:
+        """The offset is just past the last requested newline."""
+        data = b"a\nbb\nccc\n"
+        assert find_lines_end(data, len(data), 2) == 5
+
+    def test_none_means_whole_file(self) -> None:
+        """Without a line limit the whole buffer is used."""
+        assert find_lines_end(b"a\nb", 3, None) == 3
+
+    def test_long_line_is_bounded(self) -> None:
+        """A file without newlines is not scanned to the end."""
+        with patch("platyplaty.ui.file_browser_file_read.MAX_LINE_BYTES", 8):
+            assert find_lines_end(b"x" * 100, 100, 2) == 16
+
+
+class TestDecodePreviewBytes:
+    """Tests for binary sniffing and decoding."""
+
+    def test_nul_byte_is_binary(self) -> None:
+        """NUL bytes in the sniff window mark the file as binary."""
+        with pytest.raises(BinaryFileError):
+            decode_preview_bytes(b"valid text\0more", 5, "f.milk")
+
+    def test_invalid_utf8_in_preview_is_binary(self) -> None:
+        """Invalid UTF-8 within the previewed lines is binary."""
+        with pytest.raises(BinaryFileError):
+            decode_preview_bytes(b"\xff\xfe\n", 5, "f.milk")
+
+    def test_split_character_at_byte_limit_is_dropped(self) -> None:
+        """A multibyte character cut by the byte bound is not an error."""
+        data = "日本".encode() * 4
+        with patch("platyplaty.ui.file_browser_file_read.MAX_LINE_BYTES", 4):
+            assert decode_preview_bytes(data, 1, "f.milk") == "日"
+
+
+class TestLargeFiles:
+    """Tests for memory-mapped preview reads."""
+
+    def test_large_file_reads_only_leading_lines(self, tmp_path: Path) -> None:
+        """Large files yield the requested leading lines."""
+        path = tmp_path / "big.milk"
+        line = "per_frame_1=zoom=zoom+0.01;\n"
+        path.write_text(line * (MMAP_THRESHOLD // len(line) + 100))
+        lines = read_file_preview_lines(path, max_lines=3)
+        assert lines == ("per_frame_1=zoom=zoom+0.01;",) * 3
+
+    def test_lone_carriage_returns_split_lines(self, tmp_path: Path) -> None:
+        """Old Mac line endings are treated as newlines."""
+        path = tmp_path / "mac.milk"
+        path.write_bytes(b"a\rb\rc")
+        assert read_file_preview_lines(path, max_lines=2) == ("a", "b")
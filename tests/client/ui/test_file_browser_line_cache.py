@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Tests for the file browser rendered line caches."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from rich.segment import Segment
+
+from platyplaty.ui.directory_types import DirectoryEntry, EntryType
+from platyplaty.ui.file_browser_line_cache import (
+    clear_entry_line_cache,
+    entry_line_cache,
+)
+from platyplaty.ui.file_browser_pane_render import render_pane_line
+from test_fakes import make_listing
+
+_RENDER = "platyplaty.ui.file_browser_pane_render.render_normal_entry"
+_RENDER_SELECTED = "platyplaty.ui.file_browser_pane_render.render_selected_entry"
+
+
+def _listing(count: int = 2):
+    """Create a listing of count plain directories named a, b, ..."""
+    names = [chr(ord("a") + i) for i in range(count)]
+    return make_listing([
+        DirectoryEntry(name, EntryType.DIRECTORY, Path(f"/dummy/{name}"))
+        for name in names
+    ])
+
+
+def _render_names(entry: DirectoryEntry, *_args, **_kwargs) -> list[Segment]:
+    """Stand-in renderer whose row shows the entry's name."""
+    return [Segment(entry.name)]
+
+
+class TestEntryLineCache:
+    """Tests for memoised pane rows."""
+
+    def test_repeat_render_uses_cache(self) -> None:
+        """Rendering the same row twice renders it only once."""
+        listing = _listing()
+        with patch(_RENDER, return_value=[Segment("a")]) as mock_render:
+            first = render_pane_line(listing, 0, 20, False, show_indicators=False)
+            second = render_pane_line(listing, 0, 20, False, show_indicators=False)
+        assert mock_render.call_count == 1
+        assert first == second
+
+    def test_selection_change_renders_only_affected_rows(self) -> None:
+        """Moving the selection re-renders only the two rows that changed."""
+        listing = _listing(12)
+        with patch(_RENDER, side_effect=_render_names) as mock_normal, patch(
+            _RENDER_SELECTED, side_effect=_render_names
+        ) as mock_selected:
+            before = [
+                render_pane_line(listing, y, 20, False, selected_index=3)
+                for y in range(12)
+            ]
+            mock_normal.reset_mock()
+            mock_selected.reset_mock()
+            after = [
+                render_pane_line(listing, y, 20, False, selected_index=4)
+                for y in range(12)
+            ]
+        assert [c.args[0].name for c in mock_normal.call_args_list] == ["d"]
+        assert [c.args[0].name for c in mock_selected.call_args_list] == ["e"]
+        unaffected = [y for y in range(12) if y not in (3, 4)]
+        assert all(after[y] is before[y] for y in unaffected)
+
+    def test_new_listing_is_not_served_from_cache(self) -> None:
+        """A re-read listing gets a new generation and fresh rows."""
+        with patch(_RENDER, return_value=[Segment("a")]) as mock_render:
+            render_pane_line(_listing(), 0, 20, False)
+            render_pane_line(_listing(), 0, 20, False)
+        assert mock_render.call_count == 2
+
+    def test_width_is_part_of_key(self) -> None:
+        """A different pane width renders the row again."""
+        listing = _listing()
+        with patch(_RENDER, return_value=[Segment("a")]) as mock_render:
+            render_pane_line(listing, 0, 20, False)
+            render_pane_line(listing, 0, 21, False)
+        assert mock_render.call_count == 2
+
+    def test_clear_drops_rows(self) -> None:
+        """clear_entry_line_cache empties the row cache."""
+        render_pane_line(_listing(), 0, 20, False, show_indicators=False)
+        clear_entry_line_cache()
+        assert len(entry_line_cache) == 0
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Tests for cached and prefetched right pane previews."""
+
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from platyplaty.file_stat import invalidate_file_stat
+from platyplaty.ui.directory import list_directory
+from platyplaty.ui.directory_types import EntryType
+from platyplaty.ui.file_browser_prefetch import prefetch_neighbour_previews
+from platyplaty.ui.file_browser_preview_cache import (
+    clear_preview_cache,
+    estimate_preview_size,
+    get_preview,
+    preview_cache,
+    wait_for_pending_previews,
+)
+from platyplaty.ui.file_browser_types import RightPaneFilePreview
+
+_BUILD = "platyplaty.ui.file_browser_preview_cache.build_right_pane_content"
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    """Start every test with an empty preview cache."""
+    clear_preview_cache()
+    yield
+    wait_for_pending_previews()
+    clear_preview_cache()
+
+
+def _write(path: Path, text: str) -> Path:
+    """Write text to path and return it."""
+    path.write_text(text)
+    return path
+
+
+class TestGetPreview:
+    """Tests for get_preview caching."""
+
+    def test_unchanged_file_is_read_once(self, tmp_path: Path) -> None:
+        """A second lookup of an unchanged file is served from cache."""
+        path = _write(tmp_path / "a.milk", "line\n")
+        first = get_preview(path, EntryType.FILE, 10)
+        with patch(_BUILD) as mock_build:
+            second = get_preview(path, EntryType.FILE, 10)
+        mock_build.assert_not_called()
+        assert second is first
+
+    def test_resize_makes_no_system_call(self, tmp_path: Path) -> None:
+        """A cached preview is served at another height without a stat."""
+        path = _write(tmp_path / "a.milk", "".join(f"{n}\n" for n in range(20)))
+        get_preview(path, EntryType.FILE, 10)
+        with (
+            patch("os.stat", side_effect=AssertionError),
+            patch("os.lstat", side_effect=AssertionError),
+            patch(_BUILD) as mock_build,
+        ):
+            result = get_preview(path, EntryType.FILE, 12)
+        mock_build.assert_not_called()
+        assert isinstance(result, RightPaneFilePreview)
+        assert len(result.lines) == 12
+
+    def test_modified_file_is_rebuilt(self, tmp_path: Path) -> None:
+        """A new mtime, once the stat cache sees it, rebuilds the preview."""
+        path = _write(tmp_path / "a.milk", "old\n")
+        get_preview(path, EntryType.FILE, 10)
+        _write(path, "new\n")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        invalidate_file_stat(path)
+        result = get_preview(path, EntryType.FILE, 10)
+        assert isinstance(result, RightPaneFilePreview)
+        assert result.lines == ("new",)
+
+    def test_resize_is_served_from_cache(self, tmp_path: Path) -> None:
+        """A smaller pane height is cut from the cached preview."""
+        path = _write(tmp_path / "a.milk", "1\n2\n3\n")
+        get_preview(path, EntryType.FILE, 10)
+        with patch(_BUILD) as mock_build:
+            result = get_preview(path, EntryType.FILE, 2)
+        mock_build.assert_not_called()
+        assert isinstance(result, RightPaneFilePreview)
+        assert result.lines == ("1", "2")
+
+    def test_much_taller_pane_rereads(self, tmp_path: Path) -> None:
+        """Heights beyond the cached bucket read the file again."""
+        path = _write(tmp_path / "a.milk", "x\n" * 200)
+        get_preview(path, EntryType.FILE, 10)
+        result = get_preview(path, EntryType.FILE, 150)
+        assert isinstance(result, RightPaneFilePreview)
+        assert len(result.lines) == 150
+
+    def test_collapsed_state_is_not_cached(self, tmp_path: Path) -> None:
+        """Empty files (collapsed state) are not stored."""
+        path = _write(tmp_path / "empty.milk", "")
+        assert get_preview(path, EntryType.FILE, 10) is None
+        assert len(preview_cache) == 0
+
+
+class TestPrefetch:
+    """Tests for neighbour prefetching."""
+
+    def _browser(self, directory: Path, selected: int) -> MagicMock:
+        """Create a mock browser over a real directory listing."""
+        browser = MagicMock()
+        browser.current_dir = directory
+        browser._middle_listing = list_directory(directory)
+        browser.selected_index = selected
+        browser.size.height = 11
+        return browser
+
+    def test_warms_entries_in_direction_of_travel(self, tmp_path: Path) -> None:
+        """Moving down warms the entries below the selection."""
+        for i in range(8):
+            _write(tmp_path / f"{i}.milk", f"preset {i}\n")
+        prefetch_neighbour_previews(self._browser(tmp_path, 2), 1)
+        wait_for_pending_previews()
+        with patch(_BUILD) as mock_build:
+            for i in (1, 3, 4, 5, 6):
+                get_preview(tmp_path / f"{i}.milk", EntryType.FILE, 10)
+        mock_build.assert_not_called()
+        assert len(preview_cache) == 5
+
+
+class TestEstimatePreviewSize:
+    """Tests for the memory estimate."""
+
+    def test_grows_with_content(self) -> None:
+        """Longer previews are estimated as larger."""
+        small = RightPaneFilePreview(("a",))
+        large = RightPaneFilePreview(("a" * 1000,) * 10)
+        assert estimate_preview_size(large) > estimate_preview_size(small)
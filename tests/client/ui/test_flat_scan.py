@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""Tests for the background flattening scan and the flattened view."""
+
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+from platyplaty.ui import flat_scan
+from platyplaty.ui.directory import _sort_key
+from platyplaty.ui.directory_types import EntryType
+from platyplaty.ui.flat_scan import FlatScan, clear_flat_scan_cache
+from platyplaty.ui.nav_state import NavigationState
+
+
+def _make_tree(root: Path) -> None:
+    """Create a nested preset tree with names that stress sort order."""
+    (root / "a").mkdir()
+    (root / "a" / "x.milk").write_text("")
+    (root / "a" / "deep").mkdir()
+    (root / "a" / "deep" / "y.MILK").write_text("")
+    (root / "a-b.milk").write_text("")
+    (root / "a.milk").write_text("")
+    (root / "B.milk").write_text("")
+    (root / "notes.txt").write_text("")
+    (root / "list.platy").write_text("")
+    (root / "empty").mkdir()
+
+
+def _scan(root: Path) -> list[str]:
+    """Run a scan to completion and return the entry names."""
+    scan = FlatScan(root, lambda: None)
+    scan.wait(5)
+    assert scan.done
+    return [entry.name for entry in scan.snapshot()]
+
+
+class TestFlatScan:
+    """Tests for FlatScan."""
+
+    def setup_method(self) -> None:
+        """Start every test with an empty directory cache."""
+        clear_flat_scan_cache()
+
+    def test_collects_milk_files_by_relative_path(self, tmp_path: Path) -> None:
+        """Every .milk file beneath root is listed, and nothing else."""
+        _make_tree(tmp_path)
+        names = _scan(tmp_path)
+        assert sorted(names) == sorted([
+            "a/x.milk", "a/deep/y.MILK", "a-b.milk", "a.milk", "B.milk",
+        ])
+
+    def test_entries_are_in_sort_key_order(self, tmp_path: Path) -> None:
+        """Entries arrive sorted as a listing, so prefix search works."""
+        _make_tree(tmp_path)
+        scan = FlatScan(tmp_path, lambda: None)
+        scan.wait(5)
+        entries = scan.snapshot()
+        assert entries == sorted(entries, key=_sort_key)
+
+    def test_entries_carry_absolute_paths(self, tmp_path: Path) -> None:
+        """Each entry's path points at the file itself."""
+        _make_tree(tmp_path)
+        scan = FlatScan(tmp_path, lambda: None)
+        scan.wait(5)
+        for entry in scan.snapshot():
+            assert entry.path == tmp_path / entry.name
+            assert entry.entry_type == EntryType.FILE
+
+    def test_symlink_loop_terminates(self, tmp_path: Path) -> None:
+        """A symlink back to an ancestor is not followed twice."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "p.milk").write_text("")
+        (tmp_path / "sub" / "loop").symlink_to(tmp_path)
+        assert _scan(tmp_path) == ["sub/p.milk"]
+
+    def test_symlinked_file_is_included(self, tmp_path: Path) -> None:
+        """Symlinks to .milk files are listed as SYMLINK_TO_FILE."""
+        (tmp_path / "real.milk").write_text("")
+        (tmp_path / "link.milk").symlink_to(tmp_path / "real.milk")
+        scan = FlatScan(tmp_path, lambda: None)
+        scan.wait(5)
+        types = {e.name: e.entry_type for e in scan.snapshot()}
+        assert types == {
+            "link.milk": EntryType.SYMLINK_TO_FILE,
+            "real.milk": EntryType.FILE,
+        }
+
+    def test_unchanged_directories_are_not_reread(self, tmp_path: Path) -> None:
+        """A second scan reuses cached directory contents."""
+        _make_tree(tmp_path)
+        _scan(tmp_path)
+        with patch.object(flat_scan.os, "scandir") as scandir:
+            names = _scan(tmp_path)
+        scandir.assert_not_called()
+        assert "a/deep/y.MILK" in names
+
+    def test_changed_directory_is_reread(self, tmp_path: Path) -> None:
+        """Adding a file changes the mtime, so the directory is re-read."""
+        _make_tree(tmp_path)
+        _scan(tmp_path)
+        (tmp_path / "a" / "new.milk").write_text("")
+        assert "a/new.milk" in _scan(tmp_path)
+
+    def test_progress_is_reported(self, tmp_path: Path) -> None:
+        """The progress callback runs at least once, when the scan ends."""
+        _make_tree(tmp_path)
+        called = threading.Event()
+        scan = FlatScan(tmp_path, called.set)
+        scan.wait(5)
+        assert called.is_set()
+
+    def test_cancelled_scan_reports_nothing(self, tmp_path: Path) -> None:
+        """No progress is reported after cancel()."""
+        _make_tree(tmp_path)
+        gate = threading.Event()
+        calls: list[int] = []
+        blocker = flat_scan._executor.submit(gate.wait, 5)
+        scan = FlatScan(tmp_path, lambda: calls.append(1))
+        scan.cancel()
+        gate.set()
+        blocker.result(5)
+        scan.wait(5)
+        assert calls == []
+        assert scan.snapshot() == []
+
+
+class TestNavigationFlatten:
+    """Tests for flattening NavigationState."""
+
+    def _flatten(self, state: NavigationState) -> None:
+        """Flatten and wait for the scan to finish."""
+        assert state.start_flatten(lambda: None)
+        assert state._flat_scan is not None
+        state._flat_scan.wait(5)
+        state.update_flat_listing()
+
+    def test_flatten_lists_files_below(self, temp_dir_tree: Path) -> None:
+        """The listing becomes every .milk file beneath current_dir."""
+        state = NavigationState(temp_dir_tree)
+        self._flatten(state)
+        listing = state.get_listing()
+        assert listing is not None
+        assert not listing.scan_in_progress
+        assert [e.name for e in listing.entries] == [
+            "alpha.milk", "beta.milk", "gamma.milk",
+            "presets/preset1.milk", "presets/preset2.milk",
+        ]
+        assert state.is_flattened
+        assert state.selected_name is not None
+
+    def test_open_file_from_flat_view(self, temp_dir_tree: Path) -> None:
+        """Opening a flattened entry returns its real path."""
+        state = NavigationState(temp_dir_tree)
+        self._flatten(state)
+        state.jump_to_prefix("presets/preset2")
+        assert state.move_right() == str(temp_dir_tree / "presets/preset2.milk")
+
+    def test_filter_applies_to_flat_view(self, temp_dir_tree: Path) -> None:
+        """A name filter narrows the flattened files."""
+        state = NavigationState(temp_dir_tree)
+        self._flatten(state)
+        state.apply_filter("preset1")
+        listing = state.get_listing()
+        assert listing is not None
+        assert [e.name for e in listing.entries] == ["presets/preset1.milk"]
+
+    def test_stop_selects_containing_directory(self, temp_dir_tree: Path) -> None:
+        """Leaving the flat view selects the directory of the selected file."""
+        state = NavigationState(temp_dir_tree)
+        self._flatten(state)
+        state.jump_to_prefix("presets/preset2")
+        state.stop_flatten()
+        assert not state.is_flattened
+        assert state.selected_name == "presets"
+        listing = state.get_listing()
+        assert listing is not None
+        assert len(listing.entries) == 5
+
+    def test_leaving_directory_stops_flatten(self, temp_dir_tree: Path) -> None:
+        """Navigating to the parent leaves the flattened view."""
+        state = NavigationState(temp_dir_tree / "presets")
+        self._flatten(state)
+        state.move_left()
+        assert not state.is_flattened
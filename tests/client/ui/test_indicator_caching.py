@@ -6,74 +6,62 @@ from pathlib import Path
 import cachetools
 import pytest
 
+from platyplaty.ui.directory_count_worker import (
+    directory_count_cache,
+    get_directory_count,
+    wait_for_pending_counts,
+)
 from platyplaty.ui.directory_types import EntryType
 from platyplaty.ui.indicator_cache import refresh_indicator_cache
-from platyplaty.ui.indicators import count_directory_contents, directory_count_cache
-from platyplaty.ui.size_format import (
-    file_size_cache,
-    get_file_size,
-    get_symlink_size,
-    symlink_size_cache,
-)
+from platyplaty.file_stat import _stat_cache
+from platyplaty.ui.size_format import get_file_size, get_symlink_size
 
 
 class TestCacheDecoratorsApplied:
     """Verify cachetools.cached decorators are properly applied."""
 
-    def test_count_directory_contents_is_cached(self) -> None:
-        """count_directory_contents should use directory_count_cache."""
-        assert hasattr(count_directory_contents, "__wrapped__")
-        # Check the cache type
+    def test_directory_count_cache_is_bounded(self) -> None:
+        """Background directory counts use a bounded LRU cache."""
         assert isinstance(directory_count_cache, cachetools.LRUCache)
         assert directory_count_cache.maxsize == 10000
 
-    def test_get_file_size_is_cached(self) -> None:
-        """get_file_size should use file_size_cache."""
-        assert hasattr(get_file_size, "__wrapped__")
-        assert isinstance(file_size_cache, cachetools.LRUCache)
-        assert file_size_cache.maxsize == 10000
-
-    def test_get_symlink_size_is_cached(self) -> None:
-        """get_symlink_size should use symlink_size_cache."""
-        assert hasattr(get_symlink_size, "__wrapped__")
-        assert isinstance(symlink_size_cache, cachetools.LRUCache)
-        assert symlink_size_cache.maxsize == 10000
+    def test_sizes_use_shared_stat_cache(self, tmp_path: Path) -> None:
+        """File and symlink sizes are read through the file_stat cache."""
+        target = tmp_path / "target.milk"
+        target.write_text("hello")
+        link = tmp_path / "link.milk"
+        link.symlink_to(target)
+        assert get_file_size(link) == 5
+        assert get_symlink_size(link) == len(str(target))
+        assert (link,) in _stat_cache
 
 
 class TestRefreshIndicatorCache:
     """Test refresh_indicator_cache invalidates and recalculates."""
 
-    def test_refresh_directory_invalidates_and_recalculates(
+    def test_refresh_directory_revalidates_in_background(
         self, tmp_path: Path
     ) -> None:
-        """Refreshing directory should clear cache and recalculate count."""
-        # Create a directory with files
+        """Refreshing directory should recount after its mtime changes."""
         subdir = tmp_path / "subdir"
         subdir.mkdir()
         (subdir / "file.milk").touch()
+        get_directory_count(subdir)
+        wait_for_pending_counts()
+        assert get_directory_count(subdir) == 1
 
-        # First call caches the result
-        count1 = count_directory_contents(subdir)
-        assert count1 == 1
-
-        # Add another file
         (subdir / "file2.milk").touch()
+        # Cached result is kept until revalidated
+        assert get_directory_count(subdir) == 1
 
-        # Cached result should still be 1
-        count2 = count_directory_contents(subdir)
-        assert count2 == 1
-
-        # Refresh should invalidate and recalculate
         refresh_indicator_cache(EntryType.DIRECTORY, subdir)
+        wait_for_pending_counts()
+        assert get_directory_count(subdir) == 2
 
-        # Now should see updated count
-        count3 = count_directory_contents(subdir)
-        assert count3 == 2
-
-    def test_refresh_file_invalidates_file_size_cache(
+    def test_refresh_file_invalidates_stat_cache(
         self, tmp_path: Path
     ) -> None:
-        """Refreshing file should clear file_size_cache."""
+        """Refreshing file should drop its cached stat."""
         test_file = tmp_path / "test.milk"
         test_file.write_text("hello")
 
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Tests for DirectoryListing name lookups and cached selection index."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from platyplaty.ui.directory_types import DirectoryEntry, DirectoryListing, EntryType
+from platyplaty.ui.nav_state import NavigationState
+
+
+def _make_listing(names: list[str]) -> DirectoryListing:
+    """Create a listing of files with the given names."""
+    return DirectoryListing(
+        entries=[DirectoryEntry(n, EntryType.FILE, Path("/dummy")) for n in names],
+        was_empty=False,
+        had_filtered_entries=False,
+        permission_denied=False,
+    )
+
+
+class TestIndexOf:
+    """Tests for DirectoryListing.index_of."""
+
+    def test_finds_each_entry(self) -> None:
+        """Every entry name maps to its position."""
+        listing = _make_listing(["a.milk", "b.milk", "c.milk"])
+        assert [listing.index_of(n) for n in ("a.milk", "b.milk", "c.milk")] == [
+            0, 1, 2,
+        ]
+
+    def test_missing_name_returns_none(self) -> None:
+        """Unknown names return None."""
+        assert _make_listing(["a.milk"]).index_of("zzz.milk") is None
+
+    def test_duplicate_names_return_first(self) -> None:
+        """Duplicate names resolve to the first occurrence."""
+        assert _make_listing(["x", "y", "x"]).index_of("x") == 0
+
+    def test_index_not_part_of_equality(self) -> None:
+        """Listings with equal entries still compare equal."""
+        assert _make_listing(["a"]) == _make_listing(["a"])
+
+
+class TestSelectedIndexCache:
+    """Tests for the per-generation selected index cache."""
+
+    def test_repeated_lookups_resolve_once(self, temp_dir_tree: Path) -> None:
+        """The listing is searched once per navigation generation."""
+        state = NavigationState(temp_dir_tree)
+        with patch(
+            "platyplaty.ui.nav_listing.find_index_by_name", return_value=0
+        ) as mock_find:
+            for _ in range(5):
+                state.get_selected_index()
+            assert mock_find.call_count == 1
+
+    def test_selection_change_invalidates(self, temp_dir_tree: Path) -> None:
+        """Changing the selected name yields the new index."""
+        state = NavigationState(temp_dir_tree)
+        assert state.get_selected_index() == 0
+        assert state.move_down()
+        assert state.get_selected_index() == 1
+
+    def test_listing_refresh_invalidates(self, temp_dir_tree: Path) -> None:
+        """Re-reading the directory starts a new generation."""
+        state = NavigationState(temp_dir_tree)
+        before = state.generation
+        state.refresh_after_editor()
+        assert state.generation > before
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Tests for type-ahead jump and incremental listing filters."""
+
+from pathlib import Path
+
+from platyplaty.ui import listing_search
+from platyplaty.ui.directory import _sort_key
+from platyplaty.ui.directory_types import DirectoryEntry, DirectoryListing, EntryType
+from platyplaty.ui.listing_search import (
+    IncrementalFilter,
+    find_prefix_index,
+    find_substring_indices,
+)
+from platyplaty.ui.nav_state import NavigationState
+
+
+def _make_listing(dirs: list[str], files: list[str]) -> DirectoryListing:
+    """Create a listing sorted the way list_directory sorts it."""
+    entries = [DirectoryEntry(n, EntryType.DIRECTORY, Path("/d") / n) for n in dirs]
+    entries += [DirectoryEntry(n, EntryType.FILE, Path("/d") / n) for n in files]
+    return DirectoryListing(
+        entries=sorted(entries, key=_sort_key),
+        was_empty=False,
+        had_filtered_entries=False,
+        permission_denied=False,
+    )
+
+
+def _names(listing: DirectoryListing, indices: tuple[int, ...]) -> list[str]:
+    """Return the entry names at the given indices."""
+    return [listing.entries[i].name for i in indices]
+
+
+class TestFindPrefixIndex:
+    """Tests for find_prefix_index."""
+
+    def test_finds_first_file_with_prefix(self) -> None:
+        """The first entry in display order with the prefix is found."""
+        listing = _make_listing([], ["Alpha.milk", "beta.milk", "bravo.milk"])
+        index = find_prefix_index(listing, "b")
+        assert index is not None
+        assert listing.entries[index].name == "beta.milk"
+
+    def test_is_case_insensitive(self) -> None:
+        """Prefix and names are compared case-insensitively."""
+        listing = _make_listing([], ["Alpha.milk", "beta.milk"])
+        index = find_prefix_index(listing, "ALP")
+        assert index is not None
+        assert listing.entries[index].name == "Alpha.milk"
+
+    def test_directories_win_over_files(self) -> None:
+        """A matching directory is found before a matching file."""
+        listing = _make_listing(["zeta"], ["alpha.milk", "zebra.milk"])
+        index = find_prefix_index(listing, "ze")
+        assert index is not None
+        assert listing.entries[index].name == "zeta"
+
+    def test_falls_through_to_files(self) -> None:
+        """Files are searched when no directory matches."""
+        listing = _make_listing(["presets"], ["zebra.milk"])
+        index = find_prefix_index(listing, "z")
+        assert index is not None
+        assert listing.entries[index].name == "zebra.milk"
+
+    def test_no_match_returns_none(self) -> None:
+        """A prefix matching nothing returns None."""
+        listing = _make_listing(["presets"], ["alpha.milk"])
+        assert find_prefix_index(listing, "q") is None
+
+
+class TestFindSubstringIndices:
+    """Tests for find_substring_indices."""
+
+    def test_matches_anywhere_in_name(self) -> None:
+        """Entries containing the query anywhere match, in listing order."""
+        listing = _make_listing(["space"], ["aces.milk", "Spacey.milk", "x.milk"])
+        result = find_substring_indices(listing, "ace")
+        assert _names(listing, result) == ["space", "aces.milk", "Spacey.milk"]
+
+    def test_does_not_match_across_names(self) -> None:
+        """A query spanning two adjacent names does not match."""
+        listing = _make_listing([], ["ab", "cd"])
+        assert find_substring_indices(listing, "bc") == ()
+
+    def test_selective_and_broad_queries_agree(self) -> None:
+        """Both search strategies return the same matches."""
+        files = [f"{i:05d}.milk" for i in range(2000)]
+        listing = _make_listing([], files)
+        for query in ("0", "00", "0001", "1999", "milk", "9.m"):
+            expected = tuple(i for i, n in enumerate(files) if query in n)
+            assert find_substring_indices(listing, query) == expected
+
+    def test_index_is_built_once_per_listing(self) -> None:
+        """Repeated searches of one listing reuse its index."""
+        listing = _make_listing([], ["a.milk", "b.milk"])
+        listing_search._index_cache.clear()
+        find_substring_indices(listing, "a")
+        index = listing_search._index_cache[listing.generation]
+        find_substring_indices(listing, "b")
+        assert listing_search._index_cache[listing.generation] is index
+
+
+class TestIncrementalFilter:
+    """Tests for IncrementalFilter."""
+
+    def test_narrowing_rechecks_previous_matches_only(self) -> None:
+        """A longer query is matched against the previous result."""
+        listing = _make_listing([], ["abc.milk", "abd.milk", "xyz.milk"])
+        search = IncrementalFilter(listing)
+        assert _names(listing, search.update("ab")) == ["abc.milk", "abd.milk"]
+        assert _names(listing, search.update("abc")) == ["abc.milk"]
+
+    def test_widening_searches_whole_listing(self) -> None:
+        """A query that does not extend the previous one starts over."""
+        listing = _make_listing([], ["abc.milk", "xyz.milk"])
+        search = IncrementalFilter(listing)
+        search.update("abc")
+        assert _names(listing, search.update("xy")) == ["xyz.milk"]
+        assert len(search.update("")) == 2
+
+
+class TestNavigationFilter:
+    """Tests for NavigationState jump and filter operations."""
+
+    def test_jump_to_prefix_selects_match(self, temp_dir_tree: Path) -> None:
+        """Jumping selects the first entry with the prefix."""
+        state = NavigationState(temp_dir_tree)
+        assert state.jump_to_prefix("gam")
+        assert state.selected_name == "gamma.milk"
+
+    def test_jump_without_match_keeps_selection(self, temp_dir_tree: Path) -> None:
+        """A prefix matching nothing leaves the selection alone."""
+        state = NavigationState(temp_dir_tree)
+        before = state.selected_name
+        assert not state.jump_to_prefix("zzz")
+        assert state.selected_name == before
+
+    def test_filter_shows_only_matches(self, temp_dir_tree: Path) -> None:
+        """The listing is narrowed and the first match selected."""
+        state = NavigationState(temp_dir_tree)
+        state.apply_filter("ta")
+        listing = state.get_listing()
+        assert listing is not None
+        assert [e.name for e in listing.entries] == ["beta.milk"]
+        assert state.selected_name == "beta.milk"
+        assert state.get_selected_index() == 0
+        assert state.filter_query == "ta"
+
+    def test_filter_keeps_visible_selection(self, temp_dir_tree: Path) -> None:
+        """The selection is kept when it still matches."""
+        state = NavigationState(temp_dir_tree)
+        state.jump_to_prefix("gamma")
+        state.apply_filter("a.milk")
+        assert state.selected_name == "gamma.milk"
+        assert state.get_selected_index() == 2
+
+    def test_empty_query_restores_listing(self, temp_dir_tree: Path) -> None:
+        """Clearing the query shows every entry and keeps the selection."""
+        state = NavigationState(temp_dir_tree)
+        state.apply_filter("beta")
+        state.apply_filter("")
+        listing = state.get_listing()
+        assert listing is not None
+        assert len(listing.entries) == 5
+        assert state.selected_name == "beta.milk"
+        assert state.filter_query == ""
+
+    def test_no_matches_gives_empty_filtered_listing(
+        self, temp_dir_tree: Path
+    ) -> None:
+        """A query matching nothing leaves an empty listing and no selection."""
+        state = NavigationState(temp_dir_tree)
+        state.apply_filter("nothing here")
+        listing = state.get_listing()
+        assert listing is not None
+        assert listing.entries == []
+        assert listing.filter_query == "nothing here"
+        assert state.get_selected_entry() is None
+
+    def test_changing_directory_drops_filter(self, temp_dir_tree: Path) -> None:
+        """Entering a directory shows its full listing."""
+        state = NavigationState(temp_dir_tree)
+        state.apply_filter("pre")
+        state.move_right()
+        assert state.filter_query == ""
+        state.move_left()
+        listing = state.get_listing()
+        assert listing is not None
+        assert len(listing.entries) == 5
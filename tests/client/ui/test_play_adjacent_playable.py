@@ -36,7 +36,7 @@ class TestSymlinkToMilkPlayable:
         mock_browser.size = MagicMock()
         mock_browser.size.height = 20
         mock_browser.get_selected_entry.return_value = entries[1]
-        with patch("platyplaty.ui.file_browser_preset_preview._preview_milk_preset"):
+        with patch("platyplaty.ui.file_browser_preset_preview.preview_milk_preset"):
             await action_play_next_preset(mock_browser)
         assert mock_browser.selected_index == 1
 
@@ -60,7 +60,7 @@ class TestKNoopAtFirst:
         mock_browser._nav_state.scroll_offset = 0
         mock_browser.size = MagicMock()
         mock_browser.size.height = 20
-        with patch("platyplaty.ui.file_browser_preset_preview._preview_milk_preset") as mock_prev:
+        with patch("platyplaty.ui.file_browser_preset_preview.preview_milk_preset") as mock_prev:
             await action_play_previous_preset(mock_browser)
         mock_prev.assert_not_called()
         assert mock_browser.selected_index == 0
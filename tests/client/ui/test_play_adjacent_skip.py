@@ -35,7 +35,7 @@ class TestSkipPlatyFiles:
         mock_browser.size = MagicMock()
         mock_browser.size.height = 20
         mock_browser.get_selected_entry.return_value = entries[2]
-        with patch("platyplaty.ui.file_browser_preset_preview._preview_milk_preset"):
+        with patch("platyplaty.ui.file_browser_preset_preview.preview_milk_preset"):
             await action_play_next_preset(mock_browser)
         assert mock_browser.selected_index == 2
 
@@ -61,7 +61,7 @@ class TestSkipSymlinkToDir:
         mock_browser.size = MagicMock()
         mock_browser.size.height = 20
         mock_browser.get_selected_entry.return_value = entries[2]
-        with patch("platyplaty.ui.file_browser_preset_preview._preview_milk_preset"):
+        with patch("platyplaty.ui.file_browser_preset_preview.preview_milk_preset"):
             await action_play_next_preset(mock_browser)
         assert mock_browser.selected_index == 2
 
@@ -87,6 +87,6 @@ class TestSkipBrokenSymlink:
         mock_browser.size = MagicMock()
         mock_browser.size.height = 20
         mock_browser.get_selected_entry.return_value = entries[2]
-        with patch("platyplaty.ui.file_browser_preset_preview._preview_milk_preset"):
+        with patch("platyplaty.ui.file_browser_preset_preview.preview_milk_preset"):
             await action_play_next_preset(mock_browser)
         assert mock_browser.selected_index == 2
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Tests for the bounded, streaming .platy preview."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from platyplaty.ui.file_browser_playlist_preview import (
+    PREVIEW_MARGIN,
+    build_playlist_preview,
+)
+from platyplaty.ui.file_browser_types import (
+    RightPaneBinaryFile,
+    RightPaneNoMilk,
+    RightPanePlaylistPreview,
+)
+
+
+def _write_playlist(path: Path, count: int, tail: bytes = b"") -> Path:
+    """Write a playlist of count presets followed by raw tail bytes."""
+    body = "".join(f"/presets/p{i}.milk\n" for i in range(count))
+    path.write_bytes(body.encode() + tail)
+    return path
+
+
+class TestWindow:
+    """Tests for parsing only the visible window."""
+
+    def test_stops_after_window(self, tmp_path: Path) -> None:
+        """Only pane height plus the margin entries are returned."""
+        path = _write_playlist(tmp_path / "big.platy", 1000)
+        result = build_playlist_preview(path, 10)
+        assert isinstance(result, RightPanePlaylistPreview)
+        assert len(result.names) == 10 + PREVIEW_MARGIN
+        assert result.names[0] == "p0.milk"
+
+    def test_lines_after_window_are_not_decoded(self, tmp_path: Path) -> None:
+        """Invalid bytes beyond the window do not affect the preview."""
+        path = _write_playlist(tmp_path / "big.platy", 100, b"\xff\xfe\n")
+        assert isinstance(build_playlist_preview(path, 5), RightPanePlaylistPreview)
+
+    def test_disambiguates_within_window(self, tmp_path: Path) -> None:
+        """Display names are computed only for the parsed entries."""
+        path = _write_playlist(tmp_path / "big.platy", 500)
+        with patch(
+            "platyplaty.ui.file_browser_playlist_preview.compute_display_names",
+            return_value=[],
+        ) as mock_names:
+            build_playlist_preview(path, 10)
+        assert len(mock_names.call_args.args[0]) == 10 + PREVIEW_MARGIN
+
+
+class TestWholeFile:
+    """Tests for results that need the whole file."""
+
+    def test_no_valid_entries_is_no_milk(self, tmp_path: Path) -> None:
+        """A file with no valid entries anywhere shows 'no .milk files'."""
+        path = tmp_path / "bad.platy"
+        path.write_text("relative.milk\n" * 100)
+        assert isinstance(build_playlist_preview(path, 5), RightPaneNoMilk)
+
+    def test_binary_within_window(self, tmp_path: Path) -> None:
+        """Invalid UTF-8 before the window is filled is a binary file."""
+        path = _write_playlist(tmp_path / "bin.platy", 2, b"\xff\xfe\n")
+        assert isinstance(build_playlist_preview(path, 5), RightPaneBinaryFile)
+
+    def test_no_height_parses_everything(self, tmp_path: Path) -> None:
+        """Without a pane height every entry is returned."""
+        path = _write_playlist(tmp_path / "all.platy", 200)
+        result = build_playlist_preview(path)
+        assert isinstance(result, RightPanePlaylistPreview)
+        assert len(result.names) == 200
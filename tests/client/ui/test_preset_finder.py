@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Tests for the preset finder overlay and its prompt hooks."""
+
+import asyncio
+from collections.abc import Iterator
+from concurrent.futures import Future
+from unittest.mock import MagicMock, patch
+
+import pytest
+from textual.events import Key
+
+from platyplaty import preset_finder_table
+from platyplaty.fuzzy_index import FuzzyIndex
+from platyplaty.preset_finder_actions import open_preset_finder
+from platyplaty.ui.cell_width import cell_width
+from platyplaty.ui.command_prompt import CommandPrompt
+from platyplaty.ui.preset_finder import PresetFinder
+from platyplaty.ui.preset_finder_render import render_line
+
+PATHS = ["/p/a/swirl.milk", "/p/b/swirly.milk", "/p/c/swirliest.milk"]
+
+
+@pytest.fixture
+def finder(monkeypatch: pytest.MonkeyPatch) -> Iterator[PresetFinder]:
+    """A finder searching a small table."""
+    monkeypatch.setattr(preset_finder_table, "_table", FuzzyIndex(PATHS))
+    yield PresetFinder()
+
+
+class TestPresetFinder:
+    """Tests for the PresetFinder widget state."""
+
+    def test_query_selects_best_match(self, finder: PresetFinder) -> None:
+        """Typing ranks matches and selects the first one."""
+        finder.set_query("swirl")
+        assert finder.results == PATHS
+        assert finder.selected_path == "/p/a/swirl.milk"
+
+    def test_selection_is_clamped(self, finder: PresetFinder) -> None:
+        """The selection stays within the matches."""
+        finder.set_query("swirl")
+        finder.move_selection(10)
+        assert finder.selected_path == "/p/c/swirliest.milk"
+        finder.move_selection(-10)
+        assert finder.selected_path == "/p/a/swirl.milk"
+
+    def test_refresh_keeps_selection(self, finder: PresetFinder) -> None:
+        """Re-running the query keeps the selected preset selected."""
+        finder.set_query("swirl")
+        finder.move_selection(1)
+        finder.refresh_results()
+        assert finder.selected_path == "/p/b/swirly.milk"
+
+    def test_unbuilt_table_shows_indexing(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Before the table exists the header says it is indexing."""
+        monkeypatch.setattr(preset_finder_table, "_table", None)
+        finder = PresetFinder()
+        finder.set_query("swirl")
+        assert finder.indexing
+        assert finder.selected_path is None
+        assert render_line(finder, 0, 60).text.startswith("Indexing")
+
+    def test_long_directories_are_cut_from_the_left(
+        self, finder: PresetFinder
+    ) -> None:
+        """The file name stays whole when the line is too narrow."""
+        finder.results = ["/a/very/long/directory/name/swirl.milk"]
+        text = render_line(finder, 1, 20).text
+        assert text.endswith("swirl.milk")
+        assert text.startswith("…")
+        assert len(text) == 20
+
+    def test_wide_directories_are_cut_by_cells(
+        self, finder: PresetFinder
+    ) -> None:
+        """Double-width directory names are cut to the line's cells."""
+        finder.results = ["/プリセット/とても長い名前/swirl.milk"]
+        text = render_line(finder, 1, 20).text
+        assert text.endswith("swirl.milk")
+        assert text.startswith("…")
+        assert cell_width(text) == 20
+
+
+class TestPromptHooks:
+    """Tests for the command prompt hooks the finder relies on."""
+
+    async def test_key_handler_consumes_keys(self) -> None:
+        """Keys the handler accepts never reach the text editor."""
+        prompt = MagicMock(spec=CommandPrompt)
+        prompt.key_handler = MagicMock(return_value=True)
+        await CommandPrompt.on_key(prompt, Key("down", None))
+        prompt.key_handler.assert_called_once_with("down")
+        prompt.start_blink_timer.assert_not_called()
+
+    def test_hide_calls_on_hide_once(self) -> None:
+        """Dismissing the prompt runs on_hide and clears it."""
+        prompt = MagicMock(spec=CommandPrompt)
+        prompt._cursor = MagicMock()
+        on_hide = MagicMock()
+        prompt.on_hide = on_hide
+        CommandPrompt.hide(prompt)
+        on_hide.assert_called_once_with()
+        assert prompt.on_hide is None
+
+
+class TestOpenPresetFinder:
+    """Tests for open_preset_finder."""
+
+    @pytest.mark.asyncio
+    async def test_sync_finished_before_callback_refreshes(self) -> None:
+        """A table sync that is already done still refreshes the finder."""
+        finder = MagicMock(spec=PresetFinder)
+        finder.is_open = True
+        app = MagicMock()
+        app.query_one.side_effect = lambda kind: (
+            finder if kind is PresetFinder else MagicMock()
+        )
+        app.call_from_thread.side_effect = RuntimeError("on the loop thread")
+        synced: Future[None] = Future()
+        synced.set_result(None)
+        with patch(
+            "platyplaty.preset_finder_actions.start_finder_table_sync",
+            return_value=synced,
+        ):
+            await open_preset_finder(MagicMock(), app)
+        await asyncio.sleep(0)
+        finder.refresh_results.assert_called_once_with()
@@ -60,3 +60,22 @@ class TestDirtyIndicator:
         """Shows '* ' prefix before filename when dirty."""
         result = build_status_content(False, Path("/test.platy"), True, 100)
         assert "* test.platy" in result
+
+
+class TestProgress:
+    """Tests for background job progress display."""
+
+    def test_progress_follows_autoplay_state(self) -> None:
+        """Progress text sits between the autoplay state and the filename."""
+        result = build_status_content(
+            True, Path("/p/my.platy"), False, 100, "[adding: 3/10]"
+        )
+        assert result == "[autoplay: on] [adding: 3/10] my.platy"
+
+    def test_progress_shrinks_filename(self) -> None:
+        """The filename, not the progress, is truncated to fit."""
+        result = build_status_content(
+            True, Path("/p/a_long_playlist_name.platy"), False, 40, "[adding: 3/10]"
+        )
+        assert "[adding: 3/10]" in result
+        assert len(result) <= 40
@@ -28,6 +28,7 @@ class MockStatusLine:
         self._autoplay_enabled = autoplay
         self._playlist_filename = filename
         self._dirty = dirty
+        self._progress: str | None = None
 
 
 class TestErrorIndicatorPresence: